@@ -7,6 +7,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from compose.api.middleware import CorrelationMiddleware, HTTPServerMetricsMiddleware
+from compose.api.resources import (
+    get_resource_registry,
+    install_drain_on_signal,
+    reset_resource_registry,
+    warmup_enabled,
+)
 from compose.api.routers import health, youtube, cache, chat, stats, ingest, conversations, projects, artifacts, styles, memory, websearch, sandbox, imagegen, auth, settings, backup, telemetry, vaults, studio_notes, graph
 from compose.lib.telemetry import setup_telemetry
 
@@ -18,8 +24,23 @@ if TELEMETRY_ENABLED:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan handler."""
+    """Application lifespan handler.
+
+    Warms up database, storage, LLM and embedding clients in the background
+    (readiness is reported by /health/ready). On SIGTERM/SIGINT, in-flight
+    streams are drained before the server stops serving; the clients are
+    closed on shutdown.
+    """
+    registry = get_resource_registry()
+    if warmup_enabled():
+        registry.start_background()
+    else:
+        registry.mark_lazy()
+    restore_signals = install_drain_on_signal(registry)
     yield
+    restore_signals()
+    await registry.shutdown()
+    reset_resource_registry()
 
 
 # Create FastAPI app
@@ -1,50 +1,59 @@
 """Correlation ID middleware for request tracking."""
 
 import uuid
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
 from opentelemetry import trace
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class CorrelationMiddleware(BaseHTTPMiddleware):
+class CorrelationMiddleware:
     """Middleware to add correlation IDs to requests and responses.
 
     Correlation IDs enable tracking requests across services and logs.
     If a request includes X-Correlation-ID header, it will be used.
     Otherwise, a new UUID will be generated.
+
+    Implemented as pure ASGI middleware: the header is added to the
+    ``http.response.start`` message as it passes through, so streaming
+    responses are not buffered or wrapped.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: Callable
-    ) -> Response:
-        """Process request and add correlation ID.
+    def __init__(self, app: ASGIApp):
+        """Initialize middleware.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
+            app: The ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and add correlation ID.
 
-        Returns:
-            HTTP response with X-Correlation-ID header
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get correlation ID from request header or generate new one
-        correlation_id = request.headers.get("X-Correlation-ID")
-        if not correlation_id:
-            correlation_id = str(uuid.uuid4())
+        correlation_id = Headers(scope=scope).get("x-correlation-id") or str(uuid.uuid4())
 
-        # Store in request state for access in handlers
-        request.state.correlation_id = correlation_id
+        # Store in request state for access in handlers (request.state.correlation_id)
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
 
         # Add to OpenTelemetry trace context
         span = trace.get_current_span()
         if span:
             span.set_attribute("correlation_id", correlation_id)
 
-        # Process request
-        response = await call_next(request)
-
-        # Add correlation ID to response headers
-        response.headers["X-Correlation-ID"] = correlation_id
+        async def send_with_correlation_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add correlation ID to response headers
+                MutableHeaders(scope=message)["X-Correlation-ID"] = correlation_id
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_correlation_id)
@@ -2,39 +2,73 @@
 
 Emits standard HTTP server metrics compatible with Prometheus:
 - http_server_request_duration_seconds (histogram)
+- http_server_time_to_first_byte_seconds (histogram, streaming responses)
 - http_server_active_requests (gauge)
 - http_server_requests_total (counter)
+
+The middleware is pure ASGI: it only observes the messages passing
+through, so streaming responses (e.g. the stats SSE feed) are forwarded
+untouched. ``http_route`` is the templated route resolved by the router
+(``/conversations/{conversation_id}``), read once dispatch has run, so
+label cardinality is bounded by the number of routes; requests that match
+no route are labelled ``unmatched``.
 """
 
 import time
-from typing import Callable
+from typing import Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
 from opentelemetry import metrics
+from opentelemetry.metrics import MeterProvider
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope: Scope) -> str:
+    """Templated path of the route that handled a request.
+
+    Args:
+        scope: ASGI scope after routing
+
+    Returns:
+        Route path template, or UNMATCHED_ROUTE if no route matched
+    """
+    route = scope.get("route")
+    path = getattr(route, "path_format", None) or getattr(route, "path", None)
+    return path or UNMATCHED_ROUTE
 
 
-class HTTPServerMetricsMiddleware(BaseHTTPMiddleware):
+class HTTPServerMetricsMiddleware:
     """Middleware that records HTTP server metrics via OpenTelemetry.
 
     Records:
     - http_server_request_duration_seconds: Histogram of request latencies
-    - http_server_active_requests: Gauge of in-flight requests
+      (until the last body chunk is sent)
+    - http_server_time_to_first_byte_seconds: Histogram of latency to the
+      first body chunk, for streaming responses only
+    - http_server_active_requests: Gauge of in-flight requests (by method;
+      the route isn't known until the request has been dispatched)
+    - http_server_requests_total: Counter of completed requests
     """
 
-    def __init__(self, app, service_name: str = "api"):
+    def __init__(
+        self,
+        app: ASGIApp,
+        service_name: str = "api",
+        meter_provider: Optional[MeterProvider] = None,
+    ):
         """Initialize HTTP server metrics middleware.
 
         Args:
             app: The ASGI application
             service_name: Service identifier (used for logging, not metric labels
                          since service.name is already in resource attributes)
+            meter_provider: Meter provider to use instead of the global one
         """
-        super().__init__(app)
+        self.app = app
 
         # Get meter from global provider (must be set before middleware init)
-        meter = metrics.get_meter(__name__)
+        meter = metrics.get_meter(__name__, meter_provider=meter_provider)
 
         # Create histogram for request duration (in seconds)
         self._duration_histogram = meter.create_histogram(
@@ -43,6 +77,13 @@ class HTTPServerMetricsMiddleware(BaseHTTPMiddleware):
             unit="s",
         )
 
+        # Create histogram for time to first byte of streaming responses
+        self._ttfb_histogram = meter.create_histogram(
+            name="http_server_time_to_first_byte_seconds",
+            description="Time to first response body chunk of streaming responses in seconds",
+            unit="s",
+        )
+
         # Create up/down counter for active requests
         self._active_requests = meter.create_up_down_counter(
             name="http_server_active_requests",
@@ -57,54 +98,56 @@ class HTTPServerMetricsMiddleware(BaseHTTPMiddleware):
             unit="1",
         )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and record metrics."""
-        # Extract route pattern (use path if no route match)
-        route = request.scope.get("route")
-        http_route = route.path if route else request.url.path
-
-        # Common attributes (avoiding service_name which conflicts with resource attribute)
-        attributes = {
-            "http_method": request.method,
-            "http_route": http_route,
-        }
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Increment active requests
-        self._active_requests.add(1, attributes)
+        method = scope["method"]
+        active_attributes = {"http_method": method}
+        self._active_requests.add(1, active_attributes)
 
         start_time = time.perf_counter()
+        status_code = "500"
+        first_body_sent = False
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status_code, first_body_sent
+            if message["type"] == "http.response.start":
+                status_code = str(message["status"])
+            elif message["type"] == "http.response.body" and not first_body_sent:
+                first_body_sent = True
+                if message.get("more_body", False):
+                    # Streaming response: record when the first chunk goes out
+                    self._ttfb_histogram.record(
+                        time.perf_counter() - start_time,
+                        self._attributes(scope, method, status_code),
+                    )
+            await send(message)
 
         try:
-            response = await call_next(request)
-
-            # Add status code to attributes
-            attributes["http_status_code"] = str(response.status_code)
-
-            # Record request count
-            self._request_counter.add(1, attributes)
-
-            # Record duration
-            duration = time.perf_counter() - start_time
-            self._duration_histogram.record(duration, attributes)
-
-            return response
-
+            await self.app(scope, receive, send_with_metrics)
         except Exception as e:
             # Record error metrics
-            attributes["http_status_code"] = "500"
+            attributes = self._attributes(scope, method, "500")
             attributes["error_type"] = type(e).__name__
-
-            self._request_counter.add(1, attributes)
-
-            duration = time.perf_counter() - start_time
-            self._duration_histogram.record(duration, attributes)
-
+            self._record(attributes, start_time)
             raise
-
+        else:
+            self._record(self._attributes(scope, method, status_code), start_time)
         finally:
-            # Decrement active requests (use base attributes without status)
-            base_attrs = {
-                "http_method": request.method,
-                "http_route": http_route,
-            }
-            self._active_requests.add(-1, base_attrs)
+            self._active_requests.add(-1, active_attributes)
+
+    @staticmethod
+    def _attributes(scope: Scope, method: str, status_code: str) -> dict[str, str]:
+        # Common attributes (avoiding service_name which conflicts with resource attribute)
+        return {
+            "http_method": method,
+            "http_route": route_template(scope),
+            "http_status_code": status_code,
+        }
+
+    def _record(self, attributes: dict[str, str], start_time: float) -> None:
+        self._request_counter.add(1, attributes)
+        self._duration_histogram.record(time.perf_counter() - start_time, attributes)
@@ -0,0 +1,459 @@
+"""Lifespan-managed API resources: warm-up, readiness and graceful shutdown.
+
+Clients for SurrealDB, MinIO, the LLM providers, Infinity embeddings and
+Neo4j are created lazily by their modules. Without warm-up, the first
+request after a deploy pays for every connection handshake. The
+ResourceRegistry starts them all concurrently when the app starts: it
+connects, preflights ``init_schema`` and embeds a short query. It also
+closes them when the app stops.
+
+Warm-up runs in the background, so liveness (``/health/live``) answers
+immediately. Readiness (``/health/ready``) turns true once every required
+resource has started.
+
+Draining has to start before the server stops serving. Once uvicorn
+begins shutting down it closes its listeners, sends close 1012 to every
+WebSocket and waits for open connections (including SSE streams) to
+finish. Only after that does it run the lifespan shutdown. So
+install_drain_on_signal wraps the server's SIGTERM/SIGINT handler. On the
+first signal the registry:
+1. Marks itself draining, so readiness fails while the server still
+   answers.
+2. Runs drain hooks, e.g. ending SSE streams so they don't hold up the
+   server's connection wait.
+3. Waits up to API_DRAIN_TIMEOUT for tracked streams (in-flight chat
+   completions over WebSocket) to finish.
+Then it passes the signal on to the server, which stops as usual. A
+second signal is passed on immediately. Resources are closed in the
+lifespan shutdown, which also drains if no signal started it.
+
+Set ``API_WARMUP=false`` to skip warm-up; resources then initialize on
+first use as before.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Settings
+WARMUP_TIMEOUT = float(os.getenv("API_WARMUP_TIMEOUT", "30"))  # Seconds per resource
+DRAIN_TIMEOUT = float(os.getenv("API_DRAIN_TIMEOUT", "10"))  # Seconds to wait for streams
+SHUTDOWN_TIMEOUT = 5.0  # Seconds per resource close
+
+DRAIN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+HookFn = Callable[[], Awaitable[None]]
+
+
+class SkipResource(Exception):
+    """Raised by a startup hook when its resource isn't configured."""
+
+
+@dataclass
+class Resource:
+    """A warmed-up dependency and its lifecycle hooks."""
+
+    name: str
+    startup: HookFn
+    shutdown: Optional[HookFn] = None
+    required: bool = False
+    status: str = "pending"  # pending | ready | failed | skipped
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+
+
+def warmup_enabled() -> bool:
+    """Whether resources are warmed up at startup (API_WARMUP, default true)."""
+    return os.getenv("API_WARMUP", "true").lower() != "false"
+
+
+class ResourceRegistry:
+    """Concurrent startup, readiness tracking and ordered shutdown.
+
+    Example:
+        >>> registry = ResourceRegistry()
+        >>> registry.register("surrealdb", connect, close, required=True)
+        >>> registry.start_background()
+        >>> ...
+        >>> await registry.shutdown()
+    """
+
+    def __init__(
+        self,
+        warmup_timeout: float = WARMUP_TIMEOUT,
+        drain_timeout: float = DRAIN_TIMEOUT,
+    ):
+        """Initialize registry.
+
+        Args:
+            warmup_timeout: Seconds each startup hook may take
+            drain_timeout: Seconds shutdown waits for tracked streams
+        """
+        self.warmup_timeout = warmup_timeout
+        self.drain_timeout = drain_timeout
+        self._resources: dict[str, Resource] = {}
+        self._drain_hooks: list[Callable[[], Awaitable[None] | None]] = []
+        self._warmup_task: Optional[asyncio.Task] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        self._started = False
+        self.draining = False
+        self._active_streams = 0
+        self._streams_idle = asyncio.Event()
+        self._streams_idle.set()
+
+    def register(
+        self,
+        name: str,
+        startup: HookFn,
+        shutdown: Optional[HookFn] = None,
+        required: bool = False,
+    ) -> None:
+        """Register a resource.
+
+        Args:
+            name: Resource name shown in readiness output
+            startup: Async hook creating and warming the resource
+            shutdown: Async hook closing it
+            required: Whether readiness waits for it
+        """
+        self._resources[name] = Resource(name, startup, shutdown, required)
+
+    def on_drain(self, hook: Callable[[], Awaitable[None] | None]) -> None:
+        """Register a hook run when shutdown starts (e.g. ending SSE streams)."""
+        self._drain_hooks.append(hook)
+
+    @property
+    def resources(self) -> dict[str, Resource]:
+        """Registered resources by name."""
+        return self._resources
+
+    async def _start_resource(self, resource: Resource) -> None:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(resource.startup(), timeout=self.warmup_timeout)
+            resource.status = "ready"
+        except SkipResource as e:
+            resource.status = "skipped"
+            resource.error = str(e) or None
+        except Exception as e:
+            resource.status = "failed"
+            resource.error = str(e) or type(e).__name__
+            logger.warning(f"Warm-up of {resource.name} failed: {resource.error}")
+        resource.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    async def start(self) -> None:
+        """Start all registered resources concurrently."""
+        await asyncio.gather(
+            *(self._start_resource(resource) for resource in self._resources.values())
+        )
+        self._started = True
+        summary = ", ".join(
+            f"{r.name}={r.status} ({r.duration_ms:.0f} ms)" for r in self._resources.values()
+        )
+        logger.info(f"Resource warm-up finished: {summary}")
+
+    def start_background(self) -> asyncio.Task:
+        """Start resources in a background task (the app serves meanwhile)."""
+        if self._warmup_task is None:
+            self._warmup_task = asyncio.create_task(self.start(), name="resource-warmup")
+        return self._warmup_task
+
+    def mark_lazy(self) -> None:
+        """Skip warm-up; resources initialize on first use."""
+        for resource in self._resources.values():
+            resource.status = "skipped"
+            resource.error = "warm-up disabled"
+        self._started = True
+
+    @property
+    def ready(self) -> bool:
+        """Whether startup finished, required resources are up and not draining."""
+        if self.draining or not self._started:
+            return False
+        return all(
+            r.status in ("ready", "skipped")
+            for r in self._resources.values()
+            if r.required
+        )
+
+    def status(self) -> dict:
+        """Readiness summary with per-resource status."""
+        return {
+            "ready": self.ready,
+            "draining": self.draining,
+            "active_streams": self._active_streams,
+            "resources": {
+                r.name: {
+                    "status": r.status,
+                    "required": r.required,
+                    "error": r.error,
+                    "duration_ms": r.duration_ms,
+                }
+                for r in self._resources.values()
+            },
+        }
+
+    @asynccontextmanager
+    async def track_stream(self) -> AsyncIterator[None]:
+        """Mark a response stream as in flight, so shutdown waits for it."""
+        self._active_streams += 1
+        self._streams_idle.clear()
+        try:
+            yield
+        finally:
+            self._active_streams -= 1
+            if self._active_streams == 0:
+                self._streams_idle.set()
+
+    async def drain(self) -> None:
+        """Stop reporting ready, run drain hooks and wait for tracked streams.
+
+        Idempotent: later calls wait for the first drain to finish.
+        """
+        if self._drain_task is None:
+            self._drain_task = asyncio.ensure_future(self._drain())
+        await self._drain_task
+
+    async def _drain(self) -> None:
+        self.draining = True
+
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except asyncio.CancelledError:
+                pass
+
+        for hook in self._drain_hooks:
+            try:
+                result = hook()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"Drain hook failed: {e}")
+
+        if self._active_streams:
+            logger.info(f"Waiting for {self._active_streams} in-flight streams")
+            try:
+                await asyncio.wait_for(self._streams_idle.wait(), timeout=self.drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"{self._active_streams} streams still open after {self.drain_timeout}s")
+
+    async def shutdown(self) -> None:
+        """Drain (if not already drained), then close all resources concurrently."""
+        await self.drain()
+
+        async def close(resource: Resource) -> None:
+            try:
+                await asyncio.wait_for(resource.shutdown(), timeout=SHUTDOWN_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"Closing {resource.name} failed: {e}")
+
+        await asyncio.gather(
+            *(close(r) for r in self._resources.values() if r.shutdown is not None)
+        )
+
+
+def install_drain_on_signal(registry: ResourceRegistry) -> Callable[[], None]:
+    """Drain the registry on SIGTERM/SIGINT before the server stops serving.
+
+    Wraps the handlers the server (uvicorn) installed. The first signal
+    starts ``registry.drain()`` and forwards the signal to the server once
+    the drain is done. A second signal is forwarded immediately. Must be
+    called from the lifespan startup, on the main thread's event loop;
+    otherwise (or without a server handler) nothing is installed.
+
+    Args:
+        registry: Registry to drain
+
+    Returns:
+        Function restoring the server's handlers
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return lambda: None
+
+    loop = asyncio.get_running_loop()
+    server_handlers = {
+        sig: handler
+        for sig in DRAIN_SIGNALS
+        if callable(handler := signal.getsignal(sig)) and handler is not signal.default_int_handler
+    }
+    draining = False
+
+    def forward(sig: int) -> None:
+        server_handlers[sig](sig, None)
+
+    def handle(sig: int, frame) -> None:
+        nonlocal draining
+        if draining:
+            forward(sig)
+            return
+        draining = True
+        logger.info(f"Received signal {sig}, draining before shutdown")
+
+        def start() -> None:
+            task = loop.create_task(registry.drain())
+            task.add_done_callback(lambda _: forward(sig))
+
+        loop.call_soon_threadsafe(start)
+
+    for sig in server_handlers:
+        signal.signal(sig, handle)
+
+    def restore() -> None:
+        for sig, handler in server_handlers.items():
+            if signal.getsignal(sig) is handle:
+                signal.signal(sig, handler)
+
+    return restore
+
+
+# =============================================================================
+# Default resources
+# =============================================================================
+
+
+async def _start_surrealdb() -> None:
+    from compose.services.surrealdb import init_schema
+    from compose.services.surrealdb.driver import get_db
+
+    await get_db()
+    await init_schema()
+
+
+async def _close_surrealdb() -> None:
+    from compose.services.surrealdb.driver import close_db
+
+    await close_db()
+
+
+async def _start_minio() -> None:
+    from compose.services.minio import get_async_minio_client
+
+    await asyncio.to_thread(get_async_minio_client)
+
+
+async def _close_minio() -> None:
+    from compose.services.minio import reset_async_minio_client
+
+    reset_async_minio_client()
+
+
+async def _start_llm_clients() -> None:
+    from compose.api.routers.chat import get_ollama_client, get_openai_client, get_openrouter_client
+
+    get_openrouter_client()
+    get_openai_client()
+    get_ollama_client()
+
+
+async def _close_llm_clients() -> None:
+    from compose.api.routers import chat
+
+    clients = [chat._openrouter_client, chat._openai_client, chat._ollama_client]
+    await asyncio.gather(*(c.close() for c in clients if c is not None))
+    chat.reset_clients()
+
+
+async def _start_embeddings() -> None:
+    from compose.services.embeddings import get_global_embedder
+
+    # Preflight a query embedding so the model is loaded before the first search
+    await asyncio.to_thread(get_global_embedder().embed, "warm-up")
+
+
+def _warm_neo4j() -> None:
+    from compose.services.graph import driver
+    from compose.services.graph.repository import init_schema
+
+    if not driver.NEO4J_PASSWORD:
+        raise SkipResource("NEO4J_PASSWORD not set")
+    driver.get_driver().verify_connectivity()
+    init_schema()
+
+
+async def _start_neo4j() -> None:
+    await asyncio.to_thread(_warm_neo4j)
+
+
+async def _close_neo4j() -> None:
+    from compose.services.graph.driver import close_driver
+
+    await asyncio.to_thread(close_driver)
+
+
+async def _close_health_monitor() -> None:
+    from compose.services import health
+
+    if health._monitor is not None:
+        await health._monitor.aclose()
+
+
+async def _close_progress_feed() -> None:
+    from compose.services.progress_feed import stop_progress_feed
+
+    await stop_progress_feed()
+
+
+async def _noop() -> None:
+    pass
+
+
+def _close_stats_streams() -> None:
+    from compose.api.routers.stats import get_stats_broadcaster
+
+    # Kept (closed) until shutdown, so clients reconnecting while the
+    # server drains get an empty stream instead of a new open one
+    get_stats_broadcaster().close()
+
+
+async def _reset_stats_broadcaster() -> None:
+    from compose.api.routers.stats import reset_stats_broadcaster
+
+    reset_stats_broadcaster()
+
+
+def create_default_registry() -> ResourceRegistry:
+    """Create a registry with the API's dependencies registered.
+
+    Returns:
+        ResourceRegistry with SurrealDB (required), MinIO, LLM clients,
+        embeddings, Neo4j, health monitor, progress feed and stats streams
+        registered
+    """
+    registry = ResourceRegistry()
+    registry.register("surrealdb", _start_surrealdb, _close_surrealdb, required=True)
+    registry.register("minio", _start_minio, _close_minio)
+    registry.register("llm_clients", _start_llm_clients, _close_llm_clients)
+    registry.register("embeddings", _start_embeddings)
+    registry.register("neo4j", _start_neo4j, _close_neo4j)
+    registry.register("health_monitor", _noop, _close_health_monitor)
+    registry.register("progress_feed", _noop, _close_progress_feed)
+    registry.register("stats_streams", _noop, _reset_stats_broadcaster)
+    registry.on_drain(_close_stats_streams)
+    return registry
+
+
+_registry: Optional[ResourceRegistry] = None
+
+
+def get_resource_registry() -> ResourceRegistry:
+    """Get the process-wide resource registry singleton."""
+    global _registry
+    if _registry is None:
+        _registry = create_default_registry()
+    return _registry
+
+
+def reset_resource_registry() -> None:
+    """Discard the registry singleton (for testing)."""
+    global _registry
+    _registry = None
@@ -77,7 +77,7 @@ async def get_backup(backup_id: str):
 
 
 @router.post("/{backup_id}/restore", response_model=RestoreResponse)
-async def restore_backup(backup_id: str):
+async def restore_backup(backup_id: str, resume: bool = False):
     """Restore data from a backup.
 
     WARNING: This will DELETE all existing data in the backed-up tables
@@ -85,6 +85,8 @@ async def restore_backup(backup_id: str):
 
     Args:
         backup_id: ID of the backup to restore.
+        resume: Continue a failed restore of this backup instead of
+            starting over.
 
     Returns:
         Restore operation result.
@@ -103,7 +105,7 @@ async def restore_backup(backup_id: str):
             detail=f"Cannot restore incomplete backup with status: {backup.status}",
         )
 
-    success = await service.restore_backup(backup_id)
+    success = await service.restore_backup(backup_id, resume=resume)
     if not success:
         raise HTTPException(status_code=500, detail="Restore operation failed")
 
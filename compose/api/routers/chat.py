@@ -4,19 +4,23 @@ import json
 import os
 import random
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from openai import AsyncOpenAI
 from pydantic import BaseModel
 
+from compose.api.resources import get_resource_registry
 from compose.services.conversations import get_conversation_service
 from compose.services.memory import get_memory_service
 from compose.services.projects import get_project_service
 from compose.services.styles import get_styles_service
 from compose.services.surrealdb import semantic_search
 
+# The OpenAI SDK is imported when the first client is created
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 # Configuration (read at import - no side effects)
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -25,15 +29,17 @@ INFINITY_URL = os.getenv("INFINITY_URL", "http://localhost:7997")
 INFINITY_MODEL = os.getenv("INFINITY_MODEL", "Alibaba-NLP/gte-large-en-v1.5")
 
 # Lazy-initialized clients (no network calls at import time)
-_openrouter_client: AsyncOpenAI | None = None
-_openai_client: AsyncOpenAI | None = None
-_ollama_client: AsyncOpenAI | None = None
+_openrouter_client: "AsyncOpenAI | None" = None
+_openai_client: "AsyncOpenAI | None" = None
+_ollama_client: "AsyncOpenAI | None" = None
 
 
-def get_openrouter_client() -> AsyncOpenAI | None:
+def get_openrouter_client() -> "AsyncOpenAI | None":
     """Get OpenRouter client, creating it on first use."""
     global _openrouter_client
     if _openrouter_client is None and OPENROUTER_API_KEY:
+        from openai import AsyncOpenAI
+
         _openrouter_client = AsyncOpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=OPENROUTER_API_KEY,
@@ -41,18 +47,22 @@ def get_openrouter_client() -> AsyncOpenAI | None:
     return _openrouter_client
 
 
-def get_openai_client() -> AsyncOpenAI | None:
+def get_openai_client() -> "AsyncOpenAI | None":
     """Get direct OpenAI client, creating it on first use."""
     global _openai_client
     if _openai_client is None and OPENAI_API_KEY:
+        from openai import AsyncOpenAI
+
         _openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
     return _openai_client
 
 
-def get_ollama_client() -> AsyncOpenAI:
+def get_ollama_client() -> "AsyncOpenAI":
     """Get Ollama client, creating it on first use."""
     global _ollama_client
     if _ollama_client is None:
+        from openai import AsyncOpenAI
+
         _ollama_client = AsyncOpenAI(
             base_url=f"{OLLAMA_URL}/v1",
             api_key="ollama",  # Ollama doesn't need a real key
@@ -376,21 +386,23 @@ async def websocket_chat(websocket: WebSocket):
                     messages.append({"role": "system", "content": system_message})
                 messages.append({"role": "user", "content": message})
 
-                stream = await client.chat.completions.create(
-                    model=actual_model,
-                    messages=messages,
-                    stream=True,
-                )
-
-                full_response = ""
-                async for chunk in stream:
-                    if chunk.choices[0].delta.content:
-                        content = chunk.choices[0].delta.content
-                        full_response += content
-                        await websocket.send_json({
-                            "type": "token",
-                            "content": content
-                        })
+                # Tracked so shutdown waits for the completion to finish
+                async with get_resource_registry().track_stream():
+                    stream = await client.chat.completions.create(
+                        model=actual_model,
+                        messages=messages,
+                        stream=True,
+                    )
+
+                    full_response = ""
+                    async for chunk in stream:
+                        if chunk.choices[0].delta.content:
+                            content = chunk.choices[0].delta.content
+                            full_response += content
+                            await websocket.send_json({
+                                "type": "token",
+                                "content": content
+                            })
 
                 # Save assistant message to conversation
                 if conversation_id and full_response.strip():
@@ -577,21 +589,23 @@ Respond helpfully and concisely."""
                     client = openrouter
                     actual_model = model
 
-                stream = await client.chat.completions.create(
-                    model=actual_model,
-                    messages=[{"role": "user", "content": augmented_prompt}],
-                    stream=True,
-                )
-
-                full_response = ""
-                async for chunk in stream:
-                    if chunk.choices[0].delta.content:
-                        content = chunk.choices[0].delta.content
-                        full_response += content
-                        await websocket.send_json({
-                            "type": "token",
-                            "content": content
-                        })
+                # Tracked so shutdown waits for the completion to finish
+                async with get_resource_registry().track_stream():
+                    stream = await client.chat.completions.create(
+                        model=actual_model,
+                        messages=[{"role": "user", "content": augmented_prompt}],
+                        stream=True,
+                    )
+
+                    full_response = ""
+                    async for chunk in stream:
+                        if chunk.choices[0].delta.content:
+                            content = chunk.choices[0].delta.content
+                            full_response += content
+                            await websocket.send_json({
+                                "type": "token",
+                                "content": content
+                            })
 
                 # Save assistant message to conversation
                 if conversation_id and full_response.strip():
@@ -4,8 +4,10 @@ import os
 
 import httpx
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
 from compose.api.models import HealthCheckResponse
+from compose.api.resources import get_resource_registry
 
 router = APIRouter(tags=["health"])
 
@@ -31,6 +33,24 @@ async def health_check():
     return HealthCheckResponse(status=status, checks=checks)
 
 
+@router.get("/health/live")
+async def liveness():
+    """Liveness: the process is up and serving (no dependency checks)."""
+    return {"status": "ok"}
+
+
+@router.get("/health/ready")
+async def readiness():
+    """Readiness: resources are warmed up and the app isn't draining.
+
+    Returns 503 until warm-up of required resources finishes, if a required
+    resource failed, or once shutdown has started.
+    """
+    registry = get_resource_registry()
+    status = registry.status()
+    return JSONResponse(status, status_code=200 if registry.ready else 503)
+
+
 async def check_surrealdb() -> dict:
     """Check if SurrealDB is accessible."""
     try:
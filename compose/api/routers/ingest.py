@@ -1,9 +1,8 @@
 """Universal URL ingest API router."""
 
-import csv
 import os
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Literal
 
@@ -25,6 +24,8 @@ class IngestRequest(BaseModel):
 
     url: str
     channel_limit: Literal["month", "year", "50", "100", "all"] = "all"
+    # Re-fetch the whole range instead of only uploads not yet synced
+    full_sync: bool = False
 
 
 class IngestResponse(BaseModel):
@@ -165,179 +166,39 @@ async def ingest_video(url: str) -> IngestResponse:
 
 
 async def ingest_channel(
-    url: str, limit: Literal["month", "year", "50", "100", "all"]
+    url: str, limit: Literal["month", "year", "50", "100", "all"], full_sync: bool = False
 ) -> IngestResponse:
-    """Fetch channel videos and queue as CSV."""
-    from googleapiclient.discovery import build
-    from googleapiclient.errors import HttpError
+    """Fetch a channel's new uploads and queue them as CSV.
 
-    api_key = os.getenv("YOUTUBE_API_KEY")
-    if not api_key:
-        return IngestResponse(
-            type="channel",
-            status="error",
-            message="YOUTUBE_API_KEY not configured",
-            details={},
-        )
+    Uploads already fetched by an earlier sync of the channel are skipped,
+    unless full_sync is set.
+    """
+    from googleapiclient.errors import HttpError
+    from compose.services.youtube import ChannelSync
+
+    # Calculate cutoff date based on limit
+    now = datetime.now(timezone.utc)
+    if limit == "month":
+        cutoff_date, max_videos = now - timedelta(days=30), None
+    elif limit == "year":
+        cutoff_date, max_videos = now - timedelta(days=365), None
+    elif limit == "50":
+        cutoff_date, max_videos = now - timedelta(days=365 * 10), 50
+    elif limit == "100":
+        cutoff_date, max_videos = now - timedelta(days=365 * 10), 100
+    else:  # all
+        cutoff_date, max_videos = now - timedelta(days=365 * 10), None
 
     try:
-        youtube = build("youtube", "v3", developerKey=api_key)
-
-        # Extract username from URL
-        username_match = re.search(r"@([^/]+)", url)
-        if not username_match:
-            return IngestResponse(
-                type="channel",
-                status="error",
-                message="Could not extract channel username from URL",
-                details={"url": url},
-            )
-        username = username_match.group(1)
-
-        # Get channel ID
-        search_response = youtube.search().list(
-            part="snippet", q=username, type="channel", maxResults=1
-        ).execute()
-
-        if not search_response.get("items"):
-            return IngestResponse(
-                type="channel",
-                status="error",
-                message=f"Channel not found: {username}",
-                details={},
-            )
-
-        channel_id = search_response["items"][0]["snippet"]["channelId"]
-        channel_name = search_response["items"][0]["snippet"]["title"]
-
-        # Calculate cutoff date based on limit
-        if limit == "month":
-            cutoff_date = datetime.now() - timedelta(days=30)
-            max_videos = None
-        elif limit == "year":
-            cutoff_date = datetime.now() - timedelta(days=365)
-            max_videos = None
-        elif limit == "50":
-            cutoff_date = datetime.now() - timedelta(days=365 * 10)
-            max_videos = 50
-        elif limit == "100":
-            cutoff_date = datetime.now() - timedelta(days=365 * 10)
-            max_videos = 100
-        else:  # all
-            cutoff_date = datetime.now() - timedelta(days=365 * 10)
-            max_videos = None
-
-        # Get uploads playlist
-        channel_response = youtube.channels().list(
-            part="contentDetails", id=channel_id
-        ).execute()
-
-        if not channel_response.get("items"):
-            return IngestResponse(
-                type="channel",
-                status="error",
-                message="Could not get channel details",
-                details={},
-            )
-
-        uploads_playlist_id = channel_response["items"][0]["contentDetails"][
-            "relatedPlaylists"
-        ]["uploads"]
-
-        # Fetch videos
-        videos = []
-        next_page_token = None
-
-        while True:
-            playlist_response = youtube.playlistItems().list(
-                part="snippet,contentDetails",
-                playlistId=uploads_playlist_id,
-                maxResults=50,
-                pageToken=next_page_token,
-            ).execute()
-
-            video_ids = []
-            video_dates = {}
-
-            for item in playlist_response.get("items", []):
-                video_id = item["contentDetails"]["videoId"]
-                published_at = datetime.strptime(
-                    item["snippet"]["publishedAt"], "%Y-%m-%dT%H:%M:%SZ"
-                )
-
-                if published_at >= cutoff_date:
-                    video_ids.append(video_id)
-                    video_dates[video_id] = published_at
-                else:
-                    break
-
-            if not video_ids:
-                break
-
-            # Get video details
-            videos_response = youtube.videos().list(
-                part="snippet,statistics,contentDetails", id=",".join(video_ids)
-            ).execute()
-
-            for video in videos_response.get("items", []):
-                vid = video["id"]
-                snippet = video["snippet"]
-                statistics = video.get("statistics", {})
-
-                videos.append({
-                    "title": snippet["title"],
-                    "url": f"https://www.youtube.com/watch?v={vid}",
-                    "upload_date": video_dates[vid].strftime("%Y-%m-%d"),
-                    "view_count": statistics.get("viewCount", "0"),
-                    "channel_id": channel_id,
-                    "channel_name": channel_name,
-                })
-
-                if max_videos and len(videos) >= max_videos:
-                    break
-
-            if max_videos and len(videos) >= max_videos:
-                break
-
-            next_page_token = playlist_response.get("nextPageToken")
-            if not next_page_token:
-                break
-
-        if not videos:
-            return IngestResponse(
-                type="channel",
-                status="error",
-                message="No videos found in specified time range",
-                details={"channel_id": channel_id},
-            )
-
-        # Save to CSV
-        pending_dir = QUEUE_BASE / "pending"
-        pending_dir.mkdir(parents=True, exist_ok=True)
-
-        filename = f"{username.lower().replace('-', '_')}_videos.csv"
-        csv_path = pending_dir / filename
-
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=["title", "url", "upload_date", "view_count", "channel_id", "channel_name"],
-            )
-            writer.writeheader()
-            writer.writerows(videos)
-
+        sync = ChannelSync(queue_base=QUEUE_BASE)
+        result = await sync.sync(url, cutoff=cutoff_date, max_videos=max_videos, full=full_sync)
+    except ValueError as e:
         return IngestResponse(
             type="channel",
-            status="queued",
-            message=f"Queued {len(videos)} videos from {channel_name}",
-            details={
-                "filename": filename,
-                "video_count": len(videos),
-                "channel_id": channel_id,
-                "channel_name": channel_name,
-            },
+            status="error",
+            message=str(e),
+            details={"url": url},
         )
-
     except HttpError as e:
         return IngestResponse(
             type="channel",
@@ -353,6 +214,37 @@ async def ingest_channel(
             details={},
         )
 
+    details = {
+        "channel_id": result.channel_id,
+        "channel_name": result.channel_name,
+        "since": result.since.newest_published_at if result.since else None,
+    }
+    if not result.video_count:
+        if result.since:
+            return IngestResponse(
+                type="channel",
+                status="skipped",
+                message=f"No new videos from {result.channel_name} since last sync",
+                details=details,
+            )
+        return IngestResponse(
+            type="channel",
+            status="error",
+            message="No videos found in specified time range",
+            details=details,
+        )
+
+    return IngestResponse(
+        type="channel",
+        status="queued",
+        message=f"Queued {result.video_count} videos from {result.channel_name}",
+        details={
+            "filename": result.csv_path.name,
+            "video_count": result.video_count,
+            **details,
+        },
+    )
+
 
 async def ingest_article(url: str) -> IngestResponse:
     """Ingest a webpage/article using Docling and store in MinIO."""
@@ -408,7 +300,7 @@ async def ingest_url(request: IngestRequest) -> IngestResponse:
 
     Automatically detects URL type and processes accordingly:
     - YouTube videos: Immediate ingestion (transcript + cache)
-    - YouTube channels: Fetch video list → CSV queue
+    - YouTube channels: Fetch uploads not yet synced → CSV queue
     - Articles/webpages: Docling extraction → cache
     """
     url_type = detect_url_type(request.url)
@@ -416,7 +308,7 @@ async def ingest_url(request: IngestRequest) -> IngestResponse:
     if url_type == "video":
         return await ingest_video(request.url)
     elif url_type == "channel":
-        return await ingest_channel(request.url, request.channel_limit)
+        return await ingest_channel(request.url, request.channel_limit, request.full_sync)
     else:
         return await ingest_article(request.url)
 
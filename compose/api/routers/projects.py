@@ -1,9 +1,11 @@
 """Projects REST API router."""
 
 import asyncio
+import re
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Request, UploadFile, File, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from compose.services.projects import (
@@ -51,6 +53,9 @@ def delete_file_from_index(project_id: str, file_id: str) -> None:
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+# Upload size limit
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+
 
 class CreateProjectRequest(BaseModel):
     """Request to create a new project."""
@@ -189,7 +194,7 @@ async def process_file_background(
         )
 
         # Update file record with processing status
-        service.mark_file_processed(
+        await service.mark_file_processed(
             project_id=project_id,
             file_id=file_id,
             vector_indexed=result.get("success", False),
@@ -203,7 +208,7 @@ async def process_file_background(
 
     except Exception as e:
         print(f"Background file processing error: {e}")
-        service.mark_file_processed(
+        await service.mark_file_processed(
             project_id=project_id,
             file_id=file_id,
             vector_indexed=False,
@@ -220,11 +225,13 @@ async def upload_file(
     """Upload a file to a project.
 
     The file will be stored and processed in the background (text extraction, RAG indexing).
+    The upload is streamed from its spooled temporary file to MinIO, so it is
+    never held in memory as a whole.
     """
     service = get_project_service()
 
     # Check project exists
-    project = service.get_project(project_id)
+    project = await service.get_project(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
@@ -232,31 +239,32 @@ async def upload_file(
     if not file.filename:
         raise HTTPException(status_code=400, detail="Filename required")
 
-    # Read file data
-    file_data = await file.read()
-
     # Size limit: 50MB
-    if len(file_data) > 50 * 1024 * 1024:
+    size_bytes = file.size
+    if size_bytes is None:
+        size_bytes = await asyncio.to_thread(_upload_size, file)
+    if size_bytes > MAX_UPLOAD_BYTES:
         raise HTTPException(status_code=400, detail="File too large (max 50MB)")
 
     # Sanitize filename
-    import re
     safe_filename = re.sub(r'[^\w\-_\.]', '_', file.filename)
 
     # Add file to project
-    file_record = service.add_file(
+    await file.seek(0)
+    file_record = await service.add_file(
         project_id=project_id,
         filename=safe_filename,
         original_filename=file.filename,
         content_type=file.content_type or "application/octet-stream",
-        file_data=file_data,
+        file_data=file.file,
+        size_bytes=size_bytes,
     )
 
     if not file_record:
         raise HTTPException(status_code=500, detail="Failed to save file")
 
     # Get file path for processing
-    file_path = service.get_file_path(project_id, file_record.id)
+    file_path = await service.get_file_path(project_id, file_record.id)
 
     # Queue background processing
     if file_path:
@@ -288,6 +296,87 @@ async def get_file_info(project_id: str, file_id: str):
     raise HTTPException(status_code=404, detail="File not found")
 
 
+@router.get("/{project_id}/files/{file_id}/content")
+async def download_file(project_id: str, file_id: str, request: Request):
+    """Stream a file's content.
+
+    Supports single-range ``Range: bytes=...`` requests (206 Partial Content),
+    so large PDFs can be viewed and resumed without downloading them whole.
+    """
+    service = get_project_service()
+    file = await service.get_file(project_id, file_id)
+
+    if not file:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    size = file.size_bytes
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'inline; filename="{file.filename}"',
+    }
+    status_code = 200
+    offset, length = 0, size
+
+    range_header = request.headers.get("range")
+    if range_header:
+        byte_range = _parse_range(range_header, size)
+        if byte_range is None:
+            raise HTTPException(
+                status_code=416,
+                detail="Requested range not satisfiable",
+                headers={"Content-Range": f"bytes */{size}"},
+            )
+        start, end = byte_range
+        offset, length = start, end - start + 1
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        status_code = 206
+
+    headers["Content-Length"] = str(length)
+    if length == 0:
+        # Empty file: a zero length would mean "to the end" for MinIO
+        content = iter(())
+    else:
+        content = service.iter_file_content(project_id, file_id, offset=offset, length=length)
+
+    return StreamingResponse(
+        content,
+        status_code=status_code,
+        media_type=file.content_type or "application/octet-stream",
+        headers=headers,
+    )
+
+
+def _upload_size(file: UploadFile) -> int:
+    """Measure an upload by seeking its spooled file to the end."""
+    file.file.seek(0, 2)
+    return file.file.tell()
+
+
+def _parse_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """Parse a single ``bytes=`` range into inclusive (start, end).
+
+    Returns None if the range is malformed, has several parts, or lies
+    outside the file.
+    """
+    match = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header)
+    if not match or not any(match.groups()):
+        return None
+
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            return None
+        return max(size - suffix, 0), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return None
+    return start, end
+
+
 @router.delete("/{project_id}/files/{file_id}")
 async def delete_file(project_id: str, file_id: str):
     """Delete a file from a project and remove from index."""
@@ -1,8 +1,11 @@
 """Stats API router with SSE for real-time dashboard updates.
 
-Worker progress is stored in SurrealDB worker_progress table and polled for updates.
-LIVE SELECT (push-based) is not yet available in the Python SDK (PR #200 merged Oct 2025,
-but not released to PyPI yet as of Nov 2025). Will upgrade when SDK 1.0.7+ is released.
+Worker progress is stored in SurrealDB worker_progress table. Changes are pushed
+through compose.services.progress_feed (LIVE SELECT, or in-process events when the
+worker is co-located); without either, the table is polled as before.
+
+SSE clients share one StatsBroadcaster per process: each stats section is
+refreshed on its own cadence and only changed sections are pushed.
 """
 
 import asyncio
@@ -11,6 +14,7 @@ import logging
 import os
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, AsyncGenerator, Optional
 
 import httpx
 from fastapi import APIRouter
@@ -22,31 +26,33 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["stats"])
 
 # Configuration
-SURREALDB_URL = os.getenv("SURREALDB_URL", "http://localhost:8000")
-MINIO_URL = os.getenv("MINIO_URL", "http://localhost:9000")
 WEBSHARE_API_TOKEN = os.getenv("WEBSHARE_API_TOKEN", "")
-INFINITY_URL = os.getenv("INFINITY_URL", "http://localhost:7997")
 
 # Queue paths (container paths - data mounted at /app/src/compose/data)
 QUEUE_BASE = Path(os.getenv("QUEUE_BASE", "/app/src/compose/data/queues"))
 ARCHIVE_BASE = Path(os.getenv("ARCHIVE_BASE", "/app/src/compose/data/archive"))
 
-# Polling interval (seconds) - will upgrade to LIVE SELECT when SDK supports it
+# Polling interval (seconds) when worker progress is not pushed by the progress feed
 POLL_INTERVAL_ACTIVE = 1.0  # Fast polling when workers are active
 POLL_INTERVAL_IDLE = 3.0    # Slower polling when idle
 
+# Refresh cadence (seconds) per section for the shared SSE collector.
+# "queue" uses POLL_INTERVAL_ACTIVE/POLL_INTERVAL_IDLE depending on worker activity.
+SECTION_INTERVALS = {
+    "queue": POLL_INTERVAL_ACTIVE,
+    "recent_activity": 5.0,
+    "cache": 10.0,
+    "archive": 30.0,
+    "health": 15.0,
+    "webshare": 300.0,
+}
 
-async def get_queue_stats() -> dict:
-    """Get queue directory statistics with worker progress from queue."""
-    pending_dir = QUEUE_BASE / "pending"
-    processing_dir = QUEUE_BASE / "processing"
-    completed_dir = QUEUE_BASE / "completed"
+# Max wait for the first full snapshot before sending what is available
+INITIAL_SNAPSHOT_TIMEOUT = 3.0
 
-    pending_files = list(pending_dir.glob("*.csv")) if pending_dir.exists() else []
-    processing_files = list(processing_dir.glob("*.csv")) if processing_dir.exists() else []
-    completed_files = list(completed_dir.glob("*.csv")) if completed_dir.exists() else []
 
-    # Get active workers from SurrealDB worker_progress table
+async def get_active_workers() -> list[dict]:
+    """Get worker progress rows from SurrealDB, most recently updated first."""
     active_workers = []
     try:
         from compose.services.surrealdb.driver import execute_query
@@ -68,6 +74,27 @@ async def get_queue_stats() -> dict:
         # Non-critical - dashboard can still show queue stats without worker progress
         logger.error(f"Failed to fetch worker progress from SurrealDB: {e}")
 
+    return active_workers
+
+
+async def get_queue_stats(include_workers: bool = True) -> dict:
+    """Get queue directory statistics with worker progress from queue.
+
+    Args:
+        include_workers: Query SurrealDB for worker progress (skip when
+            progress is already pushed via the progress feed)
+    """
+    pending_dir = QUEUE_BASE / "pending"
+    processing_dir = QUEUE_BASE / "processing"
+    completed_dir = QUEUE_BASE / "completed"
+
+    pending_files = list(pending_dir.glob("*.csv")) if pending_dir.exists() else []
+    processing_files = list(processing_dir.glob("*.csv")) if processing_dir.exists() else []
+    completed_files = list(completed_dir.glob("*.csv")) if completed_dir.exists() else []
+
+    # Get active workers from SurrealDB worker_progress table
+    active_workers = await get_active_workers() if include_workers else []
+
     return {
         "pending_count": len(pending_files),
         "pending_files": [f.name for f in pending_files],
@@ -217,94 +244,26 @@ def is_local_url(url: str) -> bool:
 
 
 async def get_service_health() -> dict:
-    """Check health of dependent services."""
-    surrealdb_ok = False
-    minio_ok = False
-    infinity_ok = False
-    ollama_ok = False
-    queue_worker_ok = False
-    n8n_ok = False
-    docling_ok = False
-
-    # Check SurrealDB
-    try:
-        from compose.services.surrealdb import verify_connection
-        await verify_connection()
-        surrealdb_ok = True
-    except Exception:
-        pass
-
-    # Check MinIO
-    try:
-        from compose.services.minio import create_minio_client
-        client = create_minio_client()
-        client.ensure_bucket()
-        minio_ok = True
-    except Exception:
-        pass
-
-    # Check Infinity
-    try:
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(f"{INFINITY_URL}/health")
-            infinity_ok = response.status_code == 200
-    except Exception:
-        pass
-
-    # Check Ollama
-    ollama_url = os.getenv("OLLAMA_URL", "http://192.168.16.241:11434")
-    try:
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(f"{ollama_url}/api/tags")
-            ollama_ok = response.status_code == 200
-    except Exception:
-        pass
-
-    # Check Queue Worker via SurrealDB (if any workers have reported progress recently)
-    try:
-        from compose.services.surrealdb.driver import execute_query
-
-        # Check if worker_progress table has any recent entries (within last 60 seconds)
-        query = "SELECT * FROM worker_progress WHERE updated_at > time::now() - 60s;"
-        results = await execute_query(query)
-
-        if results:
-            queue_worker_ok = True  # Workers are actively reporting
-        else:
-            # No recent progress, but check if directories exist (worker is idle but healthy)
-            pending_dir = QUEUE_BASE / "pending"
-            if pending_dir.exists():
-                queue_worker_ok = True
-    except Exception:
-        pass
-
-    # Check n8n (workflow automation) - remote server
-    n8n_url = os.getenv("N8N_URL", "http://192.168.16.241:5678")
-    try:
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(f"{n8n_url}/healthz")
-            n8n_ok = response.status_code == 200
-    except Exception:
-        pass
-
-    # Check Docling (document processing) - remote server
-    docling_url = os.getenv("DOCLING_URL", "http://192.168.16.241:5001")
-    try:
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(f"{docling_url}/health")
-            docling_ok = response.status_code == 200
-    except Exception:
-        pass
+    """Check health of dependent services.
 
-    return {
-        "surrealdb": {"ok": surrealdb_ok, "local": is_local_url(SURREALDB_URL)},
-        "minio": {"ok": minio_ok, "local": is_local_url(MINIO_URL)},
-        "infinity": {"ok": infinity_ok, "local": is_local_url(INFINITY_URL)},
-        "ollama": {"ok": ollama_ok, "local": is_local_url(ollama_url)},
-        "queue_worker": {"ok": queue_worker_ok, "local": True},
-        "n8n": {"ok": n8n_ok, "local": is_local_url(n8n_url)},
-        "docling": {"ok": docling_ok, "local": is_local_url(docling_url)},
-    }
+    All probes run concurrently through the shared HealthMonitor, which
+    caches results briefly and backs off from services that stay down.
+    """
+    from compose.services.health import get_health_monitor, service_urls
+
+    results = await get_health_monitor().check_all()
+    urls = service_urls()
+
+    health = {}
+    for name, result in results.items():
+        # Queue worker runs alongside the API
+        local = True if name == "queue_worker" else is_local_url(urls.get(name, ""))
+        health[name] = {
+            "ok": result.ok,
+            "local": local,
+            "latency_ms": result.latency_ms,
+        }
+    return health
 
 
 def get_recent_activity() -> list:
@@ -328,45 +287,271 @@ def get_recent_activity() -> list:
     return activity
 
 
-async def generate_stats_stream():
-    """Generate stats as SSE stream with polling from SurrealDB.
+def _sse(payload: dict) -> str:
+    """Format a payload as an SSE data message."""
+    return f"data: {json.dumps(payload, default=str)}\n\n"
+
+
+class StatsBroadcaster:
+    """Per-process stats collector shared by all /stats/stream clients.
+
+    One refresh task per section keeps a cached snapshot up to date, so a
+    slow section (Webshare, health probes) never delays the queue. Each
+    subscriber gets the full snapshot on connect, then only the sections
+    whose content changed since its last message.
 
-    Polls worker_progress table from SurrealDB at adaptive intervals:
-    - 1 second when workers are active (for responsive progress updates)
-    - 3 seconds when idle (to reduce load)
+    Collection starts with the first subscriber and stops when the last
+    one disconnects.
 
-    TODO: Upgrade to LIVE SELECT push-based updates when surrealdb SDK 1.0.7+ is released.
-    See: https://github.com/surrealdb/surrealdb.py/pull/200
+    Example:
+        >>> broadcaster = get_stats_broadcaster()
+        >>> async for message in broadcaster.stream():
+        ...     print(message)
     """
-    last_worker_count = 0
 
-    while True:
+    def __init__(self, intervals: Optional[dict[str, float]] = None):
+        """Initialize broadcaster.
+
+        Args:
+            intervals: Refresh cadence per section (default: SECTION_INTERVALS)
+        """
+        self.intervals = dict(intervals or SECTION_INTERVALS)
+        self.snapshot: dict[str, Any] = {}
+        self.versions: dict[str, int] = {}
+        self.subscriber_count = 0
+        # Set on shutdown: subscriber streams end after their next wake-up
+        self.closed = False
+        # Worker progress keyed by worker_id while the progress feed is live
+        # (None = poll worker_progress with the queue section)
+        self.workers: Optional[dict[str, dict]] = None
+        self._attempted: set[str] = set()
+        self._tasks: list[asyncio.Task] = []
+        self._changed = asyncio.Event()
+        self._ready = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        """Whether refresh tasks are active."""
+        return bool(self._tasks)
+
+    async def _collect(self, section: str) -> Any:
+        """Fetch the current value of one stats section."""
+        if section == "queue":
+            if self.workers is not None:
+                stats = await get_queue_stats(include_workers=False)
+                stats["active_workers"] = self._worker_list()
+                return stats
+            return await get_queue_stats()
+        if section == "cache":
+            return await get_cache_stats()
+        if section == "archive":
+            # Filesystem walk - keep it off the event loop
+            return await asyncio.to_thread(get_archive_stats)
+        if section == "health":
+            return await get_service_health()
+        if section == "recent_activity":
+            return await asyncio.to_thread(get_recent_activity)
+        if section == "webshare":
+            return await get_webshare_stats()
+        raise ValueError(f"Unknown stats section: {section}")
+
+    def _interval(self, section: str) -> float:
+        """Refresh interval for a section (queue adapts to worker activity)."""
+        if section == "queue":
+            if self.workers is not None:
+                # Progress is pushed; only queue directories are polled
+                return POLL_INTERVAL_IDLE
+            active = (self.snapshot.get("queue") or {}).get("active_workers")
+            return POLL_INTERVAL_ACTIVE if active else POLL_INTERVAL_IDLE
+        return self.intervals[section]
+
+    def _publish(self) -> None:
+        """Wake all subscribers waiting for changes."""
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def update(self, section: str, value: Any) -> bool:
+        """Store a section value, notifying subscribers if it changed.
+
+        Args:
+            section: Section name
+            value: Freshly collected section value
+
+        Returns:
+            True if the value differs from the cached one
+        """
+        self._attempted.add(section)
+        changed = section not in self.snapshot or self.snapshot[section] != value
+        if changed:
+            self.snapshot[section] = value
+            self.versions[section] = self.versions.get(section, 0) + 1
+        if self._attempted >= set(self.intervals):
+            self._ready.set()
+        if changed:
+            self._publish()
+        return changed
+
+    async def _refresh_loop(self, section: str) -> None:
+        """Refresh one section forever at its own cadence."""
+        while True:
+            try:
+                value = await self._collect(section)
+            except Exception as e:
+                # Keep serving the last good value
+                logger.error(f"Failed to refresh stats section {section}: {e}")
+                self._attempted.add(section)
+                if self._attempted >= set(self.intervals):
+                    self._ready.set()
+            else:
+                self.update(section, value)
+            await asyncio.sleep(self._interval(section))
+
+    def _worker_list(self) -> list[dict]:
+        """Pushed worker progress, most recently updated first."""
+        return sorted(
+            (self.workers or {}).values(),
+            key=lambda w: str(w.get("updated_at") or ""),
+            reverse=True,
+        )
+
+    def _apply_workers(self) -> None:
+        """Merge pushed worker progress into the cached queue section."""
+        if "queue" not in self.snapshot:
+            return
+        queue = dict(self.snapshot["queue"])
+        queue["active_workers"] = self._worker_list()
+        self.update("queue", queue)
+
+    async def _reload_workers(self) -> None:
+        """Re-read worker_progress (after a LIVE notification)."""
+        self.workers = {w["worker_id"]: w for w in await get_active_workers()}
+
+    async def _progress_loop(self) -> None:
+        """Apply pushed worker progress events to the queue section."""
+        from compose.services.progress_feed import get_progress_hub, start_progress_feed
+
+        if not await start_progress_feed():
+            return  # Keep polling worker_progress with the queue section
+
+        async with get_progress_hub().subscribe() as events:
+            try:
+                await self._reload_workers()
+                self._apply_workers()
+                while True:
+                    event = await events.get()
+                    refresh = False
+                    # Drain bursts so one re-read covers many notifications
+                    while True:
+                        if event.action == "update":
+                            self.workers[event.worker_id] = event.record
+                        elif event.action == "delete":
+                            self.workers.pop(event.worker_id, None)
+                        else:
+                            refresh = True
+                        if events.empty():
+                            break
+                        event = events.get_nowait()
+                    if refresh:
+                        await self._reload_workers()
+                    self._apply_workers()
+            finally:
+                self.workers = None
+
+    def start(self) -> None:
+        """Start refresh tasks if not already running."""
+        if self.running:
+            return
+        self._tasks = [
+            asyncio.create_task(self._refresh_loop(section), name=f"stats-{section}")
+            for section in self.intervals
+        ]
+        if "queue" in self.intervals:
+            self._tasks.append(
+                asyncio.create_task(self._progress_loop(), name="stats-progress")
+            )
+
+    def stop(self) -> None:
+        """Cancel refresh tasks (cached snapshot is kept)."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    def close(self) -> None:
+        """End all subscriber streams and stop refreshing (app shutdown)."""
+        self.closed = True
+        self.stop()
+        self._publish()
+
+    async def stream(self) -> AsyncGenerator[str, None]:
+        """Yield SSE messages for one subscriber.
+
+        The first message is the full snapshot; later messages contain only
+        changed sections plus a timestamp.
+        """
+        if self.closed:
+            return
+        self.subscriber_count += 1
+        self.start()
         try:
-            stats = {
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=INITIAL_SNAPSHOT_TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
+
+            sent = dict(self.versions)
+            yield _sse({
                 "timestamp": datetime.now(timezone.utc).isoformat(),
-                "queue": await get_queue_stats(),
-                "cache": await get_cache_stats(),
-                "archive": get_archive_stats(),
-                "health": await get_service_health(),
-                "recent_activity": get_recent_activity(),
-                "webshare": await get_webshare_stats(),
-            }
-            yield f"data: {json.dumps(stats)}\n\n"
+                **self.snapshot,
+            })
 
-            # Adaptive polling: faster when workers are active
-            current_worker_count = len(stats["queue"].get("active_workers", []))
-            if current_worker_count > 0:
-                poll_interval = POLL_INTERVAL_ACTIVE
-            else:
-                poll_interval = POLL_INTERVAL_IDLE
+            while not self.closed:
+                changed_event = self._changed
+                changed = [s for s, v in self.versions.items() if sent.get(s) != v]
+                if not changed:
+                    await changed_event.wait()
+                    continue
+
+                payload: dict[str, Any] = {"timestamp": datetime.now(timezone.utc).isoformat()}
+                for section in changed:
+                    payload[section] = self.snapshot[section]
+                    sent[section] = self.versions[section]
+                yield _sse(payload)
+        finally:
+            self.subscriber_count -= 1
+            if self.subscriber_count == 0:
+                self.stop()
+
+
+_broadcaster: Optional[StatsBroadcaster] = None
+
+
+def get_stats_broadcaster() -> StatsBroadcaster:
+    """Get the process-wide stats broadcaster singleton."""
+    global _broadcaster
+    if _broadcaster is None:
+        _broadcaster = StatsBroadcaster()
+    return _broadcaster
 
-            last_worker_count = current_worker_count
-            await asyncio.sleep(poll_interval)
 
-        except Exception as e:
-            error_data = {"error": str(e), "timestamp": datetime.now(timezone.utc).isoformat()}
-            yield f"data: {json.dumps(error_data)}\n\n"
-            await asyncio.sleep(POLL_INTERVAL_IDLE)
+def reset_stats_broadcaster() -> None:
+    """Stop and discard the broadcaster singleton (for testing)."""
+    global _broadcaster
+    if _broadcaster is not None:
+        _broadcaster.stop()
+    _broadcaster = None
+
+
+async def generate_stats_stream():
+    """Generate stats as SSE stream from the shared broadcaster.
+
+    Sections refresh on their own cadence (see SECTION_INTERVALS); the queue
+    section polls SurrealDB worker_progress every second while workers are
+    active and every 3 seconds when idle, unless the progress feed pushes
+    worker changes (SurrealDB LIVE SELECT or in-process events).
+
+    """
+    async for message in get_stats_broadcaster().stream():
+        yield message
 
 
 @router.get("/stats")
@@ -387,11 +572,9 @@ async def get_stats():
 async def stats_stream():
     """SSE endpoint for real-time stats updates.
 
-    Uses adaptive polling from SurrealDB worker_progress table:
-    - 1 second intervals when workers are actively processing
-    - 3 second intervals when idle
-
-    Will upgrade to LIVE SELECT push-based updates when SDK supports it.
+    The first event is the full stats snapshot; later events carry only the
+    sections that changed (clients merge them into their copy). Worker
+    progress is pushed as it happens when the progress feed is available.
     """
     return StreamingResponse(
         generate_stats_stream(),
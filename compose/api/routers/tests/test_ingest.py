@@ -58,7 +58,7 @@ class TestIngestRequestModel:
 
     def test_model_fields(self):
         """Verify model has exactly the expected fields."""
-        expected_fields = {"url", "channel_limit"}
+        expected_fields = {"url", "channel_limit", "full_sync"}
         actual_fields = set(IngestRequest.model_fields.keys())
         assert actual_fields == expected_fields
 
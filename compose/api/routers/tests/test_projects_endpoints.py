@@ -341,6 +341,119 @@ class TestGetFileInfoEndpoint:
             assert exc_info.value.detail == "File not found"
 
 
+@pytest.fixture
+def file_client():
+    """TestClient for the projects router backed by in-memory fakes."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from compose.api.routers.projects import router
+    from compose.services.projects import ProjectService
+    from compose.services.tests.fakes import FakeDatabaseExecutor, FakeMinIOClient
+
+    fake_db = FakeDatabaseExecutor()
+    fake_db.tables["project"] = [{"id": "proj-123", "name": "Test"}]
+    service = ProjectService(db=fake_db, minio=FakeMinIOClient())
+
+    app = FastAPI()
+    app.include_router(router)
+    with patch("compose.api.routers.projects.get_project_service", return_value=service):
+        with TestClient(app) as client:
+            yield client, service
+
+
+@pytest.mark.unit
+class TestFileStreaming:
+    """Test streamed upload and ranged download endpoints."""
+
+    def _upload(self, client, content=b"0123456789"):
+        response = client.post(
+            "/projects/proj-123/files",
+            files={"file": ("report v1.pdf", content, "application/pdf")},
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def test_upload_streams_to_minio(self, file_client):
+        """Uploads are stored without reading them into memory first."""
+        client, service = file_client
+
+        record = self._upload(client)
+
+        assert record["filename"] == "report_v1.pdf"
+        assert record["size_bytes"] == 10
+        assert list(service.minio.objects.values()) == [b"0123456789"]
+
+    def test_upload_too_large(self, file_client):
+        """Uploads over the size limit are rejected before storage."""
+        client, service = file_client
+
+        with patch("compose.api.routers.projects.MAX_UPLOAD_BYTES", 5):
+            response = client.post(
+                "/projects/proj-123/files",
+                files={"file": ("big.bin", b"0123456789", "application/octet-stream")},
+            )
+
+        assert response.status_code == 400
+        assert service.minio.objects == {}
+
+    def test_download_whole_file(self, file_client):
+        """Downloads stream the full content with range support advertised."""
+        client, _ = file_client
+        record = self._upload(client)
+
+        response = client.get(f"/projects/proj-123/files/{record['id']}/content")
+
+        assert response.status_code == 200
+        assert response.content == b"0123456789"
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-type"] == "application/pdf"
+
+    @pytest.mark.parametrize(
+        "range_header, body, content_range",
+        [
+            ("bytes=2-5", b"2345", "bytes 2-5/10"),
+            ("bytes=7-", b"789", "bytes 7-9/10"),
+            ("bytes=-3", b"789", "bytes 7-9/10"),
+            ("bytes=8-100", b"89", "bytes 8-9/10"),
+        ],
+    )
+    def test_download_range(self, file_client, range_header, body, content_range):
+        """Range requests return 206 with the requested bytes."""
+        client, _ = file_client
+        record = self._upload(client)
+
+        response = client.get(
+            f"/projects/proj-123/files/{record['id']}/content",
+            headers={"Range": range_header},
+        )
+
+        assert response.status_code == 206
+        assert response.content == body
+        assert response.headers["content-range"] == content_range
+
+    def test_download_unsatisfiable_range(self, file_client):
+        """Ranges past the end of the file return 416."""
+        client, _ = file_client
+        record = self._upload(client)
+
+        response = client.get(
+            f"/projects/proj-123/files/{record['id']}/content",
+            headers={"Range": "bytes=10-"},
+        )
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */10"
+
+    def test_download_missing_file(self, file_client):
+        """Unknown files return 404."""
+        client, _ = file_client
+
+        response = client.get("/projects/proj-123/files/nope/content")
+
+        assert response.status_code == 404
+
+
 @pytest.mark.unit
 class TestDeleteFileEndpoint:
     """Test delete_file endpoint behavior."""
@@ -3,6 +3,8 @@
 Run with: uv run pytest compose/api/routers/tests/test_stats_endpoints.py
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, AsyncMock
 from datetime import datetime
@@ -520,3 +522,207 @@ class TestGetStatsEndpoint:
 
         # Should not raise - valid ISO format
         datetime.fromisoformat(result["timestamp"].replace("Z", "+00:00"))
+
+
+# -----------------------------------------------------------------------------
+# StatsBroadcaster Tests
+# -----------------------------------------------------------------------------
+
+
+def _parse_sse(message: str) -> dict:
+    import json
+
+    assert message.startswith("data: ")
+    return json.loads(message[len("data: "):])
+
+
+@pytest.mark.unit
+class TestStatsBroadcaster:
+    """Test the shared SSE stats broadcaster."""
+
+    @pytest.mark.asyncio
+    async def test_update_tracks_changes(self):
+        """Only differing values bump the section version."""
+        from compose.api.routers.stats import StatsBroadcaster
+
+        broadcaster = StatsBroadcaster(intervals={"cache": 10.0})
+
+        assert broadcaster.update("cache", {"total": 1}) is True
+        assert broadcaster.update("cache", {"total": 1}) is False
+        assert broadcaster.update("cache", {"total": 2}) is True
+        assert broadcaster.versions["cache"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_sends_snapshot_then_changed_sections(self):
+        """Subscribers get the full snapshot, then only changed sections."""
+        from compose.api.routers.stats import StatsBroadcaster
+
+        broadcaster = StatsBroadcaster(intervals={"cache": 10.0, "archive": 10.0})
+        broadcaster.start = lambda: None  # drive updates manually
+        broadcaster.update("cache", {"total": 1})
+        broadcaster.update("archive", {"total_videos": 5})
+
+        stream = broadcaster.stream()
+        first = _parse_sse(await stream.__anext__())
+        assert first["cache"] == {"total": 1}
+        assert first["archive"] == {"total_videos": 5}
+
+        broadcaster.update("archive", {"total_videos": 5})  # unchanged
+        broadcaster.update("cache", {"total": 2})
+        second = _parse_sse(await stream.__anext__())
+        assert second["cache"] == {"total": 2}
+        assert "archive" not in second
+        assert "timestamp" in second
+
+        await stream.aclose()
+        assert broadcaster.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_collection(self):
+        """Concurrent subscribers reuse one refresh per section."""
+        import asyncio
+        from compose.api.routers.stats import StatsBroadcaster
+
+        health = AsyncMock(return_value={"surrealdb": {"ok": True, "local": True}})
+        broadcaster = StatsBroadcaster(intervals={"health": 60.0})
+
+        with patch("compose.api.routers.stats.get_service_health", health):
+            streams = [broadcaster.stream() for _ in range(3)]
+            messages = await asyncio.gather(*(s.__anext__() for s in streams))
+            assert broadcaster.running
+            for s in streams:
+                await s.aclose()
+
+        assert health.await_count == 1
+        assert all(_parse_sse(m)["health"]["surrealdb"]["ok"] for m in messages)
+        assert not broadcaster.running
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_last_value(self):
+        """A failing section does not block the snapshot or drop old data."""
+        from compose.api.routers.stats import StatsBroadcaster
+
+        broadcaster = StatsBroadcaster(intervals={"webshare": 60.0})
+        broadcaster.snapshot["webshare"] = {"status": "ok", "used_gb": 1.0}
+
+        with patch(
+            "compose.api.routers.stats.get_webshare_stats",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("api down"),
+        ):
+            stream = broadcaster.stream()
+            first = _parse_sse(await stream.__anext__())
+            await stream.aclose()
+
+        assert first["webshare"] == {"status": "ok", "used_gb": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_close_ends_subscriber_streams(self):
+        """Closing the broadcaster (app shutdown) ends open streams."""
+        from compose.api.routers.stats import StatsBroadcaster
+
+        broadcaster = StatsBroadcaster(intervals={"webshare": 60.0})
+
+        with patch(
+            "compose.api.routers.stats.get_webshare_stats",
+            new_callable=AsyncMock,
+            return_value={"status": "ok"},
+        ):
+            stream = broadcaster.stream()
+            await stream.__anext__()
+            pending = asyncio.ensure_future(stream.__anext__())
+            await asyncio.sleep(0)
+            broadcaster.close()
+
+            with pytest.raises(StopAsyncIteration):
+                await asyncio.wait_for(pending, timeout=1)
+
+        assert not broadcaster.running
+        assert broadcaster.subscriber_count == 0
+
+
+# -----------------------------------------------------------------------------
+# get_service_health Tests
+# -----------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestGetServiceHealth:
+    """Test get_service_health mapping of monitor results."""
+
+    @pytest.mark.asyncio
+    async def test_maps_monitor_results(self):
+        """Monitor results become ok/local/latency entries per service."""
+        from unittest.mock import MagicMock
+        from compose.api.routers.stats import get_service_health
+        from compose.services.health import ProbeResult
+
+        monitor = MagicMock()
+        monitor.check_all = AsyncMock(return_value={
+            "surrealdb": ProbeResult(ok=True, latency_ms=3.2),
+            "queue_worker": ProbeResult(ok=False, latency_ms=1.0),
+        })
+
+        with (
+            patch("compose.services.health.get_health_monitor", return_value=monitor),
+            patch(
+                "compose.services.health.service_urls",
+                return_value={"surrealdb": "http://surrealdb:8000"},
+            ),
+        ):
+            health = await get_service_health()
+
+        assert health["surrealdb"] == {"ok": True, "local": True, "latency_ms": 3.2}
+        assert health["queue_worker"]["ok"] is False
+        assert health["queue_worker"]["local"] is True
+
+
+@pytest.mark.unit
+class TestStatsBroadcasterProgressFeed:
+    """Test pushed worker progress in the stats broadcaster."""
+
+    @pytest.mark.asyncio
+    async def test_pushed_progress_updates_queue_section(self):
+        """Progress events reach subscribers without re-polling worker_progress."""
+        import asyncio
+        from compose.api.routers.stats import StatsBroadcaster
+        from compose.services import progress_feed
+
+        progress_feed.reset_progress_feed()
+        queue_stats = {
+            "pending_count": 0,
+            "pending_files": [],
+            "processing_count": 1,
+            "processing_files": ["a.csv"],
+            "completed_count": 0,
+            "completed_files": [],
+            "active_workers": [],
+        }
+        active_workers = AsyncMock(return_value=[])
+        broadcaster = StatsBroadcaster(intervals={"queue": 60.0})
+
+        with (
+            patch(
+                "compose.api.routers.stats.get_queue_stats",
+                new_callable=AsyncMock,
+                return_value=queue_stats,
+            ),
+            patch("compose.api.routers.stats.get_active_workers", active_workers),
+            patch.object(progress_feed, "PROGRESS_FEED_MODE", "local"),
+        ):
+            stream = broadcaster.stream()
+            first = _parse_sse(await stream.__anext__())
+            assert first["queue"]["active_workers"] == []
+
+            # Let the progress loop subscribe before publishing
+            for _ in range(5):
+                await asyncio.sleep(0)
+            progress_feed.publish_progress("w1", {"worker_id": "w1", "completed": 2, "total": 10})
+
+            update = _parse_sse(await asyncio.wait_for(stream.__anext__(), timeout=1.0))
+            await stream.aclose()
+
+        assert update["queue"]["active_workers"] == [{"worker_id": "w1", "completed": 2, "total": 10}]
+        assert update["queue"]["processing_count"] == 1
+        assert active_workers.await_count == 1  # initial seed only
+        progress_feed.reset_progress_feed()
@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 
 from compose.services.vaults import (
@@ -114,15 +114,42 @@ async def delete_vault(vault_id: str):
     return {"status": "deleted", "id": vault_id}
 
 
-@router.get("/{vault_id}/tree", response_model=FileTreeResponse)
-async def get_file_tree(vault_id: str):
-    """Get file tree structure for a vault."""
+@router.get(
+    "/{vault_id}/tree",
+    response_model=FileTreeResponse,
+    responses={304: {"description": "Tree unchanged since the ETag in If-None-Match"}},
+)
+async def get_file_tree(
+    vault_id: str,
+    request: Request,
+    response: Response,
+    path: Optional[str] = Query(
+        None, description="Return only this folder's direct children ('' for the root)"
+    ),
+):
+    """Get file tree structure for a vault.
+
+    Without ``path`` the full tree is returned. With ``path`` only that
+    folder's level is returned, for lazy expansion in the sidebar. Responses
+    carry an ETag; send it back in If-None-Match to get a 304 while the tree
+    is unchanged.
+    """
     service = get_vault_service()
 
-    # Verify vault exists
-    vault = await service.get_vault(vault_id)
-    if not vault:
+    if not await service.vault_exists(vault_id):
         raise HTTPException(status_code=404, detail="Vault not found")
 
-    tree = await service.get_file_tree(vault_id)
-    return FileTreeResponse(tree=tree)
+    tree = await service.get_vault_tree(vault_id)
+    headers = {"ETag": tree.etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == tree.etag:
+        return Response(status_code=304, headers=headers)
+
+    if path is None:
+        nodes = tree.nodes()
+    else:
+        nodes = tree.level(path)
+        if nodes is None:
+            raise HTTPException(status_code=404, detail="Folder not found")
+
+    response.headers.update(headers)
+    return FileTreeResponse(tree=nodes)
@@ -8,9 +8,12 @@ Usage:
     # Process single video
     uv run python tools/scripts/filter_description_urls.py VIDEO_ID
 
-    # Process all archives
+    # Process all archives (resumes from checkpoint if a previous run was interrupted)
     uv run python tools/scripts/filter_description_urls.py --all
 
+    # Ignore checkpoint and start a fresh full pass
+    uv run python tools/scripts/filter_description_urls.py --all --restart
+
     # Dry run (show what would be filtered)
     uv run python tools/scripts/filter_description_urls.py VIDEO_ID --dry-run
 
@@ -18,8 +21,12 @@ Usage:
     uv run python tools/scripts/filter_description_urls.py VIDEO_ID --heuristic-only
 """
 
+import os
 import sys
 import json
+import asyncio
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -29,8 +36,15 @@ from compose.cli.base import setup_script_environment
 setup_script_environment()
 
 from compose.services.archive import create_archive_manager
-from compose.services.youtube.url_filter import filter_urls
+from compose.services.youtube.url_filter import (
+    LLM_MAX_CONCURRENCY,
+    apply_heuristic_filter,
+    classify_filtered_urls,
+    extract_urls,
+    filter_urls,
+)
 from compose.services.analytics import create_pattern_tracker
+from compose.services.analytics.factory import create_async_pattern_tracker
 
 
 def safe_print(text: str, **kwargs) -> None:
@@ -90,6 +104,122 @@ def clear_progress() -> None:
         PROGRESS_FILE.unlink()
 
 
+# Resumable checkpoint for --all runs
+CHECKPOINT_FILE = Path("compose/data/archive/.url_filter_checkpoint.json")
+
+# Batch job tuning
+WRITE_BATCH_SIZE = 50  # Archive updates flushed (and checkpointed) together
+VIDEO_CONCURRENCY = 16  # Videos in the async classification stage at once
+SCAN_QUEUE_FACTOR = 4  # In-flight scans per process worker
+
+
+def load_checkpoint() -> dict | None:
+    """Load checkpoint from a previous interrupted --all run (None if absent)."""
+    if not CHECKPOINT_FILE.exists():
+        return None
+    try:
+        return json.loads(CHECKPOINT_FILE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def save_checkpoint(last_path: str, last_video_id: str, processed: int) -> None:
+    """Record the last archive up to which every archive has been written.
+
+    Args:
+        last_path: Archive path (sort key) of the last contiguous completed archive
+        last_video_id: Video ID of that archive
+        processed: Number of archives completed in this run
+    """
+    checkpoint = {
+        "last_path": last_path,
+        "last_video_id": last_video_id,
+        "processed": processed,
+        "updated_at": datetime.now().isoformat(),
+    }
+    CHECKPOINT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CHECKPOINT_FILE.write_text(json.dumps(checkpoint, indent=2))
+
+
+def clear_checkpoint() -> None:
+    """Remove checkpoint file."""
+    if CHECKPOINT_FILE.exists():
+        CHECKPOINT_FILE.unlink()
+
+
+def scan_archive(archive_path: str) -> dict:
+    """Read an archive and run URL extraction + heuristics (process pool worker).
+
+    Only the small fields needed downstream are returned so full archives
+    (transcripts, LLM outputs) never cross the process boundary.
+
+    Args:
+        archive_path: Path to archive JSON file
+
+    Returns:
+        Dict with path, video_id and either "skip"/"error" or the description
+        context, all_urls and heuristic_result
+    """
+    video_id = Path(archive_path).stem
+    try:
+        with open(archive_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        return {"path": archive_path, "video_id": video_id, "error": str(e)}
+
+    metadata = data.get("youtube_metadata") or {}
+    description = metadata.get("description")
+    if not description:
+        return {
+            "path": archive_path,
+            "video_id": video_id,
+            "skip": f"No description found in archive for {video_id}",
+        }
+
+    all_urls = extract_urls(description)
+    return {
+        "path": archive_path,
+        "video_id": video_id,
+        "video_context": {
+            "video_title": metadata.get("title", "N/A"),
+            "description": description[:500],
+            "channel": metadata.get("channel_title", "N/A"),
+        },
+        "all_urls": all_urls,
+        "heuristic_result": apply_heuristic_filter(all_urls),
+    }
+
+
+def write_url_fields(archive_path: str, result: dict, filtered_at: str) -> None:
+    """Write URL filter fields into an archive's youtube_metadata atomically.
+
+    Args:
+        archive_path: Path to archive JSON file
+        result: filter_urls-style result dict
+        filtered_at: ISO timestamp to record as url_filtered_at
+    """
+    path = Path(archive_path)
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    metadata = data.setdefault("youtube_metadata", {})
+    metadata["all_urls"] = result["all_urls"]
+    metadata["blocked_urls"] = result["blocked_urls"]
+    metadata["content_urls"] = result["content_urls"]
+    metadata["marketing_urls"] = result["marketing_urls"]
+    metadata["url_filter_version"] = "v1_heuristic_llm"
+    metadata["url_filtered_at"] = filtered_at
+
+    temp_fd, temp_path = tempfile.mkstemp(suffix=".json", dir=path.parent, text=True)
+    try:
+        with open(temp_fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, default=str)
+        os.replace(temp_path, path)
+    except Exception:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
 def process_video_urls(
     video_id: str,
     archive_manager,
@@ -224,50 +354,70 @@ def process_video_urls(
     }
 
 
-def process_all_videos(
-    archive_manager,
-    pattern_tracker,
+def find_archive_files(archive_manager) -> list[Path]:
+    """List all archive files in stable (month, filename) order."""
+    youtube_dir = archive_manager.writer.youtube_dir
+    if not youtube_dir.exists():
+        return []
+
+    if archive_manager.writer.config.organize_by_month:
+        return sorted(
+            path
+            for month_dir in youtube_dir.iterdir()
+            if month_dir.is_dir()
+            for path in month_dir.glob("*.json")
+        )
+    return sorted(youtube_dir.glob("*.json"))
+
+
+async def _create_job_tracker():
+    """Create async pattern tracker for the job, or None for the SQLite backend."""
+    try:
+        return await create_async_pattern_tracker()
+    except NotImplementedError:
+        print("Note: analytics recording requires PATTERN_TRACKER_BACKEND=surrealdb, skipping")
+        return None
+
+
+async def run_filter_job(
+    archive_files: list[Path],
     dry_run: bool = False,
     use_llm: bool = True,
+    workers: int | None = None,
+    video_concurrency: int = VIDEO_CONCURRENCY,
+    llm_concurrency: int = LLM_MAX_CONCURRENCY,
+    write_batch_size: int = WRITE_BATCH_SIZE,
 ) -> dict:
-    """Process URLs for all videos in archive with pattern learning.
+    """Run the pipelined URL filter over archive files.
+
+    Stages:
+    1. Process pool reads archives and runs URL extraction + heuristics
+    2. Async stage classifies remaining URLs (learned patterns, shared LLM
+       cache, LLM calls bounded by one semaphore across all videos)
+    3. Completed results are written to archives in batches on a thread pool,
+       then the checkpoint advances to the last contiguous written archive
 
     Args:
-        archive_manager: ArchiveManager instance
-        pattern_tracker: PatternTracker instance
-        dry_run: If True, don't update archives
+        archive_files: Archive paths to process, in checkpoint order
+        dry_run: If True, don't update archives or checkpoint
         use_llm: If True, use LLM for classification
+        workers: Process pool size (defaults to CPU count)
+        video_concurrency: Videos classified concurrently
+        llm_concurrency: Max in-flight LLM requests across all videos
+        write_batch_size: Archive updates per write/checkpoint batch
 
     Returns:
-        Dict with batch processing results
+        Dict with batch processing stats
     """
-    # Get all archive files
-    youtube_dir = archive_manager.writer.youtube_dir
-
-    # Find all JSON files
-    archive_files = []
-    if archive_manager.writer.config.organize_by_month:
-        # Search in month directories
-        for month_dir in youtube_dir.iterdir():
-            if month_dir.is_dir():
-                archive_files.extend(month_dir.glob("*.json"))
-    else:
-        # Search in flat structure
-        archive_files = list(youtube_dir.glob("*.json"))
-
-    print(f"Found {len(archive_files)} archives to process")
-
-    # Initialize progress tracking
+    loop = asyncio.get_running_loop()
+    workers = workers or os.cpu_count() or 1
+    total = len(archive_files)
     started_at = datetime.now().isoformat()
-    update_progress(
-        status="running",
-        total=len(archive_files),
-        processed=0,
-        errors=0,
-        started_at=started_at,
-    )
+    filtered_at = datetime.now().isoformat()
+
+    pattern_tracker = await _create_job_tracker()
+    llm_semaphore = asyncio.Semaphore(llm_concurrency)
 
-    # Process each video
     total_stats = {
         "processed": 0,
         "skipped": 0,
@@ -279,48 +429,202 @@ def process_all_videos(
         "total_llm_cost": 0.0,
     }
 
-    for i, archive_file in enumerate(archive_files, 1):
-        video_id = archive_file.stem
-
-        # Update progress
-        update_progress(
-            status="running",
-            total=len(archive_files),
-            processed=i - 1,
-            current_video_id=video_id,
-            errors=total_stats["errors"],
-            started_at=started_at,
-        )
-
-        try:
-            result = process_video_urls(video_id, archive_manager, pattern_tracker, dry_run, use_llm)
-
-            if result["success"]:
-                total_stats["processed"] += 1
-                total_stats["total_urls"] += result["stats"]["total_urls"]
-                total_stats["content_urls"] += result["stats"]["content_urls"]
-                total_stats["blocked_urls"] += result["stats"]["blocked_urls"]
-                total_stats["marketing_urls"] += result["stats"]["marketing_urls"]
-                total_stats["total_llm_cost"] += result["stats"]["llm_cost"]
-            else:
-                total_stats["skipped"] += 1
-                print(f"  [SKIP] {result['message']}")
-
-        except Exception as e:
-            total_stats["errors"] += 1
-            print(f"  [ERROR] {video_id}: {e}")
+    # Checkpoint watermark: index of last archive with all predecessors done.
+    # Failed archives never count as completed, so the watermark stops before
+    # the first failure and a resumed run retries it.
+    position = {str(path): i for i, path in enumerate(archive_files)}
+    completed: set[int] = set()
+    failed: set[int] = set()
+    watermark = -1
+    pending_writes: list[tuple[str, dict]] = []
+    finished: list[str] = []  # paths handled since last flush (written or skipped)
+    errored: list[str] = []  # paths that failed to scan or classify since last flush
+    flush_lock = asyncio.Lock()
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=workers * SCAN_QUEUE_FACTOR)
+
+    with ProcessPoolExecutor(max_workers=workers) as scan_pool, \
+            ThreadPoolExecutor(max_workers=min(8, write_batch_size)) as write_pool:
+
+        async def flush() -> None:
+            nonlocal watermark, pending_writes, finished, errored
+            async with flush_lock:
+                writes, pending_writes = pending_writes, []
+                done, finished = finished, []
+                failures, errored = errored, []
+
+                if writes and not dry_run:
+                    outcomes = await asyncio.gather(
+                        *(
+                            loop.run_in_executor(write_pool, write_url_fields, path, result, filtered_at)
+                            for path, result in writes
+                        ),
+                        return_exceptions=True,
+                    )
+                    for (path, _), outcome in zip(writes, outcomes):
+                        if isinstance(outcome, Exception):
+                            total_stats["errors"] += 1
+                            total_stats["processed"] -= 1
+                            print(f"  [ERROR] {Path(path).stem}: write failed: {outcome}")
+                            failures.append(path)
+
+                failed.update(position[path] for path in failures)
+                completed.update(position[path] for path in done if position[path] not in failed)
+                while watermark + 1 in completed:
+                    watermark += 1
+
+                done_count = len(completed)
+                if watermark >= 0 and not dry_run:
+                    last = archive_files[watermark]
+                    save_checkpoint(str(last), last.stem, done_count)
+
+                update_progress(
+                    status="running",
+                    total=total,
+                    processed=done_count + len(failed),
+                    current_video_id=archive_files[watermark].stem if watermark >= 0 else "",
+                    errors=total_stats["errors"],
+                    started_at=started_at,
+                )
+                print(
+                    f"[{done_count + len(failed)}/{total}] processed={total_stats['processed']} "
+                    f"skipped={total_stats['skipped']} errors={total_stats['errors']} "
+                    f"llm_cost=${total_stats['total_llm_cost']:.4f}"
+                )
 
-        print("-" * 70)
+        async def produce() -> None:
+            in_flight: set[asyncio.Future] = set()
+            for path in archive_files:
+                in_flight.add(loop.run_in_executor(scan_pool, scan_archive, str(path)))
+                if len(in_flight) >= workers * SCAN_QUEUE_FACTOR:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        await queue.put(future.result())
+            for future in asyncio.as_completed(in_flight):
+                await queue.put(await future)
+            for _ in range(video_concurrency):
+                await queue.put(None)
+
+        async def consume() -> None:
+            while True:
+                scanned = await queue.get()
+                if scanned is None:
+                    return
+
+                path = scanned["path"]
+                if "error" in scanned:
+                    total_stats["errors"] += 1
+                    print(f"  [ERROR] {scanned['video_id']}: {scanned['error']}")
+                    errored.append(path)
+                    continue
+                elif "skip" in scanned:
+                    total_stats["skipped"] += 1
+                else:
+                    try:
+                        result = await classify_filtered_urls(
+                            scanned["all_urls"],
+                            scanned["heuristic_result"],
+                            scanned["video_context"],
+                            video_id=scanned["video_id"],
+                            use_llm=use_llm,
+                            pattern_tracker=pattern_tracker,
+                            semaphore=llm_semaphore,
+                        )
+                        pending_writes.append((path, result))
+                        total_stats["processed"] += 1
+                        total_stats["total_urls"] += len(result["all_urls"])
+                        total_stats["content_urls"] += len(result["content_urls"])
+                        total_stats["blocked_urls"] += len(result["blocked_urls"])
+                        total_stats["marketing_urls"] += len(result["marketing_urls"])
+                        total_stats["total_llm_cost"] += result["total_llm_cost"]
+                    except Exception as e:
+                        total_stats["errors"] += 1
+                        print(f"  [ERROR] {scanned['video_id']}: {e}")
+                        errored.append(path)
+                        continue
+
+                finished.append(path)
+                if len(finished) >= write_batch_size:
+                    await flush()
+
+        update_progress(status="running", total=total, processed=0, errors=0, started_at=started_at)
+
+        await asyncio.gather(produce(), *(consume() for _ in range(video_concurrency)))
+        await flush()
+
+    if pattern_tracker:
+        await pattern_tracker.close()
 
-    # Mark as completed
     update_progress(
         status="completed",
-        total=len(archive_files),
-        processed=len(archive_files),
+        total=total,
+        processed=len(completed) + len(failed),
         errors=total_stats["errors"],
         started_at=started_at,
     )
 
+    return total_stats
+
+
+def process_all_videos(
+    archive_manager,
+    dry_run: bool = False,
+    use_llm: bool = True,
+    workers: int | None = None,
+    llm_concurrency: int = LLM_MAX_CONCURRENCY,
+    restart: bool = False,
+) -> dict:
+    """Process URLs for all videos in archive with pattern learning.
+
+    Runs run_filter_job over every archive, resuming after the archive
+    recorded in CHECKPOINT_FILE unless restart is set. The checkpoint is
+    removed once a full pass completes without errors; otherwise it stays
+    before the first failed archive so the next run retries from there.
+
+    Args:
+        archive_manager: ArchiveManager instance
+        dry_run: If True, don't update archives
+        use_llm: If True, use LLM for classification
+        workers: Process pool size for extraction/heuristics
+        llm_concurrency: Max in-flight LLM requests
+        restart: If True, ignore any existing checkpoint
+
+    Returns:
+        Dict with batch processing results
+    """
+    archive_files = find_archive_files(archive_manager)
+    total_archives = len(archive_files)
+
+    if restart:
+        clear_checkpoint()
+
+    checkpoint = None if dry_run else load_checkpoint()
+    if checkpoint:
+        last_path = checkpoint["last_path"]
+        archive_files = [path for path in archive_files if str(path) > last_path]
+        print(
+            f"Resuming after {checkpoint['last_video_id']} "
+            f"({total_archives - len(archive_files)} archives already done)"
+        )
+
+    print(f"Found {len(archive_files)} archives to process")
+
+    total_stats = asyncio.run(
+        run_filter_job(
+            archive_files,
+            dry_run=dry_run,
+            use_llm=use_llm,
+            workers=workers,
+            llm_concurrency=llm_concurrency,
+        )
+    )
+
+    if not dry_run:
+        if total_stats["errors"]:
+            print(f"Keeping checkpoint: {total_stats['errors']} archives failed and will be retried")
+        else:
+            clear_checkpoint()
+
     # Print summary
     print(f"\n{'='*70}")
     print(f"Batch Processing Summary")
@@ -502,6 +806,23 @@ def main():
         action="store_true",
         help="Use heuristic filter only (no LLM calls)",
     )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="With --all: ignore the checkpoint and start a fresh full pass",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="With --all: process pool size for extraction/heuristics (default: CPU count)",
+    )
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=LLM_MAX_CONCURRENCY,
+        help=f"With --all: max in-flight LLM requests (default: {LLM_MAX_CONCURRENCY})",
+    )
     parser.add_argument(
         "--show-pattern-stats",
         action="store_true",
@@ -548,7 +869,14 @@ def main():
             print(f"Dry run: {args.dry_run}")
             print(f"{'='*70}\n")
 
-            stats = process_all_videos(archive_manager, pattern_tracker, args.dry_run, use_llm)
+            stats = process_all_videos(
+                archive_manager,
+                dry_run=args.dry_run,
+                use_llm=use_llm,
+                workers=args.workers,
+                llm_concurrency=args.llm_concurrency,
+                restart=args.restart,
+            )
 
             if stats["errors"] > 0:
                 sys.exit(1)
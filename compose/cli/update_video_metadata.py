@@ -24,7 +24,7 @@ from compose.cli.base import setup_script_environment
 setup_script_environment()
 
 from compose.services.archive import create_archive_manager
-from compose.services.youtube import fetch_video_metadata
+from compose.services.youtube import fetch_video_metadata, fetch_videos_metadata
 
 
 def safe_print(text: str, **kwargs) -> None:
@@ -42,11 +42,18 @@ def safe_print(text: str, **kwargs) -> None:
         print(safe_text, **kwargs)
 
 
+def _has_metadata(archive_manager, video_id: str) -> bool:
+    """Check whether an archive already has YouTube metadata."""
+    archive = archive_manager.get(video_id)
+    return bool(archive and archive.youtube_metadata and archive.youtube_metadata.get("title"))
+
+
 def update_single_video_metadata(
     video_id: str,
     archive_manager,
     dry_run: bool = False,
     force: bool = False,
+    prefetched: tuple = None,
 ) -> dict:
     """Update YouTube metadata for a single video.
 
@@ -55,6 +62,7 @@ def update_single_video_metadata(
         archive_manager: ArchiveManager instance
         dry_run: If True, don't update archive
         force: If True, update even if metadata exists
+        prefetched: (metadata, error) from a batched fetch (fetched here if None)
 
     Returns:
         Dict with processing results
@@ -81,8 +89,11 @@ def update_single_video_metadata(
     print(f"URL: {archive.url}")
 
     # Fetch metadata
-    print("Fetching YouTube metadata...")
-    youtube_metadata, error = fetch_video_metadata(video_id)
+    if prefetched is not None:
+        youtube_metadata, error = prefetched
+    else:
+        print("Fetching YouTube metadata...")
+        youtube_metadata, error = fetch_video_metadata(video_id)
 
     if error:
         return {
@@ -160,6 +171,13 @@ def update_all_video_metadata(
         "already_has_metadata": 0,
     }
 
+    # Batch-fetch metadata for videos that need it (50 IDs per API call)
+    video_ids = [archive_file.stem for archive_file in archive_files]
+    if not force:
+        video_ids = [vid for vid in video_ids if not _has_metadata(archive_manager, vid)]
+    print(f"Fetching YouTube metadata for {len(video_ids)} videos...")
+    fetched = fetch_videos_metadata(video_ids)
+
     for archive_file in archive_files:
         video_id = archive_file.stem
 
@@ -169,6 +187,7 @@ def update_all_video_metadata(
                 archive_manager,
                 dry_run,
                 force,
+                prefetched=fetched.get(video_id),
             )
 
             if result["success"]:
@@ -10,11 +10,30 @@ This module provides a base class for building reprocessing workflows that:
 Design pattern: Template Method
 - Subclasses implement specific transformation logic
 - Base class handles iteration, staleness detection, and error handling
+
+Archives are streamed from disk and processed on a worker pool (processes
+by default, so CPU-bound transformations aren't serialized by the GIL).
+Each worker parses an archive once and writes the derived output back from
+that same object. A manifest index (reprocessing_index.json in the archive
+base directory) records each archive's derived-output manifests keyed by
+file mtime and size, so up-to-date archives are skipped without parsing.
 """
 
 import json
+import os
 import sys
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, Iterator, Optional, Protocol, Tuple
 
@@ -26,7 +45,13 @@ from compose.services.archive import create_local_archive_writer, YouTubeArchive
 from compose.services.archive.local_reader import LocalArchiveReader
 from compose.services.archive.config import ArchiveConfig
 
-from .transform_versions import get_transform_manifest, compare_versions, is_stale
+from .versions import get_transform_manifest, is_stale
+
+# Default worker pool size for run()
+DEFAULT_MAX_WORKERS = os.cpu_count() or 1
+
+# Index of derived-output manifests, stored in the archive base directory
+MANIFEST_INDEX_FILENAME = "reprocessing_index.json"
 
 
 class ReprocessingHooks(Protocol):
@@ -57,6 +82,111 @@ class ReprocessingHooks(Protocol):
         ...
 
 
+@dataclass
+class ArchiveResult:
+    """Outcome of processing one archive (returned from pool workers)."""
+
+    video_id: str
+    status: str  # "processed", "skipped", or "error"
+    reason: str = ""
+    elapsed_seconds: float = 0.0
+    error: Optional[Exception] = None
+    index_entry: Optional[Dict[str, Any]] = None
+
+
+class ManifestIndex:
+    """On-disk index of derived-output manifests per archive file.
+
+    Entries are keyed by archive path relative to the archive base directory
+    and are only trusted while the file's mtime and size are unchanged.
+
+    Entry format:
+        {"mtime_ns": int, "size": int, "outputs": {output_type: transform_manifest}}
+    """
+
+    def __init__(self, path: Path):
+        """Load index from disk (missing or corrupt files start empty).
+
+        Args:
+            path: Index file path
+        """
+        self.path = path
+        self.root = path.parent
+        try:
+            self.entries: Dict[str, Dict[str, Any]] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _key(self, archive_path: Path) -> str:
+        try:
+            return archive_path.relative_to(self.root).as_posix()
+        except ValueError:
+            return str(archive_path)
+
+    def lookup(self, archive_path: Path) -> Optional[Dict[str, dict]]:
+        """Get the derived-output manifests for an unchanged archive file.
+
+        Args:
+            archive_path: Archive JSON file
+
+        Returns:
+            Mapping of output_type -> transform_manifest, or None if the file
+            isn't indexed or changed since it was indexed
+        """
+        entry = self.entries.get(self._key(archive_path))
+        if entry is None:
+            return None
+        try:
+            stat = archive_path.stat()
+        except OSError:
+            return None
+        if entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            return None
+        return entry["outputs"]
+
+    def set(self, archive_path: Path, entry: Dict[str, Any]) -> None:
+        """Store an entry built by make_entry."""
+        self.entries[self._key(archive_path)] = entry
+
+    def save(self) -> None:
+        """Atomically write the index to disk."""
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.entries), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def make_entry(archive_path: Path, archive: YouTubeArchive) -> Dict[str, Any]:
+        """Build an index entry from an archive and its file's current stat.
+
+        Args:
+            archive_path: Archive JSON file (as currently on disk)
+            archive: Parsed archive matching the file contents
+
+        Returns:
+            Index entry with the latest manifest per derived output type
+        """
+        stat = archive_path.stat()
+        output_types = {output.output_type for output in archive.derived_outputs}
+        outputs = {
+            output_type: archive.get_latest_derived_output(output_type).transform_manifest
+            for output_type in output_types
+        }
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "outputs": outputs}
+
+
+# Pipeline instance for process pool workers (set by _init_worker)
+_worker_pipeline: Optional["BaseReprocessingPipeline"] = None
+
+
+def _init_worker(pipeline: "BaseReprocessingPipeline") -> None:
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+
+def _process_in_worker(video_id: str, archive_path: Path, manifest: Dict[str, Any]) -> ArchiveResult:
+    return _worker_pipeline.process_path(video_id, archive_path, manifest)
+
+
 class BaseReprocessingPipeline(ABC):
     """Base class for archive reprocessing pipelines.
 
@@ -69,6 +199,10 @@ class BaseReprocessingPipeline(ABC):
     - get_version_keys(): Return list of version keys to check for staleness
     - process_archive(): Transform archive data and return output
 
+    With use_processes=True (the default) the pipeline is pickled into each
+    worker process, so subclasses holding unpicklable state (clients, open
+    connections) should create it lazily or pass use_processes=False.
+
     Example:
         class MyPipeline(BaseReprocessingPipeline):
             def get_output_type(self) -> str:
@@ -90,6 +224,8 @@ class BaseReprocessingPipeline(ABC):
         archive_base_dir: Optional[Path] = None,
         dry_run: bool = False,
         hooks: Optional[ReprocessingHooks] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        use_processes: bool = True,
     ):
         """Initialize reprocessing pipeline.
 
@@ -97,13 +233,18 @@ class BaseReprocessingPipeline(ABC):
             archive_base_dir: Path to archive directory (default: projects/data/archive)
             dry_run: If True, don't write changes to disk
             hooks: Optional observer hooks for progress tracking
+            max_workers: Worker pool size (1 processes archives inline)
+            use_processes: Use a process pool (True) or a thread pool (False)
         """
         self.dry_run = dry_run
         self.hooks = hooks
+        self.max_workers = max(1, max_workers)
+        self.use_processes = use_processes
 
         # Set up archive services
         if archive_base_dir is None:
             archive_base_dir = project_root / "projects" / "data" / "archive"
+        self.archive_base_dir = Path(archive_base_dir)
 
         archive_config = ArchiveConfig(base_dir=archive_base_dir, organize_by_month=True)
         self.archive_reader = LocalArchiveReader(config=archive_config)
@@ -117,6 +258,12 @@ class BaseReprocessingPipeline(ABC):
             "total": 0,
         }
 
+    def __getstate__(self) -> dict:
+        # Hooks run in the parent process only
+        state = self.__dict__.copy()
+        state["hooks"] = None
+        return state
+
     @abstractmethod
     def get_output_type(self) -> str:
         """Get output type name for derived outputs.
@@ -131,7 +278,7 @@ class BaseReprocessingPipeline(ABC):
         """Get list of version keys to check for staleness.
 
         Returns:
-            List of keys from transform_versions.VERSIONS
+            List of keys from versions.VERSIONS
             (e.g., ["normalizer", "vocabulary"])
         """
         pass
@@ -151,23 +298,18 @@ class BaseReprocessingPipeline(ABC):
         """
         pass
 
-    def should_reprocess(self, archive: YouTubeArchive) -> Tuple[bool, str]:
-        """Check if archive needs reprocessing.
+    def check_manifest(self, stored_manifest: Optional[dict]) -> Tuple[bool, str]:
+        """Check a stored derived-output manifest against current versions.
 
         Args:
-            archive: Archive to check
+            stored_manifest: Manifest of the latest output of this type, or None
 
         Returns:
             Tuple of (should_reprocess, reason)
         """
-        # Check if archive has derived output of this type
-        existing_output = archive.get_latest_derived_output(self.get_output_type())
-
-        if not existing_output:
+        if stored_manifest is None:
             return True, "no existing output"
 
-        # Check version staleness
-        stored_manifest = existing_output.transform_manifest
         stale, changed_keys = is_stale(stored_manifest, check_keys=self.get_version_keys())
 
         if stale:
@@ -175,13 +317,27 @@ class BaseReprocessingPipeline(ABC):
 
         return False, "up-to-date"
 
-    def iter_archives(self) -> Iterator[Tuple[str, YouTubeArchive]]:
-        """Iterate over all archives.
+    def should_reprocess(self, archive: YouTubeArchive) -> Tuple[bool, str]:
+        """Check if archive needs reprocessing.
+
+        Args:
+            archive: Archive to check
+
+        Returns:
+            Tuple of (should_reprocess, reason)
+        """
+        existing_output = archive.get_latest_derived_output(self.get_output_type())
+        return self.check_manifest(existing_output.transform_manifest if existing_output else None)
+
+    def iter_archive_paths(self) -> Iterator[Tuple[str, Path]]:
+        """Iterate over archive files without parsing them.
 
         Yields:
-            Tuples of (video_id, archive)
+            Tuples of (video_id, archive_path)
         """
         youtube_dir = self.archive_reader.youtube_dir
+        if not youtube_dir.exists():
+            return
 
         # Search all month directories
         if self.archive_reader.config.organize_by_month:
@@ -189,87 +345,203 @@ class BaseReprocessingPipeline(ABC):
                 if not month_dir.is_dir():
                     continue
                 for archive_file in sorted(month_dir.glob("*.json")):
-                    video_id = archive_file.stem
-                    archive = self.archive_reader.get(video_id)
-                    if archive:
-                        yield video_id, archive
+                    yield archive_file.stem, archive_file
         else:
             for archive_file in sorted(youtube_dir.glob("*.json")):
-                video_id = archive_file.stem
-                archive = self.archive_reader.get(video_id)
-                if archive:
-                    yield video_id, archive
+                yield archive_file.stem, archive_file
+
+    def iter_archives(self) -> Iterator[Tuple[str, YouTubeArchive]]:
+        """Iterate over all archives, parsing each lazily.
+
+        Yields:
+            Tuples of (video_id, archive)
+        """
+        for video_id, archive_path in self.iter_archive_paths():
+            yield video_id, self.load_archive(archive_path)
+
+    @staticmethod
+    def load_archive(archive_path: Path) -> YouTubeArchive:
+        """Parse an archive file."""
+        with open(archive_path, "r", encoding="utf-8") as f:
+            return YouTubeArchive(**json.load(f))
+
+    def process_path(
+        self,
+        video_id: str,
+        archive_path: Path,
+        manifest: Dict[str, Any],
+    ) -> ArchiveResult:
+        """Load, check, process and write back one archive.
+
+        Runs in pool workers. The parsed archive is updated in place and
+        written straight back to archive_path.
+
+        Args:
+            video_id: YouTube video ID
+            archive_path: Archive JSON file
+            manifest: Current transform manifest (computed once per run)
+
+        Returns:
+            ArchiveResult for the archive
+        """
+        try:
+            archive = self.load_archive(archive_path)
+
+            should_process, reason = self.should_reprocess(archive)
+            if not should_process:
+                return ArchiveResult(
+                    video_id=video_id,
+                    status="skipped",
+                    reason=reason,
+                    index_entry=ManifestIndex.make_entry(archive_path, archive),
+                )
+
+            start_time = time.time()
+            output_value = self.process_archive(archive)
+            elapsed = time.time() - start_time
+
+            # Update archive with derived output (unless dry run)
+            index_entry = None
+            if not self.dry_run:
+                transformer_version = "+".join([
+                    manifest.get(key, "unknown")
+                    for key in self.get_version_keys()
+                ])
+
+                self.archive_writer.add_derived_output(
+                    video_id=video_id,
+                    output_type=self.get_output_type(),
+                    output_value=output_value,
+                    transformer_version=transformer_version,
+                    transform_manifest=manifest,
+                    source_outputs=self.get_source_outputs(archive),
+                    archive=archive,
+                    archive_path=archive_path,
+                )
+                index_entry = ManifestIndex.make_entry(archive_path, archive)
+
+            return ArchiveResult(
+                video_id=video_id,
+                status="processed",
+                elapsed_seconds=elapsed,
+                index_entry=index_entry,
+            )
+
+        except Exception as e:
+            return ArchiveResult(video_id=video_id, status="error", error=e)
+
+    def _create_executor(self) -> Optional[Executor]:
+        """Create the worker pool (None processes archives inline)."""
+        if self.max_workers <= 1:
+            return None
+        if self.use_processes:
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self,),
+            )
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _record(self, result: ArchiveResult, archive_path: Path, index: ManifestIndex) -> None:
+        """Update stats, hooks and the manifest index with a result."""
+        if result.index_entry is not None:
+            index.set(archive_path, result.index_entry)
+
+        if result.status == "skipped":
+            if self.hooks:
+                self.hooks.on_archive_skip(result.video_id, result.reason)
+            self.stats["skipped"] += 1
+        elif result.status == "processed":
+            if self.hooks:
+                self.hooks.on_archive_success(result.video_id, result.elapsed_seconds)
+            self.stats["processed"] += 1
+        else:
+            if self.hooks:
+                self.hooks.on_archive_error(result.video_id, result.error)
+            self.stats["errors"] += 1
+
+    def _collect(self, future: Future, video_id: str, archive_path: Path, index: ManifestIndex) -> None:
+        """Record a finished worker future."""
+        try:
+            result = future.result()
+        except Exception as e:
+            # Worker crashed or the result couldn't be pickled
+            result = ArchiveResult(video_id=video_id, status="error", error=e)
+        self._record(result, archive_path, index)
 
     def run(self, limit: Optional[int] = None) -> Dict[str, int]:
         """Run reprocessing pipeline.
 
+        Archives whose indexed manifest is current are skipped without being
+        parsed; the rest are processed on the worker pool, with at most
+        2 * max_workers archives in flight.
+
         Args:
             limit: Optional limit on number of archives to process
 
         Returns:
             Dict with stats: {processed, skipped, errors, total}
         """
-        import time
-
-        # Count total archives
-        archives = list(self.iter_archives())
-        total = min(len(archives), limit) if limit else len(archives)
+        # Collect paths only; archives are parsed by the workers
+        archive_paths = list(islice(self.iter_archive_paths(), limit or None))
+        total = len(archive_paths)
         self.stats["total"] = total
 
         # Notify start
         if self.hooks:
             self.hooks.on_start(total)
 
-        # Process each archive
-        for i, (video_id, archive) in enumerate(archives, 1):
-            if limit and i > limit:
-                break
+        manifest = get_transform_manifest()
+        output_type = self.get_output_type()
+        index = ManifestIndex(self.archive_base_dir / MANIFEST_INDEX_FILENAME)
 
-            # Notify archive start
-            if self.hooks:
-                self.hooks.on_archive_start(video_id, i, total)
-
-            try:
-                # Check if reprocessing needed
-                should_process, reason = self.should_reprocess(archive)
+        executor = self._create_executor()
+        in_flight: Dict[Future, Tuple[str, Path]] = {}
+        window = self.max_workers * 2
 
-                if not should_process:
-                    if self.hooks:
-                        self.hooks.on_archive_skip(video_id, reason)
-                    self.stats["skipped"] += 1
-                    continue
-
-                # Process archive
-                start_time = time.time()
-                output_value = self.process_archive(archive)
-                elapsed = time.time() - start_time
-
-                # Update archive with derived output (unless dry run)
-                if not self.dry_run:
-                    current_manifest = get_transform_manifest()
-                    transformer_version = "+".join([
-                        current_manifest.get(key, "unknown")
-                        for key in self.get_version_keys()
-                    ])
-
-                    self.archive_writer.add_derived_output(
-                        video_id=video_id,
-                        output_type=self.get_output_type(),
-                        output_value=output_value,
-                        transformer_version=transformer_version,
-                        transform_manifest=current_manifest,
-                        source_outputs=self.get_source_outputs(archive),
-                    )
-
-                # Notify success
+        try:
+            for i, (video_id, archive_path) in enumerate(archive_paths, 1):
+                # Notify archive start
                 if self.hooks:
-                    self.hooks.on_archive_success(video_id, elapsed)
-                self.stats["processed"] += 1
+                    self.hooks.on_archive_start(video_id, i, total)
+
+                # Skip up-to-date archives straight from the index
+                indexed_outputs = index.lookup(archive_path)
+                if indexed_outputs is not None:
+                    should_process, reason = self.check_manifest(indexed_outputs.get(output_type))
+                    if not should_process:
+                        self._record(
+                            ArchiveResult(video_id=video_id, status="skipped", reason=reason),
+                            archive_path,
+                            index,
+                        )
+                        continue
+
+                if executor is None:
+                    self._record(self.process_path(video_id, archive_path, manifest), archive_path, index)
+                    continue
 
-            except Exception as e:
-                if self.hooks:
-                    self.hooks.on_archive_error(video_id, e)
-                self.stats["errors"] += 1
+                if self.use_processes:
+                    future = executor.submit(_process_in_worker, video_id, archive_path, manifest)
+                else:
+                    future = executor.submit(self.process_path, video_id, archive_path, manifest)
+                in_flight[future] = (video_id, archive_path)
+
+                if len(in_flight) >= window:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._collect(future, *in_flight.pop(future), index)
+
+            for future in list(in_flight):
+                self._collect(future, *in_flight.pop(future), index)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            if not self.dry_run:
+                try:
+                    index.save()
+                except OSError:
+                    pass
 
         # Notify complete
         if self.hooks:
@@ -292,7 +564,14 @@ class BaseReprocessingPipeline(ABC):
 
 
 class ConsoleHooks:
-    """Simple console-based progress hooks."""
+    """Simple console-based progress hooks.
+
+    Archives finish out of order on the worker pool, so each line is
+    printed on completion with the archive's position.
+    """
+
+    def __init__(self):
+        self._positions: Dict[str, str] = {}
 
     def on_start(self, total_archives: int) -> None:
         print(f"\n{'='*70}")
@@ -301,16 +580,19 @@ class ConsoleHooks:
         print(f"{'='*70}\n")
 
     def on_archive_start(self, video_id: str, index: int, total: int) -> None:
-        print(f"[{index}/{total}] {video_id}", end=" - ")
+        self._positions[video_id] = f"[{index}/{total}] {video_id}"
+
+    def _prefix(self, video_id: str) -> str:
+        return self._positions.pop(video_id, video_id)
 
     def on_archive_skip(self, video_id: str, reason: str) -> None:
-        print(f"SKIP ({reason})")
+        print(f"{self._prefix(video_id)} - SKIP ({reason})")
 
     def on_archive_success(self, video_id: str, elapsed_seconds: float) -> None:
-        print(f"OK ({elapsed_seconds:.2f}s)")
+        print(f"{self._prefix(video_id)} - OK ({elapsed_seconds:.2f}s)")
 
     def on_archive_error(self, video_id: str, error: Exception) -> None:
-        print(f"ERROR: {error}")
+        print(f"{self._prefix(video_id)} - ERROR: {error}")
 
     def on_complete(self, stats: Dict[str, int]) -> None:
         print(f"\n{'='*70}")
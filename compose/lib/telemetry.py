@@ -1,24 +1,18 @@
-"""OpenTelemetry tracing, metrics, and logging configuration for LGTM stack."""
+"""OpenTelemetry tracing, metrics, and logging configuration for LGTM stack.
+
+The SDK, OTLP exporters and instrumentors are imported by the setup_*
+functions, so importing this module (e.g. for ``traced``) stays cheap when
+telemetry is disabled.
+"""
 
 import os
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from opentelemetry import trace, metrics
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
-from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
-from opentelemetry._logs import set_logger_provider
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk._logs import LoggerProvider
 
 
 def setup_tracing(
@@ -36,6 +30,11 @@ def setup_tracing(
     Returns:
         Tracer instance
     """
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
     # Get OTLP endpoint from environment or use default
     if otlp_endpoint is None:
         otlp_endpoint = os.getenv("OTLP_ENDPOINT", "http://192.168.16.241:4318")
@@ -66,6 +65,10 @@ def setup_tracing(
 
     # Auto-instrument frameworks if enabled
     if enable_instrumentation:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+        from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+        from opentelemetry.instrumentation.logging import LoggingInstrumentor
+
         # Auto-instrument FastAPI
         FastAPIInstrumentor().instrument()
 
@@ -94,6 +97,11 @@ def setup_metrics(
     Returns:
         Meter instance
     """
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.sdk.resources import Resource
+
     # Get OTLP endpoint from environment or use default
     if otlp_endpoint is None:
         otlp_endpoint = os.getenv("OTLP_ENDPOINT", "http://192.168.16.241:4318")
@@ -135,7 +143,7 @@ def setup_logging_export(
     service_name: str,
     otlp_endpoint: Optional[str] = None,
     log_level: int = logging.INFO,
-) -> LoggerProvider:
+) -> "LoggerProvider":
     """Configure OpenTelemetry log export to LGTM stack.
 
     Args:
@@ -146,6 +154,12 @@ def setup_logging_export(
     Returns:
         LoggerProvider instance
     """
+    from opentelemetry._logs import set_logger_provider
+    from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
+    from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
+    from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+    from opentelemetry.sdk.resources import Resource
+
     # Get OTLP endpoint from environment or use default (HTTP port 4318)
     if otlp_endpoint is None:
         otlp_endpoint = os.getenv("OTLP_ENDPOINT", "http://192.168.16.241:4318")
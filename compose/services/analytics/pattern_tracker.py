@@ -2,6 +2,7 @@
 
 import sqlite3
 import re
+import json
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -105,6 +106,19 @@ class SQLitePatternTracker:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_pending_domain ON pending_reevaluation (domain)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_pending_reevaluated ON pending_reevaluation (reevaluated)")
 
+        # LLM classification cache (one row per normalized URL)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS url_classification_cache (
+                normalized_url TEXT PRIMARY KEY,
+                domain TEXT NOT NULL,
+                classification TEXT NOT NULL CHECK (classification IN ('content', 'marketing')),
+                confidence REAL NOT NULL CHECK (confidence >= 0.0 AND confidence <= 1.0),
+                reason TEXT,
+                suggested_pattern TEXT,
+                classified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
         conn.commit()
         conn.close()
 
@@ -345,52 +359,49 @@ class SQLitePatternTracker:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        # Find domains with min_count+ pending URLs
+        # Fetch all pending rows for qualifying domains in one query,
+        # largest domains first, then group in Python
         cursor.execute(
             """
-            SELECT domain, COUNT(*) as url_count
-            FROM pending_reevaluation
-            WHERE reevaluated = 0
-            GROUP BY domain
-            HAVING url_count >= ?
-            ORDER BY url_count DESC
+            SELECT p.domain, p.url, p.video_id, p.classification, p.confidence
+            FROM pending_reevaluation p
+            JOIN (
+                SELECT domain, COUNT(*) as url_count
+                FROM pending_reevaluation
+                WHERE reevaluated = 0
+                GROUP BY domain
+                HAVING url_count >= ?
+            ) d ON d.domain = p.domain
+            WHERE p.reevaluated = 0
+            ORDER BY d.url_count DESC, p.domain
             """,
             (min_count,),
         )
 
-        results = []
-        for domain, url_count in cursor.fetchall():
-            # Get URLs and video IDs for this domain
-            cursor.execute(
-                """
-                SELECT url, video_id, classification, confidence
-                FROM pending_reevaluation
-                WHERE domain = ? AND reevaluated = 0
-                """,
-                (domain,),
-            )
-
-            urls = []
-            video_ids = []
-            confidences = []
-            classifications = {"content": 0, "marketing": 0}
-
-            for url, video_id, classification, confidence in cursor.fetchall():
-                urls.append(url)
-                video_ids.append(video_id)
-                confidences.append(confidence)
-                classifications[classification] += 1
-
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        grouped: dict[str, dict] = {}
+        for domain, url, video_id, classification, confidence in cursor.fetchall():
+            group = grouped.setdefault(domain, {
+                "urls": [],
+                "video_ids": [],
+                "confidences": [],
+                "classifications": {"content": 0, "marketing": 0},
+            })
+            group["urls"].append(url)
+            group["video_ids"].append(video_id)
+            group["confidences"].append(confidence)
+            group["classifications"][classification] += 1
 
+        results = []
+        for domain, group in grouped.items():
+            confidences = group["confidences"]
             results.append(
                 DomainReevaluation(
                     domain=domain,
-                    url_count=url_count,
-                    urls=urls,
-                    video_ids=video_ids,
-                    avg_confidence=avg_confidence,
-                    classifications=classifications,
+                    url_count=len(group["urls"]),
+                    urls=group["urls"],
+                    video_ids=group["video_ids"],
+                    avg_confidence=sum(confidences) / len(confidences) if confidences else 0.0,
+                    classifications=group["classifications"],
                 )
             )
 
@@ -547,6 +558,69 @@ class SQLitePatternTracker:
         conn.commit()
         conn.close()
 
+    def get_cached_classifications(
+        self, normalized_urls: list[str]
+    ) -> dict[str, dict]:
+        """Get persisted LLM classifications for normalized URLs."""
+        if not normalized_urls:
+            return {}
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        placeholders = ", ".join("?" for _ in normalized_urls)
+        cursor.execute(
+            f"""
+            SELECT normalized_url, classification, confidence, reason, suggested_pattern
+            FROM url_classification_cache
+            WHERE normalized_url IN ({placeholders})
+            """,
+            list(normalized_urls),
+        )
+
+        results = {}
+        for normalized_url, classification, confidence, reason, suggested_pattern in cursor.fetchall():
+            results[normalized_url] = {
+                "classification": classification,
+                "confidence": confidence,
+                "reason": reason,
+                "suggested_pattern": json.loads(suggested_pattern) if suggested_pattern else None,
+            }
+
+        conn.close()
+        return results
+
+    def cache_classification(
+        self,
+        normalized_url: str,
+        classification: str,
+        confidence: float,
+        reason: Optional[str] = None,
+        suggested_pattern: Optional[dict] = None,
+    ) -> None:
+        """Persist an LLM classification so it can be reused across videos."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO url_classification_cache
+            (normalized_url, domain, classification, confidence, reason, suggested_pattern)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                normalized_url,
+                self._extract_domain(normalized_url),
+                classification,
+                confidence,
+                reason,
+                json.dumps(suggested_pattern) if suggested_pattern else None,
+            ),
+        )
+
+        conn.commit()
+        conn.close()
+
     def close(self) -> None:
         """Close database connection.
 
@@ -148,6 +148,39 @@ class PatternTracker(Protocol):
         """
         ...
 
+    def get_cached_classifications(
+        self, normalized_urls: list[str]
+    ) -> dict[str, dict]:
+        """Get persisted LLM classifications for normalized URLs.
+
+        Args:
+            normalized_urls: URLs normalized with url_filter.normalize_url
+
+        Returns:
+            Dict mapping normalized URL to dict with classification,
+            confidence, reason, suggested_pattern (misses are omitted)
+        """
+        ...
+
+    def cache_classification(
+        self,
+        normalized_url: str,
+        classification: str,
+        confidence: float,
+        reason: Optional[str] = None,
+        suggested_pattern: Optional[dict] = None,
+    ) -> None:
+        """Persist an LLM classification so it can be reused across videos.
+
+        Args:
+            normalized_url: URL normalized with url_filter.normalize_url
+            classification: 'content' or 'marketing'
+            confidence: 0.0-1.0
+            reason: Explanation for classification
+            suggested_pattern: Pattern suggested by LLM (if any)
+        """
+        ...
+
     def close(self) -> None:
         """Close database connection."""
         ...
@@ -294,6 +327,39 @@ class AsyncPatternTracker(Protocol):
         """
         ...
 
+    async def get_cached_classifications(
+        self, normalized_urls: list[str]
+    ) -> dict[str, dict]:
+        """Get persisted LLM classifications for normalized URLs.
+
+        Args:
+            normalized_urls: URLs normalized with url_filter.normalize_url
+
+        Returns:
+            Dict mapping normalized URL to dict with classification,
+            confidence, reason, suggested_pattern (misses are omitted)
+        """
+        ...
+
+    async def cache_classification(
+        self,
+        normalized_url: str,
+        classification: str,
+        confidence: float,
+        reason: Optional[str] = None,
+        suggested_pattern: Optional[dict] = None,
+    ) -> None:
+        """Persist an LLM classification so it can be reused across videos.
+
+        Args:
+            normalized_url: URL normalized with url_filter.normalize_url
+            classification: 'content' or 'marketing'
+            confidence: 0.0-1.0
+            reason: Explanation for classification
+            suggested_pattern: Pattern suggested by LLM (if any)
+        """
+        ...
+
     async def close(self) -> None:
         """Close database connection."""
         ...
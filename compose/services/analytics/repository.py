@@ -5,14 +5,16 @@ Provides:
 - CRUD operations for URL classifications
 - CRUD operations for learned patterns
 - CRUD operations for pending re-evaluations
+- Cached LLM classifications keyed by normalized URL
 - Analytics queries for pattern effectiveness
 """
 
 import logging
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
-from compose.services.surrealdb.driver import execute_query
+from compose.services.surrealdb.driver import execute_multi_query, execute_query
 from .models import (
     DomainReevaluation,
     LearnedPatternRecord,
@@ -23,6 +25,16 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Effectiveness report cache with TTL (dashboard polls this frequently)
+effectiveness_report_cache: dict[str, Any] = {
+    "data": None,
+    "timestamp": None,
+    "ttl": 30,  # seconds
+}
+
+# Precision below which patterns are reported as low-performing
+PRECISION_THRESHOLD = 0.7
+
 
 def _parse_datetime(value, default: datetime | None = None) -> datetime:
     """Parse datetime from SurrealDB result.
@@ -48,6 +60,21 @@ def _parse_datetime_optional(value) -> datetime | None:
     return None
 
 
+def _row_to_pattern_stats(r: dict) -> PatternStats:
+    """Build a PatternStats model from a pattern_learned row."""
+    return PatternStats(
+        pattern=r.get("pattern"),
+        pattern_type=r.get("pattern_type"),
+        classification=r.get("classification"),
+        times_applied=r.get("times_applied", 0),
+        correct_count=r.get("correct_count", 0),
+        precision=r.get("precision", 1.0),
+        status=r.get("status", "active"),
+        added_at=_parse_datetime(r.get("added_at")),
+        last_used_at=_parse_datetime_optional(r.get("last_used_at")),
+    )
+
+
 # =============================================================================
 # Schema Initialization
 # =============================================================================
@@ -56,7 +83,8 @@ def _parse_datetime_optional(value) -> datetime | None:
 async def init_analytics_schema() -> None:
     """Initialize SurrealDB schema for analytics tables.
 
-    Creates 3 tables: pattern_classification, pattern_learned, pattern_pending_reeval
+    Creates 4 tables: pattern_classification, pattern_learned,
+    pattern_pending_reeval, pattern_url_cache
     """
     queries = [
         # URL Classifications
@@ -104,6 +132,21 @@ async def init_analytics_schema() -> None:
         DEFINE INDEX idx_pending_domain ON TABLE pattern_pending_reeval COLUMNS domain;
         DEFINE INDEX idx_pending_reevaluated ON TABLE pattern_pending_reeval COLUMNS reevaluated;
         """,
+        # LLM classification cache (record ID is the normalized URL)
+        """
+        DEFINE TABLE pattern_url_cache SCHEMAFULL;
+        DEFINE FIELD url ON TABLE pattern_url_cache TYPE string;
+        DEFINE FIELD domain ON TABLE pattern_url_cache TYPE string;
+        DEFINE FIELD classification ON TABLE pattern_url_cache TYPE string ASSERT $value IN ["content", "marketing"];
+        DEFINE FIELD confidence ON TABLE pattern_url_cache TYPE float ASSERT $value >= 0.0 AND $value <= 1.0;
+        DEFINE FIELD reason ON TABLE pattern_url_cache TYPE option<string>;
+        DEFINE FIELD suggested_pattern ON TABLE pattern_url_cache TYPE option<object>;
+        DEFINE FIELD suggested_pattern.pattern ON TABLE pattern_url_cache TYPE option<string>;
+        DEFINE FIELD suggested_pattern.type ON TABLE pattern_url_cache TYPE option<string>;
+        DEFINE FIELD suggested_pattern.rationale ON TABLE pattern_url_cache TYPE option<string>;
+        DEFINE FIELD classified_at ON TABLE pattern_url_cache TYPE datetime VALUE time::now();
+        DEFINE INDEX idx_url_cache_domain ON TABLE pattern_url_cache COLUMNS domain;
+        """,
     ]
 
     for query in queries:
@@ -207,6 +250,86 @@ async def get_low_confidence_classifications(threshold: float = 0.7) -> list[URL
     return records
 
 
+# =============================================================================
+# Classification Cache Operations
+# =============================================================================
+
+
+async def get_cached_classifications(normalized_urls: list[str]) -> dict[str, dict]:
+    """Get cached LLM classifications for a set of normalized URLs.
+
+    Args:
+        normalized_urls: URLs normalized with url_filter.normalize_url
+
+    Returns:
+        Dict mapping normalized URL to classification dict (misses omitted)
+    """
+    if not normalized_urls:
+        return {}
+
+    query = """
+    SELECT url, classification, confidence, reason, suggested_pattern
+    FROM pattern_url_cache
+    WHERE url IN $urls;
+    """
+
+    results = await execute_query(query, {"urls": list(normalized_urls)})
+
+    return {
+        r.get("url"): {
+            "classification": r.get("classification"),
+            "confidence": float(r.get("confidence", 0.0)),
+            "reason": r.get("reason"),
+            "suggested_pattern": r.get("suggested_pattern"),
+        }
+        for r in results
+    }
+
+
+async def cache_classification(
+    normalized_url: str,
+    domain: str,
+    classification: str,
+    confidence: float,
+    reason: Optional[str] = None,
+    suggested_pattern: Optional[dict] = None,
+) -> dict:
+    """Upsert a cached LLM classification keyed by normalized URL.
+
+    Args:
+        normalized_url: URL normalized with url_filter.normalize_url
+        domain: Extracted domain
+        classification: "content" or "marketing"
+        confidence: Confidence score (0.0-1.0)
+        reason: Optional explanation
+        suggested_pattern: Optional pattern suggested by the LLM
+
+    Returns:
+        Dict with "cached" status
+    """
+    query = """
+    UPSERT type::thing('pattern_url_cache', $url) SET
+        url = $url,
+        domain = $domain,
+        classification = $classification,
+        confidence = $confidence,
+        reason = $reason,
+        suggested_pattern = $suggested_pattern;
+    """
+
+    params = {
+        "url": normalized_url,
+        "domain": domain,
+        "classification": classification,
+        "confidence": confidence,
+        "reason": reason,
+        "suggested_pattern": suggested_pattern,
+    }
+
+    result = await execute_query(query, params)
+    return {"cached": len(result) > 0}
+
+
 # =============================================================================
 # Pending Re-evaluation Operations
 # =============================================================================
@@ -286,69 +409,49 @@ async def add_or_update_pending_reevaluation(
 async def get_domains_for_batch_reeval(min_count: int = 3) -> list[DomainReevaluation]:
     """Get domains with min_count+ pending URLs for batch re-evaluation.
 
+    Aggregates URLs, video IDs, confidence and classification counts per
+    domain in a single grouped query (no per-domain follow-up queries).
+
     Args:
         min_count: Minimum number of pending URLs required
 
     Returns:
-        List of DomainReevaluation objects with aggregated data
+        List of DomainReevaluation objects with aggregated data, largest first
     """
-    # Find domains with min_count+ pending URLs
-    domain_query = """
-    SELECT domain, count() AS url_count
-    FROM pattern_pending_reeval
-    WHERE reevaluated = false
-    GROUP BY domain
+    query = """
+    SELECT * FROM (
+        SELECT
+            domain,
+            count() AS url_count,
+            array::group(url) AS urls,
+            array::group(video_id) AS video_ids,
+            math::mean(confidence) AS avg_confidence,
+            count(classification = "content") AS content_count,
+            count(classification = "marketing") AS marketing_count
+        FROM pattern_pending_reeval
+        WHERE reevaluated = false
+        GROUP BY domain
+    )
+    WHERE url_count >= $min_count
     ORDER BY url_count DESC;
     """
 
-    domain_results = await execute_query(domain_query)
-
-    # Filter domains with min_count+ URLs and fetch details
-    results = []
-    for domain_row in domain_results:
-        domain = domain_row.get("domain")
-        url_count = int(domain_row.get("url_count", 0))
-
-        if url_count < min_count:
-            continue
-
-        # Get URLs and video IDs for this domain
-        detail_query = """
-        SELECT url, video_id, classification, confidence
-        FROM pattern_pending_reeval
-        WHERE domain = $domain AND reevaluated = false;
-        """
-
-        detail_results = await execute_query(detail_query, {"domain": domain})
-
-        urls = []
-        video_ids = []
-        confidences = []
-        classifications = {"content": 0, "marketing": 0}
-
-        for row in detail_results:
-            urls.append(row.get("url"))
-            video_ids.append(row.get("video_id"))
-            confidences.append(float(row.get("confidence", 0.0)))
-
-            classification = row.get("classification")
-            if classification in classifications:
-                classifications[classification] += 1
-
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-
-        results.append(
-            DomainReevaluation(
-                domain=domain,
-                url_count=url_count,
-                urls=urls,
-                video_ids=video_ids,
-                avg_confidence=avg_confidence,
-                classifications=classifications,
-            )
+    rows = await execute_query(query, {"min_count": min_count})
+
+    return [
+        DomainReevaluation(
+            domain=row.get("domain"),
+            url_count=int(row.get("url_count", 0)),
+            urls=list(row.get("urls") or []),
+            video_ids=list(row.get("video_ids") or []),
+            avg_confidence=float(row.get("avg_confidence") or 0.0),
+            classifications={
+                "content": int(row.get("content_count", 0)),
+                "marketing": int(row.get("marketing_count", 0)),
+            },
         )
-
-    return results
+        for row in rows
+    ]
 
 
 async def mark_reevaluated(url: str) -> dict:
@@ -416,6 +519,7 @@ async def add_learned_pattern(
 
     try:
         result = await execute_query(query, params)
+        invalidate_effectiveness_report_cache()
         return {"created": len(result) > 0}
     except Exception as e:
         # Unique constraint violation - pattern already exists, skip
@@ -477,18 +581,7 @@ async def get_pattern_stats(pattern: str) -> Optional[PatternStats]:
     if not results:
         return None
 
-    r = results[0]
-    return PatternStats(
-        pattern=r.get("pattern"),
-        pattern_type=r.get("pattern_type"),
-        classification=r.get("classification"),
-        times_applied=r.get("times_applied", 0),
-        correct_count=r.get("correct_count", 0),
-        precision=r.get("precision", 1.0),
-        status=r.get("status", "active"),
-        added_at=_parse_datetime(r.get("added_at")),
-        last_used_at=_parse_datetime_optional(r.get("last_used_at")),
-    )
+    return _row_to_pattern_stats(results[0])
 
 
 async def update_pattern_usage(pattern: str) -> dict:
@@ -535,7 +628,7 @@ async def update_pattern_precision(pattern: str, correct: bool) -> dict:
 
     # Update query with conditional status change
     # Pattern precision threshold is typically 0.7-0.8
-    precision_threshold = 0.7
+    precision_threshold = PRECISION_THRESHOLD
 
     query = """
     UPDATE pattern_learned SET
@@ -553,6 +646,7 @@ async def update_pattern_precision(pattern: str, correct: bool) -> dict:
     }
 
     result = await execute_query(query, params)
+    invalidate_effectiveness_report_cache()
     return {
         "updated": len(result) > 0,
         "precision": new_precision,
@@ -560,9 +654,23 @@ async def update_pattern_precision(pattern: str, correct: bool) -> dict:
     }
 
 
-async def get_pattern_effectiveness_report() -> dict:
+def invalidate_effectiveness_report_cache() -> None:
+    """Drop the cached effectiveness report so the next call re-queries."""
+    effectiveness_report_cache["data"] = None
+    effectiveness_report_cache["timestamp"] = None
+
+
+async def get_pattern_effectiveness_report(use_cache: bool = True) -> dict:
     """Get aggregated pattern statistics.
 
+    All counts and top-N lists are fetched in one multi-statement round trip.
+    Results are cached for a short TTL (see effectiveness_report_cache) and
+    invalidated when patterns are added or their precision changes; usage
+    counters may lag by up to one TTL.
+
+    Args:
+        use_cache: Return a cached report if it is still fresh
+
     Returns:
         Dict with:
         - total_patterns: Total count
@@ -572,75 +680,52 @@ async def get_pattern_effectiveness_report() -> dict:
         - low_performing_patterns: Patterns with precision < threshold
         - pending_reevaluation_count: Count of pending re-evaluations
     """
-    # Total patterns
-    total_query = "SELECT COUNT() AS count FROM pattern_learned GROUP ALL;"
-    total_result = await execute_query(total_query)
-    total_patterns = int(total_result[0].get("count", 0)) if total_result else 0
-
-    # Active patterns
-    active_query = 'SELECT COUNT() AS count FROM pattern_learned WHERE status = "active" GROUP ALL;'
-    active_result = await execute_query(active_query)
-    active_patterns = int(active_result[0].get("count", 0)) if active_result else 0
-
-    # Inactive patterns
-    inactive_query = 'SELECT COUNT() AS count FROM pattern_learned WHERE status = "inactive" GROUP ALL;'
-    inactive_result = await execute_query(inactive_query)
-    inactive_patterns = int(inactive_result[0].get("count", 0)) if inactive_result else 0
-
-    # Top patterns (by times_applied)
-    top_query = """
+    now = time.monotonic()
+    if (
+        use_cache
+        and effectiveness_report_cache["data"] is not None
+        and effectiveness_report_cache["timestamp"] is not None
+        and (now - effectiveness_report_cache["timestamp"]) < effectiveness_report_cache["ttl"]
+    ):
+        return dict(effectiveness_report_cache["data"])
+
+    # 1. pattern counts by status, 2. top patterns by usage,
+    # 3. low performers (precision < threshold, times_applied > 5), 4. pending count
+    query = """
+    SELECT
+        count() AS total,
+        count(status = "active") AS active,
+        count(status = "inactive") AS inactive
+    FROM pattern_learned GROUP ALL;
+
     SELECT * FROM pattern_learned
     WHERE status = "active"
     ORDER BY times_applied DESC
     LIMIT 10;
-    """
-    top_results = await execute_query(top_query)
-    top_patterns = []
-    for r in top_results:
-        top_patterns.append(PatternStats(
-            pattern=r.get("pattern"),
-            pattern_type=r.get("pattern_type"),
-            classification=r.get("classification"),
-            times_applied=r.get("times_applied", 0),
-            correct_count=r.get("correct_count", 0),
-            precision=r.get("precision", 1.0),
-            status=r.get("status", "active"),
-            added_at=_parse_datetime(r.get("added_at")),
-            last_used_at=_parse_datetime_optional(r.get("last_used_at")),
-        ))
 
-    # Low-performing patterns (precision < threshold, times_applied > 5)
-    precision_threshold = 0.7
-    low_query = """
     SELECT * FROM pattern_learned
     WHERE precision < $threshold AND times_applied > 5
     ORDER BY precision ASC;
+
+    SELECT count() AS count FROM pattern_pending_reeval WHERE reevaluated = false GROUP ALL;
     """
-    low_results = await execute_query(low_query, {"threshold": precision_threshold})
-    low_performing_patterns = []
-    for r in low_results:
-        low_performing_patterns.append(PatternStats(
-            pattern=r.get("pattern"),
-            pattern_type=r.get("pattern_type"),
-            classification=r.get("classification"),
-            times_applied=r.get("times_applied", 0),
-            correct_count=r.get("correct_count", 0),
-            precision=r.get("precision", 1.0),
-            status=r.get("status", "active"),
-            added_at=_parse_datetime(r.get("added_at")),
-            last_used_at=_parse_datetime_optional(r.get("last_used_at")),
-        ))
 
-    # Pending re-evaluation count
-    pending_query = "SELECT COUNT() AS count FROM pattern_pending_reeval WHERE reevaluated = false GROUP ALL;"
-    pending_result = await execute_query(pending_query)
-    pending_reevaluation_count = int(pending_result[0].get("count", 0)) if pending_result else 0
+    counts, top_results, low_results, pending_result = await execute_multi_query(
+        query, {"threshold": PRECISION_THRESHOLD}
+    )
 
-    return {
-        "total_patterns": total_patterns,
-        "active_patterns": active_patterns,
-        "inactive_patterns": inactive_patterns,
-        "top_patterns": top_patterns,
-        "low_performing_patterns": low_performing_patterns,
-        "pending_reevaluation_count": pending_reevaluation_count,
+    status_counts = counts[0] if counts else {}
+    report = {
+        "total_patterns": int(status_counts.get("total", 0)),
+        "active_patterns": int(status_counts.get("active", 0)),
+        "inactive_patterns": int(status_counts.get("inactive", 0)),
+        "top_patterns": [_row_to_pattern_stats(r) for r in top_results],
+        "low_performing_patterns": [_row_to_pattern_stats(r) for r in low_results],
+        "pending_reevaluation_count": (
+            int(pending_result[0].get("count", 0)) if pending_result else 0
+        ),
     }
+
+    effectiveness_report_cache["data"] = report
+    effectiveness_report_cache["timestamp"] = now
+    return dict(report)
@@ -195,6 +195,30 @@ class SurrealDBPatternTracker:
         """Update pattern statistics after verification."""
         await repository.update_pattern_precision(pattern, correct)
 
+    async def get_cached_classifications(
+        self, normalized_urls: list[str]
+    ) -> dict[str, dict]:
+        """Get persisted LLM classifications for normalized URLs."""
+        return await repository.get_cached_classifications(normalized_urls)
+
+    async def cache_classification(
+        self,
+        normalized_url: str,
+        classification: str,
+        confidence: float,
+        reason: Optional[str] = None,
+        suggested_pattern: Optional[dict] = None,
+    ) -> None:
+        """Persist an LLM classification so it can be reused across videos."""
+        await repository.cache_classification(
+            normalized_url=normalized_url,
+            domain=extract_domain(normalized_url),
+            classification=classification,
+            confidence=confidence,
+            reason=reason,
+            suggested_pattern=suggested_pattern,
+        )
+
     async def close(self) -> None:
         """Close database connection (no-op for SurrealDB singleton)."""
         pass
@@ -263,6 +263,128 @@ class TestEffectivenessReport:
         assert popular_idx < unpopular_idx
 
 
+class TestSurrealDBRepositoryQueries:
+    """Tests for the set-based SurrealDB analytics queries (mocked driver)."""
+
+    @pytest.fixture(autouse=True)
+    def clear_report_cache(self):
+        from compose.services.analytics import repository
+
+        repository.invalidate_effectiveness_report_cache()
+        yield
+        repository.invalidate_effectiveness_report_cache()
+
+    async def test_batch_reeval_single_grouped_query(self):
+        """Domain aggregates come back from one query, not one per domain."""
+        from unittest.mock import AsyncMock, patch
+        from compose.services.analytics import repository
+
+        rows = [
+            {
+                "domain": "a.com",
+                "url_count": 3,
+                "urls": ["https://a.com/1", "https://a.com/2", "https://a.com/3"],
+                "video_ids": ["v1", "v2"],
+                "avg_confidence": 0.55,
+                "content_count": 2,
+                "marketing_count": 1,
+            },
+            {
+                "domain": "b.com",
+                "url_count": 2,
+                "urls": ["https://b.com/x", "https://b.com/y"],
+                "video_ids": ["v3"],
+                "avg_confidence": None,
+                "content_count": 0,
+                "marketing_count": 2,
+            },
+        ]
+        mock_query = AsyncMock(return_value=rows)
+        with patch.object(repository, "execute_query", mock_query):
+            domains = await repository.get_domains_for_batch_reeval(min_count=2)
+
+        mock_query.assert_awaited_once()
+        assert mock_query.await_args.args[1] == {"min_count": 2}
+        assert [d.domain for d in domains] == ["a.com", "b.com"]
+        assert domains[0].url_count == 3
+        assert domains[0].classifications == {"content": 2, "marketing": 1}
+        assert domains[0].avg_confidence == 0.55
+        assert domains[1].avg_confidence == 0.0
+
+    async def test_effectiveness_report_single_round_trip(self):
+        """Report is assembled from one multi-statement query."""
+        from unittest.mock import AsyncMock, patch
+        from compose.services.analytics import repository
+
+        pattern_row = {
+            "pattern": "github.com",
+            "pattern_type": "domain",
+            "classification": "content",
+            "times_applied": 12,
+            "correct_count": 11,
+            "precision": 0.92,
+            "status": "active",
+            "added_at": "2025-01-01T00:00:00Z",
+        }
+        mock_multi = AsyncMock(return_value=[
+            [{"total": 5, "active": 4, "inactive": 1}],
+            [pattern_row],
+            [],
+            [{"count": 7}],
+        ])
+        with patch.object(repository, "execute_multi_query", mock_multi):
+            report = await repository.get_pattern_effectiveness_report()
+
+        mock_multi.assert_awaited_once()
+        assert report["total_patterns"] == 5
+        assert report["active_patterns"] == 4
+        assert report["inactive_patterns"] == 1
+        assert report["top_patterns"][0].pattern == "github.com"
+        assert report["low_performing_patterns"] == []
+        assert report["pending_reevaluation_count"] == 7
+
+    async def test_effectiveness_report_empty_tables(self):
+        """Empty GROUP ALL results produce zero counts."""
+        from unittest.mock import AsyncMock, patch
+        from compose.services.analytics import repository
+
+        mock_multi = AsyncMock(return_value=[[], [], [], []])
+        with patch.object(repository, "execute_multi_query", mock_multi):
+            report = await repository.get_pattern_effectiveness_report()
+
+        assert report["total_patterns"] == 0
+        assert report["pending_reevaluation_count"] == 0
+
+    async def test_effectiveness_report_cached_within_ttl(self):
+        """Repeated calls within the TTL reuse the cached report."""
+        from unittest.mock import AsyncMock, patch
+        from compose.services.analytics import repository
+
+        mock_multi = AsyncMock(return_value=[[{"total": 1, "active": 1, "inactive": 0}], [], [], []])
+        with patch.object(repository, "execute_multi_query", mock_multi):
+            first = await repository.get_pattern_effectiveness_report()
+            second = await repository.get_pattern_effectiveness_report()
+            await repository.get_pattern_effectiveness_report(use_cache=False)
+
+        assert first == second
+        assert mock_multi.await_count == 2
+
+    async def test_effectiveness_report_invalidated_by_new_pattern(self):
+        """Adding a learned pattern drops the cached report."""
+        from unittest.mock import AsyncMock, patch
+        from compose.services.analytics import repository
+
+        mock_multi = AsyncMock(return_value=[[{"total": 1, "active": 1, "inactive": 0}], [], [], []])
+        mock_query = AsyncMock(return_value=[{"id": "pattern_learned:x"}])
+        with patch.object(repository, "execute_multi_query", mock_multi), \
+                patch.object(repository, "execute_query", mock_query):
+            await repository.get_pattern_effectiveness_report()
+            await repository.add_learned_pattern("new.com", "domain", "content", 0.9)
+            await repository.get_pattern_effectiveness_report()
+
+        assert mock_multi.await_count == 2
+
+
 class TestPatternMatching:
     """Tests for pattern matching logic."""
 
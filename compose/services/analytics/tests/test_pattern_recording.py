@@ -244,3 +244,44 @@ class TestLearnedPatterns:
         stats = tracker.get_pattern_stats("tracked.com")
         assert stats.times_applied == 2
         assert stats.last_used_at is not None
+
+
+class TestClassificationCache:
+    """Tests for persisted LLM classification cache."""
+
+    async def test_cache_roundtrip(self, tracker):
+        """Cached classification is returned for its normalized URL."""
+        tracker.cache_classification(
+            normalized_url="https://docs.python.org/3",
+            classification="content",
+            confidence=0.9,
+            reason="Documentation",
+            suggested_pattern={"pattern": "docs.python.org", "type": "domain"},
+        )
+
+        cached = tracker.get_cached_classifications(
+            ["https://docs.python.org/3", "https://missing.com"]
+        )
+
+        assert list(cached) == ["https://docs.python.org/3"]
+        entry = cached["https://docs.python.org/3"]
+        assert entry["classification"] == "content"
+        assert entry["confidence"] == 0.9
+        assert entry["suggested_pattern"]["pattern"] == "docs.python.org"
+
+    async def test_cache_overwrites_existing(self, tracker):
+        """Caching the same URL twice keeps the latest classification."""
+        for classification in ("content", "marketing"):
+            tracker.cache_classification(
+                normalized_url="https://example.com/page",
+                classification=classification,
+                confidence=0.8,
+            )
+
+        cached = tracker.get_cached_classifications(["https://example.com/page"])
+        assert cached["https://example.com/page"]["classification"] == "marketing"
+        assert cached["https://example.com/page"]["suggested_pattern"] is None
+
+    async def test_empty_lookup(self, tracker):
+        """Looking up no URLs returns an empty dict."""
+        assert tracker.get_cached_classifications([]) == {}
@@ -166,12 +166,18 @@ class LocalArchiveWriter:
 
         return None
 
-    def update(self, video_id: str, archive: YouTubeArchive) -> Path:
+    def update(
+        self,
+        video_id: str,
+        archive: YouTubeArchive,
+        archive_path: Optional[Path] = None,
+    ) -> Path:
         """Update existing archive with new data.
 
         Args:
             video_id: YouTube video ID
             archive: Updated archive object
+            archive_path: Known path of the existing archive (skips the lookup)
 
         Returns:
             Path to updated archive file
@@ -179,13 +185,14 @@ class LocalArchiveWriter:
         Raises:
             FileNotFoundError: If archive doesn't exist
         """
-        # Find existing archive
-        existing = self.get(video_id)
-        if existing is None:
-            raise FileNotFoundError(f"Archive not found for video_id: {video_id}")
+        if archive_path is None:
+            # Find existing archive
+            existing = self.get(video_id)
+            if existing is None:
+                raise FileNotFoundError(f"Archive not found for video_id: {video_id}")
 
-        # Use original fetch date for month directory
-        archive_path = self._get_archive_path(video_id, existing.fetched_at)
+            # Use original fetch date for month directory
+            archive_path = self._get_archive_path(video_id, existing.fetched_at)
 
         # Write updated archive
         with open(archive_path, "w", encoding="utf-8") as f:
@@ -273,6 +280,8 @@ class LocalArchiveWriter:
         transformer_version: str,
         transform_manifest: dict,
         source_outputs: Optional[list[str]] = None,
+        archive: Optional[YouTubeArchive] = None,
+        archive_path: Optional[Path] = None,
     ) -> Path:
         """Add derived output to existing archive.
 
@@ -283,6 +292,8 @@ class LocalArchiveWriter:
             transformer_version: Version of transformer used
             transform_manifest: Full version manifest for staleness detection
             source_outputs: List of source output types used (e.g., ["tags"])
+            archive: Already-loaded archive to update (skips re-reading it)
+            archive_path: Path the archive was loaded from
 
         Returns:
             Path to updated archive file
@@ -290,7 +301,9 @@ class LocalArchiveWriter:
         Raises:
             FileNotFoundError: If archive doesn't exist
         """
-        archive = self.get(video_id)
+        if archive is None:
+            archive = self.get(video_id)
+            archive_path = None
         if archive is None:
             raise FileNotFoundError(f"Archive not found for video_id: {video_id}")
 
@@ -302,7 +315,7 @@ class LocalArchiveWriter:
             source_outputs=source_outputs,
         )
 
-        return self.update(video_id, archive)
+        return self.update(video_id, archive, archive_path)
 
     def count(self) -> int:
         """Count total number of archived videos.
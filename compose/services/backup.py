@@ -1,21 +1,44 @@
 """Backup service for SurrealDB data to MinIO.
 
-Exports all SurrealDB tables to JSON and stores them in MinIO with
-metadata tracking in SurrealDB.
+Exports all SurrealDB tables to MinIO with metadata tracking in SurrealDB.
+
+Each table is paged through by record ID range (one key-ordered seek per
+page, see iter_table_pages) and written as gzip-compressed NDJSON parts
+under ``{minio_path}/{table}/part-NNNNN.ndjson.gz``. Parts are spooled to a
+temporary file and uploaded with MinIO multipart upload, and tables are
+backed up concurrently, so memory use is bounded by the page size and
+concurrency rather than the table size. The manifest records row counts,
+parts and a SHA-256 checksum per table.
+
+Restores stream each part back and load it with batched ``INSERT``
+statements, several tables at once. Table indexes are removed during the
+load and redefined afterwards (one index build instead of per-row updates).
+Progress is checkpointed per completed part on the backup record. A
+restore starts from scratch unless it is asked to resume, in which case it
+continues a failed or interrupted restore from each table's last completed
+part. The checkpoint is cleared once a restore succeeds.
+
+Backups written before this format (one ``{table}.json`` per table)
+can still be restored.
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
 import logging
+import os
+import tempfile
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from itertools import batched
+from typing import Any, AsyncIterator, Iterator, Optional
 from uuid import uuid4
 
 from pydantic import BaseModel
 
 from compose.services.minio.factory import create_minio_client
-from compose.services.surrealdb.driver import execute_query
+from compose.services.surrealdb.driver import execute_multi_query, execute_query
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +56,18 @@ BACKUP_TABLES = [
 ]
 
 
+# Streaming backup settings
+BACKUP_FORMAT = "ndjson.gz"
+BACKUP_PAGE_SIZE = int(os.getenv("BACKUP_PAGE_SIZE", "500"))  # Rows per query
+BACKUP_PART_BYTES = int(os.getenv("BACKUP_PART_BYTES", str(256 * 1024 * 1024)))  # NDJSON bytes per part
+BACKUP_CONCURRENCY = int(os.getenv("BACKUP_CONCURRENCY", "3"))  # Tables backed up at once
+SPOOL_MAX_BYTES = 8 * 1024 * 1024  # Part bytes kept in memory before spilling to disk
+
+# Restore settings
+RESTORE_BATCH_SIZE = int(os.getenv("RESTORE_BATCH_SIZE", "500"))  # Rows per INSERT
+RESTORE_CONCURRENCY = int(os.getenv("RESTORE_CONCURRENCY", "3"))  # Tables restored at once
+
+
 class BackupStatus(str, Enum):
     """Status of a backup job."""
 
@@ -53,14 +88,173 @@ class BackupMeta(BaseModel):
     minio_path: str
     size_bytes: int = 0
     error: Optional[str] = None
+    # Per-table restore checkpoints: {table: {status, parts_done, total_parts, rows, indexes}}
+    restore_progress: dict[str, dict] = {}
+
+
+def _record_key(record_id: Any) -> Any:
+    """Key part of a record ID (``RecordID.id``, or the text after ``table:``)."""
+    if isinstance(record_id, str):
+        return record_id.split(":", 1)[1] if ":" in record_id else record_id
+    return record_id.id
+
+
+async def iter_table_pages(table: str, page_size: int = BACKUP_PAGE_SIZE) -> AsyncIterator[list[dict]]:
+    """Page through a table in record ID order.
+
+    Each page reads the record ID range after the previous page's last key
+    (``type::thing($table, $after>..)``), which SurrealDB serves by seeking
+    into the table's key order. Every page costs O(page_size) with no sort,
+    however deep into the table it is, and unlike ``START`` offsets, rows
+    inserted or deleted during the backup don't shift later pages.
+
+    Args:
+        table: Table name
+        page_size: Rows per page
+
+    Yields:
+        Lists of up to page_size records
+    """
+    after = None
+    while True:
+        if after is None:
+            rows = await execute_query(
+                "SELECT * FROM type::thing($table, ..) LIMIT $limit",
+                {"table": table, "limit": page_size},
+            )
+        else:
+            rows = await execute_query(
+                "SELECT * FROM type::thing($table, $after>..) LIMIT $limit",
+                {"table": table, "after": after, "limit": page_size},
+            )
+        if not rows:
+            return
+        yield rows
+        if len(rows) < page_size:
+            return
+        after = _record_key(rows[-1]["id"])
+
+
+class TablePartWriter:
+    """Write one table as gzip-compressed NDJSON parts in MinIO.
+
+    Blocking (compression and upload); call from a worker thread.
+    """
+
+    def __init__(self, minio: Any, minio_path: str, table: str, part_bytes: int = BACKUP_PART_BYTES):
+        """Initialize writer.
+
+        Args:
+            minio: MinIOClient to upload parts with
+            minio_path: Backup prefix in MinIO
+            table: Table being written
+            part_bytes: Uncompressed NDJSON bytes at which a part is uploaded
+        """
+        self.minio = minio
+        self.minio_path = minio_path
+        self.table = table
+        self.part_bytes = part_bytes
+        self.rows = 0
+        self.size_bytes = 0
+        self.parts: list[dict] = []
+        self._digest = hashlib.sha256()
+        self._file = None
+        self._gzip = None
+        self._part_rows = 0
+        self._part_raw_bytes = 0
+
+    def write(self, records: list[dict]) -> None:
+        """Append records, uploading a part once it reaches part_bytes."""
+        if self._gzip is None:
+            self._file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+            self._gzip = gzip.GzipFile(fileobj=self._file, mode="wb", mtime=0)
+
+        for record in records:
+            line = (json.dumps(record, default=str) + "\n").encode("utf-8")
+            self._digest.update(line)
+            self._gzip.write(line)
+            self._part_raw_bytes += len(line)
+
+        self.rows += len(records)
+        self._part_rows += len(records)
+        if self._part_raw_bytes >= self.part_bytes:
+            self._upload_part()
+
+    def _upload_part(self) -> None:
+        self._gzip.close()
+        size = self._file.tell()
+
+        part_digest = hashlib.sha256()
+        self._file.seek(0)
+        for chunk in iter(lambda: self._file.read(1024 * 1024), b""):
+            part_digest.update(chunk)
+        self._file.seek(0)
+
+        path = f"{self.minio_path}/{self.table}/part-{len(self.parts):05d}.{BACKUP_FORMAT}"
+        self.minio.put_stream(path, self._file, length=size, content_type="application/gzip")
+        self.parts.append({
+            "path": path,
+            "rows": self._part_rows,
+            "size_bytes": size,
+            "sha256": part_digest.hexdigest(),
+        })
+        self.size_bytes += size
+
+        self._file.close()
+        self._file = None
+        self._gzip = None
+        self._part_rows = 0
+        self._part_raw_bytes = 0
+
+    def close(self) -> dict:
+        """Upload the final part.
+
+        Returns:
+            Manifest entry: rows, size_bytes, sha256 (of the uncompressed
+            NDJSON across all parts, in order) and parts
+        """
+        if self._gzip is not None:
+            if self._part_rows:
+                self._upload_part()
+            else:
+                self._file.close()
+                self._file = None
+                self._gzip = None
+
+        return {
+            "rows": self.rows,
+            "size_bytes": self.size_bytes,
+            "sha256": self._digest.hexdigest(),
+            "parts": self.parts,
+        }
+
+
+def _restore_record(record: dict) -> dict:
+    """Prepare a backed-up record for INSERT, keeping its original ID."""
+    # Remove SurrealDB internal fields for clean insert
+    clean_record = {k: v for k, v in record.items() if not k.startswith("_") and k != "id"}
+
+    original_id = record.get("id", "")
+    if isinstance(original_id, str) and ":" in original_id:
+        original_id = original_id.split(":", 1)[1]
+    if original_id:
+        clean_record["id"] = original_id
+    return clean_record
 
 
 class BackupService:
     """Service for managing SurrealDB backups to MinIO."""
 
-    def __init__(self):
-        """Initialize backup service."""
+    def __init__(self, page_size: int = BACKUP_PAGE_SIZE, part_bytes: int = BACKUP_PART_BYTES):
+        """Initialize backup service.
+
+        Args:
+            page_size: Rows fetched per query while backing up a table.
+            part_bytes: Uncompressed NDJSON bytes per backup part.
+        """
         self._minio = None
+        self.page_size = page_size
+        self.part_bytes = part_bytes
 
     @property
     def minio(self):
@@ -94,6 +288,7 @@ class BackupService:
                         minio_path=record.get("minio_path", ""),
                         size_bytes=record.get("size_bytes", 0),
                         error=record.get("error"),
+                        restore_progress=record.get("restore_progress") or {},
                     )
                 )
             except Exception as e:
@@ -154,8 +349,6 @@ class BackupService:
             minio_path: Path in MinIO to store backup files.
         """
         logger.info(f"Starting backup task for {backup_id}")
-        tables_backed_up = []
-        total_size = 0
 
         try:
             # Update status to in_progress
@@ -164,29 +357,31 @@ class BackupService:
                 {"status": BackupStatus.IN_PROGRESS.value},
             )
 
-            # Backup each table
-            for table in BACKUP_TABLES:
-                try:
-                    result = await execute_query(f"SELECT * FROM {table}")
-                    if result:
-                        # Serialize and upload to MinIO
-                        json_data = json.dumps(result, default=str)
-                        json_bytes = json_data.encode("utf-8")
-                        total_size += len(json_bytes)
-
-                        object_path = f"{minio_path}/{table}.json"
-                        self.minio.put_json(object_path, result)
-                        tables_backed_up.append(table)
-                        logger.info(f"Backed up {table}: {len(result)} records")
-                except Exception as e:
-                    logger.warning(f"Failed to backup table {table}: {e}")
+            # Back up tables concurrently
+            minio = self.minio
+            semaphore = asyncio.Semaphore(BACKUP_CONCURRENCY)
+
+            async def backup_one(table: str) -> tuple[str, Optional[dict]]:
+                async with semaphore:
+                    try:
+                        return table, await self._backup_table(minio, minio_path, table)
+                    except Exception as e:
+                        logger.warning(f"Failed to backup table {table}: {e}")
+                        return table, None
+
+            results = await asyncio.gather(*(backup_one(table) for table in BACKUP_TABLES))
+            table_details = {table: details for table, details in results if details and details["rows"]}
+            tables_backed_up = list(table_details)
+            total_size = sum(details["size_bytes"] for details in table_details.values())
 
             # Create manifest
             manifest = {
                 "backup_id": backup_id,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
+                "format": BACKUP_FORMAT,
                 "tables": tables_backed_up,
                 "total_size_bytes": total_size,
+                "table_details": table_details,
             }
             self.minio.put_json(f"{minio_path}/manifest.json", manifest)
 
@@ -213,6 +408,59 @@ class BackupService:
                 },
             )
 
+    async def _backup_table(self, minio: Any, minio_path: str, table: str) -> dict:
+        """Stream one table to MinIO as NDJSON parts.
+
+        Args:
+            minio: MinIOClient to upload with
+            minio_path: Backup prefix in MinIO
+            table: Table to back up
+
+        Returns:
+            Manifest entry for the table (see TablePartWriter.close)
+        """
+        writer = TablePartWriter(minio, minio_path, table, self.part_bytes)
+        async for page in iter_table_pages(table, self.page_size):
+            # Serialization, compression and uploads stay off the event loop
+            await asyncio.to_thread(writer.write, page)
+        details = await asyncio.to_thread(writer.close)
+        if details["rows"]:
+            logger.info(f"Backed up {table}: {details['rows']} records in {len(details['parts'])} parts")
+        return details
+
+    def _table_parts(self, minio_path: str, manifest: dict, table: str) -> list[str]:
+        """Object paths holding a table's records, in order."""
+        details = manifest.get("table_details", {}).get(table)
+        if details is None:
+            # Legacy backups store each table as one JSON array
+            return [f"{minio_path}/{table}.json"]
+        return [part["path"] for part in details["parts"]]
+
+    def _iter_part_records(self, path: str) -> Iterator[dict]:
+        """Stream the records of one backup object."""
+        if path.endswith(".json"):
+            yield from self.minio.get_json(path)
+            return
+
+        with self.minio.open_stream(path) as stream, gzip.GzipFile(fileobj=stream) as lines:
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _iter_backup_records(self, minio_path: str, manifest: dict, table: str) -> Iterator[dict]:
+        """Stream a table's records from a backup.
+
+        Args:
+            minio_path: Backup prefix in MinIO
+            manifest: Backup manifest
+            table: Table to read
+
+        Yields:
+            Backed-up records
+        """
+        for path in self._table_parts(minio_path, manifest, table):
+            yield from self._iter_part_records(path)
+
     async def get_backup(self, backup_id: str) -> Optional[BackupMeta]:
         """Get backup metadata by ID.
 
@@ -240,13 +488,20 @@ class BackupService:
             minio_path=record.get("minio_path", ""),
             size_bytes=record.get("size_bytes", 0),
             error=record.get("error"),
+            restore_progress=record.get("restore_progress") or {},
         )
 
-    async def restore_backup(self, backup_id: str) -> bool:
+    async def restore_backup(self, backup_id: str, resume: bool = False) -> bool:
         """Restore data from a backup.
 
+        Tables are loaded concurrently in batched inserts. Progress from an
+        earlier restore is only used when resume is set; otherwise it is
+        discarded and every table is reloaded.
+
         Args:
             backup_id: ID of the backup to restore.
+            resume: Continue a failed or interrupted restore of this backup
+                from each table's last completed part.
 
         Returns:
             True if restore successful, False otherwise.
@@ -263,50 +518,36 @@ class BackupService:
         try:
             # Read manifest
             manifest_path = f"{backup.minio_path}/manifest.json"
-            manifest = self.minio.get_json(manifest_path)
+            manifest = await asyncio.to_thread(self.minio.get_json, manifest_path)
             tables = manifest.get("tables", [])
 
-            # Restore each table
-            for table in tables:
-                try:
-                    object_path = f"{backup.minio_path}/{table}.json"
-                    records = self.minio.get_json(object_path)
-
-                    # Delete existing records in table
-                    await execute_query(f"DELETE {table}")
-
-                    # Insert backup records
-                    for record in records:
-                        # Remove SurrealDB internal fields for clean insert
-                        clean_record = {
-                            k: v
-                            for k, v in record.items()
-                            if not k.startswith("_") and k != "id"
-                        }
-
-                        # Get original ID if present
-                        original_id = record.get("id", "")
-                        if isinstance(original_id, str) and ":" in original_id:
-                            original_id = original_id.split(":")[1]
-
-                        # Create with original ID
-                        if original_id:
-                            await execute_query(
-                                f"CREATE {table}:`{original_id}` CONTENT $data",
-                                {"data": clean_record},
-                            )
-                        else:
-                            await execute_query(
-                                f"CREATE {table} CONTENT $data",
-                                {"data": clean_record},
-                            )
-
-                    logger.info(f"Restored {table}: {len(records)} records")
+            progress = dict(backup.restore_progress) if resume else {}
+            if progress:
+                logger.info(f"Resuming restore of backup {backup_id}")
+            elif backup.restore_progress:
+                # Leftover checkpoints belong to an earlier attempt
+                await self._clear_restore_progress(backup_id)
 
-                except Exception as e:
-                    logger.error(f"Failed to restore table {table}: {e}")
-                    return False
+            semaphore = asyncio.Semaphore(RESTORE_CONCURRENCY)
+
+            async def restore_one(table: str) -> int:
+                async with semaphore:
+                    return await self._restore_table(backup, manifest, table, progress.get(table))
+
+            results = await asyncio.gather(
+                *(restore_one(table) for table in tables),
+                return_exceptions=True,
+            )
 
+            failed = False
+            for table, result in zip(tables, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Failed to restore table {table}: {result}")
+                    failed = True
+            if failed:
+                return False
+
+            await self._clear_restore_progress(backup_id)
             logger.info(f"Restore from backup {backup_id} completed")
             return True
 
@@ -314,6 +555,97 @@ class BackupService:
             logger.error(f"Restore failed: {e}")
             return False
 
+    async def _save_restore_progress(self, backup_id: str, table: str, state: dict) -> None:
+        """Checkpoint one table's restore state on the backup record."""
+        await execute_query(
+            f"UPDATE backup:`{backup_id}` SET restore_progress[$table] = $state",
+            {"table": table, "state": state},
+        )
+
+    async def _clear_restore_progress(self, backup_id: str) -> None:
+        """Drop all restore checkpoints from the backup record."""
+        await execute_query(f"UPDATE backup:`{backup_id}` SET restore_progress = {{}}")
+
+    async def _get_table_indexes(self, table: str) -> dict[str, str]:
+        """Index definitions of a table ({name: DEFINE INDEX statement})."""
+        results = await execute_multi_query(f"INFO FOR TABLE {table};")
+        info = results[0][0] if results and results[0] else {}
+        return dict(info.get("indexes") or {})
+
+    async def _restore_table(
+        self,
+        backup: BackupMeta,
+        manifest: dict,
+        table: str,
+        state: Optional[dict] = None,
+    ) -> int:
+        """Load one table from its backup parts.
+
+        Args:
+            backup: Backup being restored
+            manifest: Backup manifest
+            table: Table to restore
+            state: Checkpoint to resume from, if any
+
+        Returns:
+            Number of records restored
+        """
+        parts = self._table_parts(backup.minio_path, manifest, table)
+        state = dict(state or {"status": "pending", "parts_done": 0, "rows": 0})
+        state["total_parts"] = len(parts)
+        if state["status"] == "done":
+            return state["rows"]
+
+        # Record index definitions before dropping them, so a resumed
+        # restore can still recreate them
+        if "indexes" not in state:
+            state["indexes"] = await self._get_table_indexes(table)
+            await self._save_restore_progress(backup.id, table, state)
+
+        for name in state["indexes"]:
+            await execute_query(f"REMOVE INDEX IF EXISTS {name} ON TABLE {table}")
+
+        try:
+            if state["parts_done"] == 0:
+                # Delete existing records in table
+                await execute_query(f"DELETE {table}")
+                state["rows"] = 0
+            state["status"] = "loading"
+
+            for part_number in range(state["parts_done"], len(parts)):
+                batches = batched(self._iter_part_records(parts[part_number]), RESTORE_BATCH_SIZE)
+                rows = state["rows"]
+                while True:
+                    # Download and decompression happen in a worker thread
+                    batch = await asyncio.to_thread(next, batches, None)
+                    if batch is None:
+                        break
+                    # IGNORE keeps a resumed part from failing on rows it already loaded
+                    await execute_query(
+                        f"INSERT IGNORE INTO {table} $rows",
+                        {"rows": [_restore_record(record) for record in batch]},
+                    )
+                    rows += len(batch)
+
+                state["rows"] = rows
+                state["parts_done"] = part_number + 1
+                await self._save_restore_progress(backup.id, table, state)
+                logger.info(
+                    f"Restoring {table}: part {part_number + 1}/{len(parts)}, {rows} records"
+                )
+        finally:
+            # Build indexes once over the loaded data
+            for name, definition in state["indexes"].items():
+                try:
+                    await execute_query(definition)
+                except Exception as e:
+                    logger.warning(f"Failed to recreate index {name} on {table}: {e}")
+
+        state["status"] = "done"
+        await self._save_restore_progress(backup.id, table, state)
+        logger.info(f"Restored {table}: {state['rows']} records")
+        return state["rows"]
+
     async def delete_backup(self, backup_id: str) -> bool:
         """Delete a backup and its files from MinIO.
 
@@ -31,6 +31,7 @@ from .driver import (
     get_session,
     execute_query,
     execute_write,
+    execute_write_batches,
     verify_connection,
 )
 
@@ -45,12 +46,16 @@ from .models import (
 from .repository import (
     init_schema,
     upsert_video,
+    upsert_videos,
     get_video,
     update_pipeline_state,
+    update_pipeline_states,
     find_stale_videos,
     count_stale_videos,
     link_video_to_channel,
+    link_videos_to_channels,
     link_video_to_topics,
+    link_videos_to_topics,
     get_video_count,
     get_channel_count,
     get_topic_count,
@@ -64,6 +69,7 @@ __all__ = [
     "get_session",
     "execute_query",
     "execute_write",
+    "execute_write_batches",
     "verify_connection",
     # Models
     "VideoNode",
@@ -74,12 +80,16 @@ __all__ = [
     # Repository
     "init_schema",
     "upsert_video",
+    "upsert_videos",
     "get_video",
     "update_pipeline_state",
+    "update_pipeline_states",
     "find_stale_videos",
     "count_stale_videos",
     "link_video_to_channel",
+    "link_videos_to_channels",
     "link_video_to_topics",
+    "link_videos_to_topics",
     "get_video_count",
     "get_channel_count",
     "get_topic_count",
@@ -2,6 +2,10 @@
 
 Provides a singleton driver instance that connects on first use.
 Supports both sync and async operations.
+
+Bulk writes go through execute_write_batches, which runs an
+``UNWIND $rows`` query over chunks of rows on one pooled session, one
+transaction per chunk.
 """
 
 import os
@@ -16,6 +20,17 @@ NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "")
 
+# Rows per transaction for execute_write_batches
+DEFAULT_BATCH_SIZE = int(os.getenv("NEO4J_BATCH_SIZE", "5000"))
+
+SUMMARY_COUNTERS = (
+    "nodes_created",
+    "nodes_deleted",
+    "relationships_created",
+    "relationships_deleted",
+    "properties_set",
+)
+
 
 # Singleton driver instance
 _driver: Optional[Driver] = None
@@ -121,13 +136,55 @@ def execute_write(
     with get_session(database) as session:
         result = session.run(query, parameters or {})
         summary = result.consume()
-        return {
-            "nodes_created": summary.counters.nodes_created,
-            "nodes_deleted": summary.counters.nodes_deleted,
-            "relationships_created": summary.counters.relationships_created,
-            "relationships_deleted": summary.counters.relationships_deleted,
-            "properties_set": summary.counters.properties_set,
-        }
+        return _summary_counters(summary)
+
+
+def _summary_counters(summary: Any) -> dict[str, int]:
+    """Extract write counters from a result summary."""
+    return {name: getattr(summary.counters, name) for name in SUMMARY_COUNTERS}
+
+
+def _run_and_consume(tx: Any, query: str, parameters: dict[str, Any]) -> Any:
+    return tx.run(query, parameters).consume()
+
+
+def execute_write_batches(
+    query: str,
+    rows: list[dict[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    parameters: Optional[dict[str, Any]] = None,
+    database: str = "neo4j",
+) -> dict[str, int]:
+    """Execute an ``UNWIND $rows`` write query over rows in batches.
+
+    All batches share one session (a single pooled connection) and each
+    batch is its own managed transaction, retried by the driver on
+    transient errors.
+
+    Args:
+        query: Cypher query reading its input from ``$rows``
+        rows: Row dicts to write
+        batch_size: Rows per transaction
+        parameters: Extra query parameters shared by every batch
+        database: Database name
+
+    Returns:
+        Summed query counters plus ``batches`` (transactions run)
+    """
+    totals = dict.fromkeys(SUMMARY_COUNTERS, 0)
+    totals["batches"] = 0
+    if not rows:
+        return totals
+
+    with get_session(database) as session:
+        for start in range(0, len(rows), batch_size):
+            batch_params = {**(parameters or {}), "rows": rows[start:start + batch_size]}
+            summary = session.execute_write(_run_and_consume, query, batch_params)
+            for name, value in _summary_counters(summary).items():
+                totals[name] += value
+            totals["batches"] += 1
+
+    return totals
 
 
 def verify_connection() -> bool:
@@ -4,13 +4,18 @@ Provides CRUD operations for:
 - Video nodes with pipeline state
 - Channel and Topic relationships
 - Efficient backfill queries for stale videos
+
+Single-video functions issue one statement per call. The bulk variants
+(upsert_videos, update_pipeline_states, link_videos_to_channels,
+link_videos_to_topics) send rows through ``UNWIND $rows`` in batches of
+DEFAULT_BATCH_SIZE per transaction, for graph rebuilds and backfills.
 """
 
 import json
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
-from .driver import execute_query, execute_write, get_session
+from .driver import DEFAULT_BATCH_SIZE, execute_query, execute_write, execute_write_batches, get_session
 from .models import VideoNode, ChannelNode, TopicNode, StaleVideoResult
 
 
@@ -38,36 +43,28 @@ def init_schema() -> None:
             pass  # Constraint/index may already exist
 
 
-def upsert_video(video: VideoNode) -> dict:
-    """Create or update a video node.
-
-    Args:
-        video: VideoNode to upsert
-
-    Returns:
-        Query summary
-    """
-    query = """
-    MERGE (v:Video {video_id: $video_id})
-    ON CREATE SET v.created_at = datetime()
-    SET v.url = $url,
-        v.fetched_at = datetime($fetched_at),
-        v.title = $title,
-        v.channel_id = $channel_id,
-        v.channel_name = $channel_name,
-        v.duration_seconds = $duration_seconds,
-        v.view_count = $view_count,
-        v.published_at = CASE WHEN $published_at IS NOT NULL THEN datetime($published_at) ELSE NULL END,
-        v.source_type = $source_type,
-        v.import_method = $import_method,
-        v.recommendation_weight = $recommendation_weight,
-        v.pipeline_state = $pipeline_state_json,
-        v.last_processed_at = CASE WHEN $last_processed_at IS NOT NULL THEN datetime($last_processed_at) ELSE NULL END,
+# SET clause shared by upsert_video ($-params) and upsert_videos (row.*)
+_VIDEO_SET_CLAUSE = """
+    SET v.url = {p}url,
+        v.fetched_at = datetime({p}fetched_at),
+        v.title = {p}title,
+        v.channel_id = {p}channel_id,
+        v.channel_name = {p}channel_name,
+        v.duration_seconds = {p}duration_seconds,
+        v.view_count = {p}view_count,
+        v.published_at = CASE WHEN {p}published_at IS NOT NULL THEN datetime({p}published_at) ELSE NULL END,
+        v.source_type = {p}source_type,
+        v.import_method = {p}import_method,
+        v.recommendation_weight = {p}recommendation_weight,
+        v.pipeline_state = {p}pipeline_state_json,
+        v.last_processed_at = CASE WHEN {p}last_processed_at IS NOT NULL THEN datetime({p}last_processed_at) ELSE NULL END,
         v.updated_at = datetime()
-    RETURN v
-    """
+"""
+
 
-    params = {
+def _video_params(video: VideoNode) -> dict:
+    """Query parameters for a video node."""
+    return {
         "video_id": video.video_id,
         "url": video.url,
         "fetched_at": video.fetched_at.isoformat(),
@@ -84,7 +81,44 @@ def upsert_video(video: VideoNode) -> dict:
         "last_processed_at": video.last_processed_at.isoformat() if video.last_processed_at else None,
     }
 
-    return execute_write(query, params)
+
+def upsert_video(video: VideoNode) -> dict:
+    """Create or update a video node.
+
+    Args:
+        video: VideoNode to upsert
+
+    Returns:
+        Query summary
+    """
+    query = f"""
+    MERGE (v:Video {{video_id: $video_id}})
+    ON CREATE SET v.created_at = datetime()
+    {_VIDEO_SET_CLAUSE.format(p="$")}
+    RETURN v
+    """
+
+    return execute_write(query, _video_params(video))
+
+
+def upsert_videos(videos: Iterable[VideoNode], batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+    """Create or update many video nodes in batched transactions.
+
+    Args:
+        videos: VideoNodes to upsert
+        batch_size: Videos per transaction
+
+    Returns:
+        Summed query summary (plus ``batches``)
+    """
+    query = f"""
+    UNWIND $rows AS row
+    MERGE (v:Video {{video_id: row.video_id}})
+    ON CREATE SET v.created_at = datetime()
+    {_VIDEO_SET_CLAUSE.format(p="row.")}
+    """
+
+    return execute_write_batches(query, [_video_params(v) for v in videos], batch_size)
 
 
 def get_video(video_id: str) -> Optional[VideoNode]:
@@ -166,6 +200,52 @@ def update_pipeline_state(video_id: str, step_name: str, version_hash: str) -> d
     })
 
 
+def update_pipeline_states(
+    states: dict[str, dict[str, str]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict:
+    """Merge step versions into many videos' pipeline state.
+
+    Current states are read in one query, merged in Python (pipeline_state
+    is a JSON string), and written back in batched transactions. Unknown
+    video IDs are ignored.
+
+    Args:
+        states: Mapping of video_id -> {step_name: version_hash}
+        batch_size: Videos per transaction
+
+    Returns:
+        Summed query summary (plus ``batches``)
+    """
+    write_query = """
+    UNWIND $rows AS row
+    MATCH (v:Video {video_id: row.video_id})
+    SET v.pipeline_state = row.pipeline_state_json,
+        v.last_processed_at = datetime(),
+        v.updated_at = datetime()
+    """
+    if not states:
+        return execute_write_batches(write_query, [], batch_size)
+
+    read_query = """
+    MATCH (v:Video)
+    WHERE v.video_id IN $video_ids
+    RETURN v.video_id AS video_id, v.pipeline_state AS pipeline_state
+    """
+    results = execute_query(read_query, {"video_ids": list(states)})
+
+    rows = []
+    for r in results:
+        current_state = json.loads(r.get("pipeline_state") or "{}")
+        current_state.update(states[r["video_id"]])
+        rows.append({
+            "video_id": r["video_id"],
+            "pipeline_state_json": json.dumps(current_state),
+        })
+
+    return execute_write_batches(write_query, rows, batch_size)
+
+
 def find_stale_videos(
     step_name: str,
     current_version: str,
@@ -272,6 +352,39 @@ def link_video_to_channel(video_id: str, channel_id: str, channel_name: str) ->
     })
 
 
+def link_videos_to_channels(
+    links: Iterable[tuple[str, str, str]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict:
+    """Create or update channel relationships for many videos.
+
+    Unlike link_video_to_channel, a channel's video_count is only
+    incremented when the relationship is new, so re-running a rebuild
+    doesn't inflate counts.
+
+    Args:
+        links: (video_id, channel_id, channel_name) tuples
+        batch_size: Links per transaction
+
+    Returns:
+        Summed query summary (plus ``batches``)
+    """
+    query = """
+    UNWIND $rows AS row
+    MATCH (v:Video {video_id: row.video_id})
+    MERGE (c:Channel {channel_id: row.channel_id})
+    ON CREATE SET c.channel_name = row.channel_name, c.video_count = 0, c.created_at = datetime()
+    MERGE (v)-[:FROM_CHANNEL]->(c)
+    ON CREATE SET c.video_count = c.video_count + 1
+    """
+
+    rows = [
+        {"video_id": video_id, "channel_id": channel_id, "channel_name": channel_name}
+        for video_id, channel_id, channel_name in links
+    ]
+    return execute_write_batches(query, rows, batch_size)
+
+
 def link_video_to_topics(video_id: str, topics: list[str]) -> dict:
     """Create topic nodes and link to video.
 
@@ -298,6 +411,39 @@ def link_video_to_topics(video_id: str, topics: list[str]) -> dict:
     })
 
 
+def link_videos_to_topics(
+    topics: dict[str, list[str]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict:
+    """Create topic nodes and link them to many videos.
+
+    A topic's video_count is only incremented for new relationships.
+
+    Args:
+        topics: Mapping of video_id -> topic/tag names
+        batch_size: Videos per transaction
+
+    Returns:
+        Summed query summary (plus ``batches``)
+    """
+    query = """
+    UNWIND $rows AS row
+    MATCH (v:Video {video_id: row.video_id})
+    UNWIND row.topics AS topic_name
+    MERGE (t:Topic {normalized_name: toLower(trim(topic_name))})
+    ON CREATE SET t.name = trim(topic_name), t.video_count = 0, t.created_at = datetime()
+    MERGE (v)-[:HAS_TOPIC]->(t)
+    ON CREATE SET t.video_count = t.video_count + 1
+    """
+
+    rows = [
+        {"video_id": video_id, "topics": names}
+        for video_id, names in topics.items()
+        if names
+    ]
+    return execute_write_batches(query, rows, batch_size)
+
+
 def get_video_count() -> int:
     """Get total number of videos in the graph."""
     results = execute_query("MATCH (v:Video) RETURN count(v) AS count")
@@ -0,0 +1,366 @@
+"""Dependency health probing with caching and circuit breaking.
+
+Probes run concurrently through one pooled httpx client; blocking probes
+(e.g. the MinIO SDK) run in a worker thread. Results are cached for a TTL,
+and services that keep failing are probed with exponential backoff instead
+of costing a full timeout on every refresh.
+
+Per-probe latency is recorded on the ``health_probe_duration_seconds``
+histogram and current status on the ``health_service_up`` gauge.
+
+Example:
+    >>> monitor = get_health_monitor()
+    >>> results = await monitor.check_all()
+    >>> results["surrealdb"].ok
+    True
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+import httpx
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+logger = logging.getLogger(__name__)
+
+# Probe defaults
+PROBE_TIMEOUT = 2.0        # Seconds before a probe counts as failed
+RESULT_TTL = 10.0          # Seconds a probe result is reused
+FAILURE_THRESHOLD = 2      # Consecutive failures before the circuit opens
+BASE_BACKOFF = 30.0        # First open-circuit interval (seconds)
+MAX_BACKOFF = 300.0        # Cap for the doubling backoff (seconds)
+
+ProbeFn = Callable[[httpx.AsyncClient], Awaitable[bool]]
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of a single dependency probe."""
+
+    ok: bool
+    latency_ms: float = 0.0
+    error: Optional[str] = None
+    checked_at: float = 0.0
+    circuit_open: bool = False
+
+
+@dataclass
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with doubling backoff.
+
+    Attributes:
+        failures: Consecutive failed probes
+        open_until: Monotonic time before which probes are skipped
+    """
+
+    failure_threshold: int = FAILURE_THRESHOLD
+    base_backoff: float = BASE_BACKOFF
+    max_backoff: float = MAX_BACKOFF
+    failures: int = 0
+    open_until: float = 0.0
+
+    def is_open(self, now: float) -> bool:
+        """Whether probes should be skipped at time now."""
+        return now < self.open_until
+
+    def record(self, ok: bool, now: float) -> None:
+        """Update state after a probe."""
+        if ok:
+            self.failures = 0
+            self.open_until = 0.0
+            return
+
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            exponent = self.failures - self.failure_threshold
+            backoff = min(self.base_backoff * (2 ** exponent), self.max_backoff)
+            self.open_until = now + backoff
+
+
+@dataclass
+class _ServiceState:
+    probe: ProbeFn
+    breaker: CircuitBreaker
+    result: Optional[ProbeResult] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+# Metrics instruments (no-op until a meter provider is configured)
+_meter = metrics.get_meter(__name__)
+probe_duration_histogram = _meter.create_histogram(
+    name="health_probe_duration_seconds",
+    description="Dependency health probe duration in seconds",
+    unit="s",
+)
+
+
+class HealthMonitor:
+    """Concurrent, cached health checks for external dependencies.
+
+    Example:
+        >>> monitor = HealthMonitor()
+        >>> monitor.register("infinity", http_probe("http://infinity:7997/health"))
+        >>> results = await monitor.check_all()
+    """
+
+    def __init__(
+        self,
+        timeout: float = PROBE_TIMEOUT,
+        ttl: float = RESULT_TTL,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        base_backoff: float = BASE_BACKOFF,
+        max_backoff: float = MAX_BACKOFF,
+    ):
+        """Initialize monitor.
+
+        Args:
+            timeout: Per-probe timeout in seconds
+            ttl: Seconds a result is served from cache
+            failure_threshold: Consecutive failures before backing off
+            base_backoff: First backoff interval in seconds
+            max_backoff: Maximum backoff interval in seconds
+        """
+        self.timeout = timeout
+        self.ttl = ttl
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._services: dict[str, _ServiceState] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def services(self) -> list[str]:
+        """Registered service names in registration order."""
+        return list(self._services)
+
+    def register(self, name: str, probe: ProbeFn) -> None:
+        """Register a probe.
+
+        Args:
+            name: Service name used in results and metrics
+            probe: Async callable taking the shared client, returning True if healthy
+        """
+        self._services[name] = _ServiceState(
+            probe=probe,
+            breaker=CircuitBreaker(
+                failure_threshold=self.failure_threshold,
+                base_backoff=self.base_backoff,
+                max_backoff=self.max_backoff,
+            ),
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared pooled HTTP client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def _run_probe(self, name: str, state: _ServiceState) -> ProbeResult:
+        """Run one probe with timeout, timing and metrics."""
+        start = time.perf_counter()
+        error = None
+        try:
+            ok = bool(await asyncio.wait_for(state.probe(self._get_client()), self.timeout))
+        except asyncio.TimeoutError:
+            ok, error = False, f"timed out after {self.timeout}s"
+        except Exception as e:
+            ok, error = False, str(e)
+        elapsed = time.perf_counter() - start
+
+        probe_duration_histogram.record(elapsed, {"service": name, "ok": ok})
+        if not ok:
+            logger.debug(f"Health probe {name} failed: {error or 'unhealthy response'}")
+
+        return ProbeResult(
+            ok=ok,
+            latency_ms=round(elapsed * 1000, 1),
+            error=error,
+            checked_at=time.monotonic(),
+        )
+
+    async def check(self, name: str, force: bool = False) -> ProbeResult:
+        """Check one service, using the cache and circuit breaker.
+
+        Args:
+            name: Registered service name
+            force: Probe even if a fresh result or open circuit exists
+
+        Returns:
+            Latest ProbeResult for the service
+        """
+        state = self._services[name]
+
+        async with state.lock:
+            now = time.monotonic()
+            cached = state.result
+            if not force and cached is not None:
+                if now - cached.checked_at < self.ttl:
+                    return cached
+                if state.breaker.is_open(now):
+                    return ProbeResult(
+                        ok=False,
+                        latency_ms=cached.latency_ms,
+                        error=cached.error,
+                        checked_at=cached.checked_at,
+                        circuit_open=True,
+                    )
+
+            result = await self._run_probe(name, state)
+            state.breaker.record(result.ok, result.checked_at)
+            state.result = result
+            return result
+
+    async def check_all(self, force: bool = False) -> dict[str, ProbeResult]:
+        """Check every registered service concurrently.
+
+        Args:
+            force: Bypass cache and circuit breakers
+
+        Returns:
+            Mapping of service name to ProbeResult
+        """
+        names = self.services
+        results = await asyncio.gather(*(self.check(name, force) for name in names))
+        return dict(zip(names, results))
+
+    def last_results(self) -> dict[str, ProbeResult]:
+        """Most recent results without probing."""
+        return {
+            name: state.result
+            for name, state in self._services.items()
+            if state.result is not None
+        }
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# =============================================================================
+# Probe factories
+# =============================================================================
+
+
+def http_probe(url: str) -> ProbeFn:
+    """Probe that succeeds when GET url returns HTTP 200."""
+
+    async def probe(client: httpx.AsyncClient) -> bool:
+        response = await client.get(url)
+        return response.status_code == 200
+
+    return probe
+
+
+async def surrealdb_probe(client: httpx.AsyncClient) -> bool:
+    """Probe SurrealDB through the shared driver connection."""
+    from compose.services.surrealdb import verify_connection
+
+    return await verify_connection()
+
+
+async def minio_probe(client: httpx.AsyncClient) -> bool:
+    """Probe MinIO (the SDK is blocking, so run it in a thread)."""
+
+    def check() -> bool:
+        from compose.services.minio import create_minio_client
+
+        create_minio_client().ensure_bucket()
+        return True
+
+    return await asyncio.to_thread(check)
+
+
+def queue_worker_probe(queue_base: Path) -> ProbeFn:
+    """Probe that succeeds if workers reported recently or the queue is mounted."""
+
+    async def probe(client: httpx.AsyncClient) -> bool:
+        from compose.services.surrealdb.driver import execute_query
+
+        # Any worker progress within the last 60 seconds
+        query = "SELECT id FROM worker_progress WHERE updated_at > time::now() - 60s LIMIT 1;"
+        if await execute_query(query):
+            return True
+        # Idle worker is still healthy if the queue directory exists
+        return (queue_base / "pending").exists()
+
+    return probe
+
+
+def service_urls() -> dict[str, str]:
+    """Base URLs of probed services (from environment)."""
+    return {
+        "surrealdb": os.getenv("SURREALDB_URL", "http://localhost:8000"),
+        "minio": os.getenv("MINIO_URL", "http://localhost:9000"),
+        "infinity": os.getenv("INFINITY_URL", "http://localhost:7997"),
+        "ollama": os.getenv("OLLAMA_URL", "http://192.168.16.241:11434"),
+        "n8n": os.getenv("N8N_URL", "http://192.168.16.241:5678"),
+        "docling": os.getenv("DOCLING_URL", "http://192.168.16.241:5001"),
+    }
+
+
+def create_default_monitor(queue_base: Optional[Path] = None) -> HealthMonitor:
+    """Create a monitor with probes for the dashboard's dependencies.
+
+    Args:
+        queue_base: Queue directory root (default: QUEUE_BASE env var)
+
+    Returns:
+        HealthMonitor with surrealdb, minio, infinity, ollama, queue_worker,
+        n8n and docling probes registered
+    """
+    urls = service_urls()
+    queue_base = queue_base or Path(os.getenv("QUEUE_BASE", "/app/src/compose/data/queues"))
+
+    monitor = HealthMonitor()
+    monitor.register("surrealdb", surrealdb_probe)
+    monitor.register("minio", minio_probe)
+    monitor.register("infinity", http_probe(f"{urls['infinity']}/health"))
+    monitor.register("ollama", http_probe(f"{urls['ollama']}/api/tags"))
+    monitor.register("queue_worker", queue_worker_probe(queue_base))
+    monitor.register("n8n", http_probe(f"{urls['n8n']}/healthz"))
+    monitor.register("docling", http_probe(f"{urls['docling']}/health"))
+    return monitor
+
+
+_monitor: Optional[HealthMonitor] = None
+
+
+def get_health_monitor() -> HealthMonitor:
+    """Get the process-wide health monitor singleton."""
+    global _monitor
+    if _monitor is None:
+        _monitor = create_default_monitor()
+    return _monitor
+
+
+def reset_health_monitor() -> None:
+    """Discard the monitor singleton (for testing)."""
+    global _monitor
+    _monitor = None
+
+
+def _observe_service_up(options: CallbackOptions):
+    """Report last known status per service for the health_service_up gauge."""
+    if _monitor is None:
+        return
+    for name, result in _monitor.last_results().items():
+        yield Observation(1 if result.ok else 0, {"service": name})
+
+
+_meter.create_observable_gauge(
+    name="health_service_up",
+    callbacks=[_observe_service_up],
+    description="Last known dependency health (1 = up, 0 = down)",
+    unit="1",
+)
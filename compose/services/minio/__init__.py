@@ -2,7 +2,20 @@
 
 from .config import MinIOConfig
 from .client import MinIOClient
+from .async_client import AsyncMinIOClient
+from .cache import ObjectCache, get_object_cache, reset_object_cache
 from .archive import ArchiveStorage
-from .factory import create_minio_client
+from .factory import create_minio_client, get_async_minio_client, reset_async_minio_client
 
-__all__ = ["MinIOConfig", "MinIOClient", "ArchiveStorage", "create_minio_client"]
+__all__ = [
+    "MinIOConfig",
+    "MinIOClient",
+    "AsyncMinIOClient",
+    "ObjectCache",
+    "get_object_cache",
+    "reset_object_cache",
+    "ArchiveStorage",
+    "create_minio_client",
+    "get_async_minio_client",
+    "reset_async_minio_client",
+]
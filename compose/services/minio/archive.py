@@ -48,6 +48,11 @@ class ArchiveStorage:
         path = f"archives/youtube/{month}/{video_id}.json"
         return self.client.get_json(path)
 
+    @staticmethod
+    def transcript_path(video_id: str) -> str:
+        """Object path of a video's transcript."""
+        return f"transcripts/{video_id}.txt"
+
     def store_transcript(self, video_id: str, transcript: str) -> str:
         """Store transcript in MinIO.
 
@@ -58,8 +63,7 @@ class ArchiveStorage:
         Returns:
             The path where transcript was stored.
         """
-        path = f"transcripts/{video_id}.txt"
-        return self.client.put_text(path, transcript)
+        return self.client.put_text(self.transcript_path(video_id), transcript)
 
     def get_transcript(self, video_id: str) -> str:
         """Retrieve transcript from MinIO.
@@ -70,7 +74,7 @@ class ArchiveStorage:
         Returns:
             Transcript text.
         """
-        return self.client.get_text(f"transcripts/{video_id}.txt")
+        return self.client.get_text(self.transcript_path(video_id))
 
     def store_llm_output(
         self, video_id: str, output_type: str, data: dict
@@ -0,0 +1,157 @@
+"""Async facade over MinIOClient.
+
+The MinIO SDK is blocking. AsyncMinIOClient runs each call on its own
+bounded thread pool (one thread per pooled HTTP connection by default), so
+async callers never block the event loop and never queue more requests
+than the connection pool can serve.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, BinaryIO, Callable, Iterable, Literal, Mapping, Optional, TypeVar
+
+from .client import MULTIPART_PART_SIZE, MinIOClient
+
+T = TypeVar("T")
+
+Decode = Literal["bytes", "text", "json"]
+
+
+class AsyncMinIOClient:
+    """Async interface to a MinIOClient backed by a bounded thread pool."""
+
+    def __init__(self, client: MinIOClient, max_workers: Optional[int] = None):
+        """Initialize the facade.
+
+        Args:
+            client: Synchronous client to run calls on.
+            max_workers: Thread pool size. Defaults to the client's connection
+                pool size (or 16 for clients without one, e.g. test fakes).
+        """
+        self.sync = client
+        self.bucket = client.bucket
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or getattr(client, "max_connections", 16),
+            thread_name_prefix="minio",
+        )
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking call on the MinIO thread pool.
+
+        Args:
+            fn: Function to call, usually a method of self.sync.
+            *args: Positional arguments.
+            **kwargs: Keyword arguments.
+
+        Returns:
+            The function's result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    def close(self) -> None:
+        """Shut down the thread pool."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def get_bytes(self, path: str, missing_ok: bool = False) -> Optional[bytes]:
+        """Retrieve an object's content (None if missing and missing_ok)."""
+        return await self.run(self.sync.get_bytes, path, missing_ok=missing_ok)
+
+    async def get_text(self, path: str, missing_ok: bool = False) -> Optional[str]:
+        """Retrieve text content (None if missing and missing_ok)."""
+        return await self.run(self.sync.get_text, path, missing_ok=missing_ok)
+
+    async def get_json(self, path: str, missing_ok: bool = False) -> Any:
+        """Retrieve JSON data (None if missing and missing_ok)."""
+        return await self.run(self.sync.get_json, path, missing_ok=missing_ok)
+
+    async def put_bytes(
+        self, path: str, content: bytes, content_type: str = "application/octet-stream"
+    ) -> str:
+        """Store raw bytes."""
+        return await self.run(self.sync.put_bytes, path, content, content_type)
+
+    async def put_text(self, path: str, text: str) -> str:
+        """Store text data."""
+        return await self.run(self.sync.put_text, path, text)
+
+    async def put_json(self, path: str, data: Any) -> str:
+        """Store JSON data."""
+        return await self.run(self.sync.put_json, path, data)
+
+    async def put_stream(
+        self,
+        path: str,
+        stream: BinaryIO,
+        length: int = -1,
+        content_type: str = "application/octet-stream",
+        part_size: int = MULTIPART_PART_SIZE,
+    ) -> str:
+        """Upload a file-like object (multipart for large objects)."""
+        return await self.run(
+            self.sync.put_stream, path, stream, length, content_type, part_size
+        )
+
+    async def exists(self, path: str) -> bool:
+        """Check if an object exists.
+
+        Prefer ``get_*(missing_ok=True)`` when the content is needed anyway.
+        """
+        return await self.run(self.sync.exists, path)
+
+    async def delete(self, path: str) -> None:
+        """Delete an object."""
+        await self.run(self.sync.delete, path)
+
+    async def list_objects(self, prefix: str = "") -> list:
+        """List objects under a prefix."""
+        return await self.run(self.sync.list_objects, prefix)
+
+    async def get_many(
+        self, paths: Iterable[str], decode: Decode = "bytes"
+    ) -> dict[str, Any]:
+        """Fetch several objects concurrently.
+
+        Args:
+            paths: Object paths to fetch.
+            decode: Return raw bytes, decoded text, or parsed JSON.
+
+        Returns:
+            Dict of path to content; missing objects map to None.
+        """
+        getter = {
+            "bytes": self.sync.get_bytes,
+            "text": self.sync.get_text,
+            "json": self.sync.get_json,
+        }[decode]
+        paths = list(dict.fromkeys(paths))
+        results = await asyncio.gather(
+            *(self.run(getter, path, missing_ok=True) for path in paths)
+        )
+        return dict(zip(paths, results))
+
+    async def put_many(self, objects: Mapping[str, Any]) -> list[str]:
+        """Store several objects concurrently.
+
+        Bytes are stored as-is, strings as text and anything else as JSON.
+
+        Args:
+            objects: Dict of path to content.
+
+        Returns:
+            Paths stored, in input order.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.run(self._putter(content), path, content) for path, content in objects.items())
+            )
+        )
+
+    def _putter(self, content: Any) -> Callable[[str, Any], str]:
+        """Pick the sync put method for a value."""
+        if isinstance(content, (bytes, bytearray)):
+            return self.sync.put_bytes
+        if isinstance(content, str):
+            return self.sync.put_text
+        return self.sync.put_json
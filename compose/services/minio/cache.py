@@ -0,0 +1,323 @@
+"""Read-through object cache for MinIOClient.
+
+Hot objects (RAG transcripts, vault notes, archive JSON) are read many
+times a minute. ObjectCache keeps their content keyed by bucket/path with
+the object's ETag in two tiers:
+
+- memory: LRU bounded by total bytes (MINIO_CACHE_MEMORY_BYTES)
+- disk: optional, under MINIO_CACHE_DIR, bounded by MINIO_CACHE_DISK_BYTES
+
+A memory entry validated within the last MINIO_CACHE_TTL seconds is served
+with no network call. Older entries, and entries loaded from disk, are
+revalidated with a HEAD request; the body is only downloaded again if the
+ETag changed. Writes and deletes through the client invalidate the entry.
+
+Lookups are counted in the ``minio_cache_lookups`` metric and summarized
+by ``ObjectCache.stats()``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+logger = logging.getLogger(__name__)
+
+# Settings
+CACHE_TTL = float(os.getenv("MINIO_CACHE_TTL", "30"))  # Seconds served without revalidation
+CACHE_MEMORY_BYTES = int(os.getenv("MINIO_CACHE_MEMORY_BYTES", str(64 * 1024 * 1024)))
+CACHE_DIR = os.getenv("MINIO_CACHE_DIR")  # Disk tier disabled when unset
+CACHE_DISK_BYTES = int(os.getenv("MINIO_CACHE_DISK_BYTES", str(1024 * 1024 * 1024)))
+
+LOOKUP_RESULTS = ("memory", "disk", "revalidated", "miss")
+
+# Metrics instruments (no-op until a meter provider is configured)
+_meter = metrics.get_meter(__name__)
+cache_lookups_counter = _meter.create_counter(
+    name="minio_cache_lookups",
+    description="MinIO object cache lookups by result (memory, disk, revalidated, miss)",
+    unit="1",
+)
+
+# Live caches, for the hit ratio gauge
+_caches: "weakref.WeakSet[ObjectCache]" = weakref.WeakSet()
+
+
+@dataclass
+class CacheEntry:
+    """Cached object content."""
+
+    data: bytes
+    etag: str
+    validated_at: float = 0.0
+    tier: str = "memory"
+
+
+def normalize_etag(etag: Optional[str]) -> Optional[str]:
+    """Strip the quotes S3 puts around ETags in response headers."""
+    return etag.strip('"') if etag else None
+
+
+class ObjectCache:
+    """Size-bounded two-tier (memory + optional disk) cache of object content.
+
+    Thread-safe; MinIOClient calls it from AsyncMinIOClient worker threads.
+    """
+
+    def __init__(
+        self,
+        name: str = "minio",
+        ttl: float = CACHE_TTL,
+        memory_bytes: int = CACHE_MEMORY_BYTES,
+        disk_dir: Optional[str | Path] = CACHE_DIR,
+        disk_bytes: int = CACHE_DISK_BYTES,
+    ):
+        """Initialize cache.
+
+        Args:
+            name: Name used in metric attributes
+            ttl: Seconds a validated entry is served without a HEAD request
+            memory_bytes: Memory tier budget in bytes
+            disk_dir: Disk tier directory, or None to disable it
+            disk_bytes: Disk tier budget in bytes
+        """
+        self.name = name
+        self.ttl = ttl
+        self.memory_bytes = memory_bytes
+        # Objects larger than this skip the memory tier
+        self.max_memory_entry = memory_bytes // 8
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_bytes = disk_bytes
+
+        self._memory: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._memory_size = 0
+        self._disk_size = 0
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(LOOKUP_RESULTS, 0)
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_size = sum(path.stat().st_size for path in self._disk_files())
+
+        _caches.add(self)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Look up an entry (memory first, then disk).
+
+        Args:
+            key: bucket/path
+
+        Returns:
+            The entry (check ``is_fresh``), or None
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            # Promote; validated_at stays 0 so the first use revalidates
+            self._store_memory(key, entry)
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether an entry can be served without revalidation."""
+        return time.monotonic() - entry.validated_at < self.ttl
+
+    def put(self, key: str, data: bytes, etag: str) -> None:
+        """Store object content in both tiers.
+
+        Args:
+            key: bucket/path
+            data: Object content
+            etag: Object ETag
+        """
+        entry = CacheEntry(data=data, etag=etag, validated_at=time.monotonic())
+        self._store_memory(key, entry)
+        self._write_disk(key, entry)
+
+    def mark_validated(self, key: str) -> None:
+        """Record that an entry's ETag was just confirmed."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                entry.validated_at = time.monotonic()
+                entry.tier = "memory"
+
+    def invalidate(self, key: str) -> None:
+        """Drop an entry from both tiers."""
+        with self._lock:
+            entry = self._memory.pop(key, None)
+            if entry is not None:
+                self._memory_size -= len(entry.data)
+        self._remove_disk(key)
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            self._counts = dict.fromkeys(LOOKUP_RESULTS, 0)
+        if self.disk_dir:
+            for path in list(self._disk_files()):
+                path.unlink(missing_ok=True)
+        self._disk_size = 0
+
+    def record(self, result: str) -> None:
+        """Count a lookup result (one of LOOKUP_RESULTS)."""
+        with self._lock:
+            self._counts[result] += 1
+        cache_lookups_counter.add(1, {"cache": self.name, "result": result})
+
+    def stats(self) -> dict:
+        """Lookup counts, hit ratio and tier sizes."""
+        with self._lock:
+            counts = dict(self._counts)
+            total = sum(counts.values())
+            hits = total - counts["miss"]
+            return {
+                **counts,
+                "lookups": total,
+                "hit_ratio": hits / total if total else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_size,
+                "disk_bytes": self._disk_size,
+            }
+
+    # -- memory tier --
+
+    def _store_memory(self, key: str, entry: CacheEntry) -> None:
+        if len(entry.data) > self.max_memory_entry:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_size -= len(previous.data)
+            self._memory[key] = entry
+            self._memory_size += len(entry.data)
+            while self._memory_size > self.memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted.data)
+
+    # -- disk tier --
+
+    def _disk_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.disk_dir / digest[:2] / digest
+
+    def _disk_files(self) -> Iterable[Path]:
+        return (path for path in self.disk_dir.glob("*/*") if path.is_file())
+
+    def _read_disk(self, key: str) -> Optional[CacheEntry]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            return None
+        # File layout: one JSON header line, then the object content
+        header, _, data = raw.partition(b"\n")
+        try:
+            meta = json.loads(header)
+        except ValueError:
+            return None
+        if meta.get("key") != key:
+            return None
+        return CacheEntry(data=data, etag=meta["etag"], tier="disk")
+
+    def _write_disk(self, key: str, entry: CacheEntry) -> None:
+        if not self.disk_dir or len(entry.data) > self.disk_bytes:
+            return
+        path = self._disk_path(key)
+        header = json.dumps({"key": key, "etag": entry.etag}).encode() + b"\n"
+        try:
+            path.parent.mkdir(exist_ok=True)
+            previous = path.stat().st_size if path.exists() else 0
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(header + entry.data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write cache file for {key}: {e}")
+            return
+        with self._lock:
+            self._disk_size += len(header) + len(entry.data) - previous
+            over_budget = self._disk_size > self.disk_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _remove_disk(self, key: str) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            self._disk_size -= size
+
+    def _evict_disk(self) -> None:
+        """Delete least recently written files until under budget."""
+        files = []
+        for path in self._disk_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        with self._lock:
+            self._disk_size = sum(size for _, size, _ in files)
+            target = self.disk_bytes * 0.9
+        for _, size, path in files:
+            if self._disk_size <= target:
+                break
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self._disk_size -= size
+
+
+def _observe_hit_ratio(options: CallbackOptions) -> Iterable[Observation]:
+    for cache in list(_caches):
+        yield Observation(cache.stats()["hit_ratio"], {"cache": cache.name})
+
+
+_meter.create_observable_gauge(
+    name="minio_cache_hit_ratio",
+    callbacks=[_observe_hit_ratio],
+    description="Share of MinIO object cache lookups served without a download",
+    unit="1",
+)
+
+
+# Shared cache instance
+_object_cache: Optional[ObjectCache] = None
+
+
+def get_object_cache() -> ObjectCache:
+    """Get or create the shared object cache."""
+    global _object_cache
+    if _object_cache is None:
+        _object_cache = ObjectCache()
+    return _object_cache
+
+
+def reset_object_cache() -> None:
+    """Drop the shared object cache (for tests)."""
+    global _object_cache
+    _object_cache = None
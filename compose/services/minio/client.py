@@ -1,30 +1,87 @@
-"""MinIO client wrapper for object storage operations."""
+"""MinIO client wrapper for object storage operations.
+
+The client shares one tuned urllib3 connection pool (MinIOConfig.max_connections
+connections, connect/read timeouts, retries on transient 5xx) across threads,
+and every read closes and releases its response so connections return to the
+pool. Reads can treat a missing object as a miss (``missing_ok=True``) instead
+of paying for a separate ``exists()`` stat first.
+
+Given an ObjectCache, reads are served read-through from it (see cache.py)
+and the client's own writes and deletes invalidate the cached entry.
+"""
 
 import json
+import os
+from contextlib import contextmanager
 from io import BytesIO
+from typing import Any, BinaryIO, Iterator, Optional
 
-from minio import Minio
+import certifi
+import urllib3
 
+from .cache import ObjectCache, normalize_etag
 from .config import MinIOConfig
 
+# Part size for streamed multipart uploads (MinIO minimum is 5 MiB)
+MULTIPART_PART_SIZE = 16 * 1024 * 1024
+
+# S3 error codes meaning the object does not exist
+MISSING_OBJECT_CODES = frozenset({"NoSuchKey", "NoSuchObject"})
+
+
+def is_missing_object(error: Exception) -> bool:
+    """Whether an error from MinIO means the object doesn't exist."""
+    from minio.error import S3Error
+
+    return isinstance(error, S3Error) and error.code in MISSING_OBJECT_CODES
+
+
+def create_http_client(config: MinIOConfig) -> urllib3.PoolManager:
+    """Create the urllib3 pool used for MinIO requests.
+
+    Args:
+        config: MinIOConfig with pool size and timeouts.
+
+    Returns:
+        PoolManager sized for config.max_connections concurrent requests.
+    """
+    return urllib3.PoolManager(
+        maxsize=config.max_connections,
+        timeout=urllib3.Timeout(connect=config.connect_timeout, read=config.read_timeout),
+        retries=urllib3.Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+    )
+
 
 class MinIOClient:
     """Client for interacting with MinIO object storage."""
 
-    def __init__(self, config: MinIOConfig):
+    def __init__(self, config: MinIOConfig, cache: Optional[ObjectCache] = None):
         """Initialize MinIO client.
 
         Args:
             config: MinIOConfig instance with connection details.
+            cache: Optional read-through cache for get_* reads.
         """
+        # The MinIO SDK is imported here so importing this module stays cheap
+        from minio import Minio
+
         endpoint = config.url.replace("http://", "").replace("https://", "")
         self.client = Minio(
             endpoint=endpoint,
             access_key=config.access_key,
             secret_key=config.secret_key,
             secure=config.secure,
+            http_client=create_http_client(config),
         )
         self.bucket = config.bucket
+        self.max_connections = config.max_connections
+        self.cache = cache
 
     def ensure_bucket(self) -> None:
         """Create bucket if it doesn't exist."""
@@ -49,19 +106,108 @@ class MinIOClient:
             length=len(content),
             content_type="application/json",
         )
+        self._invalidate(path)
         return path
 
-    def get_json(self, path: str) -> dict:
+    def get_bytes(self, path: str, missing_ok: bool = False) -> Optional[bytes]:
+        """Retrieve an object's content in a single GET.
+
+        Args:
+            path: Object path in bucket.
+            missing_ok: Return None instead of raising if the object doesn't exist.
+
+        Returns:
+            Object content, or None if missing and missing_ok.
+        """
+        if self.cache is None:
+            return self._fetch(path, missing_ok)[0]
+
+        key = self._cache_key(path)
+        entry = self.cache.get(key)
+        if entry is not None:
+            if entry.tier == "memory" and self.cache.is_fresh(entry):
+                self.cache.record("memory")
+                return entry.data
+            # Stale or from disk: a HEAD tells us whether the body changed
+            if self._stat_etag(path) == entry.etag:
+                self.cache.record("disk" if entry.tier == "disk" else "revalidated")
+                self.cache.mark_validated(key)
+                return entry.data
+            self.cache.invalidate(key)
+
+        self.cache.record("miss")
+        content, etag = self._fetch(path, missing_ok)
+        if content is not None and etag:
+            self.cache.put(key, content, etag)
+        return content
+
+    def _fetch(self, path: str, missing_ok: bool) -> tuple[Optional[bytes], Optional[str]]:
+        """GET an object, returning its content and ETag."""
+        try:
+            response = self.client.get_object(bucket_name=self.bucket, object_name=path)
+        except Exception as e:
+            if missing_ok and is_missing_object(e):
+                return None, None
+            raise
+        try:
+            return response.read(), normalize_etag(response.headers.get("ETag"))
+        finally:
+            response.close()
+            response.release_conn()
+
+    def _stat_etag(self, path: str) -> Optional[str]:
+        """ETag of an object, or None if it doesn't exist."""
+        try:
+            stat = self.client.stat_object(bucket_name=self.bucket, object_name=path)
+        except Exception as e:
+            if is_missing_object(e):
+                return None
+            raise
+        return normalize_etag(stat.etag)
+
+    def _cache_key(self, path: str) -> str:
+        return f"{self.bucket}/{path}"
+
+    def _invalidate(self, path: str) -> None:
+        """Drop a path from the cache after writing or deleting it."""
+        if self.cache is not None:
+            self.cache.invalidate(self._cache_key(path))
+
+    def put_bytes(
+        self, path: str, content: bytes, content_type: str = "application/octet-stream"
+    ) -> str:
+        """Store raw bytes in MinIO.
+
+        Args:
+            path: Object path in bucket.
+            content: Bytes to store.
+            content_type: MIME type of the object.
+
+        Returns:
+            The path where data was stored.
+        """
+        self.client.put_object(
+            bucket_name=self.bucket,
+            object_name=path,
+            data=BytesIO(content),
+            length=len(content),
+            content_type=content_type,
+        )
+        self._invalidate(path)
+        return path
+
+    def get_json(self, path: str, missing_ok: bool = False) -> Any:
         """Retrieve JSON data from MinIO.
 
         Args:
             path: Object path in bucket.
+            missing_ok: Return None instead of raising if the object doesn't exist.
 
         Returns:
-            Deserialized JSON data.
+            Deserialized JSON data, or None if missing and missing_ok.
         """
-        response = self.client.get_object(bucket_name=self.bucket, object_name=path)
-        return json.loads(response.read().decode())
+        content = self.get_bytes(path, missing_ok=missing_ok)
+        return None if content is None else json.loads(content)
 
     def put_text(self, path: str, text: str) -> str:
         """Store text data in MinIO.
@@ -81,19 +227,76 @@ class MinIOClient:
             length=len(content),
             content_type="text/plain",
         )
+        self._invalidate(path)
         return path
 
-    def get_text(self, path: str) -> str:
+    def get_text(self, path: str, missing_ok: bool = False) -> Optional[str]:
         """Retrieve text data from MinIO.
 
         Args:
             path: Object path in bucket.
+            missing_ok: Return None instead of raising if the object doesn't exist.
+
+        Returns:
+            Text content, or None if missing and missing_ok.
+        """
+        content = self.get_bytes(path, missing_ok=missing_ok)
+        return None if content is None else content.decode()
+
+    def put_stream(
+        self,
+        path: str,
+        stream: BinaryIO,
+        length: int = -1,
+        content_type: str = "application/octet-stream",
+        part_size: int = MULTIPART_PART_SIZE,
+    ) -> str:
+        """Upload a file-like object without reading it into memory.
+
+        Objects larger than part_size (or of unknown length) are sent as a
+        multipart upload, part_size bytes at a time.
+
+        Args:
+            path: Object path in bucket.
+            stream: Readable binary file-like object.
+            length: Size in bytes, or -1 if unknown.
+            content_type: MIME type of the object.
+            part_size: Multipart part size in bytes.
 
         Returns:
-            Text content.
+            The path where data was stored.
+        """
+        self.client.put_object(
+            bucket_name=self.bucket,
+            object_name=path,
+            data=stream,
+            length=length,
+            content_type=content_type,
+            part_size=part_size,
+        )
+        self._invalidate(path)
+        return path
+
+    @contextmanager
+    def open_stream(self, path: str, offset: int = 0, length: int = 0) -> Iterator[BinaryIO]:
+        """Open an object (or a byte range of it) for streaming reads.
+
+        Args:
+            path: Object path in bucket.
+            offset: First byte to read.
+            length: Number of bytes to read, or 0 for the rest of the object.
+
+        Yields:
+            Readable binary response; the connection is released on exit.
         """
-        response = self.client.get_object(bucket_name=self.bucket, object_name=path)
-        return response.read().decode()
+        response = self.client.get_object(
+            bucket_name=self.bucket, object_name=path, offset=offset, length=length
+        )
+        try:
+            yield response
+        finally:
+            response.close()
+            response.release_conn()
 
     def exists(self, path: str) -> bool:
         """Check if object exists in MinIO.
@@ -117,6 +320,7 @@ class MinIOClient:
             path: Object path in bucket.
         """
         self.client.remove_object(bucket_name=self.bucket, object_name=path)
+        self._invalidate(path)
 
     def list_objects(self, prefix: str = "") -> list:
         """List objects in MinIO bucket.
@@ -13,3 +13,7 @@ class MinIOConfig:
     secret_key: str = os.getenv("MINIO_SECRET_KEY", "minioadmin")
     bucket: str = os.getenv("MINIO_BUCKET", "vectors")
     secure: bool = False
+    # HTTP connection pool size; also the number of threads AsyncMinIOClient uses
+    max_connections: int = int(os.getenv("MINIO_MAX_CONNECTIONS", "16"))
+    connect_timeout: float = float(os.getenv("MINIO_CONNECT_TIMEOUT", "5"))
+    read_timeout: float = float(os.getenv("MINIO_READ_TIMEOUT", "60"))
@@ -1,18 +1,50 @@
 """Factory functions for creating MinIO service instances."""
 
+from typing import Optional
+
+from .async_client import AsyncMinIOClient
+from .cache import ObjectCache, get_object_cache
 from .client import MinIOClient
 from .config import MinIOConfig
 
+# Shared async client (and its connection/thread pools)
+_async_client: Optional[AsyncMinIOClient] = None
+
 
-def create_minio_client() -> MinIOClient:
+def create_minio_client(cache: Optional[ObjectCache] = None) -> MinIOClient:
     """Create and initialize a MinIO client.
 
     Loads configuration from environment variables and ensures bucket exists.
 
+    Args:
+        cache: Optional read-through cache for object reads.
+
     Returns:
         Initialized MinIOClient instance.
     """
     config = MinIOConfig()
-    client = MinIOClient(config)
+    client = MinIOClient(config, cache=cache)
     client.ensure_bucket()
     return client
+
+
+def get_async_minio_client() -> AsyncMinIOClient:
+    """Get the shared async MinIO client, creating it on first use.
+
+    Reads go through the shared object cache.
+
+    Returns:
+        AsyncMinIOClient over a client created by create_minio_client().
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncMinIOClient(create_minio_client(cache=get_object_cache()))
+    return _async_client
+
+
+def reset_async_minio_client() -> None:
+    """Close and drop the shared async client (for shutdown and tests)."""
+    global _async_client
+    if _async_client is not None:
+        _async_client.close()
+    _async_client = None
@@ -250,6 +250,7 @@ class NoteService:
 
         # Save to MinIO
         vault_service = get_vault_service()
+        vault_service.tree_cache.add(vault_id, path, note_id)
         vault = await vault_service.get_vault(vault_id)
         if vault and vault.storage_type == "minio":
             vault_service.save_note_content(vault.slug, path, content)
@@ -377,6 +378,8 @@ class NoteService:
 
         # Update MinIO
         vault_service = get_vault_service()
+        if note.path != current.path:
+            vault_service.tree_cache.move(note.vault_id, current.path, note.path, note_id)
         vault = await vault_service.get_vault(note.vault_id)
         if vault and vault.storage_type == "minio":
             # If path changed, delete old and create new
@@ -427,6 +430,7 @@ class NoteService:
 
         # Delete from MinIO
         vault_service = get_vault_service()
+        vault_service.tree_cache.remove(note.vault_id, note.path)
         vault = await vault_service.get_vault(note.vault_id)
         if vault and vault.storage_type == "minio":
             vault_service.delete_note_content(vault.slug, note.path)
@@ -4,7 +4,9 @@ This pipeline framework provides:
 - @pipeline_step decorator for registering steps
 - Git-based automatic version detection
 - Dependency tracking between steps
+- Async DAG execution (independent steps run concurrently)
 - SurrealDB integration for backfill queries
+- Per-step done/stale/pending counts from one grouped query
 
 Usage:
     from compose.services.pipeline import (
@@ -46,6 +48,7 @@ from .decorator import (
     get_all_steps,
     get_step_version,
     get_execution_order,
+    get_execution_levels,
     clear_registry,
 )
 
@@ -58,9 +61,21 @@ from .versioning import (
 
 from .runner import (
     run_pipeline,
+    run_pipeline_async,
+    flush_pipeline_states,
     get_backfill_queue,
+    get_backfill_queue_async,
     get_backfill_counts,
     run_backfill,
+    run_backfill_async,
+)
+
+from .status import (
+    StepCounts,
+    PipelineStatus,
+    get_pipeline_status,
+    get_step_counts,
+    reset_pipeline_status,
 )
 
 # Import steps to register them
@@ -88,6 +103,7 @@ __all__ = [
     "get_all_steps",
     "get_step_version",
     "get_execution_order",
+    "get_execution_levels",
     "clear_registry",
     # Versioning
     "get_version_hash",
@@ -96,9 +112,19 @@ __all__ = [
     "invalidate_version_cache",
     # Runner
     "run_pipeline",
+    "run_pipeline_async",
+    "flush_pipeline_states",
     "get_backfill_queue",
+    "get_backfill_queue_async",
     "get_backfill_counts",
     "run_backfill",
+    "run_backfill_async",
+    # Status
+    "StepCounts",
+    "PipelineStatus",
+    "get_pipeline_status",
+    "get_step_counts",
+    "reset_pipeline_status",
     # Steps
     "fetch_transcript",
     "fetch_metadata",
@@ -2,13 +2,17 @@
 
 The @pipeline_step decorator:
 1. Registers the step in a global registry
-2. Computes version hash from source code
+2. Computes version hash from source code (lazily, on first use)
 3. Infers dependencies from type annotations
 4. Wraps execution with timing and error handling
+
+Steps may be plain functions or coroutines; the runner awaits async steps
+on its event loop and runs sync steps in worker threads.
 """
 
+import inspect
 import time
-from functools import wraps
+from functools import partial, wraps
 from typing import Callable, Any, get_type_hints, Optional
 
 from .models import StepResult, PipelineContext, StepMetadata
@@ -49,7 +53,6 @@ def pipeline_step(
 
     def decorator(func: Callable) -> Callable:
         step_name = name or func.__name__
-        version_hash = get_version_hash(func)
         source_file = get_source_file(func)
 
         # Infer dependencies from type hints if not explicitly provided
@@ -65,34 +68,45 @@ def pipeline_step(
 
         metadata = StepMetadata(
             name=step_name,
-            version_hash=version_hash,
+            version_resolver=partial(get_version_hash, func),
             dependencies=inferred_deps,
             description=description or func.__doc__,
             source_file=source_file,
         )
 
-        @wraps(func)
-        def wrapper(ctx: PipelineContext, *args: Any, **kwargs: Any) -> StepResult:
-            start_time = time.perf_counter()
+        def finish(result: Any, start_time: float) -> StepResult:
+            # Ensure result is a StepResult
+            if not isinstance(result, StepResult):
+                result = StepResult.ok(result)
 
-            try:
-                result = func(ctx, *args, **kwargs)
+            result.duration_ms = (time.perf_counter() - start_time) * 1000
+            return result
+
+        def failed(e: Exception, start_time: float) -> StepResult:
+            return StepResult.fail(
+                error=f"{type(e).__name__}: {str(e)}",
+                duration_ms=(time.perf_counter() - start_time) * 1000,
+            )
 
-                # Ensure result is a StepResult
-                if not isinstance(result, StepResult):
-                    result = StepResult.ok(result)
+        if inspect.iscoroutinefunction(func):
 
-                elapsed_ms = (time.perf_counter() - start_time) * 1000
-                result.duration_ms = elapsed_ms
+            @wraps(func)
+            async def wrapper(ctx: PipelineContext, *args: Any, **kwargs: Any) -> StepResult:
+                start_time = time.perf_counter()
+                try:
+                    return finish(await func(ctx, *args, **kwargs), start_time)
+                except Exception as e:
+                    return failed(e, start_time)
 
-                return result
+        else:
 
-            except Exception as e:
-                elapsed_ms = (time.perf_counter() - start_time) * 1000
-                return StepResult.fail(
-                    error=f"{type(e).__name__}: {str(e)}",
-                    duration_ms=elapsed_ms,
-                )
+            @wraps(func)
+            def wrapper(ctx: PipelineContext, *args: Any, **kwargs: Any) -> StepResult:
+                start_time = time.perf_counter()
+                try:
+                    return finish(func(ctx, *args, **kwargs), start_time)
+                except Exception as e:
+                    return failed(e, start_time)
 
         # Attach metadata to the wrapper
         wrapper._step_metadata = metadata  # type: ignore
@@ -200,3 +214,31 @@ def get_execution_order(target_steps: list[str]) -> list[str]:
             visit(step)
 
     return result
+
+
+def get_execution_levels(target_steps: list[str]) -> list[list[str]]:
+    """Group steps into levels that can run concurrently.
+
+    Every step's dependencies are in earlier levels, so all steps within a
+    level are independent of each other.
+
+    Args:
+        target_steps: Steps to execute
+
+    Returns:
+        List of levels, each a list of step names, in execution order
+
+    Raises:
+        ValueError: If circular dependency detected or step not found
+    """
+    order = get_execution_order(target_steps)
+    depth: dict[str, int] = {}
+    for step_name in order:
+        step = get_step(step_name)
+        deps = step[1].dependencies if step else []
+        depth[step_name] = 1 + max((depth[d] for d in deps if d in depth), default=-1)
+
+    levels: list[list[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+    for step_name in order:
+        levels[depth[step_name]].append(step_name)
+    return levels
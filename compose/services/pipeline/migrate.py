@@ -29,71 +29,81 @@ def parse_archive(file_path: Path) -> dict:
         return json.load(f)
 
 
+def archive_to_video_node(archive: dict):
+    """Build a VideoNode from archive JSON.
+
+    Pipeline state is initialized to empty - backfill will process
+    missing steps.
+
+    Returns:
+        VideoNode, or None if the archive has no video_id
+    """
+    from compose.services.graph import VideoNode
+
+    video_id = archive.get("video_id")
+    if not video_id:
+        return None
+
+    # Extract metadata
+    youtube_meta = archive.get("youtube_metadata", {})
+    import_meta = archive.get("import_metadata", {})
+    channel_ctx = import_meta.get("channel_context", {})
+
+    # Parse fetched_at date
+    fetched_at_str = archive.get("fetched_at")
+    if fetched_at_str:
+        try:
+            fetched_at = datetime.fromisoformat(fetched_at_str.replace("Z", "+00:00"))
+        except ValueError:
+            fetched_at = datetime.now()
+    else:
+        fetched_at = datetime.now()
+
+    # Parse published_at date
+    published_at = None
+    published_str = youtube_meta.get("published_at")
+    if published_str:
+        try:
+            published_at = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+
+    # Create video node - pipeline_state empty since we haven't run pipeline
+    return VideoNode(
+        video_id=video_id,
+        url=archive.get("url", f"https://youtube.com/watch?v={video_id}"),
+        fetched_at=fetched_at,
+        title=youtube_meta.get("title"),
+        channel_id=youtube_meta.get("channel_id") or channel_ctx.get("channel_id"),
+        channel_name=youtube_meta.get("channel_title") or channel_ctx.get("channel_name"),
+        duration_seconds=youtube_meta.get("duration_seconds"),
+        view_count=youtube_meta.get("view_count"),
+        published_at=published_at,
+        source_type=import_meta.get("source_type"),
+        import_method=import_meta.get("import_method"),
+        recommendation_weight=import_meta.get("recommendation_weight", 1.0),
+        pipeline_state={},  # Empty - needs backfill
+    )
+
+
 def migrate_archive_to_neo4j(archive: dict, file_path: Path) -> bool:
     """Migrate a single archive to Neo4j.
 
     Creates Video node with basic metadata. Pipeline state is
     initialized to empty - backfill will process missing steps.
     """
-    from compose.services.graph import (
-        upsert_video,
-        link_video_to_channel,
-        VideoNode,
-    )
+    from compose.services.graph import upsert_video, link_video_to_channel
 
     try:
-        video_id = archive.get("video_id")
-        if not video_id:
+        video = archive_to_video_node(archive)
+        if video is None:
             return False
 
-        # Extract metadata
-        youtube_meta = archive.get("youtube_metadata", {})
-        import_meta = archive.get("import_metadata", {})
-        channel_ctx = import_meta.get("channel_context", {})
-
-        # Parse fetched_at date
-        fetched_at_str = archive.get("fetched_at")
-        if fetched_at_str:
-            try:
-                fetched_at = datetime.fromisoformat(fetched_at_str.replace("Z", "+00:00"))
-            except ValueError:
-                fetched_at = datetime.now()
-        else:
-            fetched_at = datetime.now()
-
-        # Parse published_at date
-        published_at = None
-        published_str = youtube_meta.get("published_at")
-        if published_str:
-            try:
-                published_at = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
-            except ValueError:
-                pass
-
-        # Create video node - pipeline_state empty since we haven't run pipeline
-        video = VideoNode(
-            video_id=video_id,
-            url=archive.get("url", f"https://youtube.com/watch?v={video_id}"),
-            fetched_at=fetched_at,
-            title=youtube_meta.get("title"),
-            channel_id=youtube_meta.get("channel_id") or channel_ctx.get("channel_id"),
-            channel_name=youtube_meta.get("channel_title") or channel_ctx.get("channel_name"),
-            duration_seconds=youtube_meta.get("duration_seconds"),
-            view_count=youtube_meta.get("view_count"),
-            published_at=published_at,
-            source_type=import_meta.get("source_type"),
-            import_method=import_meta.get("import_method"),
-            recommendation_weight=import_meta.get("recommendation_weight", 1.0),
-            pipeline_state={},  # Empty - needs backfill
-        )
-
         upsert_video(video)
 
         # Link to channel if available
-        channel_id = video.channel_id
-        channel_name = video.channel_name
-        if channel_id and channel_name:
-            link_video_to_channel(video_id, channel_id, channel_name)
+        if video.channel_id and video.channel_name:
+            link_video_to_channel(video.video_id, video.channel_id, video.channel_name)
 
         return True
 
@@ -102,12 +112,32 @@ def migrate_archive_to_neo4j(archive: dict, file_path: Path) -> bool:
         return False
 
 
-def run_migration(base_dir: Path = None, batch_size: int = 100) -> dict:
+def write_video_batch(videos: list) -> None:
+    """Upsert a batch of VideoNodes and their channel links."""
+    from compose.services.graph import upsert_videos, link_videos_to_channels
+
+    upsert_videos(videos)
+    link_videos_to_channels(
+        (v.video_id, v.channel_id, v.channel_name)
+        for v in videos
+        if v.channel_id and v.channel_name
+    )
+
+
+def run_migration(
+    base_dir: Path = None,
+    batch_size: int = 100,
+    write_batch_size: int = 5000,
+) -> dict:
     """Run full migration of archives to Neo4j.
 
+    Videos are written with batched UNWIND queries, write_batch_size
+    videos per transaction.
+
     Args:
         base_dir: Archive base directory
         batch_size: Print progress every N videos
+        write_batch_size: Videos per Neo4j write batch
 
     Returns:
         Summary dict with counts
@@ -137,20 +167,37 @@ def run_migration(base_dir: Path = None, batch_size: int = 100) -> dict:
     summary["total_files"] = len(archives)
     print(f"Found {len(archives)} archive files to process")
 
+    pending = []
+
+    def flush() -> None:
+        try:
+            write_video_batch(pending)
+            summary["migrated"] += len(pending)
+        except Exception as e:
+            print(f"Failed to write batch of {len(pending)} videos: {e}")
+            summary["failed"] += len(pending)
+        pending.clear()
+
     for i, file_path in enumerate(archives, 1):
         try:
-            archive = parse_archive(file_path)
-            if migrate_archive_to_neo4j(archive, file_path):
-                summary["migrated"] += 1
-            else:
+            video = archive_to_video_node(parse_archive(file_path))
+            if video is None:
                 summary["skipped"] += 1
+            else:
+                pending.append(video)
         except Exception as e:
             print(f"Failed to parse {file_path}: {e}")
             summary["failed"] += 1
 
+        if len(pending) >= write_batch_size:
+            flush()
+
         if i % batch_size == 0:
             print(f"Progress: {i}/{len(archives)} ({summary['migrated']} migrated)")
 
+    if pending:
+        flush()
+
     final_count = get_video_count()
     print(f"\nMigration complete!")
     print(f"  Files processed: {summary['total_files']}")
@@ -8,7 +8,7 @@ Defines the core data structures for pipeline steps:
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional, TypeVar, Generic
+from typing import Any, Callable, Optional, TypeVar, Generic
 
 
 T = TypeVar("T")
@@ -56,6 +56,8 @@ class PipelineContext:
         results: Dict of step_name -> StepResult
         metadata: Additional metadata
         started_at: Pipeline start time
+        step_versions: Version hashes of steps that succeeded in this run,
+            pending a batched pipeline-state write
     """
 
     video_id: str
@@ -63,6 +65,7 @@ class PipelineContext:
     results: dict[str, StepResult] = field(default_factory=dict)
     metadata: dict[str, Any] = field(default_factory=dict)
     started_at: datetime = field(default_factory=datetime.now)
+    step_versions: dict[str, str] = field(default_factory=dict)
 
     def get_result(self, step_name: str) -> Optional[StepResult]:
         """Get result from a previous step."""
@@ -90,19 +93,30 @@ class PipelineContext:
 class StepMetadata:
     """Metadata about a pipeline step.
 
+    The version hash is resolved on first access, so registering a step
+    does no hashing.
+
     Attributes:
         name: Step name (derived from function name)
-        version_hash: Git-based hash of step code
+        version_resolver: Callable returning the version hash
         dependencies: List of step names this step depends on
         description: Human-readable description
         source_file: Path to source file containing step
     """
 
     name: str
-    version_hash: str
+    version_resolver: Callable[[], str] = field(repr=False, compare=False)
     dependencies: list[str] = field(default_factory=list)
     description: Optional[str] = None
     source_file: Optional[str] = None
+    _version_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def version_hash(self) -> str:
+        """Git-based hash of step code (computed once, on first access)."""
+        if self._version_hash is None:
+            self._version_hash = self.version_resolver()
+        return self._version_hash
 
     def __hash__(self) -> int:
         return hash((self.name, self.version_hash))
@@ -116,7 +130,8 @@ class PipelineConfig:
         steps: List of step names to execute (in order)
         skip_cached: Skip steps that have already run with current version
         continue_on_error: Continue pipeline if a step fails
-        update_graph: Update Neo4j pipeline state after each step
+        update_graph: Record SurrealDB pipeline state for successful steps
+            (written in one batch at the end of the run)
     """
 
     steps: list[str] = field(default_factory=list)
@@ -1,31 +1,59 @@
 """Pipeline execution and backfill management.
 
 The runner:
-1. Executes steps in dependency order
-2. Updates SurrealDB state after each successful step
+1. Executes steps as a DAG: each dependency level runs concurrently
+2. Records SurrealDB pipeline state for successful steps in one batch
 3. Provides backfill querying for stale videos
+
+All work for a run (or a whole backfill batch) happens on one event loop,
+so the loop-bound SurrealDB connection is reused rather than recreated.
+Sync steps run in worker threads; async steps are awaited directly.
 """
 
-from datetime import datetime
-from typing import Optional
+import asyncio
+import inspect
+import logging
+import os
+from typing import Callable, Optional
 
 from .models import PipelineContext, PipelineConfig, StepResult
-from .decorator import get_step, get_all_steps, get_execution_order
+from .decorator import get_step, get_all_steps, get_execution_levels
+from .status import get_step_counts, get_pipeline_status
 
+logger = logging.getLogger(__name__)
 
-def run_pipeline(
+# Videos processed concurrently by run_backfill
+DEFAULT_BACKFILL_CONCURRENCY = int(os.getenv("BACKFILL_CONCURRENCY", "4"))
+
+
+async def _execute_step(step_func: Callable, ctx: PipelineContext) -> StepResult:
+    """Run a step on the loop (async) or in a worker thread (sync)."""
+    try:
+        if inspect.iscoroutinefunction(step_func):
+            return await step_func(ctx)
+        return await asyncio.to_thread(step_func, ctx)
+    except Exception as e:
+        return StepResult.fail(f"{type(e).__name__}: {e}")
+
+
+async def run_pipeline_async(
     video_id: str,
     url: str,
     steps: Optional[list[str]] = None,
     config: Optional[PipelineConfig] = None,
+    metadata: Optional[dict] = None,
+    flush_state: bool = True,
 ) -> PipelineContext:
-    """Execute pipeline steps for a video.
+    """Execute pipeline steps for a video, running independent steps concurrently.
 
     Args:
         video_id: YouTube video ID
         url: Video URL
         steps: List of step names to execute (or all if None)
         config: Pipeline configuration
+        metadata: Initial ctx.metadata (e.g. prefetched youtube_metadata)
+        flush_state: Write pipeline state at the end of the run. Batch
+            callers pass False and flush ctx.step_versions themselves.
 
     Returns:
         PipelineContext with results from all executed steps
@@ -36,73 +64,111 @@ def run_pipeline(
     if steps is None:
         steps = list(get_all_steps().keys())
 
+    ctx = PipelineContext(video_id=video_id, url=url, metadata=dict(metadata or {}))
     if not steps:
-        ctx = PipelineContext(video_id=video_id, url=url)
         return ctx
 
-    # Get execution order (dependency sorted)
-    execution_order = get_execution_order(steps)
-
-    ctx = PipelineContext(video_id=video_id, url=url)
+    for level in get_execution_levels(steps):
+        runnable: list[tuple[str, Callable]] = []
 
-    for step_name in execution_order:
-        step_tuple = get_step(step_name)
-        if not step_tuple:
-            ctx.set_result(step_name, StepResult.fail(f"Step '{step_name}' not found"))
-            if not config.continue_on_error:
-                break
-            continue
-
-        step_func, metadata = step_tuple
+        for step_name in level:
+            step_tuple = get_step(step_name)
+            if not step_tuple:
+                ctx.set_result(step_name, StepResult.fail(f"Step '{step_name}' not found"))
+                continue
 
-        # Check dependencies succeeded
-        for dep in metadata.dependencies:
-            dep_result = ctx.get_result(dep)
-            if not dep_result or not dep_result.success:
+            step_func, step_meta = step_tuple
+
+            # Check dependencies succeeded
+            failed_dep = next(
+                (
+                    dep for dep in step_meta.dependencies
+                    if not (ctx.get_result(dep) and ctx.get_result(dep).success)
+                ),
+                None,
+            )
+            if failed_dep is not None:
                 ctx.set_result(
                     step_name,
-                    StepResult.fail(f"Dependency '{dep}' failed or missing"),
+                    StepResult.fail(f"Dependency '{failed_dep}' failed or missing"),
                 )
-                if not config.continue_on_error:
-                    return ctx
                 continue
 
-        # Execute step
-        try:
-            result = step_func(ctx)
-            ctx.set_result(step_name, result)
+            runnable.append((step_name, step_func))
 
-            # Update SurrealDB state if configured
-            if config.update_graph and result.success:
-                try:
-                    _update_graph_state(video_id, step_name, metadata.version_hash)
-                except Exception:
-                    pass  # Non-fatal, graph update failure shouldn't break pipeline
+        # Steps in a level only read earlier results, so they can run together
+        results = await asyncio.gather(*(_execute_step(func, ctx) for _, func in runnable))
 
-        except Exception as e:
-            result = StepResult.fail(f"{type(e).__name__}: {e}")
+        for (step_name, _), result in zip(runnable, results):
             ctx.set_result(step_name, result)
+            if result.success:
+                ctx.step_versions[step_name] = get_step(step_name)[1].version_hash
 
-        if not result.success and not config.continue_on_error:
+        if not config.continue_on_error and not all(
+            ctx.get_result(name).success for name in level
+        ):
             break
 
+    if config.update_graph and flush_state:
+        await flush_pipeline_states([ctx])
+
     return ctx
 
 
-def _update_graph_state(video_id: str, step_name: str, version_hash: str) -> None:
-    """Update SurrealDB pipeline state for a video.
+def run_pipeline(
+    video_id: str,
+    url: str,
+    steps: Optional[list[str]] = None,
+    config: Optional[PipelineConfig] = None,
+    metadata: Optional[dict] = None,
+) -> PipelineContext:
+    """Execute pipeline steps for a video (sync entry point).
+
+    Wraps run_pipeline_async in a single event loop; call
+    run_pipeline_async directly from async code.
 
-    Only imports surrealdb module when needed to avoid circular deps.
+    Args:
+        video_id: YouTube video ID
+        url: Video URL
+        steps: List of step names to execute (or all if None)
+        config: Pipeline configuration
+        metadata: Initial ctx.metadata (e.g. prefetched youtube_metadata)
+
+    Returns:
+        PipelineContext with results from all executed steps
+    """
+    return asyncio.run(run_pipeline_async(video_id, url, steps, config, metadata))
+
+
+async def flush_pipeline_states(contexts: list[PipelineContext]) -> int:
+    """Write pipeline state for completed steps of many runs in one query.
+
+    Failures are logged, not raised: a missed state write only means the
+    step is re-run by a later backfill. Successful writes update the
+    cached status counts (see status.PipelineStatus).
+
+    Args:
+        contexts: Pipeline contexts whose step_versions should be recorded
+
+    Returns:
+        Number of videos whose state was submitted
     """
-    import asyncio
+    states = {ctx.video_id: dict(ctx.step_versions) for ctx in contexts if ctx.step_versions}
+    if not states:
+        return 0
+
     try:
-        from compose.services.surrealdb import update_pipeline_state
-        asyncio.run(update_pipeline_state(video_id, step_name, version_hash))
-    except (ImportError, Exception):
-        pass  # SurrealDB service not available
+        from compose.services.surrealdb import update_pipeline_states
+        before = await update_pipeline_states(states)
+    except Exception as e:
+        logger.warning(f"Pipeline state update failed for {len(states)} videos: {e}")
+        return 0
 
+    get_pipeline_status().apply_updates(states, before)
+    return len(states)
 
-def get_backfill_queue(
+
+async def get_backfill_queue_async(
     step_name: str,
     limit: int = 100,
 ) -> list[dict]:
@@ -119,7 +185,6 @@ def get_backfill_queue(
     Returns:
         List of dicts with video_id, url, current_version, required_version
     """
-    import asyncio
     step_tuple = get_step(step_name)
     if not step_tuple:
         raise ValueError(f"Step '{step_name}' not found")
@@ -129,7 +194,7 @@ def get_backfill_queue(
 
     try:
         from compose.services.surrealdb import find_stale_videos
-        stale = asyncio.run(find_stale_videos(step_name, current_version, limit))
+        stale = await find_stale_videos(step_name, current_version, limit)
         return [
             {
                 "video_id": s.video_id,
@@ -143,44 +208,61 @@ def get_backfill_queue(
         return []
 
 
+def get_backfill_queue(
+    step_name: str,
+    limit: int = 100,
+) -> list[dict]:
+    """Sync wrapper for get_backfill_queue_async."""
+    return asyncio.run(get_backfill_queue_async(step_name, limit))
+
+
 def get_backfill_counts() -> dict[str, int]:
     """Get count of videos needing reprocessing for each step.
 
+    Counts come from one grouped query (cached and kept current by
+    pipeline-state writes), not from listing stale videos.
+
     Returns:
-        Dict of step_name -> count of stale videos
+        Dict of step_name -> count of stale or never-run videos
     """
-    import asyncio
-    counts = {}
-
     try:
-        from compose.services.surrealdb import find_stale_videos
+        counts = asyncio.run(get_step_counts())
+    except Exception:
+        return {}
 
-        for step_name, metadata in get_all_steps().items():
-            stale = asyncio.run(find_stale_videos(step_name, metadata.version_hash, limit=10000))
-            counts[step_name] = len(stale)
+    return {step_name: c.needs_backfill for step_name, c in counts.items()}
 
-    except (ImportError, Exception):
-        pass
 
-    return counts
+async def _prefetch_youtube_metadata(video_ids: list[str]) -> dict:
+    """Batch-fetch YouTube metadata (50 IDs per API call) for a backfill batch."""
+    from compose.services.youtube import YouTubeMetadataService
 
+    try:
+        service = YouTubeMetadataService()
+    except ValueError:
+        return {}  # Not configured; the step reports the error per video
+    return await service.fetch_metadata_many(video_ids)
 
-def run_backfill(
+
+async def run_backfill_async(
     step_name: str,
     batch_size: int = 10,
     config: Optional[PipelineConfig] = None,
+    max_concurrency: int = DEFAULT_BACKFILL_CONCURRENCY,
 ) -> dict:
-    """Process a batch of stale videos for a step.
+    """Process a batch of stale videos for a step concurrently.
 
     Args:
         step_name: Step to backfill
         batch_size: Number of videos to process
         config: Pipeline configuration
+        max_concurrency: Maximum videos processed at once
 
     Returns:
         Summary dict with processed, succeeded, failed counts
     """
-    queue = get_backfill_queue(step_name, limit=batch_size)
+    config = config or PipelineConfig()
+    queue = await get_backfill_queue_async(step_name, limit=batch_size)
 
     summary = {
         "step": step_name,
@@ -190,14 +272,34 @@ def run_backfill(
         "errors": [],
     }
 
-    for item in queue:
-        ctx = run_pipeline(
-            video_id=item["video_id"],
-            url=item["url"],
-            steps=[step_name],
-            config=config,
-        )
+    # Fetch metadata for the whole batch in 50-ID API calls up front
+    prefetched = {}
+    if step_name == "fetch_metadata" and queue:
+        prefetched = await _prefetch_youtube_metadata([item["video_id"] for item in queue])
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def process(item: dict) -> PipelineContext:
+        initial = {}
+        if item["video_id"] in prefetched:
+            initial["youtube_metadata"] = prefetched[item["video_id"]]
+
+        async with semaphore:
+            return await run_pipeline_async(
+                video_id=item["video_id"],
+                url=item["url"],
+                steps=[step_name],
+                config=config,
+                metadata=initial,
+                flush_state=False,
+            )
 
+    contexts = await asyncio.gather(*(process(item) for item in queue))
+
+    if config.update_graph:
+        await flush_pipeline_states(contexts)
+
+    for item, ctx in zip(queue, contexts):
         result = ctx.get_result(step_name)
         if result and result.success:
             summary["succeeded"] += 1
@@ -210,3 +312,23 @@ def run_backfill(
                 })
 
     return summary
+
+
+def run_backfill(
+    step_name: str,
+    batch_size: int = 10,
+    config: Optional[PipelineConfig] = None,
+    max_concurrency: int = DEFAULT_BACKFILL_CONCURRENCY,
+) -> dict:
+    """Process a batch of stale videos for a step (sync entry point).
+
+    Args:
+        step_name: Step to backfill
+        batch_size: Number of videos to process
+        config: Pipeline configuration
+        max_concurrency: Maximum videos processed at once
+
+    Returns:
+        Summary dict with processed, succeeded, failed counts
+    """
+    return asyncio.run(run_backfill_async(step_name, batch_size, config, max_concurrency))
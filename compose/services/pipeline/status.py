@@ -0,0 +1,215 @@
+"""Per-step pipeline status counts.
+
+For every registered step a video is in one of three states:
+- done: pipeline_state[step] matches the step's current version
+- stale: the step ran with an older version
+- pending: the step has never run
+
+All steps are counted server-side in a single grouped SurrealDB query.
+The counts are then kept current incrementally: every batched
+pipeline-state write (see flush_pipeline_states) reports the states it
+replaced, and the affected videos are moved between buckets. Status calls
+are O(1) at any corpus size; a full recount happens only on first use,
+when step versions change, or after RESYNC_INTERVAL (to pick up new videos
+and writes from other processes).
+
+Example:
+    >>> counts = await get_step_counts()
+    >>> counts["generate_tags"].needs_backfill
+    42
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from .decorator import get_all_steps
+
+logger = logging.getLogger(__name__)
+
+# Seconds before cached counts are recomputed from the database
+RESYNC_INTERVAL = 300.0
+
+
+@dataclass
+class StepCounts:
+    """Video counts for one pipeline step."""
+
+    done: int = 0
+    stale: int = 0
+    pending: int = 0
+
+    @property
+    def total(self) -> int:
+        """Videos counted for the step."""
+        return self.done + self.stale + self.pending
+
+    @property
+    def needs_backfill(self) -> int:
+        """Videos that need the step (re)run."""
+        return self.stale + self.pending
+
+
+def current_step_versions() -> dict[str, str]:
+    """Current version hash of every registered step."""
+    return {name: meta.version_hash for name, meta in get_all_steps().items()}
+
+
+def build_counts_query(step_versions: dict[str, str]) -> tuple[str, dict]:
+    """Build one GROUP ALL query counting done/stale videos per step.
+
+    Args:
+        step_versions: Mapping of step name -> current version hash
+
+    Returns:
+        Tuple of (query, params). The result row has ``total`` plus
+        ``done_<i>`` and ``stale_<i>`` for the i-th step.
+    """
+    fields = ["count() AS total"]
+    params: dict[str, str] = {}
+    for i, (step, version) in enumerate(step_versions.items()):
+        params[f"step_{i}"] = step
+        params[f"version_{i}"] = version
+        state = f"pipeline_state[$step_{i}]"
+        fields.append(f"count({state} = $version_{i}) AS done_{i}")
+        fields.append(f"count({state} IS NOT NONE AND {state} != $version_{i}) AS stale_{i}")
+
+    query = f"SELECT {', '.join(fields)} FROM video GROUP ALL;"
+    return query, params
+
+
+async def count_step_states(step_versions: dict[str, str]) -> tuple[int, dict[str, StepCounts]]:
+    """Count done, stale and pending videos for each step in one query.
+
+    Args:
+        step_versions: Mapping of step name -> current version hash
+
+    Returns:
+        Tuple of (total_videos, {step_name: StepCounts})
+    """
+    from compose.services.surrealdb.driver import execute_query
+
+    query, params = build_counts_query(step_versions)
+    rows = await execute_query(query, params)
+    row = rows[0] if rows else {}
+
+    total = int(row.get("total", 0) or 0)
+    counts = {}
+    for i, step in enumerate(step_versions):
+        done = int(row.get(f"done_{i}", 0) or 0)
+        stale = int(row.get(f"stale_{i}", 0) or 0)
+        counts[step] = StepCounts(done=done, stale=stale, pending=max(total - done - stale, 0))
+    return total, counts
+
+
+def _bucket(version: Optional[str], current: str) -> str:
+    """StepCounts field a stored version falls into."""
+    if version is None:
+        return "pending"
+    return "done" if version == current else "stale"
+
+
+class PipelineStatus:
+    """Cached, incrementally maintained per-step status counts."""
+
+    def __init__(self, resync_interval: float = RESYNC_INTERVAL):
+        """Initialize status tracker.
+
+        Args:
+            resync_interval: Seconds before counts are recomputed from the database
+        """
+        self.resync_interval = resync_interval
+        self.total = 0
+        self._versions: dict[str, str] = {}
+        self._counts: dict[str, StepCounts] = {}
+        self._synced_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self, step_versions: dict[str, str]) -> bool:
+        return (
+            self._synced_at is not None
+            and self._versions == step_versions
+            and time.monotonic() - self._synced_at < self.resync_interval
+        )
+
+    async def get_counts(
+        self,
+        step_versions: Optional[dict[str, str]] = None,
+        force: bool = False,
+    ) -> dict[str, StepCounts]:
+        """Get per-step counts, recounting only when stale.
+
+        Args:
+            step_versions: Steps and versions to count (default: registered steps)
+            force: Recount from the database
+
+        Returns:
+            Mapping of step name -> StepCounts (copies)
+        """
+        step_versions = step_versions if step_versions is not None else current_step_versions()
+
+        if force or not self._is_fresh(step_versions):
+            async with self._lock:
+                if force or not self._is_fresh(step_versions):
+                    self.total, self._counts = await count_step_states(step_versions)
+                    self._versions = dict(step_versions)
+                    self._synced_at = time.monotonic()
+
+        return {name: StepCounts(c.done, c.stale, c.pending) for name, c in self._counts.items()}
+
+    def apply_updates(
+        self,
+        states: dict[str, dict[str, str]],
+        before: dict[str, dict],
+    ) -> None:
+        """Move videos between buckets after a pipeline-state write.
+
+        Args:
+            states: video_id -> {step_name: version} that was written
+            before: video_id -> pipeline_state prior to the write. Videos
+                missing here did not exist, so the write changed nothing.
+        """
+        if self._synced_at is None:
+            return
+
+        for video_id, steps in states.items():
+            if video_id not in before:
+                continue
+            previous = before[video_id] or {}
+            for step, version in steps.items():
+                counts = self._counts.get(step)
+                if counts is None:
+                    continue
+                current = self._versions[step]
+                old, new = _bucket(previous.get(step), current), _bucket(version, current)
+                if old != new:
+                    setattr(counts, old, max(getattr(counts, old) - 1, 0))
+                    setattr(counts, new, getattr(counts, new) + 1)
+
+    def invalidate(self) -> None:
+        """Force a recount on the next get_counts call."""
+        self._synced_at = None
+
+
+_status: Optional[PipelineStatus] = None
+
+
+def get_pipeline_status() -> PipelineStatus:
+    """Get the process-wide PipelineStatus singleton."""
+    global _status
+    if _status is None:
+        _status = PipelineStatus()
+    return _status
+
+
+def reset_pipeline_status() -> None:
+    """Discard the status singleton (for testing)."""
+    global _status
+    _status = None
+
+
+async def get_step_counts(force: bool = False) -> dict[str, StepCounts]:
+    """Per-step counts for all registered steps (see PipelineStatus.get_counts)."""
+    return await get_pipeline_status().get_counts(force=force)
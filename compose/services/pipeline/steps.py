@@ -43,11 +43,17 @@ def fetch_metadata(ctx: PipelineContext) -> StepResult[dict]:
     """Fetch YouTube metadata (title, channel, duration, etc.).
 
     Can run in parallel with fetch_transcript since they're independent.
+    Uses ``ctx.metadata["youtube_metadata"]`` when a batched fetch already
+    supplied the (metadata, error) pair.
     """
     from compose.services.youtube import fetch_video_metadata
 
     try:
-        metadata, error = fetch_video_metadata(ctx.video_id)
+        prefetched = ctx.metadata.get("youtube_metadata")
+        if prefetched is not None:
+            metadata, error = prefetched
+        else:
+            metadata, error = fetch_video_metadata(ctx.video_id)
 
         if error:
             return StepResult.fail(f"Metadata fetch failed: {error}")
@@ -207,7 +213,7 @@ def cache_to_minio(ctx: PipelineContext) -> StepResult[str]:
     depends_on=["cache_to_minio"],
     description="Update SurrealDB with video relationships",
 )
-def update_graph(ctx: PipelineContext) -> StepResult[str]:
+async def update_graph(ctx: PipelineContext) -> StepResult[str]:
     """Update SurrealDB with video node and relationships.
 
     Creates/updates:
@@ -215,7 +221,6 @@ def update_graph(ctx: PipelineContext) -> StepResult[str]:
     - Channel relationship
     - Topic relationships (if tags available)
     """
-    import asyncio
     from compose.services.surrealdb import (
         upsert_video,
         link_video_to_channel,
@@ -226,50 +231,47 @@ def update_graph(ctx: PipelineContext) -> StepResult[str]:
     metadata = ctx.get_value("fetch_metadata") or {}
     tags = ctx.get_value("generate_tags") or []
 
-    async def _update_db():
-        try:
-            # Create video record
-            video = VideoRecord(
-                video_id=ctx.video_id,
-                url=ctx.url,
-                fetched_at=ctx.started_at,
-                title=metadata.get("title"),
-                channel_id=metadata.get("channel_id"),
-                channel_name=metadata.get("channel_title"),
-                duration_seconds=metadata.get("duration_seconds"),
-                view_count=metadata.get("view_count"),
-                source_type=ctx.metadata.get("source_type"),
-                import_method=ctx.metadata.get("import_method"),
-                recommendation_weight=ctx.metadata.get("recommendation_weight", 1.0),
-            )
-
-            await upsert_video(video)
+    try:
+        # Create video record
+        video = VideoRecord(
+            video_id=ctx.video_id,
+            url=ctx.url,
+            fetched_at=ctx.started_at,
+            title=metadata.get("title"),
+            channel_id=metadata.get("channel_id"),
+            channel_name=metadata.get("channel_title"),
+            duration_seconds=metadata.get("duration_seconds"),
+            view_count=metadata.get("view_count"),
+            source_type=ctx.metadata.get("source_type"),
+            import_method=ctx.metadata.get("import_method"),
+            recommendation_weight=ctx.metadata.get("recommendation_weight", 1.0),
+        )
 
-            # Link to channel if available
-            if metadata.get("channel_id") and metadata.get("channel_title"):
-                await link_video_to_channel(
-                    ctx.video_id,
-                    metadata["channel_id"],
-                    metadata["channel_title"],
-                )
+        await upsert_video(video)
 
-            # Link to topics if tags available
-            if tags:
-                await link_video_to_topics(ctx.video_id, tags)
+        # Link to channel if available
+        if metadata.get("channel_id") and metadata.get("channel_title"):
+            await link_video_to_channel(
+                ctx.video_id,
+                metadata["channel_id"],
+                metadata["channel_title"],
+            )
 
-            return StepResult.ok(f"Database updated for {ctx.video_id}")
+        # Link to topics if tags available
+        if tags:
+            await link_video_to_topics(ctx.video_id, tags)
 
-        except Exception as e:
-            return StepResult.fail(f"Database update failed: {e}")
+        return StepResult.ok(f"Database updated for {ctx.video_id}")
 
-    return asyncio.run(_update_db())
+    except Exception as e:
+        return StepResult.fail(f"Database update failed: {e}")
 
 
 @pipeline_step(
     depends_on=["archive_raw"],
     description="Chunk transcript into semantic segments for fine-grained search",
 )
-def chunk_transcript(ctx: PipelineContext) -> StepResult[int]:
+async def chunk_transcript(ctx: PipelineContext) -> StepResult[int]:
     """Chunk a video transcript into semantic segments.
 
     Uses time + token hybrid chunking strategy:
@@ -290,71 +292,70 @@ def chunk_transcript(ctx: PipelineContext) -> StepResult[int]:
         VideoChunkRecord,
     )
 
-    async def _chunk_and_store():
-        try:
-            # Get timed transcript from MinIO archive
-            minio_client = create_minio_client(
-                url=os.getenv("MINIO_URL", "http://192.168.16.241:9000"),
-                bucket=os.getenv("MINIO_BUCKET", "cache"),
+    try:
+        # Get timed transcript from MinIO archive
+        minio_client = create_minio_client(
+            url=os.getenv("MINIO_URL", "http://192.168.16.241:9000"),
+            bucket=os.getenv("MINIO_BUCKET", "cache"),
+        )
+
+        archive_key = f"youtube:video:{ctx.video_id}"
+        if not await asyncio.to_thread(minio_client.exists, archive_key):
+            return StepResult.fail(f"Archive not found: {archive_key}")
+
+        archive_data = await asyncio.to_thread(minio_client.get_json, archive_key)
+        timed_transcript = archive_data.get("timed_transcript")
+
+        if not timed_transcript:
+            # Fall back to raw transcript - can't chunk without timestamps
+            return StepResult.fail(
+                f"No timed_transcript for {ctx.video_id} - cannot chunk"
             )
 
-            archive_key = f"youtube:video:{ctx.video_id}"
-            if not minio_client.exists(archive_key):
-                return StepResult.fail(f"Archive not found: {archive_key}")
-
-            archive_data = minio_client.get_json(archive_key)
-            timed_transcript = archive_data.get("timed_transcript")
-
-            if not timed_transcript:
-                # Fall back to raw transcript - can't chunk without timestamps
-                return StepResult.fail(
-                    f"No timed_transcript for {ctx.video_id} - cannot chunk"
-                )
-
-            # Chunk the transcript
-            result = chunk_youtube_transcript(timed_transcript, video_id=ctx.video_id)
-
-            if not result.chunks:
-                return StepResult.fail(f"Chunking produced no chunks for {ctx.video_id}")
-
-            # Delete existing chunks (idempotent re-chunking)
-            await delete_chunks_for_video(ctx.video_id)
-
-            # Create chunk records (without embeddings - those come later)
-            chunk_records = [
-                VideoChunkRecord(
-                    chunk_id=f"{ctx.video_id}:{chunk.chunk_index}",
-                    video_id=ctx.video_id,
-                    chunk_index=chunk.chunk_index,
-                    text=chunk.text,
-                    start_time=chunk.start_time,
-                    end_time=chunk.end_time,
-                    token_count=chunk.token_count,
-                    embedding=None,  # Embeddings generated in embed_chunks step
-                )
-                for chunk in result.chunks
-            ]
-
-            # Store chunks in SurrealDB
-            count = await upsert_chunks(chunk_records)
+        # Chunk the transcript
+        result = await asyncio.to_thread(
+            chunk_youtube_transcript, timed_transcript, video_id=ctx.video_id
+        )
 
-            return StepResult.ok(
-                count,
-                message=f"Created {count} chunks for {ctx.video_id} "
-                f"(total duration: {result.total_duration:.0f}s)",
+        if not result.chunks:
+            return StepResult.fail(f"Chunking produced no chunks for {ctx.video_id}")
+
+        # Delete existing chunks (idempotent re-chunking)
+        await delete_chunks_for_video(ctx.video_id)
+
+        # Create chunk records (without embeddings - those come later)
+        chunk_records = [
+            VideoChunkRecord(
+                chunk_id=f"{ctx.video_id}:{chunk.chunk_index}",
+                video_id=ctx.video_id,
+                chunk_index=chunk.chunk_index,
+                text=chunk.text,
+                start_time=chunk.start_time,
+                end_time=chunk.end_time,
+                token_count=chunk.token_count,
+                embedding=None,  # Embeddings generated in embed_chunks step
             )
+            for chunk in result.chunks
+        ]
 
-        except Exception as e:
-            return StepResult.fail(f"Chunking failed: {e}")
+        # Store chunks in SurrealDB
+        count = await upsert_chunks(chunk_records)
+
+        return StepResult.ok(
+            count,
+            message=f"Created {count} chunks for {ctx.video_id} "
+            f"(total duration: {result.total_duration:.0f}s)",
+        )
 
-    return asyncio.run(_chunk_and_store())
+    except Exception as e:
+        return StepResult.fail(f"Chunking failed: {e}")
 
 
 @pipeline_step(
     depends_on=["chunk_transcript"],
     description="Generate embeddings for transcript chunks using bge-m3",
 )
-def embed_chunks(ctx: PipelineContext) -> StepResult[int]:
+async def embed_chunks(ctx: PipelineContext) -> StepResult[int]:
     """Generate embeddings for all chunks of a video.
 
     Uses BAAI/bge-m3 model via Infinity service for chunk-level embeddings.
@@ -365,41 +366,38 @@ def embed_chunks(ctx: PipelineContext) -> StepResult[int]:
     from compose.services.embeddings import get_chunk_embedder
     from compose.services.surrealdb import get_chunks_for_video, upsert_chunk
 
-    async def _embed_chunks():
-        try:
-            # Get chunks for this video
-            chunks = await get_chunks_for_video(ctx.video_id)
-
-            if not chunks:
-                return StepResult.fail(f"No chunks found for {ctx.video_id}")
-
-            # Filter to chunks without embeddings
-            chunks_to_embed = [c for c in chunks if not c.embedding]
-
-            if not chunks_to_embed:
-                return StepResult.ok(
-                    0, message=f"All {len(chunks)} chunks already have embeddings"
-                )
+    try:
+        # Get chunks for this video
+        chunks = await get_chunks_for_video(ctx.video_id)
 
-            # Get embedder and generate embeddings in batch
-            embedder = get_chunk_embedder()
-            texts = [c.text for c in chunks_to_embed]
-            embeddings = embedder.embed_batch(texts)
+        if not chunks:
+            return StepResult.fail(f"No chunks found for {ctx.video_id}")
 
-            # Update each chunk with its embedding
-            for chunk, embedding in zip(chunks_to_embed, embeddings):
-                chunk.embedding = embedding
-                await upsert_chunk(chunk)
+        # Filter to chunks without embeddings
+        chunks_to_embed = [c for c in chunks if not c.embedding]
 
+        if not chunks_to_embed:
             return StepResult.ok(
-                len(chunks_to_embed),
-                message=f"Embedded {len(chunks_to_embed)} chunks for {ctx.video_id}",
+                0, message=f"All {len(chunks)} chunks already have embeddings"
             )
 
-        except Exception as e:
-            return StepResult.fail(f"Chunk embedding failed: {e}")
+        # Get embedder and generate embeddings in batch
+        embedder = get_chunk_embedder()
+        texts = [c.text for c in chunks_to_embed]
+        embeddings = await asyncio.to_thread(embedder.embed_batch, texts)
 
-    return asyncio.run(_embed_chunks())
+        # Update each chunk with its embedding
+        for chunk, embedding in zip(chunks_to_embed, embeddings):
+            chunk.embedding = embedding
+            await upsert_chunk(chunk)
+
+        return StepResult.ok(
+            len(chunks_to_embed),
+            message=f"Embedded {len(chunks_to_embed)} chunks for {ctx.video_id}",
+        )
+
+    except Exception as e:
+        return StepResult.fail(f"Chunk embedding failed: {e}")
 
 
 # Default step list for full ingestion
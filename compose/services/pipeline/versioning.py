@@ -1,46 +1,113 @@
 """Git-based versioning for pipeline steps.
 
 Computes version hashes from:
-1. Git blob hash of the source file (if in git repo)
+1. Git blob hash of the source file
 2. Hash of function source code (fallback)
 
 This ensures version changes automatically when code changes,
 eliminating the need for manual version bumping.
+
+Blob hashes are computed in process (the same SHA-1 ``git hash-object``
+produces) rather than by forking git, and are cached on disk keyed by the
+file's path, mtime and size, so unchanged files are never re-read across
+processes. Steps resolve their version lazily on first use, so importing
+the pipeline costs no hashing at all.
+
+The cache file defaults to ``~/.cache/agent-spike/pipeline_versions.json``
+and can be moved with the ``PIPELINE_VERSION_CACHE`` env var.
 """
 
 import hashlib
 import inspect
-import subprocess
-from functools import lru_cache
+import json
+import logging
+import os
+import threading
 from pathlib import Path
 from typing import Callable, Optional
 
+logger = logging.getLogger(__name__)
+
+
+def _default_cache_path() -> Path:
+    cache_home = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "agent-spike" / "pipeline_versions.json"
+
+
+VERSION_CACHE_PATH = Path(os.getenv("PIPELINE_VERSION_CACHE") or _default_cache_path())
+
+# path -> [mtime_ns, size, blob_hash]; loaded from disk on first use
+_cache: Optional[dict[str, list]] = None
+_cache_lock = threading.Lock()
+
+
+def compute_blob_hash(data: bytes) -> str:
+    """Compute the git blob hash of file contents.
+
+    Args:
+        data: File contents
+
+    Returns:
+        40 char hex SHA-1, identical to ``git hash-object``
+    """
+    header = f"blob {len(data)}\0".encode()
+    return hashlib.sha1(header + data).hexdigest()
+
+
+def _load_cache() -> dict[str, list]:
+    """Load the on-disk cache (caller holds _cache_lock)."""
+    global _cache
+    if _cache is None:
+        try:
+            _cache = json.loads(VERSION_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def _save_cache(cache: dict[str, list]) -> None:
+    """Atomically write the cache to disk (best effort)."""
+    try:
+        VERSION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = VERSION_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(cache))
+        os.replace(tmp_path, VERSION_CACHE_PATH)
+    except OSError as e:
+        logger.debug(f"Could not write version cache {VERSION_CACHE_PATH}: {e}")
+
 
-@lru_cache(maxsize=128)
 def get_git_blob_hash(file_path: str) -> Optional[str]:
     """Get git blob hash for a file.
 
-    Uses `git hash-object` to get the content hash that git uses.
-    This changes when the file content changes.
+    Hashes the file in process, reusing the disk-cached hash while the
+    file's mtime and size are unchanged.
 
     Args:
         file_path: Path to source file
 
     Returns:
-        Git blob hash (40 char hex), or None if not in git repo
+        Git blob hash (first 12 hex chars), or None if the file can't be read
     """
+    path = os.path.abspath(file_path)
     try:
-        result = subprocess.run(
-            ["git", "hash-object", file_path],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()[:12]  # First 12 chars like short SHA
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
-    return None
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    with _cache_lock:
+        cache = _load_cache()
+        entry = cache.get(path)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        try:
+            blob_hash = compute_blob_hash(Path(path).read_bytes())[:12]
+        except OSError:
+            return None
+
+        cache[path] = [stat.st_mtime_ns, stat.st_size, blob_hash]
+        _save_cache(cache)
+        return blob_hash
 
 
 def get_source_hash(func: Callable) -> str:
@@ -108,6 +175,9 @@ def invalidate_version_cache() -> None:
     """Clear the version hash cache.
 
     Call this when you want to force re-computation of hashes,
-    e.g., after hot-reloading code.
+    e.g., after hot-reloading code. The disk cache is keyed by mtime
+    and size, so this only drops the in-memory copy.
     """
-    get_git_blob_hash.cache_clear()
+    global _cache
+    with _cache_lock:
+        _cache = None
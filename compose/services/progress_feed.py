@@ -0,0 +1,223 @@
+"""Push-based worker progress change feed.
+
+Worker progress lives in the SurrealDB ``worker_progress`` table. Instead of
+every consumer re-selecting that table on a timer, progress changes are
+delivered through a ProgressHub (in-process pub/sub):
+
+- Workers publish update/delete events to the hub as they write progress.
+  When the worker runs in the same process as the API this is all that is
+  needed (``PROGRESS_FEED=local``).
+- SurrealLiveFeed forwards a SurrealDB ``LIVE SELECT`` on worker_progress
+  into the hub, so a separate worker process still pushes to the API.
+  The SDK's live stream only carries the record, not the action, so these
+  are published as ``refresh`` events telling consumers to re-read.
+
+Modes (``PROGRESS_FEED`` env var):
+    auto  - use LIVE if the connection supports it, otherwise poll (default)
+    live  - same as auto, but log a warning when LIVE is unavailable
+    local - trust in-process events only (co-located worker)
+    poll  - disable push, consumers keep polling
+
+Example:
+    >>> hub = get_progress_hub()
+    >>> async with hub.subscribe() as events:
+    ...     event = await events.get()
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Optional
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_FEED_MODE = os.getenv("PROGRESS_FEED", "auto").lower()
+
+# Per-subscriber queue bound; slow consumers drop their oldest events
+SUBSCRIBER_QUEUE_SIZE = 256
+
+PROGRESS_TABLE = "worker_progress"
+
+
+@dataclass
+class ProgressEvent:
+    """A change to one worker's progress.
+
+    Attributes:
+        action: "update", "delete", or "refresh" (re-read the table)
+        worker_id: Worker the event refers to (None for refresh)
+        record: Progress fields for updates
+    """
+
+    action: str
+    worker_id: Optional[str] = None
+    record: dict[str, Any] = field(default_factory=dict)
+
+
+class ProgressHub:
+    """In-process fan-out of progress events to any number of subscribers."""
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: set[asyncio.Queue] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active subscribers."""
+        return len(self._subscribers)
+
+    def publish(self, event: ProgressEvent) -> None:
+        """Deliver an event to every subscriber without blocking.
+
+        Args:
+            event: Progress event to publish
+        """
+        for queue in self._subscribers:
+            if queue.full():
+                # Newer progress supersedes older; drop the oldest event
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        """Subscribe for the lifetime of the context.
+
+        Yields:
+            Queue receiving ProgressEvent objects
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+
+class SurrealLiveFeed:
+    """Forward a SurrealDB LIVE SELECT on worker_progress into a ProgressHub."""
+
+    def __init__(self, hub: ProgressHub, table: str = PROGRESS_TABLE):
+        self.hub = hub
+        self.table = table
+        self._query_id = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether notifications are being forwarded."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> bool:
+        """Register the live query and start forwarding.
+
+        Returns:
+            True if the live query is active, False if unsupported or failed
+        """
+        if self.running:
+            return True
+
+        from compose.services.surrealdb.driver import get_db
+
+        try:
+            db = await get_db()
+            if not (hasattr(db, "live") and hasattr(db, "subscribe_live")):
+                return False
+            self._query_id = await db.live(self.table)
+            notifications = await db.subscribe_live(self._query_id)
+        except Exception as e:
+            logger.warning(f"LIVE SELECT on {self.table} unavailable: {e}")
+            self._query_id = None
+            return False
+
+        self._task = asyncio.create_task(self._forward(notifications), name="progress-live-feed")
+        logger.info(f"Streaming {self.table} changes via LIVE SELECT")
+        return True
+
+    async def _forward(self, notifications) -> None:
+        """Publish a refresh event for each notification."""
+        try:
+            async for _ in notifications:
+                self.hub.publish(ProgressEvent(action="refresh"))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"LIVE feed for {self.table} stopped: {e}")
+
+    async def stop(self) -> None:
+        """Stop forwarding and kill the live query."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._query_id is not None:
+            try:
+                from compose.services.surrealdb.driver import get_db
+
+                db = await get_db()
+                await db.kill(self._query_id)
+            except Exception as e:
+                logger.debug(f"Failed to kill live query: {e}")
+            self._query_id = None
+
+
+_hub: Optional[ProgressHub] = None
+_live_feed: Optional[SurrealLiveFeed] = None
+
+
+def get_progress_hub() -> ProgressHub:
+    """Get the process-wide progress hub singleton."""
+    global _hub
+    if _hub is None:
+        _hub = ProgressHub()
+    return _hub
+
+
+async def start_progress_feed(mode: Optional[str] = None) -> bool:
+    """Enable push delivery of progress events into the hub.
+
+    Args:
+        mode: Feed mode (default: PROGRESS_FEED_MODE)
+
+    Returns:
+        True if consumers can rely on hub events instead of polling
+    """
+    global _live_feed
+    mode = (mode or PROGRESS_FEED_MODE).lower()
+
+    if mode == "poll":
+        return False
+    if mode == "local":
+        return True
+
+    if _live_feed is None:
+        _live_feed = SurrealLiveFeed(get_progress_hub())
+    started = await _live_feed.start()
+    if not started and mode == "live":
+        logger.warning("PROGRESS_FEED=live but LIVE SELECT is unavailable; falling back to polling")
+    return started
+
+
+async def stop_progress_feed() -> None:
+    """Stop the LIVE feed if running."""
+    global _live_feed
+    if _live_feed is not None:
+        await _live_feed.stop()
+        _live_feed = None
+
+
+def publish_progress(worker_id: str, record: dict[str, Any]) -> None:
+    """Publish a progress update for a worker (no-op without subscribers)."""
+    get_progress_hub().publish(ProgressEvent(action="update", worker_id=worker_id, record=record))
+
+
+def publish_progress_cleared(worker_id: str) -> None:
+    """Publish that a worker finished and its progress row was removed."""
+    get_progress_hub().publish(ProgressEvent(action="delete", worker_id=worker_id))
+
+
+def reset_progress_feed() -> None:
+    """Discard hub and feed singletons (for testing)."""
+    global _hub, _live_feed
+    _hub = None
+    _live_feed = None
@@ -8,12 +8,17 @@ Projects group conversations together with shared:
 Storage:
 - SurrealDB for metadata (projects, files, conversations)
 - MinIO for file content
+
+File content is streamed in both directions: uploads are sent to MinIO
+from a file-like object (multipart for large files) and downloads are
+read in chunks, with the blocking MinIO calls run in worker threads.
 """
 
+import asyncio
 import uuid
 from datetime import datetime, timezone
 from io import BytesIO
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, BinaryIO, Optional
 
 from pydantic import BaseModel, Field
 
@@ -24,6 +29,10 @@ if TYPE_CHECKING:
     from .minio.client import MinIOClient
     from .surrealdb.protocols import DatabaseExecutor
 
+# Bytes read from MinIO per chunk when streaming file content
+FILE_CHUNK_SIZE = 1024 * 1024
+
+
 def _extract_id(record_id) -> str:
     """Extract clean ID from SurrealDB RecordID.
 
@@ -37,6 +46,14 @@ def _extract_id(record_id) -> str:
     return id_str
 
 
+def _stream_size(stream: BinaryIO) -> int:
+    """Size of the remaining content of a seekable stream."""
+    position = stream.tell()
+    size = stream.seek(0, 2) - position
+    stream.seek(position)
+    return size
+
+
 class ProjectMeta(BaseModel):
     """Project metadata for index listing."""
 
@@ -390,24 +407,42 @@ class ProjectService:
         filename: str,
         original_filename: str,
         content_type: str,
-        file_data: bytes,
+        file_data: bytes | BinaryIO,
+        size_bytes: Optional[int] = None,
     ) -> Optional[ProjectFile]:
-        """Add a file to a project."""
+        """Add a file to a project.
+
+        Args:
+            project_id: Project to add the file to
+            filename: Sanitized filename used in the storage key
+            original_filename: Filename as uploaded
+            content_type: MIME type of the file
+            file_data: File content, either bytes or a readable binary
+                file-like object positioned at the start (e.g. the spooled
+                file of a FastAPI UploadFile), which is streamed to MinIO
+            size_bytes: Size of file_data; measured by seeking if omitted
+
+        Returns:
+            The new file record, or None if the project doesn't exist
+        """
         existing = await self.get_project(project_id)
         if not existing:
             return None
 
         file_id = str(uuid.uuid4())
         now = datetime.now(timezone.utc).isoformat()
-        size_bytes = len(file_data)
+
+        stream = BytesIO(file_data) if isinstance(file_data, bytes) else file_data
+        if size_bytes is None:
+            size_bytes = _stream_size(stream)
 
         minio_key = self._minio_key(project_id, file_id, filename)
-        self.minio.client.put_object(
-            self.minio.bucket,
+        await asyncio.to_thread(
+            self.minio.put_stream,
             minio_key,
-            BytesIO(file_data),
+            stream,
             size_bytes,
-            content_type=content_type,
+            content_type,
         )
 
         await self.db.execute(
@@ -452,8 +487,8 @@ class ProjectService:
             uploaded_at=now,
         )
 
-    async def get_file_content(self, project_id: str, file_id: str) -> Optional[bytes]:
-        """Get the content of a project file from MinIO."""
+    async def get_file(self, project_id: str, file_id: str) -> Optional[ProjectFile]:
+        """Get a single file record of a project."""
         result = await self.db.execute(
             "SELECT * FROM project_file WHERE id = $id AND project_id = $project_id",
             {"id": file_id, "project_id": project_id},
@@ -462,13 +497,67 @@ class ProjectService:
         if not result:
             return None
 
-        minio_key = result[0].get("minio_key")
+        f = result[0]
+        return ProjectFile(
+            id=_extract_id(f["id"]),
+            filename=f.get("filename", ""),
+            original_filename=f.get("original_filename", ""),
+            content_type=f.get("content_type", ""),
+            size_bytes=f.get("size_bytes", 0),
+            uploaded_at=str(f.get("uploaded_at", "")),
+            processed=f.get("processed", False),
+            vector_indexed=f.get("vector_indexed", False),
+            processing_error=f.get("processing_error"),
+        )
+
+    async def iter_file_content(
+        self,
+        project_id: str,
+        file_id: str,
+        offset: int = 0,
+        length: int = 0,
+        chunk_size: int = FILE_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream the content of a project file from MinIO.
+
+        Reads happen in worker threads, chunk_size bytes at a time, and the
+        MinIO connection is released when the iterator finishes or is closed.
+
+        Args:
+            project_id: Project the file belongs to
+            file_id: File to read
+            offset: First byte to return
+            length: Number of bytes to return, or 0 for the rest of the file
+            chunk_size: Bytes per yielded chunk
+
+        Yields:
+            Chunks of file content (nothing if the file doesn't exist)
+        """
+        minio_key = await self.get_file_path(project_id, file_id)
         if not minio_key:
+            return
+
+        context = self.minio.open_stream(minio_key, offset=offset, length=length)
+        response = await asyncio.to_thread(context.__enter__)
+        try:
+            while chunk := await asyncio.to_thread(response.read, chunk_size):
+                yield chunk
+        finally:
+            await asyncio.to_thread(context.__exit__, None, None, None)
+
+    async def get_file_content(self, project_id: str, file_id: str) -> Optional[bytes]:
+        """Get the content of a project file from MinIO.
+
+        Loads the whole file into memory; prefer iter_file_content() for
+        anything that can be streamed.
+        """
+        if not await self.get_file_path(project_id, file_id):
             return None
 
         try:
-            response = self.minio.client.get_object(self.minio.bucket, minio_key)
-            return response.read()
+            return b"".join(
+                [chunk async for chunk in self.iter_file_content(project_id, file_id)]
+            )
         except Exception:
             return None
 
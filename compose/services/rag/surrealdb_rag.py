@@ -7,13 +7,48 @@ using SurrealDB vector search and MinIO transcript storage.
 import logging
 from typing import Optional
 
-from compose.services.minio import ArchiveStorage, create_minio_client
+from compose.services.minio import ArchiveStorage, get_async_minio_client
 from compose.services.surrealdb.repository import search_videos_by_text
 
 logger = logging.getLogger(__name__)
 
 
-def get_transcript_from_minio(video_id: str, max_chars: int = 4000) -> str | None:
+def _truncate_transcript(transcript: str | None, max_chars: int) -> str | None:
+    """Truncate a transcript to fit the context window."""
+    if transcript and len(transcript) > max_chars:
+        # Truncate and indicate more content exists
+        return transcript[:max_chars] + "\n\n[... transcript truncated ...]"
+    return transcript
+
+
+async def get_transcripts_from_minio(
+    video_ids: list[str], max_chars: int = 4000
+) -> dict[str, str | None]:
+    """Fetch transcripts from MinIO storage concurrently.
+
+    Args:
+        video_ids: YouTube video IDs.
+        max_chars: Maximum characters per transcript (to fit context window).
+
+    Returns:
+        Dict of video ID to transcript text (truncated if needed), or None
+        if not found.
+    """
+    try:
+        minio_client = get_async_minio_client()
+        paths = {video_id: ArchiveStorage.transcript_path(video_id) for video_id in video_ids}
+        contents = await minio_client.get_many(paths.values(), decode="text")
+    except Exception as e:
+        logger.warning(f"Failed to fetch transcripts for {video_ids}: {e}")
+        return dict.fromkeys(video_ids)
+
+    return {
+        video_id: _truncate_transcript(contents.get(path), max_chars)
+        for video_id, path in paths.items()
+    }
+
+
+async def get_transcript_from_minio(video_id: str, max_chars: int = 4000) -> str | None:
     """Fetch transcript from MinIO storage.
 
     Args:
@@ -23,17 +58,8 @@ def get_transcript_from_minio(video_id: str, max_chars: int = 4000) -> str | Non
     Returns:
         Transcript text (truncated if needed) or None if not found.
     """
-    try:
-        minio_client = create_minio_client()
-        archive = ArchiveStorage(minio_client)
-        transcript = archive.get_transcript(video_id)
-        if transcript and len(transcript) > max_chars:
-            # Truncate and indicate more content exists
-            return transcript[:max_chars] + "\n\n[... transcript truncated ...]"
-        return transcript
-    except Exception as e:
-        logger.warning(f"Failed to fetch transcript for {video_id}: {e}")
-        return None
+    transcripts = await get_transcripts_from_minio([video_id], max_chars)
+    return transcripts[video_id]
 
 
 class SurrealDBRAG:
@@ -135,6 +161,11 @@ class SurrealDBRAG:
         if not results:
             return ""
 
+        # Fetch all transcripts from MinIO at once
+        transcripts = await get_transcripts_from_minio(
+            [result.get("video_id", "") for result in results], self.max_transcript_chars
+        )
+
         # Build formatted context
         context_parts = []
 
@@ -145,8 +176,7 @@ class SurrealDBRAG:
             url = result.get("url", f"https://youtube.com/watch?v={video_id}")
             score = result.get("score", 0.0)
 
-            # Fetch transcript from MinIO
-            transcript = get_transcript_from_minio(video_id, self.max_transcript_chars)
+            transcript = transcripts.get(video_id)
 
             # Build context entry
             entry = f'[Video: "{title}"]\n'
@@ -11,6 +11,7 @@ from .config import SurrealDBConfig
 from .driver import (
     RealDatabaseExecutor,
     close_db,
+    execute_multi_query,
     execute_query,
     get_db,
     get_transaction,
@@ -38,6 +39,7 @@ from .repository import (
     semantic_search,
     semantic_search_chunks,
     update_pipeline_state,
+    update_pipeline_states,
     upsert_video,
 )
 
@@ -50,6 +52,7 @@ __all__ = [
     "reset_db",
     "get_transaction",
     "execute_query",
+    "execute_multi_query",
     "verify_connection",
     # Protocols and DI
     "DatabaseExecutor",
@@ -66,6 +69,7 @@ __all__ = [
     "upsert_video",
     "get_video",
     "update_pipeline_state",
+    "update_pipeline_states",
     "find_stale_videos",
     "link_video_to_channel",
     "link_video_to_topics",
@@ -7,20 +7,22 @@ Supports context manager for query operations.
 import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Optional
-
-from surrealdb import AsyncSurreal
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional
 
 from .config import SurrealDBConfig
 
+# The SDK (and its HTTP/WebSocket stacks) is imported on first connect
+if TYPE_CHECKING:
+    from surrealdb import AsyncSurreal
+
 logger = logging.getLogger(__name__)
 
 # Singleton connection instance
-_db: Optional[AsyncSurreal] = None
+_db: Optional["AsyncSurreal"] = None
 _lock = asyncio.Lock()
 
 
-async def get_db() -> AsyncSurreal:
+async def get_db() -> "AsyncSurreal":
     """Get or create the SurrealDB connection singleton.
 
     Uses lazy initialization with async locking to ensure thread-safe
@@ -46,6 +48,8 @@ async def get_db() -> AsyncSurreal:
         config = SurrealDBConfig()
         config.validate()
 
+        from surrealdb import AsyncSurreal
+
         # Create connection - no explicit connect() needed with AsyncSurreal
         db = AsyncSurreal(config.url)
 
@@ -103,7 +107,7 @@ def reset_db() -> None:
 
 
 @asynccontextmanager
-async def get_transaction() -> AsyncGenerator[AsyncSurreal, None]:
+async def get_transaction() -> AsyncGenerator["AsyncSurreal", None]:
     """Context manager for SurrealDB operations.
 
     Usage:
@@ -146,6 +150,55 @@ async def execute_query(
         raise
 
 
+async def execute_multi_query(
+    query: str,
+    params: Optional[dict[str, Any]] = None,
+) -> list[list[dict[str, Any]]]:
+    """Execute a multi-statement SurrealQL query in a single round trip.
+
+    execute_query only returns the first statement's result; this returns
+    one result list per statement, in order.
+
+    Args:
+        query: SurrealQL query string with one or more ``;``-separated statements
+        params: Query parameters (shared by all statements)
+
+    Returns:
+        List of per-statement results, each a list of records
+
+    Raises:
+        RuntimeError: If the request or any statement fails
+
+    Example:
+        >>> counts, rows = await execute_multi_query(
+        ...     "SELECT count() AS n FROM video GROUP ALL; SELECT * FROM topic LIMIT 5;"
+        ... )
+    """
+    db = await get_db()
+    try:
+        response = await db.query_raw(query, params or {})
+    except Exception as e:
+        logger.error(f"Query execution error: {e}")
+        raise
+
+    if response.get("error"):
+        raise RuntimeError(f"Query execution error: {response['error']}")
+
+    results: list[list[dict[str, Any]]] = []
+    for statement in response.get("result") or []:
+        if statement.get("status") == "ERR":
+            logger.error(f"Query statement error: {statement.get('result')}")
+            raise RuntimeError(f"Query statement error: {statement.get('result')}")
+        rows = statement.get("result")
+        if isinstance(rows, list):
+            results.append(rows)
+        elif rows is None:
+            results.append([])
+        else:
+            results.append([rows])
+    return results
+
+
 async def verify_connection() -> bool:
     """Verify SurrealDB connection is working.
 
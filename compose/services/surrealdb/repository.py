@@ -12,7 +12,7 @@ import logging
 from datetime import datetime
 from typing import Optional
 
-from .driver import execute_query
+from .driver import execute_multi_query, execute_query
 from .models import (
     ChannelRecord,
     ChunkSearchResult,
@@ -454,6 +454,46 @@ async def update_pipeline_state(
     return {"updated": len(result) > 0}
 
 
+async def update_pipeline_states(states: dict[str, dict[str, str]]) -> dict[str, dict]:
+    """Record completed pipeline steps for many videos in one query.
+
+    Args:
+        states: Mapping of video_id -> {step_name: version_hash}
+
+    Returns:
+        Mapping of video_id -> pipeline_state before the update, for videos
+        that exist (used to keep status counters current)
+    """
+    updates = [
+        {"video_id": video_id, "states": steps}
+        for video_id, steps in states.items()
+        if steps
+    ]
+    if not updates:
+        return {}
+
+    query = """
+    LET $before = (
+        SELECT video_id, pipeline_state FROM video WHERE video_id IN $video_ids
+    );
+    FOR $item IN $updates {
+        UPDATE video MERGE {
+            pipeline_state: $item.states,
+            last_processed_at: time::now(),
+            updated_at: time::now()
+        } WHERE video_id = $item.video_id;
+    };
+    RETURN $before;
+    """
+
+    results = await execute_multi_query(query, {
+        "updates": updates,
+        "video_ids": [u["video_id"] for u in updates],
+    })
+    before = results[-1] if results else []
+    return {row["video_id"]: row.get("pipeline_state") or {} for row in before if row}
+
+
 async def find_stale_videos(
     step_name: str,
     current_version: str,
@@ -473,34 +513,35 @@ async def find_stale_videos(
     Returns:
         List of stale videos needing reprocessing
     """
+    # Filter server-side so LIMIT applies to stale videos only
     query = """
     SELECT
         video_id,
         url,
-        pipeline_state.$(step_name) AS current_version
+        updated_at,
+        pipeline_state[$step_name] AS current_version
     FROM video
+    WHERE pipeline_state[$step_name] != $current_version
     ORDER BY updated_at ASC
-    LIMIT $(limit);
+    LIMIT $limit;
     """
 
     results = await execute_query(query, {
         "step_name": step_name,
+        "current_version": current_version,
         "limit": limit,
     })
 
-    stale = []
-    for r in results:
-        video_version = r.get("current_version")
-        if video_version != current_version:
-            stale.append(StaleVideoResult(
-                video_id=r.get("video_id"),
-                url=r.get("url"),
-                current_version=video_version,
-                required_version=current_version,
-                step_name=step_name,
-            ))
-
-    return stale
+    return [
+        StaleVideoResult(
+            video_id=r.get("video_id"),
+            url=r.get("url"),
+            current_version=r.get("current_version"),
+            required_version=current_version,
+            step_name=step_name,
+        )
+        for r in results
+    ]
 
 
 async def link_video_to_channel(
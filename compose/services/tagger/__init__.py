@@ -24,6 +24,7 @@ from .config import TaggerConfig
 from .vocabulary import VocabularyManager
 from .surrealdb_retriever import SemanticTagRetriever, create_retriever
 from .normalizer import TagNormalizer, create_normalizer
+from .compression import compress_transcript
 
 __all__ = [
     # Models
@@ -38,6 +39,8 @@ __all__ = [
     # Factory functions
     "create_retriever",
     "create_normalizer",
+    # Transcript compression
+    "compress_transcript",
 ]
 
 __version__ = "0.2.0"
@@ -0,0 +1,183 @@
+"""Transcript pre-compression for tag extraction.
+
+Long transcripts are split into sentence-aligned windows and the most
+central windows (closest to the transcript's mean embedding) are kept
+until a character budget is reached. Selected windows are returned in
+their original order so the LLM still reads a coherent narrative.
+
+Without an embedder, windows are sampled evenly across the transcript
+instead of truncating to the first N characters.
+
+Example:
+    >>> from compose.services.embeddings import get_chunk_embedder
+    >>> text = compress_transcript(transcript, max_chars=8000,
+    ...                            embed_batch=get_chunk_embedder().embed_batch)
+"""
+
+import logging
+import math
+import re
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default transcript budget sent to Phase 1 (~3.75k tokens)
+DEFAULT_MAX_CHARS = 15000
+
+# Target window size when splitting transcripts
+DEFAULT_WINDOW_CHARS = 1200
+
+# Separator placed between non-adjacent windows
+GAP_MARKER = "\n[...]\n"
+
+EmbedBatchFn = Callable[[list[str]], list[list[float]]]
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_windows(text: str, window_chars: int = DEFAULT_WINDOW_CHARS) -> list[str]:
+    """Split text into sentence-aligned windows of roughly window_chars.
+
+    Auto-generated captions often have no punctuation, so sentences longer
+    than window_chars are hard-split on whitespace.
+
+    Args:
+        text: Transcript text
+        window_chars: Target characters per window
+
+    Returns:
+        List of non-empty windows in original order
+    """
+    windows: list[str] = []
+    current = ""
+
+    for sentence in _SENTENCE_RE.split(text.strip()):
+        while len(sentence) > window_chars:
+            cut = sentence.rfind(" ", 0, window_chars)
+            cut = cut if cut > 0 else window_chars
+            if current:
+                windows.append(current)
+                current = ""
+            windows.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+
+        if current and len(current) + 1 + len(sentence) > window_chars:
+            windows.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+
+    if current:
+        windows.append(current)
+    return [w for w in windows if w]
+
+
+def centrality_scores(embeddings: list[list[float]]) -> list[float]:
+    """Score each embedding by cosine similarity to the centroid.
+
+    Args:
+        embeddings: One vector per window
+
+    Returns:
+        Similarity to the mean vector, one score per window
+    """
+    if not embeddings:
+        return []
+
+    dims = len(embeddings[0])
+    centroid = [sum(vec[i] for vec in embeddings) / len(embeddings) for i in range(dims)]
+    centroid_norm = math.sqrt(sum(c * c for c in centroid)) or 1.0
+
+    scores = []
+    for vec in embeddings:
+        norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+        dot = sum(v * c for v, c in zip(vec, centroid))
+        scores.append(dot / (norm * centroid_norm))
+    return scores
+
+
+def _select_within_budget(windows: list[str], ranking: list[int], max_chars: int) -> list[int]:
+    """Take windows in ranking order until the budget is spent."""
+    selected: list[int] = []
+    used = 0
+    for index in ranking:
+        cost = len(windows[index]) + len(GAP_MARKER)
+        if used + cost > max_chars:
+            continue
+        selected.append(index)
+        used += cost
+    return sorted(selected)
+
+
+def _even_ranking(count: int) -> list[int]:
+    """Rank windows so that any prefix is spread evenly across the transcript."""
+    ranking: list[int] = []
+    seen: set[int] = set()
+    step = count
+    while len(ranking) < count:
+        for index in range(0, count, max(step, 1)):
+            if index not in seen:
+                seen.add(index)
+                ranking.append(index)
+        step //= 2
+    return ranking
+
+
+def _join(windows: list[str], indices: list[int]) -> str:
+    """Join selected windows, marking gaps between non-adjacent ones."""
+    parts: list[str] = []
+    previous = None
+    for index in indices:
+        if parts:
+            parts.append(" " if index == previous + 1 else GAP_MARKER)
+        parts.append(windows[index])
+        previous = index
+    return "".join(parts)
+
+
+def compress_transcript(
+    transcript: str,
+    max_chars: int = DEFAULT_MAX_CHARS,
+    embed_batch: Optional[EmbedBatchFn] = None,
+    window_chars: int = DEFAULT_WINDOW_CHARS,
+) -> str:
+    """Reduce a transcript to at most max_chars of its most salient content.
+
+    The opening window is always kept (it usually states the topic); the
+    rest are ranked by embedding centrality. If embedding fails, or no
+    embedder is given, windows are sampled evenly instead.
+
+    Args:
+        transcript: Full transcript text
+        max_chars: Character budget for the result
+        embed_batch: Optional function embedding a list of texts
+        window_chars: Target characters per window
+
+    Returns:
+        Transcript unchanged if within budget, otherwise selected windows
+        in original order separated by GAP_MARKER
+    """
+    if len(transcript) <= max_chars:
+        return transcript
+
+    windows = split_windows(transcript, window_chars)
+    if len(windows) <= 1:
+        return transcript[:max_chars]
+
+    ranking: Optional[list[int]] = None
+    if embed_batch is not None:
+        try:
+            scores = centrality_scores(embed_batch(windows))
+            if len(scores) == len(windows):
+                rest = sorted(range(1, len(windows)), key=lambda i: scores[i], reverse=True)
+                ranking = [0] + rest
+        except Exception as e:
+            logger.warning(f"Embedding transcript windows failed, sampling evenly: {e}")
+
+    if ranking is None:
+        ranking = _even_ranking(len(windows))
+
+    selected = _select_within_budget(windows, ranking, max_chars)
+    if not selected:
+        return transcript[:max_chars]
+    return _join(windows, selected)
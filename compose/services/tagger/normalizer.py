@@ -1,11 +1,16 @@
 """Two-phase tag normalization agent."""
 
+import asyncio
 import json
 import os
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Type, TypeVar, Union
 
+from pydantic import BaseModel
 from pydantic_ai import Agent
 
+from compose.services.embeddings import get_chunk_embedder
+
+from .compression import DEFAULT_MAX_CHARS, EmbedBatchFn, compress_transcript
 from .config import DEFAULT_MODEL, get_ollama_url
 from .models import StructuredMetadata, NormalizedMetadata
 from .surrealdb_retriever import SemanticTagRetriever
@@ -20,6 +25,85 @@ def _configure_ollama_host(model: str) -> None:
         os.environ["OLLAMA_BASE_URL"] = ollama_url
 
 
+# Validation retries pydantic-ai may spend on a malformed structured result
+OUTPUT_RETRIES = 2
+
+# Fields that should be lists (LLMs sometimes return comma-separated strings)
+LIST_FIELDS = {
+    "subject_matter", "techniques_or_concepts", "tools_or_materials",
+    "key_points", "references"
+}
+
+MetadataT = TypeVar("MetadataT", bound=BaseModel)
+
+# Example appended to the Phase 1 prompt when parsing free-form JSON
+_PHASE1_JSON_EXAMPLE = """Example output format:
+{
+  "title": "Building AI Agents with Claude",
+  "summary": "Tutorial on creating AI agents using Claude API and prompt engineering techniques.",
+  "subject_matter": ["ai-agents", "claude-api", "prompt-engineering"],
+  "entities": {
+    "people": [],
+    "companies": ["anthropic"],
+    "named_things": ["claude"]
+  },
+  "techniques_or_concepts": ["few-shot-prompting", "chain-of-thought"],
+  "tools_or_materials": ["claude-api", "python"],
+  "content_style": "tutorial",
+  "difficulty": "intermediate",
+  "key_points": ["Learn to build agents", "Use Claude API", "Apply prompt patterns"],
+  "references": []
+}
+"""
+
+
+def _parse_json_response(response_text: str) -> dict:
+    """Parse a JSON object from free-form model text.
+
+    Strips markdown code fences and any prose around the outermost object.
+    """
+    # Strip markdown code blocks if present
+    if "```json" in response_text:
+        response_text = response_text.split("```json")[1].split("```")[0]
+    elif "```" in response_text:
+        response_text = response_text.split("```")[1].split("```")[0]
+
+    start = response_text.find("{")
+    end = response_text.rfind("}")
+    if start != -1 and end > start:
+        response_text = response_text[start:end + 1]
+
+    return json.loads(response_text)
+
+
+def _normalize_keys(data: dict) -> dict:
+    """Lower-case field names and split comma-separated list fields."""
+    normalized_data = {}
+    for key, value in data.items():
+        # Convert to lowercase to match model field names
+        normalized_key = key.lower().replace(" ", "_")
+
+        # Handle string values that should be lists
+        if normalized_key in LIST_FIELDS and isinstance(value, str):
+            value = [v.strip() for v in value.split(",") if v.strip()]
+
+        normalized_data[normalized_key] = value
+    return normalized_data
+
+
+def _coerce_output(output: Any, model_cls: Type[MetadataT]) -> MetadataT:
+    """Convert an agent result to model_cls.
+
+    Structured-output agents already return a validated model; text agents
+    return JSON that is parsed here.
+    """
+    if isinstance(output, model_cls):
+        return output
+    if isinstance(output, BaseModel):
+        return model_cls(**output.model_dump())
+    return model_cls(**_normalize_keys(_parse_json_response(str(output))))
+
+
 class TagNormalizer:
     """Two-phase tag normalization system."""
 
@@ -28,6 +112,9 @@ class TagNormalizer:
         model: str = DEFAULT_MODEL,
         retriever: Optional[SemanticTagRetriever] = None,
         vocabulary: Optional[VocabularyManager] = None,
+        structured_output: bool = True,
+        max_transcript_chars: int = DEFAULT_MAX_CHARS,
+        embed_batch: Optional[EmbedBatchFn] = None,
     ):
         """Initialize normalizer.
 
@@ -35,34 +122,68 @@ class TagNormalizer:
             model: LLM model to use (e.g., "ollama:qwen2.5:7b" or "claude-3-5-haiku-20241022")
             retriever: Semantic tag retriever for context
             vocabulary: Vocabulary manager for canonical forms
+            structured_output: Use pydantic-ai result types instead of parsing
+                free-form JSON. Malformed results are re-asked with the
+                validation error rather than failing the whole call.
+            max_transcript_chars: Transcript budget for Phase 1
+            embed_batch: Optional batch embedding function used to pick the
+                most central transcript windows when over budget
         """
         self.model = model
         self.retriever = retriever
         self.vocabulary = vocabulary
+        self.structured_output = structured_output
+        self.max_transcript_chars = max_transcript_chars
+        self.embed_batch = embed_batch
 
         # Configure Ollama host if using Ollama model
         _configure_ollama_host(model)
 
+        # Agents (and their system prompts) are built once and shared by
+        # every video processed with this normalizer
+        phase1_options: dict[str, Any] = {}
+        phase2_options: dict[str, Any] = {}
+        if structured_output:
+            phase1_options = {"output_type": StructuredMetadata, "retries": OUTPUT_RETRIES}
+            phase2_options = {"output_type": NormalizedMetadata, "retries": OUTPUT_RETRIES}
+
         # Create Phase 1 agent (raw extraction)
         self.phase1_agent = Agent(
             self.model,
             system_prompt=self._get_phase1_prompt(),
+            **phase1_options,
         )
 
         # Create Phase 2 agent (normalization)
         self.phase2_agent = Agent(
             self.model,
             system_prompt=self._get_phase2_prompt(),
+            **phase2_options,
         )
 
     def _get_phase1_prompt(self) -> str:
-        """Get Phase 1 system prompt for raw extraction."""
-        return """You are an expert content analyzer that extracts structured metadata from text.
+        """Get Phase 1 system prompt for raw extraction.
+
+        In structured-output mode the schema travels with the result type,
+        so the JSON formatting rules and example are omitted.
+        """
+        if self.structured_output:
+            intro = (
+                "Your task is to analyze the provided content and extract "
+                "comprehensive metadata into the structured JSON result.\n"
+            )
+        else:
+            intro = (
+                "Your task is to analyze the provided content and extract "
+                "comprehensive metadata as a JSON object.\n\n"
+                "Return ONLY valid JSON in the following structure:\n"
+            )
 
-Your task is to analyze the provided content and extract comprehensive metadata as a JSON object.
+        json_rules = "" if self.structured_output else "- Return ONLY valid JSON, no markdown formatting\n"
 
-Return ONLY valid JSON in the following structure:
+        prompt = f"""You are an expert content analyzer that extracts structured metadata from text.
 
+{intro}
 **Title**: Generate a clear, descriptive title (5-10 words)
 
 **Summary**: Write a 1-2 sentence summary of the main points
@@ -97,34 +218,27 @@ Return ONLY valid JSON in the following structure:
 - Include URLs or clear references
 
 IMPORTANT:
-- Return ONLY valid JSON, no markdown formatting
-- Be thorough but accurate
+{json_rules}- Be thorough but accurate
 - Extract what's actually in the content, don't infer
 - Use consistent formatting (lowercase-with-hyphens for tags)
 - Avoid generic terms like "ai" or "technology" unless they're the main focus
-
-Example output format:
-{
-  "title": "Building AI Agents with Claude",
-  "summary": "Tutorial on creating AI agents using Claude API and prompt engineering techniques.",
-  "subject_matter": ["ai-agents", "claude-api", "prompt-engineering"],
-  "entities": {
-    "people": [],
-    "companies": ["anthropic"],
-    "named_things": ["claude"]
-  },
-  "techniques_or_concepts": ["few-shot-prompting", "chain-of-thought"],
-  "tools_or_materials": ["claude-api", "python"],
-  "content_style": "tutorial",
-  "difficulty": "intermediate",
-  "key_points": ["Learn to build agents", "Use Claude API", "Apply prompt patterns"],
-  "references": []
-}
 """
+        if self.structured_output:
+            return prompt
+        return prompt + "\n" + _PHASE1_JSON_EXAMPLE
 
     def _get_phase2_prompt(self) -> str:
         """Get Phase 2 system prompt for normalization."""
-        return """You are an expert tag normalizer that ensures consistent vocabulary across a content corpus.
+        if self.structured_output:
+            output_format = "Fill in the structured JSON result with the normalized values."
+        else:
+            output_format = (
+                "Return ONLY valid JSON with the same structure as the input, "
+                "just with normalized tag values.\n"
+                "No markdown formatting, no explanations, just the JSON object."
+            )
+
+        return f"""You are an expert tag normalizer that ensures consistent vocabulary across a content corpus.
 
 Your task is to normalize the provided raw metadata to match the existing vocabulary used in similar content.
 
@@ -160,10 +274,34 @@ Your task is to normalize the provided raw metadata to match the existing vocabu
 The goal is vocabulary consistency while preserving semantic accuracy.
 
 **Output Format:**
-Return ONLY valid JSON with the same structure as the input, just with normalized tag values.
-No markdown formatting, no explanations, just the JSON object.
+{output_format}
 """
 
+    async def prepare_transcript(self, transcript: str) -> str:
+        """Fit a transcript into the Phase 1 budget.
+
+        Over-budget transcripts keep their most central windows (by embedding
+        similarity when embed_batch is set, evenly sampled otherwise) instead
+        of being cut off after the first max_transcript_chars characters.
+
+        Args:
+            transcript: Full transcript text
+
+        Returns:
+            Transcript text of at most max_transcript_chars characters
+        """
+        if len(transcript) <= self.max_transcript_chars:
+            return transcript
+        if self.embed_batch is None:
+            return compress_transcript(transcript, self.max_transcript_chars)
+        # Embedding calls are blocking HTTP requests
+        return await asyncio.to_thread(
+            compress_transcript,
+            transcript,
+            self.max_transcript_chars,
+            self.embed_batch,
+        )
+
     async def extract_raw_metadata(
         self,
         transcript: str,
@@ -178,25 +316,17 @@ No markdown formatting, no explanations, just the JSON object.
         Returns:
             Raw structured metadata
         """
+        content = await self.prepare_transcript(transcript)
+
         # Build prompt
-        prompt = f"Analyze this content and extract structured metadata as JSON.\n\n"
-        prompt += f"Content:\n{transcript[:15000]}"
+        prompt = "Analyze this content and extract structured metadata"
+        prompt += ".\n\n" if self.structured_output else " as JSON.\n\n"
+        prompt += f"Content:\n{content}"
 
         # Run Phase 1 agent
         result = await self.phase1_agent.run(prompt)
-
-        # Parse JSON response
-        response_text = result.output if hasattr(result, 'output') else str(result)
-
-        # Strip markdown code blocks if present
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
-
-        # Parse JSON
-        data = json.loads(response_text)
-        return StructuredMetadata(**data)
+        output = result.output if hasattr(result, 'output') else str(result)
+        return _coerce_output(output, StructuredMetadata)
 
     async def normalize_metadata(
         self,
@@ -242,44 +372,14 @@ No markdown formatting, no explanations, just the JSON object.
             prompt += "**Common Vocabulary (Top Tags):**\n"
             prompt += f"{', '.join(vocabulary_tags[:30])}\n\n"
 
-        prompt += "Now normalize the raw metadata to use consistent vocabulary.\n"
-        prompt += "Return ONLY the JSON object with normalized values."
+        prompt += "Now normalize the raw metadata to use consistent vocabulary."
+        if not self.structured_output:
+            prompt += "\nReturn ONLY the JSON object with normalized values."
 
         # Run Phase 2 agent
         result = await self.phase2_agent.run(prompt)
-
-        # Parse JSON response
-        response_text = result.output if hasattr(result, 'output') else str(result)
-
-        # Strip markdown code blocks if present
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
-
-        # Parse JSON
-        data = json.loads(response_text)
-
-        # Fields that should be lists
-        list_fields = {
-            "subject_matter", "techniques_or_concepts", "tools_or_materials",
-            "key_points", "references"
-        }
-
-        # Normalize field names (handle LLM returning capitalized keys)
-        normalized_data = {}
-        for key, value in data.items():
-            # Convert to lowercase to match model field names
-            normalized_key = key.lower().replace(" ", "_")
-
-            # Handle string values that should be lists
-            if normalized_key in list_fields and isinstance(value, str):
-                # Split comma-separated strings into lists
-                value = [v.strip() for v in value.split(",") if v.strip()]
-
-            normalized_data[normalized_key] = value
-
-        return NormalizedMetadata(**normalized_data)
+        output = result.output if hasattr(result, 'output') else str(result)
+        return _coerce_output(output, NormalizedMetadata)
 
     async def normalize_from_transcript(
         self,
@@ -327,11 +427,50 @@ No markdown formatting, no explanations, just the JSON object.
             "normalized": normalized,
         }
 
+    async def normalize_many(
+        self,
+        transcripts: List[str],
+        max_concurrency: int = 4,
+        use_semantic_context: bool = True,
+        use_vocabulary: bool = True,
+    ) -> List[Union[Dict[str, StructuredMetadata], Exception]]:
+        """Run the two-phase pipeline over many transcripts concurrently.
+
+        All videos share this normalizer's agents; a failure for one
+        transcript is returned in its slot instead of aborting the batch.
+
+        Args:
+            transcripts: Transcript texts to normalize
+            max_concurrency: Maximum videos in flight at once
+            use_semantic_context: Use context from similar content
+            use_vocabulary: Use vocabulary for canonical forms
+
+        Returns:
+            One result dict (or the raised exception) per transcript, in order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(transcript: str):
+            async with semaphore:
+                try:
+                    return await self.normalize_from_transcript(
+                        transcript,
+                        use_semantic_context=use_semantic_context,
+                        use_vocabulary=use_vocabulary,
+                    )
+                except Exception as e:
+                    return e
+
+        return list(await asyncio.gather(*(run_one(t) for t in transcripts)))
+
 
 def create_normalizer(
     model: str = DEFAULT_MODEL,
     retriever: Optional[SemanticTagRetriever] = None,
     vocabulary: Optional[VocabularyManager] = None,
+    structured_output: bool = True,
+    max_transcript_chars: int = DEFAULT_MAX_CHARS,
+    embed_batch: Optional[EmbedBatchFn] = None,
 ) -> TagNormalizer:
     """Create a tag normalizer.
 
@@ -339,12 +478,21 @@ def create_normalizer(
         model: LLM model to use (default: ollama:qwen2.5:7b for free local inference)
         retriever: Optional semantic retriever for context
         vocabulary: Optional vocabulary manager
+        structured_output: Use pydantic-ai result types (default) or parse JSON text
+        max_transcript_chars: Transcript budget for Phase 1
+        embed_batch: Batch embedding function for transcript compression
+            (default: the bge-m3 chunk embedder)
 
     Returns:
         TagNormalizer instance
     """
+    if embed_batch is None:
+        embed_batch = get_chunk_embedder().embed_batch
     return TagNormalizer(
         model=model,
         retriever=retriever,
-        vocabulary=vocabulary
+        vocabulary=vocabulary,
+        structured_output=structured_output,
+        max_transcript_chars=max_transcript_chars,
+        embed_batch=embed_batch,
     )
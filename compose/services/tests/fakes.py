@@ -12,6 +12,7 @@ Usage:
     service = ProjectService(db=fake_db, minio=fake_minio)
 """
 
+from contextlib import contextmanager
 from io import BytesIO
 from typing import Any
 from unittest.mock import MagicMock
@@ -368,29 +369,63 @@ class FakeMinIOClient:
         self.client.put_object = MagicMock(side_effect=put_object)
         self.client.get_object = MagicMock(side_effect=get_object)
 
+    def put_stream(
+        self,
+        path: str,
+        stream,
+        length: int = -1,
+        content_type: str = "application/octet-stream",
+        part_size: int | None = None,
+    ) -> str:
+        """Store the contents of a file-like object."""
+        self.objects[path] = stream.read()
+        return path
+
+    @contextmanager
+    def open_stream(self, path: str, offset: int = 0, length: int = 0):
+        """Open an object (or a byte range of it) for reading."""
+        if path not in self.objects:
+            raise Exception(f"Object not found: {path}")
+        data = self.objects[path]
+        end = offset + length if length else len(data)
+        yield BytesIO(data[offset:end])
+
+    def put_bytes(
+        self, path: str, content: bytes, content_type: str = "application/octet-stream"
+    ) -> str:
+        """Store raw bytes."""
+        self.objects[path] = bytes(content)
+        return path
+
+    def get_bytes(self, path: str, missing_ok: bool = False) -> bytes | None:
+        """Retrieve raw bytes (None if missing and missing_ok)."""
+        if path not in self.objects:
+            if missing_ok:
+                return None
+            raise Exception(f"Object not found: {path}")
+        return self.objects[path]
+
     def put_json(self, path: str, data: dict) -> str:
         """Store JSON data."""
         import json
         self.objects[path] = json.dumps(data).encode()
         return path
 
-    def get_json(self, path: str) -> dict:
-        """Retrieve JSON data."""
+    def get_json(self, path: str, missing_ok: bool = False) -> Any:
+        """Retrieve JSON data (None if missing and missing_ok)."""
         import json
-        if path not in self.objects:
-            raise Exception(f"Object not found: {path}")
-        return json.loads(self.objects[path].decode())
+        content = self.get_bytes(path, missing_ok=missing_ok)
+        return None if content is None else json.loads(content.decode())
 
     def put_text(self, path: str, text: str) -> str:
         """Store text data."""
         self.objects[path] = text.encode()
         return path
 
-    def get_text(self, path: str) -> str:
-        """Retrieve text data."""
-        if path not in self.objects:
-            raise Exception(f"Object not found: {path}")
-        return self.objects[path].decode()
+    def get_text(self, path: str, missing_ok: bool = False) -> str | None:
+        """Retrieve text data (None if missing and missing_ok)."""
+        content = self.get_bytes(path, missing_ok=missing_ok)
+        return None if content is None else content.decode()
 
     def exists(self, path: str) -> bool:
         """Check if object exists."""
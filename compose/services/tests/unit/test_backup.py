@@ -0,0 +1,288 @@
+"""Unit tests for streaming SurrealDB backups."""
+
+import gzip
+import hashlib
+import io
+import json
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+
+
+class FakeMinIO:
+    """In-memory stand-in for MinIOClient."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+
+    def put_stream(self, path, stream, length=-1, content_type=None, part_size=None):
+        self.objects[path] = stream.read()
+        assert length == len(self.objects[path])
+        return path
+
+    @contextmanager
+    def open_stream(self, path):
+        yield io.BytesIO(self.objects[path])
+
+    def put_json(self, path, data):
+        self.objects[path] = json.dumps(data, default=str).encode()
+        return path
+
+    def get_json(self, path):
+        return json.loads(self.objects[path])
+
+
+def fake_database(tables: dict[str, list[dict]]):
+    """execute_query replacement serving record ID range SELECTs."""
+    queries = []
+
+    async def execute_query(query, params=None):
+        params = params or {}
+        queries.append((query, params))
+        if not query.startswith("SELECT * FROM type::thing($table"):
+            return []
+        rows = sorted(tables.get(params["table"], []), key=lambda r: r["id"])
+        if "after" in params:
+            rows = [r for r in rows if r["id"].split(":", 1)[1] > params["after"]]
+        return rows[: params["limit"]]
+
+    return execute_query, queries
+
+
+def _rows(table, count):
+    return [{"id": f"{table}:{i:04d}", "n": i, "embedding": [0.5] * 8} for i in range(count)]
+
+
+def _checkpoints(queries):
+    """Table checkpoint states saved during a restore, in order."""
+    return [p["state"] for q, p in queries if "state" in p]
+
+
+class TestIterTablePages:
+    """Tests for record ID range pagination."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_pages_by_record_id_range(self):
+        """Each page reads the ID range after the previous page's last key."""
+        from compose.services.backup import iter_table_pages
+
+        execute_query, queries = fake_database({"video": _rows("video", 5)})
+        with patch("compose.services.backup.execute_query", execute_query):
+            pages = [page async for page in iter_table_pages("video", page_size=2)]
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert "after" not in queries[0][1]
+        assert queries[1][1]["after"] == "0001"
+        assert all("ORDER BY" not in q and "$after>.." in q for q, _ in queries[1:])
+
+    @pytest.mark.unit
+    def test_record_key(self):
+        """Keys come from RecordID objects or ``table:key`` strings."""
+        from surrealdb import RecordID
+
+        from compose.services.backup import _record_key
+
+        assert _record_key(RecordID("video", 42)) == 42
+        assert _record_key("video:abc") == "abc"
+
+
+class TestStreamingBackup:
+    """Tests for NDJSON part backups and restore reads."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_backup_writes_parts_and_manifest(self):
+        """Tables become gzip NDJSON parts with per-table checksums."""
+        from compose.services.backup import BackupService
+
+        tables = {"video": _rows("video", 7), "topic": _rows("topic", 2)}
+        execute_query, _ = fake_database(tables)
+        service = BackupService(page_size=3, part_bytes=1)
+        service._minio = FakeMinIO()
+
+        with patch("compose.services.backup.execute_query", execute_query):
+            await service._run_backup("b1", "backups/test")
+
+        manifest = service.minio.get_json("backups/test/manifest.json")
+        assert manifest["format"] == "ndjson.gz"
+        assert set(manifest["tables"]) == {"video", "topic"}
+
+        video = manifest["table_details"]["video"]
+        assert video["rows"] == 7
+        assert len(video["parts"]) == 3  # one part per page with a 1-byte part limit
+
+        ndjson = b"".join(
+            gzip.decompress(service.minio.objects[part["path"]]) for part in video["parts"]
+        )
+        assert hashlib.sha256(ndjson).hexdigest() == video["sha256"]
+        assert manifest["total_size_bytes"] == sum(
+            details["size_bytes"] for details in manifest["table_details"].values()
+        )
+
+        restored = list(service._iter_backup_records("backups/test", manifest, "video"))
+        assert [r["n"] for r in restored] == list(range(7))
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_empty_tables_skipped(self):
+        """Tables with no rows are left out of the manifest."""
+        from compose.services.backup import BackupService
+
+        execute_query, _ = fake_database({"video": _rows("video", 1)})
+        service = BackupService()
+        service._minio = FakeMinIO()
+
+        with patch("compose.services.backup.execute_query", execute_query):
+            await service._run_backup("b2", "backups/empty")
+
+        manifest = service.minio.get_json("backups/empty/manifest.json")
+        assert manifest["tables"] == ["video"]
+        assert not any(path.startswith("backups/empty/topic/") for path in service.minio.objects)
+
+    @pytest.mark.unit
+    def test_legacy_backup_readable(self):
+        """Backups without table_details are read from {table}.json."""
+        from compose.services.backup import BackupService
+
+        service = BackupService()
+        service._minio = FakeMinIO()
+        service.minio.put_json("backups/old/video.json", [{"id": "video:1"}])
+
+        records = list(service._iter_backup_records("backups/old", {"tables": ["video"]}, "video"))
+
+        assert records == [{"id": "video:1"}]
+
+
+class TestRestore:
+    """Tests for batched, resumable restores."""
+
+    async def _backup(self, tables, part_bytes=1):
+        """Back up tables into a FakeMinIO and return (service, backup)."""
+        from compose.services.backup import BackupMeta, BackupService, BackupStatus
+
+        execute_query, _ = fake_database(tables)
+        service = BackupService(page_size=3, part_bytes=part_bytes)
+        service._minio = FakeMinIO()
+        with patch("compose.services.backup.execute_query", execute_query):
+            await service._run_backup("b1", "backups/test")
+
+        backup = BackupMeta(
+            id="b1",
+            status=BackupStatus.COMPLETED,
+            started_at="2026-01-01T00:00:00",
+            minio_path="backups/test",
+        )
+        return service, backup
+
+    async def _restore(self, service, backup, indexes=None, resume=False):
+        """Run restore_backup against a recording database."""
+        queries = []
+
+        async def execute_query(query, params=None):
+            queries.append((query, params or {}))
+            return []
+
+        async def execute_multi_query(query, params=None):
+            return [[{"indexes": indexes or {}}]]
+
+        with (
+            patch("compose.services.backup.execute_query", execute_query),
+            patch("compose.services.backup.execute_multi_query", execute_multi_query),
+            patch.object(service, "get_backup", return_value=backup),
+            patch("compose.services.backup.RESTORE_BATCH_SIZE", 2),
+        ):
+            ok = await service.restore_backup(backup.id, resume=resume)
+        return ok, queries
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_batched_inserts_with_deferred_indexes(self):
+        """Rows load in batches between index removal and redefinition."""
+        service, backup = await self._backup({"video": _rows("video", 7)})
+        index = {"idx_n": "DEFINE INDEX idx_n ON TABLE video FIELDS n"}
+
+        ok, queries = await self._restore(service, backup, indexes=index)
+
+        assert ok
+        statements = [q for q, _ in queries]
+        inserts = [(q, p) for q, p in queries if q.startswith("INSERT")]
+        # 3 parts of 3/3/1 rows in batches of 2
+        assert [len(p["rows"]) for _, p in inserts] == [2, 1, 2, 1, 1]
+        assert inserts[0][1]["rows"][0] == {"id": "0000", "n": 0, "embedding": [0.5] * 8}
+
+        remove = statements.index("REMOVE INDEX IF EXISTS idx_n ON TABLE video")
+        delete = statements.index("DELETE video")
+        define = statements.index(index["idx_n"])
+        first_insert = statements.index(inserts[0][0])
+        last_insert = len(statements) - 1 - statements[::-1].index(inserts[-1][0])
+        assert remove < delete < first_insert
+        assert define > last_insert
+
+        progress = _checkpoints(queries)
+        assert progress[-1]["status"] == "done"
+        assert progress[-1]["rows"] == 7
+        assert progress[-1]["parts_done"] == 3
+        # A successful restore leaves no checkpoint behind
+        assert statements[-1] == "UPDATE backup:`b1` SET restore_progress = {}"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_resumes_after_last_completed_part(self):
+        """A resumed restore skips DELETE and finished parts."""
+        service, backup = await self._backup({"video": _rows("video", 7)})
+        backup.restore_progress = {
+            "video": {"status": "loading", "parts_done": 1, "rows": 3, "indexes": {}},
+        }
+
+        ok, queries = await self._restore(service, backup, resume=True)
+
+        assert ok
+        assert "DELETE video" not in [q for q, _ in queries]
+        loaded = [r["n"] for q, p in queries if q.startswith("INSERT") for r in p["rows"]]
+        assert loaded == [3, 4, 5, 6]
+        assert _checkpoints(queries)[-1]["rows"] == 7
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_leftover_progress_ignored_without_resume(self):
+        """Checkpoints from a failed attempt don't make a new restore skip tables."""
+        service, backup = await self._backup(
+            {"video": _rows("video", 4), "topic": _rows("topic", 2)}
+        )
+        backup.restore_progress = {
+            "topic": {"status": "done", "parts_done": 1, "rows": 2, "indexes": {}},
+            "video": {"status": "loading", "parts_done": 1, "rows": 3, "indexes": {}},
+        }
+
+        ok, queries = await self._restore(service, backup)
+
+        assert ok
+        statements = [q for q, _ in queries]
+        assert statements[0] == "UPDATE backup:`b1` SET restore_progress = {}"
+        assert "DELETE video" in statements
+        assert "DELETE topic" in statements
+        loaded = [r["id"] for q, p in queries if q.startswith("INSERT") for r in p["rows"]]
+        assert len(loaded) == 6
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_table_keeps_progress(self):
+        """A failing table fails the restore without blocking other tables."""
+        service, backup = await self._backup(
+            {"video": _rows("video", 4), "topic": _rows("topic", 2)}
+        )
+        service.minio.objects = {
+            path: data for path, data in service.minio.objects.items()
+            if not path.startswith("backups/test/video/part-00001")
+        }
+
+        ok, queries = await self._restore(service, backup)
+
+        assert not ok
+        states = {p["table"]: p["state"] for q, p in queries if "state" in p}
+        assert states["topic"]["status"] == "done"
+        assert states["video"]["parts_done"] == 1
+        # The checkpoint is kept so the restore can be resumed
+        assert "UPDATE backup:`b1` SET restore_progress = {}" not in [q for q, _ in queries]
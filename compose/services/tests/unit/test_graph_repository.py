@@ -0,0 +1,126 @@
+"""Unit tests for batched Neo4j graph repository writes."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+class FakeSession:
+    """Session recording every statement run through managed transactions."""
+
+    def __init__(self):
+        self.statements = []
+
+    def run(self, query, parameters=None):
+        self.statements.append((query, parameters))
+        result = MagicMock()
+        result.consume.return_value.counters = MagicMock(
+            nodes_created=len(parameters.get("rows", [])),
+            nodes_deleted=0,
+            relationships_created=0,
+            relationships_deleted=0,
+            properties_set=0,
+        )
+        return result
+
+    def execute_write(self, fn, *args):
+        return fn(self, *args)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def session():
+    """Patch the graph driver to hand out one FakeSession."""
+    fake = FakeSession()
+    driver = MagicMock()
+    driver.session.return_value = fake
+    with patch("compose.services.graph.driver.get_driver", return_value=driver):
+        yield fake
+
+
+def _video(video_id):
+    from compose.services.graph import VideoNode
+
+    return VideoNode(
+        video_id=video_id,
+        url=f"https://youtube.com/watch?v={video_id}",
+        fetched_at=datetime(2025, 1, 1),
+        channel_id="ch1",
+        channel_name="Channel",
+    )
+
+
+class TestExecuteWriteBatches:
+    """Tests for the UNWIND batch executor."""
+
+    @pytest.mark.unit
+    def test_rows_split_into_transactions(self, session):
+        """Rows are chunked by batch_size, one transaction each, counters summed."""
+        from compose.services.graph import execute_write_batches
+
+        rows = [{"n": i} for i in range(5)]
+        totals = execute_write_batches("UNWIND $rows AS row CREATE (:N {n: row.n})", rows, batch_size=2)
+
+        assert [len(params["rows"]) for _, params in session.statements] == [2, 2, 1]
+        assert totals["batches"] == 3
+        assert totals["nodes_created"] == 5
+
+    @pytest.mark.unit
+    def test_empty_rows_skip_database(self):
+        """No rows means no session is opened."""
+        from compose.services.graph import execute_write_batches
+
+        with patch("compose.services.graph.driver.get_driver") as mock_driver:
+            totals = execute_write_batches("UNWIND $rows AS row RETURN row", [])
+
+        mock_driver.assert_not_called()
+        assert totals["batches"] == 0
+
+
+class TestBulkRepository:
+    """Tests for bulk repository variants."""
+
+    @pytest.mark.unit
+    def test_upsert_videos_unwinds_rows(self, session):
+        """Videos are sent as row params to a single UNWIND MERGE."""
+        from compose.services.graph import upsert_videos
+
+        upsert_videos([_video("a"), _video("b")])
+
+        query, params = session.statements[0]
+        assert len(session.statements) == 1
+        assert "UNWIND $rows AS row" in query
+        assert "v.url = row.url" in query
+        assert [row["video_id"] for row in params["rows"]] == ["a", "b"]
+
+    @pytest.mark.unit
+    def test_update_pipeline_states_merges_existing(self, session):
+        """Existing state is read once and merged with the new versions."""
+        import json
+        from compose.services.graph import update_pipeline_states
+
+        existing = [{"video_id": "a", "pipeline_state": json.dumps({"fetch": "v1", "tags": "old"})}]
+        with patch("compose.services.graph.repository.execute_query", return_value=existing) as mock_read:
+            update_pipeline_states({"a": {"tags": "new"}, "missing": {"tags": "new"}})
+
+        assert mock_read.call_args[0][1] == {"video_ids": ["a", "missing"]}
+        rows = session.statements[0][1]["rows"]
+        assert rows == [{"video_id": "a", "pipeline_state_json": json.dumps({"fetch": "v1", "tags": "new"})}]
+
+    @pytest.mark.unit
+    def test_link_channels_and_topics(self, session):
+        """Channel links and non-empty topic lists are batched."""
+        from compose.services.graph import link_videos_to_channels, link_videos_to_topics
+
+        link_videos_to_channels([("a", "ch1", "Channel"), ("b", "ch1", "Channel")])
+        link_videos_to_topics({"a": ["AI", "RAG"], "b": []})
+
+        channel_query, channel_params = session.statements[0]
+        topic_query, topic_params = session.statements[1]
+        assert "MERGE (v)-[:FROM_CHANNEL]->(c)" in channel_query
+        assert len(channel_params["rows"]) == 2
+        assert "UNWIND row.topics AS topic_name" in topic_query
+        assert topic_params["rows"] == [{"video_id": "a", "topics": ["AI", "RAG"]}]
@@ -0,0 +1,171 @@
+"""Unit tests for the dependency health monitor."""
+
+import asyncio
+
+import pytest
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker backoff."""
+
+    @pytest.mark.unit
+    def test_opens_after_threshold(self):
+        """Circuit opens only after consecutive failures reach the threshold."""
+        from compose.services.health import CircuitBreaker
+
+        breaker = CircuitBreaker(failure_threshold=2, base_backoff=10.0)
+
+        breaker.record(False, now=0.0)
+        assert not breaker.is_open(1.0)
+
+        breaker.record(False, now=1.0)
+        assert breaker.is_open(5.0)
+        assert not breaker.is_open(11.0)
+
+    @pytest.mark.unit
+    def test_backoff_doubles_and_caps(self):
+        """Each further failure doubles the backoff up to max_backoff."""
+        from compose.services.health import CircuitBreaker
+
+        breaker = CircuitBreaker(failure_threshold=1, base_backoff=10.0, max_backoff=30.0)
+
+        breaker.record(False, now=0.0)
+        assert breaker.open_until == 10.0
+        breaker.record(False, now=0.0)
+        assert breaker.open_until == 20.0
+        breaker.record(False, now=0.0)
+        assert breaker.open_until == 30.0
+
+    @pytest.mark.unit
+    def test_success_resets(self):
+        """A healthy probe closes the circuit."""
+        from compose.services.health import CircuitBreaker
+
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record(False, now=0.0)
+        breaker.record(True, now=1.0)
+
+        assert breaker.failures == 0
+        assert not breaker.is_open(1.0)
+
+
+class TestHealthMonitor:
+    """Tests for HealthMonitor probing."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_probes_run_concurrently(self):
+        """Slow probes overlap instead of running back to back."""
+        from compose.services.health import HealthMonitor
+
+        async def slow_probe(client):
+            await asyncio.sleep(0.2)
+            return True
+
+        monitor = HealthMonitor()
+        for name in ("a", "b", "c", "d"):
+            monitor.register(name, slow_probe)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await monitor.check_all()
+        elapsed = loop.time() - start
+        await monitor.aclose()
+
+        assert all(r.ok for r in results.values())
+        assert elapsed < 0.6
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_timeout_and_errors_are_failures(self):
+        """Probes that hang or raise are reported as down with an error."""
+        from compose.services.health import HealthMonitor
+
+        async def hang(client):
+            await asyncio.sleep(10)
+            return True
+
+        async def boom(client):
+            raise ConnectionError("refused")
+
+        monitor = HealthMonitor(timeout=0.05)
+        monitor.register("hang", hang)
+        monitor.register("boom", boom)
+
+        results = await monitor.check_all()
+        await monitor.aclose()
+
+        assert not results["hang"].ok
+        assert "timed out" in results["hang"].error
+        assert not results["boom"].ok
+        assert "refused" in results["boom"].error
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_results_cached_within_ttl(self):
+        """Repeated checks within the TTL do not re-probe."""
+        from compose.services.health import HealthMonitor
+
+        calls = 0
+
+        async def probe(client):
+            nonlocal calls
+            calls += 1
+            return True
+
+        monitor = HealthMonitor(ttl=60.0)
+        monitor.register("svc", probe)
+
+        await monitor.check_all()
+        await monitor.check_all()
+        await monitor.check_all(force=True)
+
+        assert calls == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_probe(self):
+        """Known-down services are not probed again until the backoff expires."""
+        from compose.services.health import HealthMonitor
+
+        calls = 0
+
+        async def down(client):
+            nonlocal calls
+            calls += 1
+            return False
+
+        monitor = HealthMonitor(ttl=0.0, failure_threshold=1, base_backoff=60.0)
+        monitor.register("svc", down)
+
+        first = await monitor.check("svc")
+        second = await monitor.check("svc")
+
+        assert calls == 1
+        assert not first.circuit_open
+        assert second.circuit_open
+        assert not second.ok
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_http_probe_uses_shared_client(self):
+        """HTTP probes check the status code via the pooled client."""
+        from unittest.mock import AsyncMock, MagicMock
+        from compose.services.health import http_probe
+
+        client = MagicMock()
+        client.get = AsyncMock(return_value=MagicMock(status_code=503))
+
+        assert await http_probe("http://svc/health")(client) is False
+        client.get.assert_awaited_once_with("http://svc/health")
+
+    @pytest.mark.unit
+    def test_default_monitor_services(self, tmp_path):
+        """Default monitor covers every dashboard dependency."""
+        from compose.services.health import create_default_monitor
+
+        monitor = create_default_monitor(queue_base=tmp_path)
+
+        assert monitor.services == [
+            "surrealdb", "minio", "infinity", "ollama", "queue_worker", "n8n", "docling",
+        ]
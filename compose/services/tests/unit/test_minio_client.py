@@ -0,0 +1,201 @@
+"""Unit tests for MinIOClient reads and the async facade."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from minio.error import S3Error
+
+
+def _s3_error(code: str) -> S3Error:
+    return S3Error(MagicMock(), code, "message", "resource", "request", "host")
+
+
+@pytest.fixture
+def client():
+    """MinIOClient with a mocked Minio SDK client."""
+    from compose.services.minio import MinIOClient, MinIOConfig
+
+    minio = MinIOClient(MinIOConfig())
+    minio.client = MagicMock()
+    return minio
+
+
+class TestMinIOClientReads:
+    """Tests for single-GET reads."""
+
+    @pytest.mark.unit
+    def test_response_released(self, client):
+        """Reads close the response and return the connection to the pool."""
+        response = MagicMock()
+        response.read.return_value = b'{"a": 1}'
+        client.client.get_object.return_value = response
+
+        assert client.get_json("x.json") == {"a": 1}
+        response.close.assert_called_once()
+        response.release_conn.assert_called_once()
+
+    @pytest.mark.unit
+    def test_missing_ok_returns_none(self, client):
+        """NoSuchKey is a miss when missing_ok, without a stat call."""
+        client.client.get_object.side_effect = _s3_error("NoSuchKey")
+
+        assert client.get_text("missing.txt", missing_ok=True) is None
+        client.client.stat_object.assert_not_called()
+
+        with pytest.raises(S3Error):
+            client.get_text("missing.txt")
+
+    @pytest.mark.unit
+    def test_other_errors_raise(self, client):
+        """Errors other than a missing key still raise."""
+        client.client.get_object.side_effect = _s3_error("AccessDenied")
+
+        with pytest.raises(S3Error):
+            client.get_bytes("x", missing_ok=True)
+
+
+class TestAsyncMinIOClient:
+    """Tests for the thread-pool backed async facade."""
+
+    @pytest.mark.unit
+    async def test_get_many_and_put_many(self):
+        """Bulk helpers store by type and report missing objects as None."""
+        from compose.services.minio import AsyncMinIOClient
+        from compose.services.tests.fakes import FakeMinIOClient
+
+        fake = FakeMinIOClient()
+        minio = AsyncMinIOClient(fake, max_workers=4)
+        try:
+            stored = await minio.put_many({"a.json": {"x": 1}, "b.txt": "hi", "c.bin": b"\x00"})
+            result = await minio.get_many(["a.json", "b.txt", "c.bin", "nope", "a.json"])
+        finally:
+            minio.close()
+
+        assert stored == ["a.json", "b.txt", "c.bin"]
+        assert fake.get_json("a.json") == {"x": 1}
+        assert result == {"a.json": b'{"x": 1}', "b.txt": b"hi", "c.bin": b"\x00", "nope": None}
+
+    @pytest.mark.unit
+    async def test_runs_off_event_loop(self):
+        """Blocking calls run on the facade's worker threads."""
+        import threading
+
+        from compose.services.minio import AsyncMinIOClient
+
+        sync = MagicMock()
+        sync.get_text.side_effect = lambda path, missing_ok=False: threading.current_thread().name
+        minio = AsyncMinIOClient(sync, max_workers=2)
+        try:
+            thread_name = await minio.get_text("x")
+        finally:
+            minio.close()
+
+        assert thread_name.startswith("minio")
+
+
+def _response(data: bytes, etag: str) -> MagicMock:
+    response = MagicMock()
+    response.read.return_value = data
+    response.headers = {"ETag": f'"{etag}"'}
+    return response
+
+
+@pytest.fixture
+def cached_client(tmp_path):
+    """MinIOClient with a mocked SDK client and a two-tier cache."""
+    from compose.services.minio import MinIOClient, MinIOConfig, ObjectCache
+
+    cache = ObjectCache(name="test", ttl=60, memory_bytes=1024, disk_dir=tmp_path / "cache")
+    minio = MinIOClient(MinIOConfig(), cache=cache)
+    minio.client = MagicMock()
+    minio.client.get_object.side_effect = lambda **kw: _response(b"hello", "v1")
+    minio.client.stat_object.return_value = MagicMock(etag="v1")
+    return minio
+
+
+class TestObjectCache:
+    """Tests for read-through caching in MinIOClient."""
+
+    @pytest.mark.unit
+    def test_fresh_hit_skips_network(self, cached_client):
+        """A fresh memory entry is served without GET or HEAD."""
+        assert cached_client.get_text("transcripts/a.txt") == "hello"
+        assert cached_client.get_text("transcripts/a.txt") == "hello"
+
+        assert cached_client.client.get_object.call_count == 1
+        cached_client.client.stat_object.assert_not_called()
+        stats = cached_client.cache.stats()
+        assert (stats["memory"], stats["miss"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+    @pytest.mark.unit
+    def test_stale_entry_revalidated_by_etag(self, cached_client):
+        """Expired entries are confirmed with HEAD, refetched only on change."""
+        cached_client.cache.ttl = 0
+        cached_client.get_bytes("a")
+
+        assert cached_client.get_bytes("a") == b"hello"
+        assert cached_client.client.get_object.call_count == 1
+        assert cached_client.cache.stats()["revalidated"] == 1
+
+        cached_client.client.stat_object.return_value = MagicMock(etag="v2")
+        cached_client.client.get_object.side_effect = lambda **kw: _response(b"new", "v2")
+        assert cached_client.get_bytes("a") == b"new"
+        assert cached_client.client.get_object.call_count == 2
+
+    @pytest.mark.unit
+    def test_own_writes_invalidate(self, cached_client):
+        """Writing or deleting a path drops its cached content."""
+        cached_client.get_bytes("a")
+        cached_client.put_text("a", "changed")
+        cached_client.get_bytes("a")
+        cached_client.delete("a")
+        cached_client.get_bytes("a")
+
+        assert cached_client.client.get_object.call_count == 3
+
+    @pytest.mark.unit
+    def test_disk_tier_shared_across_instances(self, cached_client, tmp_path):
+        """A new cache finds disk entries and only needs a HEAD to use them."""
+        from compose.services.minio import ObjectCache
+
+        cached_client.get_bytes("notes/a.md")
+        cached_client.cache = ObjectCache(name="test", disk_dir=tmp_path / "cache")
+
+        assert cached_client.get_bytes("notes/a.md") == b"hello"
+        assert cached_client.client.get_object.call_count == 1
+        assert cached_client.cache.stats()["disk"] == 1
+
+    @pytest.mark.unit
+    def test_memory_tier_bounded(self):
+        """The memory tier evicts least recently used entries past its budget."""
+        from compose.services.minio import ObjectCache
+
+        cache = ObjectCache(memory_bytes=800, disk_dir=None)
+        for i in range(10):
+            cache.put(f"k{i}", b"x" * 100, "e")
+
+        assert cache.stats()["memory_bytes"] <= 800
+        assert cache.get("k0") is None
+        assert cache.get("k9").data == b"x" * 100
+
+    @pytest.mark.unit
+    def test_clear_memory_only_cache(self):
+        """clear() works without a disk tier."""
+        from compose.services.minio import ObjectCache
+
+        cache = ObjectCache(disk_dir=None)
+        cache.put("k", b"data", "e")
+        cache.get("k")
+
+        cache.clear()
+
+        assert cache.get("k") is None
+        assert cache.stats()["memory_entries"] == 0
+
+    @pytest.mark.unit
+    def test_missing_object_not_cached(self, cached_client):
+        """Misses for absent objects are not cached."""
+        cached_client.client.get_object.side_effect = _s3_error("NoSuchKey")
+
+        assert cached_client.get_json("nope.json", missing_ok=True) is None
+        assert cached_client.cache.stats()["memory_entries"] == 0
@@ -31,6 +31,17 @@ def clean_registry():
     clear_registry()
 
 
+@pytest.fixture(autouse=True)
+def version_cache(tmp_path, monkeypatch):
+    """Point the version hash disk cache at a temp file."""
+    from compose.services.pipeline import versioning
+
+    cache_path = tmp_path / "pipeline_versions.json"
+    monkeypatch.setattr(versioning, "VERSION_CACHE_PATH", cache_path)
+    monkeypatch.setattr(versioning, "_cache", None)
+    return cache_path
+
+
 class TestStepResult:
     """Tests for StepResult dataclass."""
 
@@ -156,6 +167,53 @@ class TestVersionHashing:
         assert isinstance(version, str)
         assert len(version) == 12
 
+    def test_blob_hash_matches_git(self):
+        from compose.services.pipeline.versioning import compute_blob_hash
+
+        # `printf 'hello\n' | git hash-object --stdin`
+        assert compute_blob_hash(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+    def test_blob_hash_cached_on_disk(self, tmp_path, version_cache):
+        from unittest.mock import patch
+        from compose.services.pipeline import versioning
+
+        source = tmp_path / "step.py"
+        source.write_text("x = 1\n")
+
+        first = versioning.get_git_blob_hash(str(source))
+        assert first == versioning.compute_blob_hash(b"x = 1\n")[:12]
+        assert version_cache.exists()
+
+        # A fresh process (empty in-memory cache) reuses the disk entry
+        versioning.invalidate_version_cache()
+        with patch.object(versioning, "compute_blob_hash") as mock_hash:
+            assert versioning.get_git_blob_hash(str(source)) == first
+            mock_hash.assert_not_called()
+
+        # Changing the file (size differs) recomputes
+        source.write_text("x = 22\n")
+        assert versioning.get_git_blob_hash(str(source)) != first
+
+    def test_missing_file_returns_none(self, tmp_path):
+        from compose.services.pipeline.versioning import get_git_blob_hash
+
+        assert get_git_blob_hash(str(tmp_path / "missing.py")) is None
+
+    def test_step_version_resolved_lazily(self):
+        from unittest.mock import patch
+
+        with patch("compose.services.pipeline.decorator.get_version_hash", return_value="abc123def456") as mock_version:
+            @pipeline_step()
+            def lazy_step(ctx: PipelineContext) -> StepResult:
+                return StepResult.ok("done")
+
+            mock_version.assert_not_called()
+            _, metadata = get_step("lazy_step")
+            assert metadata.version_hash == "abc123def456"
+            assert metadata.version_hash == "abc123def456"
+
+        mock_version.assert_called_once()
+
 
 class TestExecutionOrder:
     """Tests for dependency-based execution ordering."""
@@ -293,3 +351,149 @@ class TestGetAllSteps:
     def test_empty_registry(self):
         steps = get_all_steps()
         assert steps == {}
+
+
+class TestExecutionLevels:
+    """Tests for get_execution_levels."""
+
+    def test_diamond_levels(self):
+        from compose.services.pipeline import get_execution_levels
+
+        @pipeline_step()
+        def level_root(ctx: PipelineContext) -> StepResult:
+            return StepResult.ok("root")
+
+        @pipeline_step(depends_on=["level_root"])
+        def level_left(ctx: PipelineContext) -> StepResult:
+            return StepResult.ok("left")
+
+        @pipeline_step(depends_on=["level_root"])
+        def level_right(ctx: PipelineContext) -> StepResult:
+            return StepResult.ok("right")
+
+        @pipeline_step(depends_on=["level_left", "level_right"])
+        def level_end(ctx: PipelineContext) -> StepResult:
+            return StepResult.ok("end")
+
+        levels = get_execution_levels(["level_end"])
+
+        assert levels[0] == ["level_root"]
+        assert sorted(levels[1]) == ["level_left", "level_right"]
+        assert levels[2] == ["level_end"]
+
+
+class TestAsyncPipelineExecution:
+    """Tests for DAG execution in run_pipeline_async."""
+
+    async def test_independent_steps_run_concurrently(self):
+        import time
+        from compose.services.pipeline import run_pipeline_async
+
+        @pipeline_step()
+        def slow_a(ctx: PipelineContext) -> StepResult:
+            time.sleep(0.2)
+            return StepResult.ok("a")
+
+        @pipeline_step()
+        def slow_b(ctx: PipelineContext) -> StepResult:
+            time.sleep(0.2)
+            return StepResult.ok("b")
+
+        @pipeline_step(depends_on=["slow_a", "slow_b"])
+        async def join_ab(ctx: PipelineContext) -> StepResult:
+            return StepResult.ok(ctx.get_value("slow_a") + ctx.get_value("slow_b"))
+
+        start = time.monotonic()
+        ctx = await run_pipeline_async(
+            "test123", "https://test.com", steps=["join_ab"],
+            config=PipelineConfig(update_graph=False),
+        )
+        elapsed = time.monotonic() - start
+
+        assert ctx.get_value("join_ab") == "ab"
+        assert elapsed < 0.35
+
+    async def test_async_step_errors_are_captured(self):
+        from compose.services.pipeline import run_pipeline_async
+
+        @pipeline_step()
+        async def async_raising(ctx: PipelineContext) -> StepResult:
+            raise RuntimeError("boom")
+
+        ctx = await run_pipeline_async(
+            "test123", "https://test.com", steps=["async_raising"],
+            config=PipelineConfig(update_graph=False),
+        )
+
+        assert "RuntimeError" in ctx.get_result("async_raising").error
+
+    async def test_pipeline_state_written_once(self):
+        from unittest.mock import AsyncMock, patch
+        from compose.services.pipeline import get_step_version, run_pipeline_async
+
+        @pipeline_step()
+        def state_a(ctx: PipelineContext) -> StepResult:
+            return StepResult.ok("a")
+
+        @pipeline_step(depends_on=["state_a"])
+        def state_b(ctx: PipelineContext) -> StepResult:
+            return StepResult.ok("b")
+
+        @pipeline_step()
+        def state_failed(ctx: PipelineContext) -> StepResult:
+            return StepResult.fail("nope")
+
+        with patch(
+            "compose.services.surrealdb.update_pipeline_states", AsyncMock(return_value={})
+        ) as mock_update:
+            await run_pipeline_async(
+                "vid1", "https://test.com", steps=["state_b", "state_failed"],
+                config=PipelineConfig(continue_on_error=True),
+            )
+
+        mock_update.assert_awaited_once_with({
+            "vid1": {
+                "state_a": get_step_version("state_a"),
+                "state_b": get_step_version("state_b"),
+            }
+        })
+
+
+class TestBackfill:
+    """Tests for concurrent backfill."""
+
+    async def test_backfill_bounded_concurrency_and_single_flush(self):
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+        from compose.services.pipeline import run_backfill_async
+
+        active = 0
+        peak = 0
+
+        @pipeline_step()
+        async def backfill_step(ctx: PipelineContext) -> StepResult:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            if ctx.video_id == "v3":
+                return StepResult.fail("bad video")
+            return StepResult.ok(ctx.video_id)
+
+        queue = [{"video_id": f"v{i}", "url": f"https://test.com/{i}"} for i in range(8)]
+
+        with patch(
+            "compose.services.pipeline.runner.get_backfill_queue_async",
+            AsyncMock(return_value=queue),
+        ), patch(
+            "compose.services.surrealdb.update_pipeline_states", AsyncMock(return_value={})
+        ) as mock_update:
+            summary = await run_backfill_async("backfill_step", batch_size=8, max_concurrency=3)
+
+        assert peak == 3
+        assert summary["succeeded"] == 7
+        assert summary["failed"] == 1
+        assert summary["errors"] == [{"video_id": "v3", "error": "bad video"}]
+        mock_update.assert_awaited_once()
+        assert len(mock_update.await_args.args[0]) == 7
@@ -0,0 +1,105 @@
+"""Unit tests for server-side pipeline status counts."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+class TestCountsQuery:
+    """Tests for the grouped counts query."""
+
+    @pytest.mark.unit
+    def test_one_grouped_query_for_all_steps(self):
+        """Every step contributes done/stale counters to a single GROUP ALL query."""
+        from compose.services.pipeline.status import build_counts_query
+
+        query, params = build_counts_query({"tags": "v1", "embed": "v2"})
+
+        assert query.count("SELECT") == 1
+        assert "GROUP ALL" in query
+        assert "AS done_0" in query and "AS stale_1" in query
+        assert params == {"step_0": "tags", "version_0": "v1", "step_1": "embed", "version_1": "v2"}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_pending_derived_from_total(self):
+        """Pending is total minus done and stale."""
+        from compose.services.pipeline.status import count_step_states
+
+        row = {"total": 10, "done_0": 6, "stale_0": 1, "done_1": 0, "stale_1": 0}
+        with patch(
+            "compose.services.surrealdb.driver.execute_query",
+            AsyncMock(return_value=[row]),
+        ):
+            total, counts = await count_step_states({"tags": "v1", "embed": "v2"})
+
+        assert total == 10
+        assert (counts["tags"].done, counts["tags"].stale, counts["tags"].pending) == (6, 1, 3)
+        assert counts["tags"].needs_backfill == 4
+        assert counts["embed"].pending == 10
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_empty_table(self):
+        """No rows means zero counts."""
+        from compose.services.pipeline.status import count_step_states
+
+        with patch("compose.services.surrealdb.driver.execute_query", AsyncMock(return_value=[])):
+            total, counts = await count_step_states({"tags": "v1"})
+
+        assert total == 0
+        assert counts["tags"].total == 0
+
+
+class TestPipelineStatus:
+    """Tests for cached, incrementally updated counts."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_counts_cached_until_forced(self):
+        """Repeated calls reuse the cached counts."""
+        from compose.services.pipeline.status import PipelineStatus, StepCounts
+
+        status = PipelineStatus()
+        counter = AsyncMock(return_value=(5, {"tags": StepCounts(done=5)}))
+        with patch("compose.services.pipeline.status.count_step_states", counter):
+            await status.get_counts({"tags": "v1"})
+            await status.get_counts({"tags": "v1"})
+            assert counter.await_count == 1
+
+            await status.get_counts({"tags": "v1"}, force=True)
+            assert counter.await_count == 2
+
+            # New step version invalidates the cache
+            await status.get_counts({"tags": "v2"})
+            assert counter.await_count == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_apply_updates_moves_buckets(self):
+        """Written states move videos from pending/stale to done."""
+        from compose.services.pipeline.status import PipelineStatus, StepCounts
+
+        status = PipelineStatus()
+        counter = AsyncMock(return_value=(3, {"tags": StepCounts(done=1, stale=1, pending=1)}))
+        with patch("compose.services.pipeline.status.count_step_states", counter):
+            await status.get_counts({"tags": "v1"})
+
+            status.apply_updates(
+                {"a": {"tags": "v1"}, "b": {"tags": "v1"}, "missing": {"tags": "v1"}},
+                {"a": {}, "b": {"tags": "v0"}},
+            )
+            counts = await status.get_counts({"tags": "v1"})
+
+        assert (counts["tags"].done, counts["tags"].stale, counts["tags"].pending) == (3, 0, 0)
+        assert counter.await_count == 1
+
+    @pytest.mark.unit
+    def test_apply_updates_before_sync_is_noop(self):
+        """Updates are ignored until counts have been loaded once."""
+        from compose.services.pipeline.status import PipelineStatus
+
+        status = PipelineStatus()
+        status.apply_updates({"a": {"tags": "v1"}}, {"a": {}})
+
+        assert status._counts == {}
@@ -0,0 +1,124 @@
+"""Unit tests for the worker progress change feed."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+class TestProgressHub:
+    """Tests for in-process progress pub/sub."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_fan_out_to_subscribers(self):
+        """Every subscriber receives published events."""
+        from compose.services.progress_feed import ProgressEvent, ProgressHub
+
+        hub = ProgressHub()
+        async with hub.subscribe() as first, hub.subscribe() as second:
+            assert hub.subscriber_count == 2
+            hub.publish(ProgressEvent(action="update", worker_id="w1", record={"completed": 3}))
+
+            assert (await first.get()).record == {"completed": 3}
+            assert (await second.get()).worker_id == "w1"
+
+        assert hub.subscriber_count == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest(self):
+        """A full subscriber queue keeps the newest events."""
+        from compose.services.progress_feed import ProgressEvent, ProgressHub
+
+        hub = ProgressHub(queue_size=2)
+        async with hub.subscribe() as events:
+            for i in range(5):
+                hub.publish(ProgressEvent(action="update", worker_id="w", record={"completed": i}))
+
+            received = [events.get_nowait().record["completed"] for _ in range(events.qsize())]
+
+        assert received == [3, 4]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_publish_helpers(self):
+        """publish_progress and publish_progress_cleared use the singleton hub."""
+        from compose.services import progress_feed
+
+        progress_feed.reset_progress_feed()
+        hub = progress_feed.get_progress_hub()
+        async with hub.subscribe() as events:
+            progress_feed.publish_progress("w1", {"worker_id": "w1", "completed": 1})
+            progress_feed.publish_progress_cleared("w1")
+
+            update, delete = events.get_nowait(), events.get_nowait()
+
+        assert (update.action, update.worker_id) == ("update", "w1")
+        assert (delete.action, delete.worker_id) == ("delete", "w1")
+        progress_feed.reset_progress_feed()
+
+
+class TestSurrealLiveFeed:
+    """Tests for forwarding LIVE SELECT notifications."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_notifications_become_refresh_events(self):
+        """Each LIVE notification publishes a refresh event."""
+        from compose.services.progress_feed import ProgressHub, SurrealLiveFeed
+
+        notifications = asyncio.Queue()
+
+        async def stream():
+            while True:
+                yield await notifications.get()
+
+        db = MagicMock()
+        db.live = AsyncMock(return_value="live-id")
+        db.subscribe_live = AsyncMock(return_value=stream())
+        db.kill = AsyncMock()
+
+        hub = ProgressHub()
+        feed = SurrealLiveFeed(hub)
+        with patch("compose.services.surrealdb.driver.get_db", AsyncMock(return_value=db)):
+            async with hub.subscribe() as events:
+                assert await feed.start() is True
+                db.live.assert_awaited_once_with("worker_progress")
+
+                await notifications.put({"worker_id": "w1"})
+                event = await asyncio.wait_for(events.get(), timeout=1.0)
+                assert event.action == "refresh"
+
+            await feed.stop()
+
+        db.kill.assert_awaited_once_with("live-id")
+        assert not feed.running
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_live_failure_returns_false(self):
+        """Connections that reject LIVE report the feed as unavailable."""
+        from compose.services.progress_feed import ProgressHub, SurrealLiveFeed
+
+        db = MagicMock()
+        db.live = AsyncMock(side_effect=RuntimeError("LIVE not supported over HTTP"))
+
+        with patch("compose.services.surrealdb.driver.get_db", AsyncMock(return_value=db)):
+            assert await SurrealLiveFeed(ProgressHub()).start() is False
+
+
+class TestStartProgressFeed:
+    """Tests for feed mode selection."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_poll_and_local_modes(self):
+        """poll disables push; local trusts in-process events without LIVE."""
+        from compose.services.progress_feed import start_progress_feed
+
+        with patch("compose.services.progress_feed.SurrealLiveFeed") as MockFeed:
+            assert await start_progress_feed("poll") is False
+            assert await start_progress_feed("local") is True
+
+        MockFeed.assert_not_called()
@@ -396,6 +396,50 @@ class TestFileManagement:
         # Verify file was stored in MinIO
         assert len(fake_minio.objects) == 1
 
+    async def test_add_file_from_stream(self, service, fake_db, fake_minio):
+        """File-like uploads are streamed to MinIO and sized by seeking."""
+        from io import BytesIO
+
+        fake_db.tables["project"] = [{"id": "test-id", "name": "Test"}]
+
+        file = await service.add_file(
+            project_id="test-id",
+            filename="doc.pdf",
+            original_filename="doc.pdf",
+            content_type="application/pdf",
+            file_data=BytesIO(b"%PDF-1.7 content"),
+        )
+
+        assert file.size_bytes == 16
+        assert list(fake_minio.objects.values()) == [b"%PDF-1.7 content"]
+
+    async def test_iter_file_content_ranges(self, service, fake_db):
+        """File content streams in chunks, optionally from a byte range."""
+        fake_db.tables["project"] = [{"id": "test-id", "name": "Test"}]
+        file = await service.add_file(
+            project_id="test-id",
+            filename="data.bin",
+            original_filename="data.bin",
+            content_type="application/octet-stream",
+            file_data=b"abcdefghij",
+        )
+
+        chunks = [
+            chunk async for chunk in service.iter_file_content("test-id", file.id, chunk_size=4)
+        ]
+        ranged = [
+            chunk
+            async for chunk in service.iter_file_content("test-id", file.id, offset=3, length=4)
+        ]
+
+        assert chunks == [b"abcd", b"efgh", b"ij"]
+        assert ranged == [b"defg"]
+        assert await service.get_file_content("test-id", file.id) == b"abcdefghij"
+
+    async def test_get_file_content_not_found(self, service):
+        """Missing files have no content."""
+        assert await service.get_file_content("test-id", "missing") is None
+
     async def test_delete_file_not_found(self, service):
         """Test deleting non-existent file."""
         result = await service.delete_file("project-id", "non-existent-file")
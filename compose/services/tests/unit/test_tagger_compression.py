@@ -0,0 +1,112 @@
+"""Unit tests for transcript pre-compression used by the tagger."""
+
+import pytest
+
+
+def _transcript(sentences: int) -> str:
+    return " ".join(f"Sentence {i} talks about topic {i % 7}." for i in range(sentences))
+
+
+class TestSplitWindows:
+    """Tests for sentence-aligned window splitting."""
+
+    @pytest.mark.unit
+    def test_windows_respect_size(self):
+        """Windows stay near the target size and cover the text."""
+        from compose.services.tagger.compression import split_windows
+
+        text = _transcript(200)
+        windows = split_windows(text, window_chars=300)
+
+        assert len(windows) > 1
+        assert all(len(w) <= 300 for w in windows)
+        assert " ".join(windows) == text
+
+    @pytest.mark.unit
+    def test_unpunctuated_text_is_hard_split(self):
+        """Auto-captions without punctuation are split on whitespace."""
+        from compose.services.tagger.compression import split_windows
+
+        text = " ".join(["word"] * 500)
+        windows = split_windows(text, window_chars=100)
+
+        assert all(len(w) <= 100 for w in windows)
+        assert sum(len(w.split()) for w in windows) == 500
+
+
+class TestCentralityScores:
+    """Tests for centroid similarity scoring."""
+
+    @pytest.mark.unit
+    def test_outlier_scores_lowest(self):
+        """The vector furthest from the others gets the lowest score."""
+        from compose.services.tagger.compression import centrality_scores
+
+        scores = centrality_scores([[1.0, 0.0], [0.9, 0.1], [1.0, 0.1], [0.0, 1.0]])
+
+        assert scores.index(min(scores)) == 3
+
+    @pytest.mark.unit
+    def test_empty(self):
+        """No embeddings yields no scores."""
+        from compose.services.tagger.compression import centrality_scores
+
+        assert centrality_scores([]) == []
+
+
+class TestCompressTranscript:
+    """Tests for compress_transcript."""
+
+    @pytest.mark.unit
+    def test_short_transcript_unchanged(self):
+        """Transcripts within budget are returned as-is."""
+        from compose.services.tagger.compression import compress_transcript
+
+        assert compress_transcript("short text", max_chars=100) == "short text"
+
+    @pytest.mark.unit
+    def test_budget_respected_without_embedder(self):
+        """Even sampling keeps the opening and spans the transcript."""
+        import re
+        from compose.services.tagger.compression import GAP_MARKER, compress_transcript
+
+        text = _transcript(1000)
+        result = compress_transcript(text, max_chars=3000, window_chars=300)
+
+        assert len(result) <= 3000
+        assert result.startswith("Sentence 0 ")
+        assert GAP_MARKER in result
+        # Sampled windows reach the second half of the transcript
+        assert max(int(n) for n in re.findall(r"Sentence (\d+)", result)) > 500
+
+    @pytest.mark.unit
+    def test_embedder_selects_central_windows(self):
+        """Windows similar to the centroid are preferred over outliers."""
+        from compose.services.tagger.compression import compress_transcript, split_windows
+
+        text = _transcript(300)
+        windows = split_windows(text, window_chars=200)
+        outlier = len(windows) // 2
+
+        def embed_batch(texts):
+            return [[0.0, 1.0] if i == outlier else [1.0, 0.0] for i in range(len(texts))]
+
+        budget = len(text) // 2
+        result = compress_transcript(text, max_chars=budget, embed_batch=embed_batch, window_chars=200)
+
+        assert len(result) <= budget
+        assert windows[0] in result
+        assert windows[outlier] not in result
+
+    @pytest.mark.unit
+    def test_embedder_failure_falls_back(self):
+        """Embedding errors fall back to even sampling."""
+        from compose.services.tagger.compression import compress_transcript
+
+        def embed_batch(texts):
+            raise ConnectionError("Infinity down")
+
+        text = _transcript(1000)
+        result = compress_transcript(text, max_chars=3000, embed_batch=embed_batch)
+
+        assert 0 < len(result) <= 3000
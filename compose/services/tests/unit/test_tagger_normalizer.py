@@ -85,6 +85,44 @@ class TestTagNormalizer:
         assert normalizer.retriever is mock_retriever
         assert normalizer.vocabulary is mock_vocabulary
 
+    @pytest.mark.unit
+    async def test_create_normalizer_compresses_with_chunk_embedder(self):
+        """Factory-built normalizers rank transcript windows with the chunk embedder."""
+        from compose.services.tagger.normalizer import create_normalizer
+
+        embedder = MagicMock()
+        embedder.embed_batch.side_effect = lambda texts: [[1.0, float(i)] for i in range(len(texts))]
+
+        with (
+            patch("compose.services.tagger.normalizer.Agent"),
+            patch("compose.services.tagger.normalizer.get_chunk_embedder", return_value=embedder),
+        ):
+            normalizer = create_normalizer(model="test-model", max_transcript_chars=2000)
+
+        transcript = " ".join(f"Sentence number {i} about the topic." for i in range(400))
+        content = await normalizer.prepare_transcript(transcript)
+
+        assert normalizer.embed_batch == embedder.embed_batch
+        embedder.embed_batch.assert_called_once()
+        assert len(content) <= 2000
+
+    @pytest.mark.unit
+    def test_create_normalizer_explicit_embedder(self):
+        """An explicit embed_batch overrides the default embedder."""
+        from compose.services.tagger.normalizer import create_normalizer
+
+        def embed_batch(texts):
+            return [[1.0] for _ in texts]
+
+        with (
+            patch("compose.services.tagger.normalizer.Agent"),
+            patch("compose.services.tagger.normalizer.get_chunk_embedder") as mock_embedder,
+        ):
+            normalizer = create_normalizer(model="test-model", embed_batch=embed_batch)
+
+        assert normalizer.embed_batch is embed_batch
+        mock_embedder.assert_not_called()
+
     @pytest.mark.unit
     def test_normalizer_phase1_prompt(self):
         """Test Phase 1 prompt content."""
@@ -316,6 +354,124 @@ class TestTagNormalizer:
         assert "normalized" in result
 
 
+    @pytest.mark.unit
+    def test_structured_output_agents_use_result_types(self):
+        """Structured mode builds agents with pydantic result types."""
+        from compose.services.tagger.models import NormalizedMetadata
+        from compose.services.tagger.normalizer import TagNormalizer
+
+        with patch("compose.services.tagger.normalizer.Agent") as MockAgent:
+            normalizer = TagNormalizer(model="test")
+
+        output_types = [call.kwargs.get("output_type") for call in MockAgent.call_args_list]
+        assert output_types == [StructuredMetadata, NormalizedMetadata]
+        assert "Example output format" not in normalizer._get_phase1_prompt()
+
+    @pytest.mark.unit
+    def test_text_mode_agents_keep_json_prompt(self):
+        """Text mode keeps the JSON formatting rules and example."""
+        from compose.services.tagger.normalizer import TagNormalizer
+
+        with patch("compose.services.tagger.normalizer.Agent") as MockAgent:
+            normalizer = TagNormalizer(model="test", structured_output=False)
+
+        assert all("output_type" not in call.kwargs for call in MockAgent.call_args_list)
+        prompt = normalizer._get_phase1_prompt()
+        assert "Return ONLY valid JSON" in prompt
+        assert "Example output format" in prompt
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_extract_raw_metadata_structured_result(self):
+        """Structured results are returned without JSON parsing."""
+        from compose.services.tagger.normalizer import TagNormalizer
+
+        metadata = StructuredMetadata(
+            title="Structured",
+            summary="Summary",
+            subject_matter=["ai-agents"],
+            entities={},
+            techniques_or_concepts=[],
+            tools_or_materials=[],
+        )
+
+        with patch("compose.services.tagger.normalizer.Agent"):
+            normalizer = TagNormalizer(model="test")
+            mock_agent = MagicMock()
+            mock_agent.run = AsyncMock(return_value=MagicMock(output=metadata))
+            normalizer.phase1_agent = mock_agent
+
+            result = await normalizer.extract_raw_metadata("Test")
+
+        assert result is metadata
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_extract_raw_metadata_ignores_surrounding_prose(self):
+        """Text responses with prose around the JSON object still parse."""
+        from compose.services.tagger.normalizer import TagNormalizer
+
+        with patch("compose.services.tagger.normalizer.Agent"):
+            normalizer = TagNormalizer(model="test", structured_output=False)
+            mock_agent = MagicMock()
+            mock_agent.run = AsyncMock(return_value=MagicMock(output=(
+                'Here is the metadata: {"Title": "Prose", "summary": "s", '
+                '"subject_matter": "rag, agents", "entities": {}, '
+                '"techniques_or_concepts": [], "tools_or_materials": []} Hope this helps!'
+            )))
+            normalizer.phase1_agent = mock_agent
+
+            result = await normalizer.extract_raw_metadata("Test")
+
+        assert result.title == "Prose"
+        assert result.subject_matter == ["rag", "agents"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_extract_raw_metadata_compresses_long_transcript(self):
+        """Transcripts over budget are compressed before Phase 1."""
+        from compose.services.tagger.normalizer import TagNormalizer
+
+        transcript = " ".join(f"Sentence number {i} about agents." for i in range(2000))
+
+        with patch("compose.services.tagger.normalizer.Agent"):
+            normalizer = TagNormalizer(model="test", max_transcript_chars=5000)
+            mock_agent = MagicMock()
+            mock_agent.run = AsyncMock(return_value=MagicMock(output=json.dumps({
+                "title": "t", "summary": "s", "subject_matter": [], "entities": {},
+                "techniques_or_concepts": [], "tools_or_materials": [],
+            })))
+            normalizer.phase1_agent = mock_agent
+
+            await normalizer.extract_raw_metadata(transcript)
+
+        prompt = mock_agent.run.await_args.args[0]
+        content = prompt.split("Content:\n", 1)[1]
+        assert len(content) <= 5000
+        assert content.startswith("Sentence number 0 ")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_normalize_many_isolates_failures(self):
+        """One failing transcript does not abort the batch."""
+        from compose.services.tagger.normalizer import TagNormalizer
+
+        with patch("compose.services.tagger.normalizer.Agent"):
+            normalizer = TagNormalizer(model="test")
+
+        async def fake_normalize(transcript, **kwargs):
+            if transcript == "bad":
+                raise ValueError("boom")
+            return {"raw": transcript, "normalized": transcript}
+
+        normalizer.normalize_from_transcript = fake_normalize
+        results = await normalizer.normalize_many(["a", "bad", "c"], max_concurrency=2)
+
+        assert results[0]["raw"] == "a"
+        assert isinstance(results[1], ValueError)
+        assert results[2]["raw"] == "c"
+
+
 # =============================================================================
 # Integration-Style Unit Tests (SurrealDB-based)
 # =============================================================================
@@ -0,0 +1,298 @@
+"""Unit tests for incremental YouTube channel sync.
+
+Tests for channel_sync.py - uploads playlist walk, streamed CSV, synced spans
+
+Run with: uv run pytest compose/services/tests/unit/test_youtube_channel_sync.py -v
+"""
+
+import csv
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+class FakeRequest:
+    """API request whose execute() returns a canned response."""
+
+    def __init__(self, api, method, kwargs):
+        self.api = api
+        self.method = method
+        self.kwargs = kwargs
+
+    def execute(self, http=None):
+        self.api.calls.append((self.method, self.kwargs))
+        return self.api.respond(self.method, self.kwargs)
+
+
+class FakeYouTube:
+    """Data API client serving one channel's uploads (newest first)."""
+
+    def __init__(self, uploads: list[tuple[str, str]], page_size: int = 2):
+        self.uploads = uploads
+        self.page_size = page_size
+        self.calls = []
+
+    def _resource(self, name):
+        resource = MagicMock()
+        resource.list.side_effect = lambda **kwargs: FakeRequest(self, name, kwargs)
+        return resource
+
+    def search(self):
+        return self._resource("search")
+
+    def channels(self):
+        return self._resource("channels")
+
+    def playlistItems(self):
+        return self._resource("playlistItems")
+
+    def videos(self):
+        return self._resource("videos")
+
+    def respond(self, method, kwargs):
+        if method == "search":
+            return {"items": [{"snippet": {"channelId": "UC1", "title": "Test Channel"}}]}
+        if method == "channels":
+            return {"items": [{"contentDetails": {"relatedPlaylists": {"uploads": "UU1"}}}]}
+        if method == "playlistItems":
+            start = int(kwargs.get("pageToken") or 0)
+            page = self.uploads[start:start + self.page_size]
+            response = {
+                "items": [
+                    {"contentDetails": {"videoId": vid}, "snippet": {"publishedAt": published}}
+                    for vid, published in page
+                ]
+            }
+            if start + self.page_size < len(self.uploads):
+                response["nextPageToken"] = str(start + self.page_size)
+            return response
+        if method == "videos":
+            return {
+                "items": [
+                    {
+                        "id": vid,
+                        "snippet": {"title": f"Video {vid}", "description": "d" * 300},
+                        "statistics": {"viewCount": "10"},
+                        "contentDetails": {"duration": "PT1M5S"},
+                    }
+                    for vid in kwargs["id"].split(",")
+                ]
+            }
+        raise AssertionError(method)
+
+    def count(self, method):
+        return sum(1 for name, _ in self.calls if name == method)
+
+
+UPLOADS = [
+    ("v5", "2025-05-01T00:00:00Z"),
+    ("v4", "2025-04-01T00:00:00Z"),
+    ("v3", "2025-03-01T00:00:00Z"),
+    ("v2", "2025-02-01T00:00:00Z"),
+    ("v1", "2025-01-01T00:00:00Z"),
+]
+
+
+def _rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _sync(api, tmp_path):
+    from compose.services.youtube.channel_sync import ChannelSync
+
+    return ChannelSync(queue_base=tmp_path, client=api)
+
+
+@pytest.mark.unit
+class TestChannelSync:
+    """Test ChannelSync.sync."""
+
+    async def test_first_sync_streams_all_uploads(self, tmp_path):
+        """All uploads in range are written newest first and the span is saved."""
+        api = FakeYouTube(UPLOADS)
+        result = await _sync(api, tmp_path).sync("https://www.youtube.com/@Test-Channel/videos")
+
+        assert result.video_count == 5
+        assert result.csv_path == tmp_path / "pending" / "test_channel_videos.csv"
+        rows = _rows(result.csv_path)
+        assert [r["url"][-2:] for r in rows] == ["v5", "v4", "v3", "v2", "v1"]
+        assert rows[0] == {
+            "title": "Video v5",
+            "url": "https://www.youtube.com/watch?v=v5",
+            "upload_date": "2025-05-01",
+            "view_count": "10",
+            "channel_id": "UC1",
+            "channel_name": "Test Channel",
+        }
+        assert list((tmp_path / "pending").iterdir()) == [result.csv_path]
+        assert result.since is None
+        (span,) = result.synced
+        assert span.newest_video_id == "v5"
+        assert span.oldest_published_at is None  # walked back to the first upload
+
+    async def test_resync_fetches_only_new_uploads(self, tmp_path):
+        """A second sync stops at the synced span without paging further."""
+        await _sync(FakeYouTube(UPLOADS), tmp_path).sync("https://www.youtube.com/@chan")
+        (tmp_path / "pending" / "chan_videos.csv").unlink()  # processed by the worker
+
+        api = FakeYouTube([("v7", "2025-07-01T00:00:00Z"), ("v6", "2025-06-01T00:00:00Z")] + UPLOADS)
+        result = await _sync(api, tmp_path).sync("https://www.youtube.com/@chan")
+
+        assert result.video_count == 2
+        assert [r["url"][-2:] for r in _rows(result.csv_path)] == ["v7", "v6"]
+        assert result.since.newest_video_id == "v5"
+        assert [span.newest_video_id for span in result.synced] == ["v7"]
+        # Page 2 reaches the synced span; page 3+ is never requested
+        assert api.count("playlistItems") == 2
+
+    async def test_no_new_uploads(self, tmp_path):
+        """Without new uploads no CSV is written and the span is kept."""
+        await _sync(FakeYouTube(UPLOADS), tmp_path).sync("https://www.youtube.com/@chan")
+
+        api = FakeYouTube(UPLOADS)
+        result = await _sync(api, tmp_path).sync("https://www.youtube.com/@chan")
+
+        assert result.video_count == 0
+        assert result.csv_path is None
+        assert [span.newest_video_id for span in result.synced] == ["v5"]
+        assert api.count("videos") == 0
+        assert api.count("playlistItems") == 1
+
+    async def test_full_sync_ignores_synced_spans(self, tmp_path):
+        """full=True walks back to the cutoff regardless of synced spans."""
+        await _sync(FakeYouTube(UPLOADS), tmp_path).sync("https://www.youtube.com/@chan")
+
+        cutoff = datetime(2025, 2, 15, tzinfo=timezone.utc)
+        result = await _sync(FakeYouTube(UPLOADS), tmp_path).sync(
+            "https://www.youtube.com/@chan", cutoff=cutoff, full=True
+        )
+
+        assert result.video_count == 3
+        # The first batch is still pending, so the new CSV gets its own name
+        assert result.csv_path.name.startswith("chan_videos_")
+        assert [r["url"][-2:] for r in _rows(result.csv_path)] == ["v5", "v4", "v3"]
+
+    async def test_max_videos(self, tmp_path):
+        """max_videos stops mid-page."""
+        api = FakeYouTube(UPLOADS)
+        result = await _sync(api, tmp_path).sync("https://www.youtube.com/@chan", max_videos=3)
+
+        assert result.video_count == 3
+        assert api.count("playlistItems") == 2
+
+    async def test_custom_fields(self, tmp_path):
+        """Callers can choose columns such as duration and description."""
+        result = await _sync(FakeYouTube(UPLOADS[:1]), tmp_path).sync(
+            "https://www.youtube.com/@chan", fields=["url", "duration", "description"]
+        )
+
+        (row,) = _rows(result.csv_path)
+        assert row["duration"] == "1:05"
+        assert len(row["description"]) == 200
+
+    async def test_failure_leaves_no_partial_csv(self, tmp_path):
+        """An API error mid-walk removes the partial file and saves no span."""
+        api = FakeYouTube(UPLOADS)
+        original = api.respond
+
+        def respond(method, kwargs):
+            if method == "playlistItems" and kwargs.get("pageToken"):
+                raise RuntimeError("quotaExceeded")
+            return original(method, kwargs)
+
+        api.respond = respond
+        sync = _sync(api, tmp_path)
+        with pytest.raises(RuntimeError):
+            await sync.sync("https://www.youtube.com/@chan")
+
+        assert list((tmp_path / "pending").iterdir()) == []
+        assert sync.state.get("UC1") == []
+
+    async def test_truncated_sync_is_continued(self, tmp_path):
+        """Uploads left out by max_videos are fetched by later syncs."""
+        seen = []
+        first = await _sync(FakeYouTube(UPLOADS), tmp_path).sync("https://www.youtube.com/@chan", max_videos=2)
+        seen += [r["url"][-2:] for r in _rows(first.csv_path)]
+        first.csv_path.unlink()
+
+        uploads = [("v7", "2025-07-01T00:00:00Z"), ("v6", "2025-06-01T00:00:00Z")] + UPLOADS
+        second = await _sync(FakeYouTube(uploads), tmp_path).sync("https://www.youtube.com/@chan", max_videos=3)
+        seen += [r["url"][-2:] for r in _rows(second.csv_path)]
+        second.csv_path.unlink()
+
+        # v7, v6 are new; v5, v4 were synced; v3 fills the limit
+        assert seen == ["v5", "v4", "v7", "v6", "v3"]
+        assert [(s.newest_video_id, s.oldest_video_id) for s in second.synced] == [("v7", "v3")]
+
+        third = await _sync(FakeYouTube(uploads), tmp_path).sync("https://www.youtube.com/@chan")
+        assert [r["url"][-2:] for r in _rows(third.csv_path)] == ["v2", "v1"]
+        third.csv_path.unlink()
+
+        api = FakeYouTube(uploads)
+        fourth = await _sync(api, tmp_path).sync("https://www.youtube.com/@chan")
+        assert fourth.video_count == 0
+        assert api.count("playlistItems") == 1
+
+    async def test_gap_between_spans_is_filled(self, tmp_path):
+        """A truncated sync that doesn't reach the previous span leaves no gap."""
+        await _sync(FakeYouTube(UPLOADS[3:]), tmp_path).sync("https://www.youtube.com/@chan")
+        (tmp_path / "pending" / "chan_videos.csv").unlink()
+
+        first = await _sync(FakeYouTube(UPLOADS), tmp_path).sync("https://www.youtube.com/@chan", max_videos=1)
+        assert [r["url"][-2:] for r in _rows(first.csv_path)] == ["v5"]
+        assert [s.newest_video_id for s in first.synced] == ["v5", "v2"]
+        first.csv_path.unlink()
+
+        second = await _sync(FakeYouTube(UPLOADS), tmp_path).sync("https://www.youtube.com/@chan")
+        assert [r["url"][-2:] for r in _rows(second.csv_path)] == ["v4", "v3"]
+        (span,) = second.synced
+        assert (span.newest_video_id, span.oldest_published_at) == ("v5", None)
+
+    async def test_wider_range_fetches_older_uploads(self, tmp_path):
+        """A sync with an older cutoff than before fetches the uploads in between."""
+        month = datetime(2025, 3, 15, tzinfo=timezone.utc)
+        first = await _sync(FakeYouTube(UPLOADS), tmp_path).sync("https://www.youtube.com/@chan", cutoff=month)
+        assert [r["url"][-2:] for r in _rows(first.csv_path)] == ["v5", "v4"]
+        first.csv_path.unlink()
+
+        api = FakeYouTube(UPLOADS)
+        second = await _sync(api, tmp_path).sync("https://www.youtube.com/@chan")
+
+        assert [r["url"][-2:] for r in _rows(second.csv_path)] == ["v3", "v2", "v1"]
+        assert second.since.newest_video_id == "v5"
+        (span,) = second.synced
+        assert span.oldest_published_at is None
+
+        # The narrower range is covered now
+        api = FakeYouTube(UPLOADS)
+        third = await _sync(api, tmp_path).sync("https://www.youtube.com/@chan", cutoff=month)
+        assert third.video_count == 0
+        assert api.count("playlistItems") == 1
+
+    async def test_url_without_handle(self, tmp_path):
+        """URLs without an @handle are rejected."""
+        with pytest.raises(ValueError, match="username"):
+            await _sync(FakeYouTube(UPLOADS), tmp_path).sync("https://www.youtube.com/channel/UC1")
+
+
+@pytest.mark.unit
+class TestYouTubeClientCache:
+    """Test get_youtube_client."""
+
+    def test_client_built_once_per_key(self):
+        """The discovery client is built once and reused."""
+        from compose.services.youtube.channel_sync import get_youtube_client, reset_youtube_clients
+
+        reset_youtube_clients()
+        try:
+            with patch("googleapiclient.discovery.build") as mock_build:
+                first = get_youtube_client("key-1")
+                second = get_youtube_client("key-1")
+                get_youtube_client("key-2")
+
+            assert first is second
+            assert mock_build.call_count == 2
+        finally:
+            reset_youtube_clients()
@@ -16,7 +16,7 @@ class TestYouTubeMetadataServiceInit:
     @pytest.mark.unit
     def test_init_with_api_key(self):
         """Test initialization with explicit API key."""
-        with patch("compose.services.youtube.metadata_service.build") as mock_build:
+        with patch("googleapiclient.discovery.build") as mock_build:
             mock_build.return_value = MagicMock()
             from compose.services.youtube.metadata_service import YouTubeMetadataService
 
@@ -30,7 +30,7 @@ class TestYouTubeMetadataServiceInit:
     def test_init_with_env_var(self):
         """Test initialization from environment variable."""
         with patch.dict(os.environ, {"YOUTUBE_API_KEY": "env-api-key"}):
-            with patch("compose.services.youtube.metadata_service.build") as mock_build:
+            with patch("googleapiclient.discovery.build") as mock_build:
                 mock_build.return_value = MagicMock()
                 from compose.services.youtube.metadata_service import (
                     YouTubeMetadataService,
@@ -167,7 +167,7 @@ class TestFetchMetadata:
             ]
         }
 
-        with patch("compose.services.youtube.metadata_service.build") as mock_build:
+        with patch("googleapiclient.discovery.build") as mock_build:
             mock_youtube = MagicMock()
             mock_request = MagicMock()
             mock_request.execute.return_value = mock_response
@@ -194,7 +194,7 @@ class TestFetchMetadata:
         """Test fetch_metadata raises ValueError for non-existent video."""
         mock_response = {"items": []}
 
-        with patch("compose.services.youtube.metadata_service.build") as mock_build:
+        with patch("googleapiclient.discovery.build") as mock_build:
             mock_youtube = MagicMock()
             mock_request = MagicMock()
             mock_request.execute.return_value = mock_response
@@ -229,7 +229,7 @@ class TestFetchMetadata:
             ]
         }
 
-        with patch("compose.services.youtube.metadata_service.build") as mock_build:
+        with patch("googleapiclient.discovery.build") as mock_build:
             mock_youtube = MagicMock()
             mock_request = MagicMock()
             mock_request.execute.return_value = mock_response
@@ -249,7 +249,7 @@ class TestFetchMetadata:
     @pytest.mark.unit
     def test_fetch_metadata_safe_success(self):
         """Test fetch_metadata_safe returns tuple on success."""
-        with patch("compose.services.youtube.metadata_service.build") as mock_build:
+        with patch("googleapiclient.discovery.build") as mock_build:
             mock_youtube = MagicMock()
             mock_request = MagicMock()
             mock_request.execute.return_value = {
@@ -281,7 +281,7 @@ class TestFetchMetadata:
     @pytest.mark.unit
     def test_fetch_metadata_safe_video_not_found(self):
         """Test fetch_metadata_safe returns error tuple for non-existent video."""
-        with patch("compose.services.youtube.metadata_service.build") as mock_build:
+        with patch("googleapiclient.discovery.build") as mock_build:
             mock_youtube = MagicMock()
             mock_request = MagicMock()
             mock_request.execute.return_value = {"items": []}
@@ -302,7 +302,7 @@ class TestFetchMetadata:
         """Test fetch_metadata_safe handles HTTP errors."""
         from googleapiclient.errors import HttpError
 
-        with patch("compose.services.youtube.metadata_service.build") as mock_build:
+        with patch("googleapiclient.discovery.build") as mock_build:
             mock_youtube = MagicMock()
             mock_request = MagicMock()
             # Create a proper HttpError
@@ -325,7 +325,7 @@ class TestFetchMetadata:
     @pytest.mark.unit
     def test_fetch_metadata_safe_unexpected_error(self):
         """Test fetch_metadata_safe handles unexpected errors."""
-        with patch("compose.services.youtube.metadata_service.build") as mock_build:
+        with patch("googleapiclient.discovery.build") as mock_build:
             mock_youtube = MagicMock()
             mock_request = MagicMock()
             mock_request.execute.side_effect = RuntimeError("Network failure")
@@ -357,3 +357,153 @@ class TestFetchVideoMetadataFunction:
             assert metadata is None
             assert error is not None
             assert "API key" in error
+
+
+def _video_item(video_id: str) -> dict:
+    return {
+        "id": video_id,
+        "snippet": {
+            "title": f"Title {video_id}",
+            "publishedAt": "2024-01-01T00:00:00Z",
+            "channelId": "UC123",
+            "channelTitle": "Channel",
+        },
+        "statistics": {"viewCount": "10"},
+        "contentDetails": {"duration": "PT1M"},
+    }
+
+
+def _batch_service(execute):
+    """Build a service whose videos.list(id=...) responses come from execute(ids)."""
+    mock_youtube = MagicMock()
+
+    def list_videos(part, id):
+        request = MagicMock()
+        request.execute.side_effect = lambda http=None: execute(id.split(","))
+        return request
+
+    mock_youtube.videos.return_value.list.side_effect = list_videos
+
+    with patch("googleapiclient.discovery.build", return_value=mock_youtube):
+        from compose.services.youtube.metadata_service import YouTubeMetadataService
+
+        return YouTubeMetadataService(api_key="test-key"), mock_youtube
+
+
+class TestFetchMetadataMany:
+    """Test batched metadata fetching."""
+
+    @pytest.mark.unit
+    def test_fetch_metadata_batch_single_request(self):
+        """Up to 50 IDs are sent in one videos.list call."""
+        service, mock_youtube = _batch_service(
+            lambda ids: {"items": [_video_item(v) for v in ids]}
+        )
+
+        items = service.fetch_metadata_batch(["a", "b", "c"])
+
+        assert set(items) == {"a", "b", "c"}
+        assert items["b"]["title"] == "Title b"
+        mock_youtube.videos.return_value.list.assert_called_once_with(
+            part="snippet,statistics,contentDetails", id="a,b,c"
+        )
+
+    @pytest.mark.unit
+    def test_fetch_metadata_batch_rejects_oversized(self):
+        """More than 50 IDs is a caller error."""
+        service, _ = _batch_service(lambda ids: {"items": []})
+
+        with pytest.raises(ValueError, match="at most 50"):
+            service.fetch_metadata_batch([str(i) for i in range(51)])
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_chunks_into_50_id_requests(self):
+        """120 IDs become three requests; missing videos get an error entry."""
+        requested = []
+
+        def execute(ids):
+            requested.append(len(ids))
+            return {"items": [_video_item(v) for v in ids if v != "v7"]}
+
+        service, _ = _batch_service(execute)
+        ids = [f"v{i}" for i in range(120)]
+
+        results = await service.fetch_metadata_many(ids + ["v0"])
+
+        assert sorted(requested) == [20, 50, 50]
+        assert len(results) == 120
+        assert results["v3"][0]["title"] == "Title v3"
+        assert results["v3"][1] is None
+        assert results["v7"] == (None, "Video not found: v7")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_chunk_isolated(self):
+        """An error in one chunk only fails that chunk's IDs."""
+        def execute(ids):
+            if "v60" in ids:
+                raise RuntimeError("Network failure")
+            return {"items": [_video_item(v) for v in ids]}
+
+        service, _ = _batch_service(execute)
+
+        results = await service.fetch_metadata_many([f"v{i}" for i in range(100)])
+
+        assert results["v10"][1] is None
+        assert "Network failure" in results["v60"][1]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_quota_exceeded_stops_remaining_chunks(self):
+        """After a quotaExceeded response no further requests are sent."""
+        from googleapiclient.errors import HttpError
+        from compose.services.youtube.metadata_service import QuotaLimiter
+
+        calls = 0
+
+        def execute(ids):
+            nonlocal calls
+            calls += 1
+            resp = MagicMock()
+            resp.status = 403
+            resp.reason = "Forbidden"
+            raise HttpError(resp, b'{"error": {"errors": [{"reason": "quotaExceeded"}]}}')
+
+        service, _ = _batch_service(execute)
+        limiter = QuotaLimiter(max_concurrency=1)
+
+        results = await service.fetch_metadata_many([f"v{i}" for i in range(150)], limiter)
+
+        assert calls == 1
+        assert limiter.exhausted
+        assert all(error and "API error" in error for _, error in results.values())
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_quota_budget_limits_requests(self):
+        """Requests beyond the unit budget are refused without calling the API."""
+        from compose.services.youtube.metadata_service import QuotaLimiter
+
+        service, mock_youtube = _batch_service(
+            lambda ids: {"items": [_video_item(v) for v in ids]}
+        )
+        limiter = QuotaLimiter(quota_units=1)
+
+        results = await service.fetch_metadata_many([f"v{i}" for i in range(100)], limiter)
+
+        assert mock_youtube.videos.return_value.list.call_count == 1
+        assert limiter.remaining == 0
+        assert sum(1 for _, error in results.values() if error is None) == 50
+        assert sum(1 for _, error in results.values() if error and "quota" in error) == 50
+
+    @pytest.mark.unit
+    def test_fetch_videos_metadata_without_api_key(self):
+        """Every ID gets the configuration error when no key is set."""
+        with patch.dict(os.environ, {}, clear=True):
+            from compose.services.youtube.metadata_service import fetch_videos_metadata
+
+            results = fetch_videos_metadata(["a", "b"])
+
+            assert set(results) == {"a", "b"}
+            assert all(m is None and "API key" in e for m, e in results.values())
@@ -365,14 +365,14 @@ class TestGetTranscript:
         mock_fetched.snippets = [mock_snippet]
 
         with patch(
-            "compose.services.youtube.utils.YouTubeTranscriptService"
-        ) as mock_service_class:
+            "compose.services.youtube.utils.get_default_service"
+        ) as mock_get_service:
             mock_service = MagicMock()
             mock_service.fetch_transcript_safe.return_value = (
                 "Test transcript content",
                 None,
             )
-            mock_service_class.return_value = mock_service
+            mock_get_service.return_value = mock_service
 
             from compose.services.youtube.utils import get_transcript
 
@@ -385,14 +385,14 @@ class TestGetTranscript:
     def test_get_transcript_error(self):
         """Test transcript retrieval error handling."""
         with patch(
-            "compose.services.youtube.utils.YouTubeTranscriptService"
-        ) as mock_service_class:
+            "compose.services.youtube.utils.get_default_service"
+        ) as mock_get_service:
             mock_service = MagicMock()
             mock_service.fetch_transcript_safe.return_value = (
                 None,
                 "Transcripts disabled",
             )
-            mock_service_class.return_value = mock_service
+            mock_get_service.return_value = mock_service
 
             from compose.services.youtube.utils import get_transcript
 
@@ -440,11 +440,11 @@ class TestGetTranscript:
         mock_cache.exists.return_value = False
 
         with patch(
-            "compose.services.youtube.utils.YouTubeTranscriptService"
-        ) as mock_service_class:
+            "compose.services.youtube.utils.get_default_service"
+        ) as mock_get_service:
             mock_service = MagicMock()
             mock_service.fetch_transcript_safe.return_value = ("Fresh transcript", None)
-            mock_service_class.return_value = mock_service
+            mock_get_service.return_value = mock_service
 
             from compose.services.youtube.utils import get_transcript
 
@@ -455,3 +455,180 @@ class TestGetTranscript:
 
             assert transcript == "Fresh transcript"
             mock_cache.set.assert_called_once()
+
+
+def _fetched(*texts):
+    """Build a fetched transcript mock with one snippet per text."""
+    snippets = []
+    for i, text in enumerate(texts):
+        snippet = MagicMock()
+        snippet.text = text
+        snippet.start = float(i)
+        snippet.duration = 1.0
+        snippets.append(snippet)
+    fetched = MagicMock()
+    fetched.snippets = snippets
+    return fetched
+
+
+class TestPooledFetching:
+    """Test session reuse, combined fetches and fetch_many."""
+
+    @pytest.mark.unit
+    def test_session_reused_across_fetches(self):
+        """One API instance (and pooled session) serves repeated fetches."""
+        with patch(
+            "compose.services.youtube.transcript_service.YouTubeTranscriptApi"
+        ) as mock_api_class:
+            mock_api_class.return_value.fetch.return_value = _fetched("Hello")
+
+            from compose.services.youtube.transcript_service import (
+                YouTubeTranscriptService,
+            )
+
+            service = YouTubeTranscriptService(use_proxy=False, rate_limit=0)
+            service.fetch_transcript("a")
+            service.fetch_timed_transcript("b")
+            service.fetch_transcript("c")
+
+            assert mock_api_class.call_count == 1
+            assert mock_api_class.call_args.kwargs["http_client"] is not None
+
+    @pytest.mark.unit
+    def test_text_and_segments_in_one_request(self):
+        """fetch_transcript_with_segments makes a single API call."""
+        with patch(
+            "compose.services.youtube.transcript_service.YouTubeTranscriptApi"
+        ) as mock_api_class:
+            mock_api = mock_api_class.return_value
+            mock_api.fetch.return_value = _fetched("Hello", "World")
+
+            from compose.services.youtube.transcript_service import (
+                YouTubeTranscriptService,
+            )
+
+            service = YouTubeTranscriptService(use_proxy=False, rate_limit=0)
+            text, segments = service.fetch_transcript_with_segments("test123")
+
+            assert text == "Hello World"
+            assert segments[1] == {"text": "World", "start": 1.0, "duration": 1.0}
+            mock_api.fetch.assert_called_once_with("test123", languages=["en"])
+
+    @pytest.mark.unit
+    def test_blocked_request_resets_session(self):
+        """A blocked kept-alive request retries on a fresh session."""
+        from youtube_transcript_api._errors import RequestBlocked
+
+        with patch(
+            "compose.services.youtube.transcript_service.YouTubeTranscriptApi"
+        ) as mock_api_class:
+            blocked, fresh = MagicMock(), MagicMock()
+            blocked.fetch.side_effect = RequestBlocked("test123")
+            fresh.fetch.return_value = _fetched("Unblocked")
+            mock_api_class.side_effect = [blocked, fresh]
+
+            from compose.services.youtube.transcript_service import (
+                YouTubeTranscriptService,
+            )
+
+            service = YouTubeTranscriptService(use_proxy=False, keep_alive=True, rate_limit=0)
+
+            assert service.fetch_transcript("test123") == "Unblocked"
+            assert mock_api_class.call_count == 2
+
+    @pytest.mark.unit
+    def test_proxied_session_keeps_pool_size_and_retries(self, monkeypatch):
+        """The pooled adapter survives the API's own mount and keeps its Retry."""
+        monkeypatch.delenv("YOUTUBE_TRANSCRIPT_KEEP_ALIVE", raising=False)
+        from compose.services.youtube.transcript_service import YouTubeTranscriptService
+
+        service = YouTubeTranscriptService(
+            proxy_username="u", proxy_password="p", use_proxy=True, rate_limit=0, pool_size=16
+        )
+        session = service._get_api()._fetcher._http_client
+        adapter = session.get_adapter("https://www.youtube.com")
+
+        assert adapter._pool_maxsize == 16
+        assert adapter.max_retries.total == service.proxy_config.retries_when_blocked
+        assert adapter.max_retries.status_forcelist == [429]
+        assert session.get_adapter("http://www.youtube.com") is adapter
+        # Proxy connections are kept alive by default
+        assert service.keep_alive is True
+        assert session.headers["Connection"] == "keep-alive"
+
+    @pytest.mark.unit
+    def test_keep_alive_opt_out(self):
+        """keep_alive=False keeps the library's Connection: close header."""
+        from compose.services.youtube.transcript_service import YouTubeTranscriptService
+
+        service = YouTubeTranscriptService(
+            proxy_username="u", proxy_password="p", use_proxy=True, keep_alive=False, rate_limit=0
+        )
+        session = service._get_api()._fetcher._http_client
+
+        assert session.headers["Connection"] == "close"
+        assert session.get_adapter("https://www.youtube.com").max_retries.total > 0
+
+    @pytest.mark.unit
+    def test_fetch_many_runs_concurrently(self):
+        """Slow fetches overlap across worker threads; errors stay per video."""
+        import time
+        from youtube_transcript_api._errors import TranscriptsDisabled
+
+        def fetch(video_id, languages):
+            time.sleep(0.2)
+            if video_id == "bad":
+                raise TranscriptsDisabled(video_id)
+            return _fetched(f"text {video_id}")
+
+        with patch(
+            "compose.services.youtube.transcript_service.YouTubeTranscriptApi"
+        ) as mock_api_class:
+            mock_api_class.return_value.fetch.side_effect = fetch
+
+            from compose.services.youtube.transcript_service import (
+                YouTubeTranscriptService,
+            )
+
+            service = YouTubeTranscriptService(use_proxy=False, rate_limit=0)
+            start = time.monotonic()
+            results = service.fetch_many(["a", "b", "c", "bad", "a"], max_workers=4)
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 0.6
+        assert set(results) == {"a", "b", "c", "bad"}
+        assert results["b"].ok and results["b"].text == "text b"
+        assert results["b"].segments[0]["text"] == "text b"
+        assert not results["bad"].ok
+        assert results["bad"].error == "Transcripts are disabled for this video"
+
+
+class TestRateLimiter:
+    """Test the per-proxy token bucket."""
+
+    @pytest.mark.unit
+    def test_limits_rate_after_burst(self):
+        """Requests beyond the burst wait for tokens to refill."""
+        import time
+        from compose.services.youtube.transcript_service import RateLimiter
+
+        limiter = RateLimiter(rate=20, burst=2)
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # Two immediate tokens, then two more at 20/s
+        assert 0.08 <= elapsed < 0.5
+
+    @pytest.mark.unit
+    def test_shared_per_proxy(self):
+        """Services on the same proxy share one limiter."""
+        from compose.services.youtube.transcript_service import YouTubeTranscriptService
+
+        first = YouTubeTranscriptService(proxy_username="u", proxy_password="p", use_proxy=True)
+        second = YouTubeTranscriptService(proxy_username="u", proxy_password="p", use_proxy=True)
+        direct = YouTubeTranscriptService(use_proxy=False)
+
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter is not direct.rate_limiter
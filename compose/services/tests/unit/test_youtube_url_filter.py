@@ -6,7 +6,7 @@ Run with: uv run pytest compose/services/tests/unit/test_youtube_url_filter.py -
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import os
 
 
@@ -278,6 +278,74 @@ class TestApplyHeuristicFilter:
         assert result["remaining"] == []
 
 
+class TestHeuristicURLFilter:
+    """Test the precompiled heuristic filter engine."""
+
+    @pytest.mark.unit
+    def test_blocks_subdomain_of_blocked_domain(self):
+        """Host-suffix lookup blocks subdomains of blocked domains."""
+        from compose.services.youtube.url_filter import HeuristicURLFilter
+
+        is_blocked, reason = HeuristicURLFilter().check("https://creator.gumroad.com/l/course")
+
+        assert is_blocked is True
+        assert reason == "Blocked domain: gumroad.com"
+
+    @pytest.mark.unit
+    def test_domain_in_path_is_not_a_domain_match(self):
+        """A blocked domain name appearing only in the path is not a host match."""
+        from compose.services.youtube.url_filter import HeuristicURLFilter
+
+        is_blocked, reason = HeuristicURLFilter().check("https://github.com/someone/bit.ly-clone")
+
+        assert is_blocked is False
+        assert reason is None
+
+    @pytest.mark.unit
+    def test_substring_domain_entries(self):
+        """Domain entries with a path or no TLD still match as substrings."""
+        from compose.services.youtube.url_filter import HeuristicURLFilter
+
+        engine = HeuristicURLFilter()
+
+        assert engine.check("https://www.amazon.com/dp/B000123") == (True, "Blocked domain: amazon.com/dp")
+        assert engine.check("https://linktree.example/me") == (True, "Blocked domain: linktree")
+
+    @pytest.mark.unit
+    def test_pattern_reason_follows_list_order(self):
+        """Reason names the first pattern in list order, not leftmost in URL."""
+        from compose.services.youtube.url_filter import HeuristicURLFilter
+
+        _, reason = HeuristicURLFilter().check("https://shop.example.com/buy/checkout")
+
+        assert reason == "Blocked pattern: checkout"
+
+    @pytest.mark.unit
+    def test_filter_many_custom_lists(self):
+        """filter_many applies custom blocklists and keeps input order."""
+        from compose.services.youtube.url_filter import HeuristicURLFilter
+
+        engine = HeuristicURLFilter(
+            blocked_domains=["spam.com"],
+            blocked_url_patterns=[r"promo"],
+            social_profile_patterns=[],
+        )
+        urls = [
+            "https://a.com/x",
+            "https://spam.com/1",
+            "https://b.com/promo",
+            "https://a.com/x",
+        ]
+
+        result = engine.filter_many(urls)
+
+        assert result["remaining"] == ["https://a.com/x", "https://a.com/x"]
+        assert result["blocked"] == [
+            ("https://spam.com/1", "Blocked domain: spam.com"),
+            ("https://b.com/promo", "Blocked pattern: promo"),
+        ]
+
+
 class TestClassifyUrlWithLlm:
     """Test LLM-based URL classification."""
 
@@ -294,9 +362,7 @@ class TestClassifyUrlWithLlm:
         mock_response.usage.input_tokens = 100
         mock_response.usage.output_tokens = 50
 
-        with patch(
-            "compose.services.youtube.url_filter.Anthropic"
-        ) as mock_anthropic_class:
+        with patch("anthropic.Anthropic") as mock_anthropic_class:
             mock_client = MagicMock()
             mock_client.messages.create.return_value = mock_response
             mock_anthropic_class.return_value = mock_client
@@ -327,9 +393,7 @@ class TestClassifyUrlWithLlm:
         mock_response.usage.input_tokens = 100
         mock_response.usage.output_tokens = 50
 
-        with patch(
-            "compose.services.youtube.url_filter.Anthropic"
-        ) as mock_anthropic_class:
+        with patch("anthropic.Anthropic") as mock_anthropic_class:
             mock_client = MagicMock()
             mock_client.messages.create.return_value = mock_response
             mock_anthropic_class.return_value = mock_client
@@ -367,9 +431,7 @@ class TestClassifyUrlWithLlm:
         mock_response.usage.input_tokens = 100
         mock_response.usage.output_tokens = 80
 
-        with patch(
-            "compose.services.youtube.url_filter.Anthropic"
-        ) as mock_anthropic_class:
+        with patch("anthropic.Anthropic") as mock_anthropic_class:
             mock_client = MagicMock()
             mock_client.messages.create.return_value = mock_response
             mock_anthropic_class.return_value = mock_client
@@ -395,9 +457,7 @@ class TestClassifyUrlWithLlm:
         mock_response.usage.input_tokens = 100
         mock_response.usage.output_tokens = 50
 
-        with patch(
-            "compose.services.youtube.url_filter.Anthropic"
-        ) as mock_anthropic_class:
+        with patch("anthropic.Anthropic") as mock_anthropic_class:
             mock_client = MagicMock()
             mock_client.messages.create.return_value = mock_response
             mock_anthropic_class.return_value = mock_client
@@ -495,21 +555,325 @@ class TestFilterUrls:
         mock_response.usage.input_tokens = 200
         mock_response.usage.output_tokens = 100
 
-        with patch(
-            "compose.services.youtube.url_filter.Anthropic"
-        ) as mock_anthropic_class:
+        with patch("anthropic.AsyncAnthropic") as mock_anthropic_class:
             mock_client = MagicMock()
-            mock_client.messages.create.return_value = mock_response
+            mock_client.messages.create = AsyncMock(return_value=mock_response)
             mock_anthropic_class.return_value = mock_client
 
-            from compose.services.youtube.url_filter import filter_urls
+            from compose.services.youtube.url_filter import (
+                URLClassificationCache,
+                filter_urls,
+            )
 
             result = await filter_urls(
                 description="Check https://docs.python.org for info",
                 video_context={"video_title": "Tutorial"},
                 use_llm=True,
                 api_key="test-key",
+                cache=URLClassificationCache(),
             )
 
             assert result["total_llm_cost"] > 0
             assert len(result["llm_classifications"]) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_filter_urls_batches_urls_into_one_prompt(self):
+        """Several ambiguous URLs are classified with a single LLM call."""
+        mock_response = _batch_response([
+            {"url": "https://docs.python.org", "classification": "content", "confidence": 0.9, "reason": "Docs"},
+            {"url": "https://example.com/course", "classification": "marketing", "confidence": 0.8, "reason": "Course"},
+        ])
+
+        with patch("anthropic.AsyncAnthropic") as mock_anthropic_class:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            mock_anthropic_class.return_value = mock_client
+
+            from compose.services.youtube.url_filter import (
+                URLClassificationCache,
+                filter_urls,
+            )
+
+            result = await filter_urls(
+                description="See https://docs.python.org and https://example.com/course",
+                video_context={"video_title": "Tutorial"},
+                api_key="test-key",
+                cache=URLClassificationCache(),
+            )
+
+            assert mock_client.messages.create.await_count == 1
+            assert result["content_urls"] == ["https://docs.python.org"]
+            assert result["marketing_urls"] == ["https://example.com/course"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_filter_urls_reuses_cached_classification(self):
+        """A URL seen in an earlier video is not sent to the LLM again."""
+        mock_response = _batch_response([
+            {"url": "https://docs.python.org", "classification": "content", "confidence": 0.9, "reason": "Docs"},
+        ])
+
+        with patch("anthropic.AsyncAnthropic") as mock_anthropic_class:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            mock_anthropic_class.return_value = mock_client
+
+            from compose.services.youtube.url_filter import (
+                URLClassificationCache,
+                filter_urls,
+            )
+
+            cache = URLClassificationCache()
+            await filter_urls(
+                description="Docs: https://docs.python.org",
+                video_context={"video_title": "Video 1"},
+                api_key="test-key",
+                cache=cache,
+            )
+            result = await filter_urls(
+                description="Docs: https://www.docs.python.org/",
+                video_context={"video_title": "Video 2"},
+                api_key="test-key",
+                cache=cache,
+            )
+
+            assert mock_client.messages.create.await_count == 1
+            assert result["content_urls"] == ["https://www.docs.python.org/"]
+            assert result["llm_classifications"][0]["cached"] is True
+            assert result["total_llm_cost"] == 0.0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_filter_urls_llm_error_defaults_to_marketing(self):
+        """Failed LLM batches mark URLs as marketing and are not cached."""
+        with patch("anthropic.AsyncAnthropic") as mock_anthropic_class:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(side_effect=RuntimeError("boom"))
+            mock_anthropic_class.return_value = mock_client
+
+            from compose.services.youtube.url_filter import (
+                URLClassificationCache,
+                filter_urls,
+            )
+
+            cache = URLClassificationCache()
+            result = await filter_urls(
+                description="Docs: https://docs.python.org",
+                video_context={"video_title": "Test"},
+                api_key="test-key",
+                cache=cache,
+            )
+
+            assert result["marketing_urls"] == ["https://docs.python.org"]
+            assert "LLM error: boom" in result["llm_classifications"][0]["reason"]
+            assert len(cache) == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_filter_urls_parse_failure_not_cached(self):
+        """URLs missing from the LLM reply are marketing but not cached anywhere."""
+        mock_response = _batch_response([
+            {"url": "https://docs.python.org", "classification": "content", "confidence": 0.9, "reason": "Docs"},
+        ])
+        tracker = _mock_tracker()
+
+        with patch("anthropic.AsyncAnthropic") as mock_anthropic_class:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            mock_anthropic_class.return_value = mock_client
+
+            from compose.services.youtube.url_filter import (
+                URLClassificationCache,
+                filter_urls,
+            )
+
+            cache = URLClassificationCache()
+            result = await filter_urls(
+                description="See https://docs.python.org and https://example.com/course",
+                video_context={"video_title": "Tutorial"},
+                api_key="test-key",
+                cache=cache,
+                pattern_tracker=tracker,
+                video_id="vid1",
+            )
+
+            assert result["content_urls"] == ["https://docs.python.org"]
+            assert result["marketing_urls"] == ["https://example.com/course"]
+            failed = result["llm_classifications"][1]
+            assert "LLM error: Failed to parse" in failed["reason"]
+            assert failed["cost_usd"] > 0
+            assert "https://example.com/course" not in cache
+            cached_urls = [c.kwargs["normalized_url"] for c in tracker.cache_classification.await_args_list]
+            assert cached_urls == ["https://docs.python.org"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_filter_urls_tracker_errors_do_not_abort(self):
+        """A failing tracker write for one URL keeps the other classifications."""
+        mock_response = _batch_response([
+            {"url": "https://docs.python.org", "classification": "content", "confidence": 0.9, "reason": "Docs"},
+            {"url": "https://example.com/course", "classification": "marketing", "confidence": 0.8, "reason": "Course"},
+        ])
+        tracker = _mock_tracker()
+        tracker.cache_classification.side_effect = RuntimeError("db down")
+        tracker.record_classification.side_effect = [RuntimeError("db down"), None]
+
+        with patch("anthropic.AsyncAnthropic") as mock_anthropic_class:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            mock_anthropic_class.return_value = mock_client
+
+            from compose.services.youtube.url_filter import (
+                URLClassificationCache,
+                filter_urls,
+            )
+
+            result = await filter_urls(
+                description="See https://docs.python.org and https://example.com/course",
+                video_context={"video_title": "Tutorial"},
+                api_key="test-key",
+                cache=URLClassificationCache(),
+                pattern_tracker=tracker,
+                video_id="vid1",
+            )
+
+            assert result["content_urls"] == ["https://docs.python.org"]
+            assert result["marketing_urls"] == ["https://example.com/course"]
+            assert tracker.record_classification.await_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_filter_urls_cache_read_error_falls_back_to_llm(self):
+        """Failing tracker reads fall back to classifying the URLs with the LLM."""
+        mock_response = _batch_response([
+            {"url": "https://docs.python.org", "classification": "content", "confidence": 0.9, "reason": "Docs"},
+        ])
+        tracker = _mock_tracker()
+        tracker.check_learned_patterns.side_effect = RuntimeError("db down")
+        tracker.get_cached_classifications.side_effect = RuntimeError("db down")
+
+        with patch("anthropic.AsyncAnthropic") as mock_anthropic_class:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            mock_anthropic_class.return_value = mock_client
+
+            from compose.services.youtube.url_filter import (
+                URLClassificationCache,
+                filter_urls,
+            )
+
+            result = await filter_urls(
+                description="Docs: https://docs.python.org",
+                video_context={"video_title": "Tutorial"},
+                api_key="test-key",
+                cache=URLClassificationCache(),
+                pattern_tracker=tracker,
+                video_id="vid1",
+            )
+
+            assert result["content_urls"] == ["https://docs.python.org"]
+            assert mock_client.messages.create.await_count == 1
+
+
+def _mock_tracker() -> MagicMock:
+    """Build a pattern tracker mock with no learned or persisted classifications."""
+    tracker = MagicMock()
+    tracker.check_learned_patterns = AsyncMock(return_value=None)
+    tracker.get_cached_classifications = AsyncMock(return_value={})
+    tracker.cache_classification = AsyncMock()
+    tracker.record_classification = AsyncMock()
+    tracker.add_learned_pattern = AsyncMock()
+    return tracker
+
+
+def _batch_response(items: list[dict]) -> MagicMock:
+    """Build a mock Anthropic response containing a JSON array."""
+    import json
+
+    mock_response = MagicMock()
+    mock_response.content = [MagicMock(text=json.dumps(items))]
+    mock_response.usage = MagicMock()
+    mock_response.usage.input_tokens = 300
+    mock_response.usage.output_tokens = 120
+    return mock_response
+
+
+class TestNormalizeUrl:
+    """Test cache key normalization."""
+
+    @pytest.mark.unit
+    def test_normalize_case_www_fragment_and_slash(self):
+        """Host case, www prefix, fragment and trailing slash are ignored."""
+        from compose.services.youtube.url_filter import normalize_url
+
+        assert normalize_url("HTTPS://www.GitHub.com/user/repo/#readme") == "https://github.com/user/repo"
+
+    @pytest.mark.unit
+    def test_normalize_keeps_query(self):
+        """Query strings are part of the key."""
+        from compose.services.youtube.url_filter import normalize_url
+
+        assert normalize_url("https://example.com/p?id=1") == "https://example.com/p?id=1"
+
+
+class TestURLClassificationCache:
+    """Test in-memory classification cache."""
+
+    @pytest.mark.unit
+    def test_get_put_and_stats(self):
+        """Entries are found by normalized URL and hits/misses are counted."""
+        from compose.services.youtube.url_filter import URLClassificationCache
+
+        cache = URLClassificationCache()
+        assert cache.get("https://example.com") is None
+
+        cache.put("https://example.com/", {"classification": "content"})
+
+        assert cache.get("https://www.example.com")["classification"] == "content"
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self):
+        """Cache stays within max_entries by evicting LRU entries."""
+        from compose.services.youtube.url_filter import URLClassificationCache
+
+        cache = URLClassificationCache(max_entries=2)
+        cache.put("https://a.com", {"classification": "content"})
+        cache.put("https://b.com", {"classification": "content"})
+        cache.get("https://a.com")
+        cache.put("https://c.com", {"classification": "content"})
+
+        assert "https://a.com" in cache
+        assert "https://b.com" not in cache
+        assert len(cache) == 2
+
+
+class TestParseBatchResponse:
+    """Test batch LLM response parsing."""
+
+    @pytest.mark.unit
+    def test_matches_items_by_url(self):
+        """Items are matched by URL regardless of order."""
+        from compose.services.youtube.url_filter import _parse_batch_response
+
+        text = """```json
+        [{"url": "https://b.com", "classification": "marketing", "confidence": 0.8, "reason": "B"},
+         {"url": "https://a.com", "classification": "content", "confidence": 0.9, "reason": "A"}]
+        ```"""
+        results = _parse_batch_response(text, ["https://a.com", "https://b.com"])
+
+        assert [r["classification"] for r in results] == ["content", "marketing"]
+
+    @pytest.mark.unit
+    def test_missing_items_fall_back_to_marketing(self):
+        """URLs absent from the response get the parse-failure fallback."""
+        from compose.services.youtube.url_filter import _parse_batch_response
+
+        results = _parse_batch_response("not json", ["https://a.com"])
+
+        assert results[0]["classification"] == "marketing"
+        assert results[0]["confidence"] == 0.5
+        assert "Failed to parse" in results[0]["reason"]
+        assert results[0]["parsed"] is False
@@ -0,0 +1,255 @@
+"""Incrementally maintained file trees for vaults.
+
+The Studio sidebar asks for a vault's file tree on every navigation.
+VaultTreeCache loads a vault's note paths once, then keeps a folder index
+up to date as NoteService creates, renames and deletes notes. Serving the
+tree, or a single folder level for lazy expansion, needs no database query.
+
+Every change bumps the tree's version, which is exposed as an ETag. Clients
+revalidate with If-None-Match and get a 304 while the tree is unchanged.
+
+Notes written by other processes are not seen until the entry expires
+after VAULT_TREE_TTL seconds and is reloaded.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+from .surrealdb.models import FileTreeNode
+
+# Settings
+VAULT_TREE_TTL = float(os.getenv("VAULT_TREE_TTL", "300"))  # Seconds before a reload
+
+TreeLoader = Callable[[str], Awaitable[list[dict]]]
+
+
+def _vault_key(vault_id) -> str:
+    """Normalize a vault ID (``abc`` or record form ``vault:abc``)."""
+    vault_id = str(vault_id)
+    if vault_id.startswith("vault:"):
+        return vault_id.split(":", 1)[1]
+    return vault_id
+
+
+def _split(path: str) -> tuple[list[str], str]:
+    """Split a note path into its folder names and file name."""
+    parts = [part for part in path.split("/") if part]
+    if not parts:
+        return [], path
+    return parts[:-1], parts[-1]
+
+
+def _sort_key(node: FileTreeNode) -> tuple[int, str]:
+    """Folders first, then alphabetically."""
+    return (0 if node.type == "folder" else 1, node.name.lower())
+
+
+@dataclass
+class _Folder:
+    """One folder level: subfolder names and files by name."""
+
+    folders: set[str] = field(default_factory=set)
+    files: dict[str, tuple[str, str]] = field(default_factory=dict)  # name -> (path, note_id)
+
+
+class VaultTree:
+    """Folder index of one vault's notes.
+
+    Folders are keyed by path ("" is the root), so any level can be listed
+    without walking the tree.
+    """
+
+    def __init__(self):
+        """Initialize an empty tree."""
+        self._folders: dict[str, _Folder] = {"": _Folder()}
+        self._token = uuid.uuid4().hex[:8]
+        self._nodes: Optional[list[FileTreeNode]] = None
+        self.version = 0
+        self.loaded_at = time.monotonic()
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "VaultTree":
+        """Build a tree from note records with ``id`` and ``path``."""
+        tree = cls()
+        for r in records:
+            note_id = str(r.get("id", ""))
+            if ":" in note_id:
+                note_id = note_id.split(":", 1)[1]
+            tree._insert(r.get("path", ""), note_id)
+        return tree
+
+    @property
+    def etag(self) -> str:
+        """Weak ETag identifying this version of the tree."""
+        return f'W/"{self._token}-{self.version}"'
+
+    def _insert(self, path: str, note_id: str) -> None:
+        folders, name = _split(path)
+        parent = ""
+        for part in folders:
+            child = f"{parent}/{part}" if parent else part
+            self._folders[parent].folders.add(part)
+            self._folders.setdefault(child, _Folder())
+            parent = child
+        self._folders[parent].files[name] = (path, note_id)
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._nodes = None
+
+    def add(self, path: str, note_id: str) -> None:
+        """Add (or replace) the note at a path."""
+        self._insert(path, note_id)
+        self._changed()
+
+    def remove(self, path: str) -> bool:
+        """Remove the note at a path, pruning folders left empty.
+
+        Returns:
+            True if the note was in the tree
+        """
+        folders, name = _split(path)
+        parent = "/".join(folders)
+        folder = self._folders.get(parent)
+        if folder is None or folder.files.pop(name, None) is None:
+            return False
+
+        while parent and not folder.folders and not folder.files:
+            del self._folders[parent]
+            grandparent, _, folder_name = parent.rpartition("/")
+            folder = self._folders[grandparent]
+            folder.folders.discard(folder_name)
+            parent = grandparent
+
+        self._changed()
+        return True
+
+    def level(self, folder_path: str = "") -> Optional[list[FileTreeNode]]:
+        """List one folder level; subfolders are returned without children.
+
+        Args:
+            folder_path: Folder path ("" for the vault root)
+
+        Returns:
+            Sorted nodes, or None if the folder doesn't exist
+        """
+        folder_path = "/".join(part for part in folder_path.split("/") if part)
+        folder = self._folders.get(folder_path)
+        if folder is None:
+            return None
+
+        nodes = [
+            FileTreeNode(
+                name=name,
+                path=f"{folder_path}/{name}" if folder_path else name,
+                type="folder",
+            )
+            for name in folder.folders
+        ]
+        nodes.extend(
+            FileTreeNode(name=name, path=path, type="file", note_id=note_id)
+            for name, (path, note_id) in folder.files.items()
+        )
+        nodes.sort(key=_sort_key)
+        return nodes
+
+    def nodes(self) -> list[FileTreeNode]:
+        """Full nested tree (memoized until the next change; treat as read-only)."""
+        if self._nodes is None:
+            self._nodes = self._build("")
+        return self._nodes
+
+    def _build(self, folder_path: str) -> list[FileTreeNode]:
+        nodes = self.level(folder_path) or []
+        for node in nodes:
+            if node.type == "folder":
+                node.children = self._build(node.path)
+        return nodes
+
+
+class VaultTreeCache:
+    """Per-vault VaultTree cache, updated in place on note changes.
+
+    Example:
+        >>> cache = VaultTreeCache(load_note_paths)
+        >>> tree = await cache.get(vault_id)
+        >>> cache.add(vault_id, "inbox/idea.md", note_id)
+    """
+
+    def __init__(self, loader: TreeLoader, ttl: float = VAULT_TREE_TTL):
+        """Initialize cache.
+
+        Args:
+            loader: Async function returning a vault's note records (id, path)
+            ttl: Seconds a loaded tree is served before it is reloaded
+        """
+        self._loader = loader
+        self.ttl = ttl
+        self._trees: dict[str, VaultTree] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        # Bumped on every change, so a load racing a write isn't cached
+        self._generations: dict[str, int] = {}
+
+    def peek(self, vault_id: str) -> Optional[VaultTree]:
+        """Cached tree if present and fresh, without loading."""
+        tree = self._trees.get(_vault_key(vault_id))
+        if tree is None or time.monotonic() - tree.loaded_at >= self.ttl:
+            return None
+        return tree
+
+    async def get(self, vault_id: str) -> VaultTree:
+        """Get a vault's tree, loading it on first use or after expiry."""
+        key = _vault_key(vault_id)
+        tree = self.peek(key)
+        if tree is not None:
+            return tree
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            tree = self.peek(key)
+            if tree is not None:
+                return tree
+
+            generation = self._generations.get(key, 0)
+            tree = VaultTree.from_records(await self._loader(key))
+            if self._generations.get(key, 0) == generation:
+                self._trees[key] = tree
+            return tree
+
+    def _touch(self, key: str) -> Optional[VaultTree]:
+        self._generations[key] = self._generations.get(key, 0) + 1
+        return self._trees.get(key)
+
+    def add(self, vault_id: str, path: str, note_id: str) -> None:
+        """Record a created note."""
+        tree = self._touch(_vault_key(vault_id))
+        if tree is not None:
+            tree.add(path, note_id)
+
+    def move(self, vault_id: str, old_path: str, new_path: str, note_id: str) -> None:
+        """Record a renamed or moved note."""
+        tree = self._touch(_vault_key(vault_id))
+        if tree is not None:
+            tree.remove(old_path)
+            tree.add(new_path, note_id)
+
+    def remove(self, vault_id: str, path: str) -> None:
+        """Record a deleted note."""
+        tree = self._touch(_vault_key(vault_id))
+        if tree is not None:
+            tree.remove(path)
+
+    def invalidate(self, vault_id: str) -> None:
+        """Drop a vault's tree (e.g. when the vault is deleted)."""
+        key = _vault_key(vault_id)
+        self._touch(key)
+        self._trees.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all trees."""
+        for key in list(self._trees):
+            self.invalidate(key)
@@ -11,10 +11,12 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from .minio.cache import get_object_cache
 from .minio.client import MinIOClient
 from .minio.config import MinIOConfig
 from .surrealdb.driver import execute_query
 from .surrealdb.models import FileTreeNode, VaultRecord
+from .vault_tree import VaultTree, VaultTreeCache
 
 
 class VaultMeta(BaseModel):
@@ -97,8 +99,9 @@ class VaultService:
         """Initialize vault service with MinIO client."""
         config = MinIOConfig()
         config.bucket = "mentat-vaults"
-        self._minio = MinIOClient(config)
+        self._minio = MinIOClient(config, cache=get_object_cache())
         self._minio.ensure_bucket()
+        self.tree_cache = VaultTreeCache(self._load_tree_records)
 
     async def list_vaults(self) -> list[VaultMeta]:
         """List all vaults with note counts.
@@ -335,83 +338,59 @@ class VaultService:
 
         # Delete the vault
         await execute_query("DELETE vault WHERE id = $id;", {"id": vault_id})
+        self.tree_cache.invalidate(vault_id)
 
         return True
 
-    async def get_file_tree(self, vault_id: str) -> list[FileTreeNode]:
-        """Get file tree structure for a vault.
+    async def vault_exists(self, vault_id: str) -> bool:
+        """Check whether a vault exists, without counting its notes.
 
         Args:
             vault_id: Vault ID
 
         Returns:
-            List of root-level FileTreeNode objects representing folder/file structure
+            True if the vault exists
         """
+        # A cached tree means the vault existed and wasn't deleted since
+        if self.tree_cache.peek(vault_id) is not None:
+            return True
+
+        results = await execute_query(
+            'SELECT id FROM type::thing("vault", $id) LIMIT 1;',
+            {"id": vault_id},
+        )
+        return bool(results)
+
+    async def _load_tree_records(self, vault_id: str) -> list[dict]:
+        """Load note IDs and paths for a vault's tree cache."""
         query = """
-        SELECT id, path, title FROM note
-        WHERE vault_id = $vault_id
-        ORDER BY path ASC;
+        SELECT id, path FROM note
+        WHERE vault_id = $vault_id;
         """
+        return await execute_query(query, {"vault_id": vault_id})
 
-        results = await execute_query(query, {"vault_id": vault_id})
+    async def get_vault_tree(self, vault_id: str) -> VaultTree:
+        """Get the cached file tree of a vault (loaded on first use).
 
-        # Build tree from flat path list
-        root_nodes: dict[str, FileTreeNode] = {}
+        Args:
+            vault_id: Vault ID
 
-        for r in results:
-            path = r.get("path", "")
-            title = r.get("title", "Untitled")
-            note_id = str(r.get("id", ""))
-            if ":" in note_id:
-                note_id = note_id.split(":", 1)[1]
-
-            parts = path.split("/")
-
-            # Create folder nodes as needed
-            current_dict = root_nodes
-            current_path = ""
-
-            for i, part in enumerate(parts[:-1]):
-                current_path = f"{current_path}/{part}" if current_path else part
-
-                if part not in current_dict:
-                    folder_node = FileTreeNode(
-                        name=part,
-                        path=current_path,
-                        type="folder",
-                        children=[],
-                    )
-                    current_dict[part] = folder_node
-
-                # Navigate into children dict
-                folder = current_dict[part]
-                if not hasattr(folder, "_children_dict"):
-                    folder._children_dict = {}
-                current_dict = folder._children_dict
-
-            # Add file node
-            filename = parts[-1]
-            file_node = FileTreeNode(
-                name=filename,
-                path=path,
-                type="file",
-                note_id=note_id,
-            )
-            current_dict[filename] = file_node
-
-        # Convert nested dicts to children lists
-        def flatten_dict(d: dict) -> list[FileTreeNode]:
-            result = []
-            for node in d.values():
-                if hasattr(node, "_children_dict"):
-                    node.children = flatten_dict(node._children_dict)
-                    delattr(node, "_children_dict")
-                result.append(node)
-            # Sort: folders first, then alphabetically
-            result.sort(key=lambda n: (0 if n.type == "folder" else 1, n.name.lower()))
-            return result
-
-        return flatten_dict(root_nodes)
+        Returns:
+            VaultTree with the vault's folder index and ETag
+        """
+        return await self.tree_cache.get(vault_id)
+
+    async def get_file_tree(self, vault_id: str) -> list[FileTreeNode]:
+        """Get file tree structure for a vault.
+
+        Args:
+            vault_id: Vault ID
+
+        Returns:
+            List of root-level FileTreeNode objects representing folder/file structure
+        """
+        tree = await self.get_vault_tree(vault_id)
+        return tree.nodes()
 
     def get_minio_path(self, vault_slug: str, note_path: str) -> str:
         """Get MinIO object path for a note.
@@ -450,9 +429,7 @@ class VaultService:
             Note content or None if not found
         """
         minio_path = self.get_minio_path(vault_slug, note_path)
-        if not self._minio.exists(minio_path):
-            return None
-        return self._minio.get_text(minio_path)
+        return self._minio.get_text(minio_path, missing_ok=True)
 
     def delete_note_content(self, vault_slug: str, note_path: str) -> None:
         """Delete note content from MinIO.
@@ -461,9 +438,9 @@ class VaultService:
             vault_slug: Vault slug
             note_path: Note path within vault
         """
+        # Deleting a missing object is a no-op in S3, so no exists() check
         minio_path = self.get_minio_path(vault_slug, note_path)
-        if self._minio.exists(minio_path):
-            self._minio.delete(minio_path)
+        self._minio.delete(minio_path)
 
 
 # Singleton service instance
@@ -6,8 +6,11 @@ This module provides:
 - get_transcript: Fetch video transcripts using proxy-enabled service
 - YouTubeTranscriptService: Low-level transcript fetching with proxy support
 - get_default_service: Get singleton YouTubeTranscriptService instance
+- TranscriptResult: Per-video result of YouTubeTranscriptService.fetch_many
 - YouTubeMetadataService: YouTube Data API v3 metadata fetching
 - fetch_video_metadata: Convenience function for fetching metadata
+- fetch_videos_metadata: Batched metadata fetch (50 IDs per API call)
+- ChannelSync: Incremental channel upload sync into the pending CSV queue
 
 Example:
     >>> from compose.services.youtube import extract_video_id, get_transcript
@@ -19,13 +22,19 @@ Example:
 """
 
 from .utils import extract_video_id, get_video_info, get_transcript, get_timed_transcript
-from .transcript_service import YouTubeTranscriptService, get_default_service
-from .metadata_service import YouTubeMetadataService, fetch_video_metadata
+from .transcript_service import YouTubeTranscriptService, TranscriptResult, get_default_service
+from .metadata_service import YouTubeMetadataService, fetch_video_metadata, fetch_videos_metadata
+from .channel_sync import ChannelSync, ChannelSyncResult, SyncedRange, get_youtube_client
 from .url_filter import (
     extract_urls,
     is_blocked_by_heuristic,
     apply_heuristic_filter,
+    normalize_url,
+    URLClassificationCache,
+    get_classification_cache,
     classify_url_with_llm,
+    classify_urls_with_llm_async,
+    classify_filtered_urls,
     filter_urls,
 )
 
@@ -36,11 +45,22 @@ __all__ = [
     "get_timed_transcript",
     "YouTubeTranscriptService",
     "get_default_service",
+    "TranscriptResult",
     "YouTubeMetadataService",
     "fetch_video_metadata",
+    "fetch_videos_metadata",
+    "ChannelSync",
+    "ChannelSyncResult",
+    "SyncedRange",
+    "get_youtube_client",
     "extract_urls",
     "is_blocked_by_heuristic",
     "apply_heuristic_filter",
+    "normalize_url",
+    "URLClassificationCache",
+    "get_classification_cache",
     "classify_url_with_llm",
+    "classify_urls_with_llm_async",
+    "classify_filtered_urls",
     "filter_urls",
 ]
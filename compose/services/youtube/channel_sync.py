@@ -0,0 +1,485 @@
+"""Incremental YouTube channel sync into the pending CSV queue.
+
+ChannelSync walks a channel's uploads playlist newest first. It writes each
+page of videos to the queue CSV as soon as that page's details arrive, so
+nothing is held in memory until the end of the walk.
+
+- The built Data API client is cached per API key (get_youtube_client).
+  Building it parses the discovery document, so it is done only once.
+- Requests run in worker threads. Each thread has its own httplib2.Http,
+  because httplib2 is not thread-safe; threads are reused, so connections
+  are reused too. The event loop is never blocked.
+- Rows are written to ``<name>.csv.part`` and renamed to ``<name>.csv`` when
+  the walk finishes. The queue worker only picks up ``*.csv``, so it never
+  sees a partial file.
+- After a sync, the spans of the channel's uploads that have been walked
+  completely are saved in ``.channel_sync.json`` in the queue directory.
+  Later syncs skip uploads inside a saved span. They stop as soon as the
+  rest of the requested range is covered. So re-ingesting a channel
+  fetches only new uploads. A sync cut short by max_videos, or a wider
+  range than before, still fetches whatever is missing.
+
+Example:
+    >>> sync = ChannelSync(queue_base=Path("compose/data/queues"))
+    >>> result = await sync.sync("https://www.youtube.com/@NateBJones")
+    >>> print(result.video_count, result.csv_path)
+"""
+
+import asyncio
+import csv
+import json
+import os
+import re
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Optional
+
+from .metadata_service import YouTubeMetadataService
+
+# Columns of the channel CSV consumed by the queue worker
+CSV_FIELDS = ["title", "url", "upload_date", "view_count", "channel_id", "channel_name"]
+
+# playlistItems.list / videos.list page size limit
+PAGE_SIZE = 50
+
+STATE_FILENAME = ".channel_sync.json"
+
+# Built discovery clients, keyed by API key
+_clients: dict[str, Any] = {}
+_clients_lock = threading.Lock()
+_thread_local = threading.local()
+
+
+def get_youtube_client(api_key: str) -> Any:
+    """Get the Data API v3 client for an API key, building it on first use.
+
+    The client object is shared across threads; requests made from worker
+    threads must be executed with that thread's own Http (see _thread_http).
+
+    Args:
+        api_key: YouTube Data API v3 key
+
+    Returns:
+        googleapiclient Resource for the youtube v3 API
+    """
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            from googleapiclient.discovery import build
+
+            client = build("youtube", "v3", developerKey=api_key, cache_discovery=False)
+            _clients[api_key] = client
+        return client
+
+
+def reset_youtube_clients() -> None:
+    """Drop cached clients (for testing)."""
+    with _clients_lock:
+        _clients.clear()
+
+
+def _thread_http() -> Any:
+    """httplib2.Http owned by the current thread (reused across requests)."""
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        import httplib2
+
+        http = _thread_local.http = httplib2.Http()
+    return http
+
+
+def channel_username(url: str) -> Optional[str]:
+    """Extract the @handle from a channel URL (without the @)."""
+    match = re.search(r"@([^/?#]+)", url)
+    return match.group(1) if match else None
+
+
+def parse_published(value: str) -> datetime:
+    """Parse a Data API publishedAt timestamp (UTC)."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@dataclass
+class SyncedRange:
+    """Span of a channel's uploads that has been walked completely.
+
+    Every upload published between the two bounds (inclusive) has been
+    fetched. The newest bound is an upload. The oldest bound is either an
+    upload (a sync cut short by max_videos) or a cutoff time (oldest_video_id
+    is None). If oldest_published_at is None, the span reaches back to the
+    channel's first upload.
+    """
+
+    newest_published_at: str
+    newest_video_id: str
+    oldest_published_at: Optional[str] = None
+    oldest_video_id: Optional[str] = None
+    synced_at: str = ""
+
+    def covers(self, video_id: str, published: datetime) -> bool:
+        """Whether an upload lies inside the span."""
+        newest = parse_published(self.newest_published_at)
+        if published > newest or (published == newest and video_id != self.newest_video_id):
+            return False
+        if self.oldest_published_at is None:
+            return True
+        oldest = parse_published(self.oldest_published_at)
+        if published == oldest:
+            return self.oldest_video_id is None or video_id == self.oldest_video_id
+        return published > oldest
+
+    def reaches(self, cutoff: Optional[datetime]) -> bool:
+        """Whether the span extends back to cutoff (None: the first upload)."""
+        if self.oldest_published_at is None:
+            return True
+        return cutoff is not None and parse_published(self.oldest_published_at) <= cutoff
+
+    def overlaps(self, other: "SyncedRange") -> bool:
+        """Whether two spans overlap or touch."""
+        return (
+            parse_published(self.newest_published_at) >= _oldest_bound(other)[0]
+            and parse_published(other.newest_published_at) >= _oldest_bound(self)[0]
+        )
+
+
+def _oldest_bound(span: SyncedRange) -> tuple[datetime, int]:
+    """Sort key of a span's oldest bound (smaller reaches further back)."""
+    if span.oldest_published_at is None:
+        return datetime.min.replace(tzinfo=timezone.utc), 0
+    # A cutoff bound includes every upload at that time, an upload bound only itself
+    return parse_published(span.oldest_published_at), 0 if span.oldest_video_id is None else 1
+
+
+def merge_ranges(ranges: list[SyncedRange], new: SyncedRange) -> list[SyncedRange]:
+    """Add a span to a channel's spans, merging any it overlaps.
+
+    Returns:
+        Disjoint spans, newest first
+    """
+    merged = new
+    result = []
+    for span in ranges:
+        if not span.overlaps(merged):
+            result.append(span)
+            continue
+        newer = max(span, merged, key=lambda r: parse_published(r.newest_published_at))
+        older = min(span, merged, key=_oldest_bound)
+        merged = SyncedRange(
+            newest_published_at=newer.newest_published_at,
+            newest_video_id=newer.newest_video_id,
+            oldest_published_at=older.oldest_published_at,
+            oldest_video_id=older.oldest_video_id,
+            synced_at=new.synced_at,
+        )
+    result.append(merged)
+    result.sort(key=lambda r: parse_published(r.newest_published_at), reverse=True)
+    return result
+
+
+class ChannelSyncState:
+    """Per-channel synced spans persisted as a JSON file."""
+
+    def __init__(self, path: Path):
+        """Initialize state store.
+
+        Args:
+            path: JSON file holding {channel_id: [span, ...]}
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, list[dict]]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, channel_id: str) -> list[SyncedRange]:
+        """Synced spans of a channel, newest first (empty if never synced)."""
+        data = self._load().get(channel_id)
+        if not isinstance(data, list):
+            return []
+        return [SyncedRange(**span) for span in data]
+
+    def set(self, channel_id: str, ranges: list[SyncedRange]) -> None:
+        """Save a channel's synced spans (atomic file replace)."""
+        with self._lock:
+            data = self._load()
+            data[channel_id] = [asdict(span) for span in ranges]
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+
+
+@dataclass
+class ChannelSyncResult:
+    """Outcome of one channel sync."""
+
+    channel_id: str
+    channel_name: str
+    video_count: int
+    csv_path: Optional[Path]
+    since: Optional[SyncedRange]  # Newest span synced before this run
+    synced: list[SyncedRange]  # Spans synced after this run, newest first
+
+
+def video_row(video: dict, published_at: str, channel_id: str, channel_name: str) -> dict:
+    """Build a CSV row from a videos.list item.
+
+    Includes CSV_FIELDS plus ``duration`` (h:mm:ss) and ``description``
+    (first 200 chars) for callers that write those columns too.
+    """
+    snippet = video["snippet"]
+    statistics = video.get("statistics", {})
+    duration = video.get("contentDetails", {}).get("duration", "")
+    return {
+        "title": snippet["title"],
+        "url": f"https://www.youtube.com/watch?v={video['id']}",
+        "upload_date": parse_published(published_at).strftime("%Y-%m-%d"),
+        "view_count": statistics.get("viewCount", "0"),
+        "channel_id": channel_id,
+        "channel_name": channel_name,
+        "duration": YouTubeMetadataService.format_duration(duration) if duration else "",
+        "description": snippet.get("description", "")[:200],
+    }
+
+
+class ChannelSync:
+    """Fetch a channel's new uploads into a pending queue CSV."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        queue_base: Path = Path("compose/data/queues"),
+        client: Any = None,
+    ):
+        """Initialize channel sync.
+
+        Args:
+            api_key: YouTube Data API v3 key (uses YOUTUBE_API_KEY env var if not provided)
+            queue_base: Queue directory (CSV goes to pending/, state next to it)
+            client: Prebuilt API client (default: cached client for api_key)
+
+        Raises:
+            ValueError: If no API key is available
+        """
+        if client is None:
+            api_key = api_key or os.getenv("YOUTUBE_API_KEY")
+            if not api_key:
+                raise ValueError("YOUTUBE_API_KEY not configured")
+            client = get_youtube_client(api_key)
+        self.youtube = client
+        self.pending_dir = Path(queue_base) / "pending"
+        self.state = ChannelSyncState(Path(queue_base) / STATE_FILENAME)
+
+    async def _execute(self, request: Any) -> dict:
+        """Execute an API request in a worker thread."""
+        return await asyncio.to_thread(lambda: request.execute(http=_thread_http()))
+
+    async def find_channel(self, username: str) -> Optional[tuple[str, str]]:
+        """Look up a channel by handle.
+
+        Returns:
+            (channel_id, channel_name), or None if no channel matched
+        """
+        response = await self._execute(
+            self.youtube.search().list(part="snippet", q=username, type="channel", maxResults=1)
+        )
+        items = response.get("items") or []
+        if not items:
+            return None
+        return items[0]["snippet"]["channelId"], items[0]["snippet"]["title"]
+
+    async def uploads_playlist_id(self, channel_id: str) -> Optional[str]:
+        """Uploads playlist of a channel, or None if the channel is unknown."""
+        response = await self._execute(
+            self.youtube.channels().list(part="contentDetails", id=channel_id)
+        )
+        items = response.get("items") or []
+        if not items:
+            return None
+        return items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
+
+    async def iter_uploads(self, playlist_id: str) -> AsyncIterator[list[tuple[str, str]]]:
+        """Yield pages of (video_id, publishedAt), newest first.
+
+        Pages are requested lazily, so a caller that stops iterating
+        requests no further pages.
+        """
+        page_token = None
+        while True:
+            response = await self._execute(
+                self.youtube.playlistItems().list(
+                    part="snippet,contentDetails",
+                    playlistId=playlist_id,
+                    maxResults=PAGE_SIZE,
+                    pageToken=page_token,
+                )
+            )
+            page = [
+                (item["contentDetails"]["videoId"], item["snippet"]["publishedAt"])
+                for item in response.get("items", [])
+            ]
+            if page:
+                yield page
+            page_token = response.get("nextPageToken")
+            if not page or not page_token:
+                return
+
+    def _csv_path(self, filename: str) -> Path:
+        """Pending CSV path, not clobbering an earlier batch still queued."""
+        path = self.pending_dir / filename
+        if path.exists():
+            stamp = datetime.now().strftime("%Y%m%d%H%M%S")
+            path = path.with_name(f"{path.stem}_{stamp}{path.suffix}")
+        return path
+
+    async def sync(
+        self,
+        url: str,
+        cutoff: Optional[datetime] = None,
+        max_videos: Optional[int] = None,
+        full: bool = False,
+        filename: Optional[str] = None,
+        fields: list[str] = CSV_FIELDS,
+        on_page: Optional[Callable[[int], None]] = None,
+    ) -> ChannelSyncResult:
+        """Fetch a channel's not yet synced uploads into a pending CSV.
+
+        Walks the uploads newest first. Uploads inside spans saved by earlier
+        syncs are skipped. The walk stops at the cutoff, after max_videos
+        fetched videos, or once a synced span reaches the cutoff. The span
+        walked this time is then merged into the saved ones. A sync cut short
+        by max_videos, or an older cutoff than before, is therefore continued
+        by the next sync and no uploads are lost.
+
+        Args:
+            url: Channel URL with an @handle
+            cutoff: Skip uploads published before this (timezone-aware) time
+            max_videos: Stop after fetching this many videos
+            full: Re-fetch uploads inside already synced spans too
+            filename: CSV filename (default: <handle>_videos.csv)
+            fields: CSV columns (see video_row for the available ones)
+            on_page: Called with the running video count after each page
+
+        Returns:
+            ChannelSyncResult (csv_path is None when nothing was fetched)
+
+        Raises:
+            ValueError: If the URL has no handle or the channel isn't found
+            HttpError: If an API request fails
+        """
+        username = channel_username(url)
+        if not username:
+            raise ValueError("Could not extract channel username from URL")
+
+        channel = await self.find_channel(username)
+        if channel is None:
+            raise ValueError(f"Channel not found: {username}")
+        channel_id, channel_name = channel
+
+        playlist_id = await self.uploads_playlist_id(channel_id)
+        if playlist_id is None:
+            raise ValueError("Could not get channel details")
+
+        stored = self.state.get(channel_id)
+        skip_ranges = [] if full else stored
+        csv_path = self._csv_path(filename or f"{username.lower().replace('-', '_')}_videos.csv")
+        part_path = csv_path.with_name(csv_path.name + ".part")
+
+        # The walk covers the playlist from its newest upload down to `bottom`:
+        # uploads are either fetched or already inside a synced span.
+        count = 0
+        newest: Optional[tuple[str, str]] = None
+        bottom: Optional[tuple[str, Optional[str]]] = None  # None: reached the first upload
+        file = None
+        uploads = self.iter_uploads(playlist_id)
+        try:
+            async for page in uploads:
+                if newest is None:
+                    newest = page[0]
+
+                batch = []
+                stopped = False
+                for video_id, published_at in page:
+                    published = parse_published(published_at)
+                    if cutoff and published < cutoff:
+                        bottom, stopped = (cutoff.isoformat(), None), True
+                        break
+                    span = next((r for r in skip_ranges if r.covers(video_id, published)), None)
+                    if span is not None:
+                        if span.reaches(cutoff):
+                            # Everything from here back to the cutoff is synced
+                            if span.oldest_published_at is not None:
+                                bottom = (span.oldest_published_at, span.oldest_video_id)
+                            stopped = True
+                            break
+                        continue
+                    batch.append((video_id, published_at))
+                    if max_videos and count + len(batch) >= max_videos:
+                        bottom, stopped = (published_at, video_id), True
+                        break
+
+                if batch:
+                    response = await self._execute(
+                        self.youtube.videos().list(
+                            part="snippet,statistics,contentDetails",
+                            id=",".join(video_id for video_id, _ in batch),
+                        )
+                    )
+                    details = {video["id"]: video for video in response.get("items", [])}
+
+                    if file is None:
+                        self.pending_dir.mkdir(parents=True, exist_ok=True)
+                        file = open(part_path, "w", newline="", encoding="utf-8")
+                        writer = csv.DictWriter(file, fieldnames=fields, extrasaction="ignore")
+                        writer.writeheader()
+                    # Playlist order (newest first); deleted/private videos have no details
+                    for video_id, published_at in batch:
+                        if video_id in details:
+                            writer.writerow(video_row(details[video_id], published_at, channel_id, channel_name))
+                            count += 1
+                    file.flush()
+                    if on_page:
+                        on_page(count)
+
+                if stopped:
+                    break
+        except BaseException:
+            if file is not None:
+                file.close()
+                part_path.unlink(missing_ok=True)
+            raise
+        finally:
+            await uploads.aclose()
+
+        if file is not None:
+            file.close()
+            if count:
+                os.replace(part_path, csv_path)
+            else:
+                part_path.unlink(missing_ok=True)
+
+        synced = stored
+        if newest is not None:
+            walked = SyncedRange(
+                newest_published_at=newest[1],
+                newest_video_id=newest[0],
+                oldest_published_at=bottom[0] if bottom else None,
+                oldest_video_id=bottom[1] if bottom else None,
+                synced_at=datetime.now(timezone.utc).isoformat(),
+            )
+            synced = merge_ranges(stored, walked)
+            self.state.set(channel_id, synced)
+
+        return ChannelSyncResult(
+            channel_id=channel_id,
+            channel_name=channel_name,
+            video_count=count,
+            csv_path=csv_path if count else None,
+            since=stored[0] if stored else None,
+            synced=synced,
+        )
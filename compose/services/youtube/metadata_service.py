@@ -2,15 +2,97 @@
 
 This module wraps the YouTube Data API to fetch video metadata
 (title, description, statistics, channel info, etc.).
+
+``videos.list`` accepts up to 50 IDs per request at the same quota cost
+(1 unit) as a single ID, so bulk callers should use
+``fetch_metadata_many`` / ``fetch_videos_metadata`` rather than looping
+over ``fetch_metadata``.
 """
 
+import asyncio
 import os
 import re
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 from datetime import datetime
 
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+# googleapiclient is imported when a service is created, not with this module
+if TYPE_CHECKING:
+    from googleapiclient.errors import HttpError
+
+# videos.list accepts at most 50 comma-separated IDs per request
+MAX_IDS_PER_REQUEST = 50
+
+# Concurrent videos.list requests for bulk fetches
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Daily Data API quota (units); videos.list costs 1 unit per request
+DEFAULT_DAILY_QUOTA = int(os.getenv("YOUTUBE_API_DAILY_QUOTA", "10000"))
+
+MetadataResult = Tuple[Optional[dict], Optional[str]]
+
+
+class QuotaLimiter:
+    """Bound concurrent Data API requests and the quota units they spend.
+
+    Requests wait on a semaphore for a concurrency slot. Once the unit
+    budget is spent, or the API reports ``quotaExceeded``, further
+    acquisitions fail fast instead of burning requests that will be
+    rejected.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        quota_units: int = DEFAULT_DAILY_QUOTA,
+    ):
+        """Initialize limiter.
+
+        Args:
+            max_concurrency: Maximum requests in flight
+            quota_units: Units available before requests are refused
+        """
+        self.quota_units = quota_units
+        self.units_used = 0
+        self.exhausted = False
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @property
+    def remaining(self) -> int:
+        """Quota units left (0 once the API reported exhaustion)."""
+        if self.exhausted:
+            return 0
+        return max(self.quota_units - self.units_used, 0)
+
+    async def acquire(self, cost: int = 1) -> None:
+        """Wait for a request slot and reserve quota units.
+
+        Args:
+            cost: Quota units the request will spend
+
+        Raises:
+            RuntimeError: If the quota budget is exhausted
+        """
+        await self._semaphore.acquire()
+        if self.remaining < cost:
+            self._semaphore.release()
+            raise RuntimeError("YouTube API quota exhausted")
+        self.units_used += cost
+
+    def release(self) -> None:
+        """Release a request slot."""
+        self._semaphore.release()
+
+    def mark_exhausted(self) -> None:
+        """Refuse further requests (API returned quotaExceeded)."""
+        self.exhausted = True
+
+
+def _is_quota_error(error: "HttpError") -> bool:
+    """Whether an HttpError is a quota/rate-limit rejection."""
+    if getattr(error.resp, "status", None) != 403:
+        return False
+    content = error.content.decode("utf-8", "replace") if isinstance(error.content, bytes) else str(error.content)
+    return "quota" in content.lower() or "quota" in str(error).lower()
 
 
 class YouTubeMetadataService:
@@ -40,6 +122,8 @@ class YouTubeMetadataService:
                 "YouTube API key not provided and YOUTUBE_API_KEY environment variable not set"
             )
 
+        from googleapiclient.discovery import build
+
         self.youtube = build("youtube", "v3", developerKey=self.api_key)
 
     def fetch_metadata(self, video_id: str) -> dict:
@@ -70,16 +154,112 @@ class YouTubeMetadataService:
             HttpError: If API request fails
             ValueError: If video not found
         """
+        items = self._list_videos([video_id])
+        if not items:
+            raise ValueError(f"Video not found: {video_id}")
+
+        return self._item_to_metadata(items[0], video_id)
+
+    def fetch_metadata_batch(self, video_ids: list[str], http=None) -> dict[str, dict]:
+        """Fetch metadata for up to 50 videos in one videos.list request.
+
+        Args:
+            video_ids: YouTube video IDs (at most MAX_IDS_PER_REQUEST)
+            http: Optional httplib2.Http to execute with (required when
+                called from multiple threads, since httplib2 is not thread-safe)
+
+        Returns:
+            Dict of video_id -> metadata (same fields as fetch_metadata).
+            Videos that are missing, private or deleted are absent.
+
+        Raises:
+            HttpError: If API request fails
+            ValueError: If more than MAX_IDS_PER_REQUEST IDs are given
+        """
+        if len(video_ids) > MAX_IDS_PER_REQUEST:
+            raise ValueError(
+                f"videos.list accepts at most {MAX_IDS_PER_REQUEST} IDs, got {len(video_ids)}"
+            )
+        if not video_ids:
+            return {}
+
+        return {
+            video["id"]: self._item_to_metadata(video, video["id"])
+            for video in self._list_videos(video_ids, http)
+        }
+
+    async def fetch_metadata_many(
+        self,
+        video_ids: Iterable[str],
+        limiter: Optional[QuotaLimiter] = None,
+    ) -> dict[str, MetadataResult]:
+        """Fetch metadata for many videos, 50 IDs per request.
+
+        Chunks are requested concurrently (each in a worker thread with its
+        own HTTP connection) under a QuotaLimiter. A chunk that fails only
+        marks its own IDs as failed; a quotaExceeded response stops the
+        remaining chunks from being sent.
+
+        Args:
+            video_ids: YouTube video IDs (duplicates are fetched once)
+            limiter: Shared QuotaLimiter (default: new limiter with default limits)
+
+        Returns:
+            Dict of video_id -> (metadata, error), in the same shape as
+            fetch_metadata_safe, with an entry for every requested ID
+
+        Example:
+            >>> results = await service.fetch_metadata_many(ids)
+            >>> metadata, error = results["dQw4w9WgXcQ"]
+        """
+        import httplib2
+        from googleapiclient.errors import HttpError
+
+        unique_ids = list(dict.fromkeys(vid for vid in video_ids if vid))
+        limiter = limiter or QuotaLimiter()
+        chunks = [
+            unique_ids[i:i + MAX_IDS_PER_REQUEST]
+            for i in range(0, len(unique_ids), MAX_IDS_PER_REQUEST)
+        ]
+
+        async def fetch_chunk(chunk: list[str]) -> dict[str, MetadataResult]:
+            try:
+                await limiter.acquire()
+            except RuntimeError as e:
+                return {vid: (None, f"YouTube API error: {e}") for vid in chunk}
+
+            try:
+                items = await asyncio.to_thread(self.fetch_metadata_batch, chunk, httplib2.Http())
+            except HttpError as e:
+                if _is_quota_error(e):
+                    limiter.mark_exhausted()
+                return {vid: (None, f"YouTube API error: {e}") for vid in chunk}
+            except Exception as e:
+                return {vid: (None, f"Unexpected error fetching metadata: {e}") for vid in chunk}
+            finally:
+                limiter.release()
+
+            return {
+                vid: (items[vid], None) if vid in items else (None, f"Video not found: {vid}")
+                for vid in chunk
+            }
+
+        results: dict[str, MetadataResult] = {}
+        for chunk_results in await asyncio.gather(*(fetch_chunk(c) for c in chunks)):
+            results.update(chunk_results)
+        return results
+
+    def _list_videos(self, video_ids: list[str], http=None) -> list[dict]:
+        """Run one videos.list request and return its items."""
         request = self.youtube.videos().list(
             part="snippet,statistics,contentDetails",
-            id=video_id,
+            id=",".join(video_ids),
         )
-        response = request.execute()
+        response = request.execute(http=http) if http is not None else request.execute()
+        return response.get("items", [])
 
-        if not response.get("items"):
-            raise ValueError(f"Video not found: {video_id}")
-
-        video = response["items"][0]
+    def _item_to_metadata(self, video: dict, video_id: str) -> dict:
+        """Convert a videos.list item to the metadata dict."""
         snippet = video["snippet"]
         statistics = video.get("statistics", {})
         content_details = video["contentDetails"]
@@ -88,7 +268,7 @@ class YouTubeMetadataService:
         duration_iso = content_details["duration"]
         duration_seconds = self._parse_duration_to_seconds(duration_iso)
 
-        metadata = {
+        return {
             "video_id": video_id,
             "title": snippet["title"],
             "description": snippet.get("description", ""),
@@ -106,8 +286,6 @@ class YouTubeMetadataService:
             "fetched_at": datetime.now().isoformat(),
         }
 
-        return metadata
-
     def fetch_metadata_safe(self, video_id: str) -> Tuple[Optional[dict], Optional[str]]:
         """Fetch metadata with error handling.
 
@@ -119,6 +297,8 @@ class YouTubeMetadataService:
             - If successful: (metadata, None)
             - If failed: (None, error_message)
         """
+        from googleapiclient.errors import HttpError
+
         try:
             metadata = self.fetch_metadata(video_id)
             return metadata, None
@@ -213,3 +393,27 @@ def fetch_video_metadata(video_id: str) -> Tuple[Optional[dict], Optional[str]]:
         return service.fetch_metadata_safe(video_id)
     except ValueError as e:
         return None, str(e)
+
+
+def fetch_videos_metadata(video_ids: Iterable[str]) -> dict[str, MetadataResult]:
+    """Convenience function to fetch metadata for many videos.
+
+    Synchronous wrapper around YouTubeMetadataService.fetch_metadata_many
+    for scripts; async callers should use the service method directly.
+
+    Args:
+        video_ids: YouTube video IDs
+
+    Returns:
+        Dict of video_id -> (metadata_dict, error_string) for every ID
+
+    Example:
+        >>> results = fetch_videos_metadata(["dQw4w9WgXcQ", "jNQXAC9IVRw"])
+        >>> metadata, error = results["dQw4w9WgXcQ"]
+    """
+    video_ids = list(video_ids)
+    try:
+        service = YouTubeMetadataService()
+    except ValueError as e:
+        return {vid: (None, str(e)) for vid in video_ids}
+    return asyncio.run(service.fetch_metadata_many(video_ids))
@@ -5,18 +5,129 @@ This service wraps youtube-transcript-api with:
 - Configurable via environment variables
 - Dependency injection pattern
 - Drop-in replacement for direct API usage
+- Pooled keep-alive HTTP sessions (one per thread) so repeated fetches
+  reuse proxy/TLS connections instead of handshaking per video
+- fetch_many for bounded-concurrency bulk fetches, rate limited per proxy
 
 Environment variables:
 - WEBSHARE_PROXY_USERNAME: Webshare proxy username
 - WEBSHARE_PROXY_PASSWORD: Webshare proxy password
 - YOUTUBE_TRANSCRIPT_USE_PROXY: Set to "false" to disable proxy (default: true)
+- YOUTUBE_TRANSCRIPT_KEEP_ALIVE: Set to "false" to close connections after
+  each request, rotating the proxy IP every request (default: true)
+- YOUTUBE_TRANSCRIPT_RATE_LIMIT: Max requests per second per proxy (default: 5)
+- YOUTUBE_TRANSCRIPT_MAX_WORKERS: Default fetch_many concurrency (default: 8)
 """
 
 import os
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from requests import Session
+from requests.adapters import DEFAULT_RETRIES, HTTPAdapter
+from urllib3 import Retry
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.proxies import WebshareProxyConfig
-from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
+from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, RequestBlocked
+
+DEFAULT_RATE_LIMIT = float(os.getenv("YOUTUBE_TRANSCRIPT_RATE_LIMIT", "5"))
+DEFAULT_MAX_WORKERS = int(os.getenv("YOUTUBE_TRANSCRIPT_MAX_WORKERS", "8"))
+
+
+class _KeepAliveWebshareProxyConfig(WebshareProxyConfig):
+    """Webshare config that lets the session keep proxy connections open.
+
+    The stock config sends ``Connection: close`` so every request rotates to
+    a new exit IP. Keeping connections alive trades that for connection
+    reuse: retries on a kept-alive connection hit the same IP, so the
+    service resets its session on RequestBlocked to rotate it.
+    """
+
+    @property
+    def prevent_keeping_connections_alive(self) -> bool:
+        return False
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting requests per second.
+
+    Example:
+        >>> limiter = RateLimiter(rate=5)
+        >>> limiter.acquire()  # Blocks until a token is available
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """Initialize limiter.
+
+        Args:
+            rate: Tokens added per second (<= 0 disables limiting)
+            burst: Bucket capacity (default: max(1, rate))
+        """
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_rate_limiters: dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str, rate: float = DEFAULT_RATE_LIMIT) -> RateLimiter:
+    """Get the shared rate limiter for a proxy endpoint.
+
+    Args:
+        key: Proxy identifier ("direct" for no proxy)
+        rate: Requests per second when creating the limiter
+
+    Returns:
+        RateLimiter shared by every service using that proxy
+    """
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = RateLimiter(rate)
+        return _rate_limiters[key]
+
+
+@dataclass
+class TranscriptResult:
+    """Outcome of fetching one transcript.
+
+    Attributes:
+        video_id: YouTube video ID
+        text: Full transcript text (None on failure)
+        segments: Timed segments [{"text", "start", "duration"}, ...]
+        error: Error message (None on success)
+    """
+
+    video_id: str
+    text: Optional[str] = None
+    segments: list[dict] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the transcript was fetched."""
+        return self.error is None
 
 
 class YouTubeTranscriptService:
@@ -35,6 +146,9 @@ class YouTubeTranscriptService:
         proxy_username: Optional[str] = None,
         proxy_password: Optional[str] = None,
         use_proxy: Optional[bool] = None,
+        keep_alive: Optional[bool] = None,
+        rate_limit: Optional[float] = None,
+        pool_size: int = DEFAULT_MAX_WORKERS,
     ):
         """Initialize YouTube transcript service.
 
@@ -42,6 +156,11 @@ class YouTubeTranscriptService:
             proxy_username: Webshare proxy username (default: from WEBSHARE_PROXY_USERNAME env)
             proxy_password: Webshare proxy password (default: from WEBSHARE_PROXY_PASSWORD env)
             use_proxy: Whether to use proxy (default: from YOUTUBE_TRANSCRIPT_USE_PROXY env, or True)
+            keep_alive: Keep proxy connections open across requests (default:
+                from YOUTUBE_TRANSCRIPT_KEEP_ALIVE env, or True)
+            rate_limit: Requests per second for this instance only (default:
+                share the proxy's limiter at DEFAULT_RATE_LIMIT)
+            pool_size: Connections kept per host in each session's pool
         """
         # Get proxy credentials from env if not provided
         self.proxy_username = proxy_username or os.getenv("WEBSHARE_PROXY_USERNAME")
@@ -54,11 +173,17 @@ class YouTubeTranscriptService:
 
         self.use_proxy = use_proxy
 
+        if keep_alive is None:
+            keep_alive = os.getenv("YOUTUBE_TRANSCRIPT_KEEP_ALIVE", "true").lower() in ("true", "1", "yes")
+        self.keep_alive = keep_alive
+        self.pool_size = pool_size
+
         # Configure proxy if enabled and credentials available
         self.proxy_config = None
         if self.use_proxy and self.proxy_username and self.proxy_password:
             # Create Webshare proxy config
-            self.proxy_config = WebshareProxyConfig(
+            config_class = _KeepAliveWebshareProxyConfig if keep_alive else WebshareProxyConfig
+            self.proxy_config = config_class(
                 proxy_username=self.proxy_username,
                 proxy_password=self.proxy_password,
             )
@@ -66,6 +191,76 @@ class YouTubeTranscriptService:
         else:
             self._proxy_configured = False
 
+        # One API instance (and pooled requests.Session) per thread, since
+        # YouTubeTranscriptApi and Session are not thread-safe
+        self._local = threading.local()
+        if rate_limit is None:
+            limiter_key = f"webshare:{self.proxy_username}" if self._proxy_configured else "direct"
+            self.rate_limiter = get_rate_limiter(limiter_key)
+        else:
+            self.rate_limiter = RateLimiter(rate_limit)
+
+    def _get_api(self) -> YouTubeTranscriptApi:
+        """Get this thread's API instance, creating its pooled session once."""
+        api = getattr(self._local, "api", None)
+        if api is None:
+            session = Session()
+
+            # Create API instance with or without proxy config
+            if self._proxy_configured:
+                api = YouTubeTranscriptApi(proxy_config=self.proxy_config, http_client=session)
+            else:
+                api = YouTubeTranscriptApi(http_client=session)
+
+            # The API mounts its own retrying adapter on proxied sessions;
+            # replace it with one that keeps that Retry and adds the pool size
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_size,
+                pool_maxsize=self.pool_size,
+                max_retries=self._retry_config(),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._local.api = api
+        return api
+
+    def _retry_config(self) -> Retry | int:
+        """Retry policy matching what YouTubeTranscriptApi would mount."""
+        if self._proxy_configured and self.proxy_config.retries_when_blocked > 0:
+            return Retry(total=self.proxy_config.retries_when_blocked, status_forcelist=[429])
+        return DEFAULT_RETRIES
+
+    def _reset_api(self) -> None:
+        """Drop this thread's session so the next request opens new connections."""
+        self._local.api = None
+
+    def _fetch(self, video_id: str, languages: Optional[list[str]]):
+        """Fetch a transcript once, rate limited, through the pooled session.
+
+        A blocked request resets the session and is retried once, so a
+        kept-alive proxy connection stuck on a blocked IP gets rotated.
+        """
+        if languages is None:
+            languages = ["en"]
+
+        self.rate_limiter.acquire()
+        try:
+            return self._get_api().fetch(video_id, languages=languages)
+        except RequestBlocked:
+            if not self.keep_alive:
+                raise
+            self._reset_api()
+            self.rate_limiter.acquire()
+            return self._get_api().fetch(video_id, languages=languages)
+
+    @staticmethod
+    def _segments(fetched) -> list[dict]:
+        """Convert fetched snippets to timed segment dicts."""
+        return [
+            {"text": snippet.text, "start": snippet.start, "duration": snippet.duration}
+            for snippet in fetched.snippets
+        ]
+
     def fetch_transcript(self, video_id: str, languages: Optional[list[str]] = None) -> str:
         """Fetch transcript for a YouTube video.
 
@@ -81,22 +276,10 @@ class YouTubeTranscriptService:
             NoTranscriptFound: If no transcript found in requested languages
             Exception: For other errors (network, parsing, etc.)
         """
-        if languages is None:
-            languages = ["en"]
-
-        # Create API instance with or without proxy config
-        if self._proxy_configured:
-            api = YouTubeTranscriptApi(proxy_config=self.proxy_config)
-        else:
-            api = YouTubeTranscriptApi()
-
-        # Fetch transcript
-        fetched = api.fetch(video_id, languages=languages)
+        fetched = self._fetch(video_id, languages)
 
         # Combine all transcript snippets into single text
-        full_text = " ".join(snippet.text for snippet in fetched.snippets)
-
-        return full_text
+        return " ".join(snippet.text for snippet in fetched.snippets)
 
     def fetch_timed_transcript(
         self, video_id: str, languages: Optional[list[str]] = None
@@ -116,23 +299,25 @@ class YouTubeTranscriptService:
             NoTranscriptFound: If no transcript found in requested languages
             Exception: For other errors (network, parsing, etc.)
         """
-        if languages is None:
-            languages = ["en"]
+        return self._segments(self._fetch(video_id, languages))
 
-        # Create API instance with or without proxy config
-        if self._proxy_configured:
-            api = YouTubeTranscriptApi(proxy_config=self.proxy_config)
-        else:
-            api = YouTubeTranscriptApi()
+    def fetch_transcript_with_segments(
+        self, video_id: str, languages: Optional[list[str]] = None
+    ) -> tuple[str, list[dict]]:
+        """Fetch plain text and timed segments with a single request.
 
-        # Fetch transcript
-        fetched = api.fetch(video_id, languages=languages)
+        Args:
+            video_id: YouTube video ID (11 characters)
+            languages: Preferred transcript languages (default: ['en'])
 
-        # Return snippets with timestamps
-        return [
-            {"text": snippet.text, "start": snippet.start, "duration": snippet.duration}
-            for snippet in fetched.snippets
-        ]
+        Returns:
+            Tuple of (full_text, segments)
+
+        Raises:
+            Same exceptions as fetch_transcript()
+        """
+        segments = self._segments(self._fetch(video_id, languages))
+        return " ".join(seg["text"] for seg in segments), segments
 
     def fetch_transcript_safe(
         self,
@@ -153,12 +338,56 @@ class YouTubeTranscriptService:
         try:
             transcript = self.fetch_transcript(video_id, languages)
             return (transcript, None)
-        except TranscriptsDisabled:
-            return (None, "Transcripts are disabled for this video")
-        except NoTranscriptFound:
-            return (None, f"No transcript found for languages: {languages}")
         except Exception as e:
-            return (None, f"Error fetching transcript: {str(e)}")
+            return (None, self._describe_error(e, languages))
+
+    def fetch_many(
+        self,
+        video_ids: Iterable[str],
+        languages: Optional[list[str]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> dict[str, TranscriptResult]:
+        """Fetch many transcripts concurrently.
+
+        Each worker thread keeps its own pooled session; all workers share
+        the proxy's rate limiter, so concurrency hides per-request latency
+        without exceeding the request rate.
+
+        Args:
+            video_ids: YouTube video IDs (duplicates are fetched once)
+            languages: Preferred transcript languages
+            max_workers: Maximum concurrent fetches
+
+        Returns:
+            Dict of video_id -> TranscriptResult with text and segments
+
+        Example:
+            >>> results = service.fetch_many(["dQw4w9WgXcQ", "jNQXAC9IVRw"])
+            >>> results["dQw4w9WgXcQ"].text[:50]
+        """
+        unique_ids = list(dict.fromkeys(video_ids))
+        if not unique_ids:
+            return {}
+
+        def fetch_one(video_id: str) -> TranscriptResult:
+            try:
+                text, segments = self.fetch_transcript_with_segments(video_id, languages)
+                return TranscriptResult(video_id=video_id, text=text, segments=segments)
+            except Exception as e:
+                return TranscriptResult(video_id=video_id, error=self._describe_error(e, languages))
+
+        workers = max(1, min(max_workers, len(unique_ids)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transcript") as pool:
+            return dict(zip(unique_ids, pool.map(fetch_one, unique_ids)))
+
+    @staticmethod
+    def _describe_error(error: Exception, languages: Optional[list[str]]) -> str:
+        """Error message in the format used by fetch_transcript_safe."""
+        if isinstance(error, TranscriptsDisabled):
+            return "Transcripts are disabled for this video"
+        if isinstance(error, NoTranscriptFound):
+            return f"No transcript found for languages: {languages}"
+        return f"Error fetching transcript: {str(error)}"
 
     def is_proxy_configured(self) -> bool:
         """Check if proxy is configured and enabled.
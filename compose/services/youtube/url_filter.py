@@ -3,13 +3,32 @@
 Extracts URLs from video descriptions and filters them using:
 1. Heuristic/rule-based filtering (blocks marketing/sponsor URLs)
 2. LLM classification for ambiguous URLs (Claude Haiku)
+
+LLM results are cached by normalized URL so the same affiliate or docs link
+appearing in many descriptions is only classified once. Cache misses are
+classified in multi-URL prompts, run concurrently under a concurrency limit.
 """
 
 import re
 import os
 import json
-from typing import Optional
-from anthropic import Anthropic
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Awaitable, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+# The Anthropic SDK takes ~2s to import; it's loaded on the first LLM call
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
+logger = logging.getLogger(__name__)
+
+
+# LLM classification settings
+LLM_MODEL = "claude-3-5-haiku-20241022"
+LLM_BATCH_SIZE = 10  # URLs classified per prompt
+LLM_MAX_CONCURRENCY = 4  # Concurrent in-flight LLM requests
 
 
 # Heuristic blocklist patterns
@@ -65,6 +84,13 @@ SOCIAL_PROFILE_PATTERNS = [
 ]
 
 
+# Match http:// and https:// URLs
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+# Scheme, optional userinfo, then host (port/path/query excluded)
+_HOST_RE = re.compile(r"^[a-z][a-z0-9+.-]*://(?:[^@/?#]*@)?([^/?#:]*)")
+
+
 def extract_urls(text: str) -> list[str]:
     """Extract all URLs from text using regex.
 
@@ -78,10 +104,7 @@ def extract_urls(text: str) -> list[str]:
         >>> extract_urls("Check out https://github.com/user/repo and http://example.com")
         ['https://github.com/user/repo', 'http://example.com']
     """
-    # Match http:// and https:// URLs
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-
-    urls = re.findall(url_pattern, text)
+    urls = _URL_RE.findall(text)
 
     # Remove trailing punctuation (common in descriptions)
     cleaned_urls = []
@@ -94,14 +117,161 @@ def extract_urls(text: str) -> list[str]:
         cleaned_urls.append(url)
 
     # Deduplicate while preserving order
-    seen = set()
-    unique_urls = []
-    for url in cleaned_urls:
-        if url not in seen:
-            seen.add(url)
-            unique_urls.append(url)
+    return list(dict.fromkeys(cleaned_urls))
+
+
+class HeuristicURLFilter:
+    """Precompiled heuristic URL filter.
+
+    Compiles the blocklists once so each URL costs:
+    - a host-suffix set lookup for plain domains (e.g. "gumroad.com" matches
+      "gumroad.com" and "store.gumroad.com")
+    - one combined alternation regex for domain entries that carry a path or
+      no TLD (e.g. "patreon.com/join", "linktree")
+    - one combined alternation regex each for URL patterns and social profiles
+
+    The per-pattern regexes are only consulted to name the matching rule for
+    URLs that are already known to be blocked.
+
+    Example:
+        >>> engine = HeuristicURLFilter()
+        >>> engine.check("https://store.gumroad.com/l/course")
+        (True, 'Blocked domain: gumroad.com')
+        >>> result = engine.filter_many(["https://github.com/a/b", "https://bit.ly/x"])
+        >>> result["remaining"]
+        ['https://github.com/a/b']
+    """
+
+    def __init__(
+        self,
+        blocked_domains: Optional[list[str]] = None,
+        blocked_url_patterns: Optional[list[str]] = None,
+        social_profile_patterns: Optional[list[str]] = None,
+    ):
+        """Compile blocklists.
+
+        Args:
+            blocked_domains: Domain entries (defaults to BLOCKED_DOMAINS)
+            blocked_url_patterns: Regex patterns (defaults to BLOCKED_URL_PATTERNS)
+            social_profile_patterns: Regex patterns (defaults to SOCIAL_PROFILE_PATTERNS)
+        """
+        domains = BLOCKED_DOMAINS if blocked_domains is None else blocked_domains
+        url_patterns = BLOCKED_URL_PATTERNS if blocked_url_patterns is None else blocked_url_patterns
+        social_patterns = SOCIAL_PROFILE_PATTERNS if social_profile_patterns is None else social_profile_patterns
+
+        # Plain domains go in a set; entries with a path or no TLD stay substrings
+        self._host_domains = {
+            d.lower() for d in domains if "/" not in d and "." in d
+        }
+        self._substring_domains = [
+            d.lower() for d in domains if "/" in d or "." not in d
+        ]
+        self._substring_domain_re = _compile_alternation(
+            [re.escape(d) for d in self._substring_domains]
+        )
+
+        self._url_patterns = [(p, re.compile(p)) for p in url_patterns]
+        self._url_pattern_re = _compile_alternation(url_patterns)
+        self._social_re = _compile_alternation(social_patterns)
+
+    def _match_host(self, host: str) -> Optional[str]:
+        """Return blocked domain matching host or one of its parent domains."""
+        while host:
+            if host in self._host_domains:
+                return host
+            _, _, host = host.partition(".")
+        return None
+
+    def check(self, url: str) -> tuple[bool, Optional[str]]:
+        """Check if URL should be blocked.
+
+        Args:
+            url: URL to check
+
+        Returns:
+            Tuple of (is_blocked: bool, reason: str | None)
+        """
+        url_lower = url.lower()
+
+        # Check blocked domains
+        host_match = _HOST_RE.match(url_lower)
+        if host_match:
+            domain = self._match_host(host_match.group(1))
+            if domain:
+                return True, f"Blocked domain: {domain}"
+
+        if self._substring_domain_re is not None and self._substring_domain_re.search(url_lower):
+            return True, f"Blocked domain: {self._first_substring_domain(url_lower)}"
+
+        # Check blocked URL patterns
+        if self._url_pattern_re is not None and self._url_pattern_re.search(url_lower):
+            for pattern, compiled in self._url_patterns:
+                if compiled.search(url_lower):
+                    return True, f"Blocked pattern: {pattern}"
+
+        # Check social profile patterns
+        if self._social_re is not None and self._social_re.search(url_lower):
+            return True, "Social media profile (not content)"
+
+        return False, None
+
+    def _first_substring_domain(self, url_lower: str) -> str:
+        """Name the first substring domain entry (in list order) found in URL."""
+        for domain in self._substring_domains:
+            if domain in url_lower:
+                return domain
+        return ""
+
+    def filter_many(self, urls: list[str]) -> dict:
+        """Apply the filter to many URLs in one pass.
+
+        Repeated URLs are only evaluated once.
+
+        Args:
+            urls: List of URLs to filter
+
+        Returns:
+            Dict with:
+                - blocked: list of (url, reason) tuples for blocked URLs
+                - remaining: list of URLs that passed heuristic filter
+        """
+        blocked = []
+        remaining = []
+        seen: dict[str, tuple[bool, Optional[str]]] = {}
+        check = self.check
+
+        for url in urls:
+            verdict = seen.get(url)
+            if verdict is None:
+                verdict = seen[url] = check(url)
+            if verdict[0]:
+                blocked.append((url, verdict[1]))
+            else:
+                remaining.append(url)
+
+        return {
+            "blocked": blocked,
+            "remaining": remaining,
+        }
+
 
-    return unique_urls
+def _compile_alternation(patterns: list[str]) -> Optional[re.Pattern]:
+    """Compile patterns into one non-capturing alternation (None if empty)."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
+# Process-wide filter compiled from the module-level blocklists
+_default_filter: Optional[HeuristicURLFilter] = None
+
+
+def get_heuristic_filter() -> HeuristicURLFilter:
+    """Get the HeuristicURLFilter singleton built from the default blocklists."""
+    global _default_filter
+    if _default_filter is None:
+        _default_filter = HeuristicURLFilter()
+    return _default_filter
 
 
 def is_blocked_by_heuristic(url: str) -> tuple[bool, Optional[str]]:
@@ -119,24 +289,7 @@ def is_blocked_by_heuristic(url: str) -> tuple[bool, Optional[str]]:
         >>> is_blocked_by_heuristic("https://github.com/user/repo")
         (False, None)
     """
-    url_lower = url.lower()
-
-    # Check blocked domains
-    for domain in BLOCKED_DOMAINS:
-        if domain in url_lower:
-            return True, f"Blocked domain: {domain}"
-
-    # Check blocked URL patterns
-    for pattern in BLOCKED_URL_PATTERNS:
-        if re.search(pattern, url_lower):
-            return True, f"Blocked pattern: {pattern}"
-
-    # Check social profile patterns
-    for pattern in SOCIAL_PROFILE_PATTERNS:
-        if re.search(pattern, url_lower):
-            return True, "Social media profile (not content)"
-
-    return False, None
+    return get_heuristic_filter().check(url)
 
 
 def apply_heuristic_filter(urls: list[str]) -> dict:
@@ -158,20 +311,110 @@ def apply_heuristic_filter(urls: list[str]) -> dict:
         >>> len(result['remaining'])
         1
     """
-    blocked = []
-    remaining = []
+    return get_heuristic_filter().filter_many(urls)
 
-    for url in urls:
-        is_blocked, reason = is_blocked_by_heuristic(url)
-        if is_blocked:
-            blocked.append((url, reason))
-        else:
-            remaining.append(url)
 
-    return {
-        "blocked": blocked,
-        "remaining": remaining,
-    }
+def normalize_url(url: str) -> str:
+    """Normalize URL for use as a classification cache key.
+
+    Lowercases scheme and host, drops a leading "www.", the fragment and any
+    trailing slash on the path. Query strings are kept since they can change
+    the meaning of a link (e.g. affiliate parameters).
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Normalized URL string
+
+    Example:
+        >>> normalize_url("HTTPS://www.GitHub.com/user/repo/#readme")
+        'https://github.com/user/repo'
+    """
+    parts = urlsplit(url.strip())
+    netloc = parts.netloc.lower()
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), netloc, path, parts.query, ""))
+
+
+class URLClassificationCache:
+    """In-memory LRU cache of LLM URL classifications keyed by normalized URL.
+
+    Shared across videos so a URL is only sent to the LLM once per process.
+    Entries are dicts with classification, confidence, reason and
+    suggested_pattern. Persistence is handled by the pattern tracker
+    (see filter_urls).
+
+    Example:
+        >>> cache = URLClassificationCache(max_entries=100)
+        >>> cache.put("https://docs.python.org/", {"classification": "content", ...})
+        >>> cache.get("https://docs.python.org")["classification"]
+        'content'
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached URLs before LRU eviction
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url: str) -> Optional[dict]:
+        """Get cached classification for URL (None on miss)."""
+        key = normalize_url(url)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, url: str, entry: dict) -> None:
+        """Store classification for URL, evicting least recently used entries."""
+        key = normalize_url(url)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, url: str) -> bool:
+        return normalize_url(url) in self._entries
+
+
+# Process-wide cache shared by all filter_urls calls
+_classification_cache: Optional[URLClassificationCache] = None
+
+
+def get_classification_cache() -> URLClassificationCache:
+    """Get the process-wide URL classification cache singleton."""
+    global _classification_cache
+    if _classification_cache is None:
+        _classification_cache = URLClassificationCache()
+    return _classification_cache
+
+
+def _estimate_cost(usage) -> float:
+    """Estimate Claude Haiku cost in USD from response usage.
+
+    Haiku pricing: $0.25 per 1M input tokens, $1.25 per 1M output tokens
+    """
+    return (usage.input_tokens / 1_000_000 * 0.25) + (usage.output_tokens / 1_000_000 * 1.25)
 
 
 def classify_url_with_llm(
@@ -206,6 +449,8 @@ def classify_url_with_llm(
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY not set")
 
+    from anthropic import Anthropic
+
     client = Anthropic(api_key=api_key)
 
     prompt = f"""You are analyzing a URL found in a YouTube video description.
@@ -237,7 +482,7 @@ Respond in JSON format:
 If confidence <= 0.7, omit suggested_pattern field."""
 
     response = client.messages.create(
-        model="claude-3-5-haiku-20241022",
+        model=LLM_MODEL,
         max_tokens=250,  # Increased for pattern suggestion
         messages=[{"role": "user", "content": prompt}],
     )
@@ -262,14 +507,237 @@ If confidence <= 0.7, omit suggested_pattern field."""
         suggested_pattern = None
 
     # Calculate cost (approximate)
-    # Haiku pricing: $0.25 per 1M input tokens, $1.25 per 1M output tokens
-    input_tokens = response.usage.input_tokens
-    output_tokens = response.usage.output_tokens
-    cost_usd = (input_tokens / 1_000_000 * 0.25) + (output_tokens / 1_000_000 * 1.25)
+    cost_usd = _estimate_cost(response.usage)
 
     return classification, confidence, reason, suggested_pattern, cost_usd
 
 
+def _build_batch_prompt(urls: list[str], video_context: dict) -> str:
+    """Build a prompt that classifies several URLs in one request."""
+    url_lines = "\n".join(f"{i}. {url}" for i, url in enumerate(urls, 1))
+
+    return f"""You are analyzing URLs found in a YouTube video description.
+
+Video Title: {video_context.get('video_title', 'N/A')}
+Video Description (first 500 chars): {video_context.get('description', '')[:500]}
+
+URLs to classify:
+{url_lines}
+
+Task: Classify each URL as either "content" or "marketing" with a confidence score.
+
+- "content" = Educational resources, documentation, tools, code repos, articles, tutorials, relevant references
+- "marketing" = Sponsorships, paid products, memberships, affiliate links, promotional content
+
+Also, if you're confident (>0.7) about a classification, suggest a pattern that could be used to auto-classify similar URLs in the future.
+
+Respond with a JSON array containing one object per URL, in the same order:
+[
+  {{
+    "url": "the URL exactly as given",
+    "classification": "content" or "marketing",
+    "confidence": 0.95,  // 0.0-1.0 score
+    "reason": "Brief explanation (1 sentence)",
+    "suggested_pattern": {{  // Only if confidence > 0.7
+      "pattern": "github.com",  // Domain, URL substring, or path component
+      "type": "domain",  // "domain", "url_pattern", or "path"
+      "rationale": "Why this pattern is reliable"
+    }}
+  }}
+]
+
+If confidence <= 0.7, omit suggested_pattern field."""
+
+
+class LLMResponseParseError(ValueError):
+    """A URL had no usable item in a batch LLM response.
+
+    Returned in place of a classification so callers treat it like an LLM
+    error. The fallback is not cached as if the LLM had classified the URL.
+    """
+
+    def __init__(self, message: str = "Failed to parse LLM response", cost_usd: float = 0.0):
+        super().__init__(message)
+        self.cost_usd = cost_usd
+
+
+def _parse_batch_response(response_text: str, urls: list[str]) -> list[dict]:
+    """Parse a batch classification response into one dict per URL.
+
+    Items are matched to URLs by their "url" field, falling back to position.
+    A single JSON object is accepted when only one URL was sent. URLs missing
+    from the response get the same marketing/0.5 fallback as
+    classify_url_with_llm, with "parsed" set to False.
+    """
+    items: list = []
+    json_match = re.search(r'(\[.*\]|\{.*\})', response_text, re.DOTALL)
+    if json_match:
+        try:
+            parsed = json.loads(json_match.group(0))
+            items = parsed if isinstance(parsed, list) else [parsed]
+        except json.JSONDecodeError:
+            items = []
+
+    by_url = {
+        item["url"]: item
+        for item in items
+        if isinstance(item, dict) and item.get("url")
+    }
+
+    results = []
+    for i, url in enumerate(urls):
+        item = by_url.get(url)
+        if item is None and i < len(items) and isinstance(items[i], dict):
+            item = items[i]
+
+        if item is None:
+            results.append({
+                "classification": "marketing",
+                "confidence": 0.5,
+                "reason": "Failed to parse LLM response",
+                "suggested_pattern": None,
+                "parsed": False,
+            })
+            continue
+
+        results.append({
+            "classification": item.get("classification", "marketing"),
+            "confidence": item.get("confidence", 0.5),
+            "reason": item.get("reason", "No reason provided"),
+            "suggested_pattern": item.get("suggested_pattern"),
+            "parsed": True,
+        })
+
+    return results
+
+
+async def classify_urls_with_llm_async(
+    urls: list[str],
+    video_context: dict,
+    api_key: Optional[str] = None,
+    client: Optional["AsyncAnthropic"] = None,
+) -> list[tuple[str, float, str, Optional[dict], float] | LLMResponseParseError]:
+    """Classify several URLs in a single prompt using the async Anthropic client.
+
+    Args:
+        urls: URLs to classify (one prompt for all of them)
+        video_context: Dict with video_title, description, etc.
+        api_key: Optional Anthropic API key (uses ANTHROPIC_API_KEY env var if not provided)
+        client: Optional AsyncAnthropic client to reuse across batches
+
+    Returns:
+        List of (classification, confidence, reason, suggested_pattern, cost_usd)
+        tuples in the same order as urls. The request cost is split evenly
+        across the URLs in the batch. URLs the response didn't classify get
+        an LLMResponseParseError (carrying their cost share) instead.
+
+    Example:
+        >>> results = await classify_urls_with_llm_async(
+        ...     ["https://docs.python.org", "https://gumroad.com/l/course"],
+        ...     {"video_title": "Python Tutorial"},
+        ... )
+        >>> [r[0] for r in results]
+        ['content', 'marketing']
+    """
+    if not urls:
+        return []
+
+    if client is None:
+        api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY not set")
+        from anthropic import AsyncAnthropic
+
+        client = AsyncAnthropic(api_key=api_key)
+
+    response = await client.messages.create(
+        model=LLM_MODEL,
+        max_tokens=150 + 200 * len(urls),
+        messages=[{"role": "user", "content": _build_batch_prompt(urls, video_context)}],
+    )
+
+    parsed = _parse_batch_response(response.content[0].text.strip(), urls)
+    cost_per_url = _estimate_cost(response.usage) / len(urls)
+
+    return [
+        (
+            item["classification"],
+            item["confidence"],
+            item["reason"],
+            item["suggested_pattern"],
+            cost_per_url,
+        )
+        if item["parsed"]
+        else LLMResponseParseError(item["reason"], cost_usd=cost_per_url)
+        for item in parsed
+    ]
+
+
+async def _tracker_write(url: str, write: Awaitable) -> None:
+    """Await a pattern tracker write, logging failures instead of raising.
+
+    A storage error for one URL must not abort the whole batch and drop
+    classifications that were already paid for.
+    """
+    try:
+        await write
+    except Exception as e:
+        logger.warning(f"Pattern tracker write failed for {url}: {e}")
+
+
+async def classify_urls_concurrently(
+    urls: list[str],
+    video_context: dict,
+    api_key: Optional[str] = None,
+    batch_size: int = LLM_BATCH_SIZE,
+    max_concurrency: int = LLM_MAX_CONCURRENCY,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> dict[str, tuple | Exception]:
+    """Classify URLs in batches, running batches concurrently.
+
+    Args:
+        urls: URLs to classify
+        video_context: Dict with video_title, description, etc.
+        api_key: Optional Anthropic API key
+        batch_size: Max URLs per prompt
+        max_concurrency: Max in-flight LLM requests (ignored if semaphore given)
+        semaphore: Optional semaphore shared across calls to bound total
+            in-flight requests when many videos are filtered concurrently
+
+    Returns:
+        Dict mapping each URL to its classification tuple (see
+        classify_urls_with_llm_async), or to the Exception raised for its batch
+    """
+    if not urls:
+        return {}
+
+    api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        error = ValueError("ANTHROPIC_API_KEY not set")
+        return {url: error for url in urls}
+
+    from anthropic import AsyncAnthropic
+
+    client = AsyncAnthropic(api_key=api_key)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+    batches = [urls[i:i + batch_size] for i in range(0, len(urls), batch_size)]
+
+    async def run_batch(batch: list[str]) -> list:
+        async with semaphore:
+            try:
+                return await classify_urls_with_llm_async(batch, video_context, client=client)
+            except Exception as e:
+                return [e] * len(batch)
+
+    batch_results = await asyncio.gather(*(run_batch(batch) for batch in batches))
+
+    results: dict[str, tuple | Exception] = {}
+    for batch, outcomes in zip(batches, batch_results):
+        results.update(zip(batch, outcomes))
+    return results
+
+
 async def filter_urls(
     description: str,
     video_context: dict,
@@ -277,6 +745,10 @@ async def filter_urls(
     use_llm: bool = True,
     pattern_tracker = None,  # Type hint omitted to avoid circular import
     api_key: Optional[str] = None,
+    cache: Optional[URLClassificationCache] = None,
+    batch_size: int = LLM_BATCH_SIZE,
+    max_concurrency: int = LLM_MAX_CONCURRENCY,
+    semaphore: Optional[asyncio.Semaphore] = None,
 ) -> dict:
     """Extract and filter URLs from video description with pattern learning.
 
@@ -284,8 +756,9 @@ async def filter_urls(
     1. Extracts URLs from description
     2. Applies heuristic filter
     3. Checks learned patterns (if pattern_tracker provided)
-    4. Classifies remaining URLs with LLM (if enabled)
-    5. Records classifications and learns patterns
+    4. Reuses cached LLM classifications (in-memory, then pattern_tracker store)
+    5. Classifies remaining URLs with LLM in concurrent batches (if enabled)
+    6. Records classifications and learns patterns
 
     Args:
         description: Video description text
@@ -294,6 +767,10 @@ async def filter_urls(
         use_llm: Whether to use LLM for classification (default: True)
         pattern_tracker: Optional PatternTracker instance for learning
         api_key: Optional Anthropic API key
+        cache: Classification cache (defaults to the process-wide cache)
+        batch_size: Max URLs classified per LLM prompt
+        max_concurrency: Max concurrent LLM requests
+        semaphore: Optional LLM request semaphore shared across videos
 
     Returns:
         Dict with:
@@ -320,6 +797,50 @@ async def filter_urls(
 
     # Apply heuristic filter
     heuristic_result = apply_heuristic_filter(all_urls)
+
+    return await classify_filtered_urls(
+        all_urls,
+        heuristic_result,
+        video_context,
+        video_id=video_id,
+        use_llm=use_llm,
+        pattern_tracker=pattern_tracker,
+        api_key=api_key,
+        cache=cache,
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+        semaphore=semaphore,
+    )
+
+
+async def classify_filtered_urls(
+    all_urls: list[str],
+    heuristic_result: dict,
+    video_context: dict,
+    video_id: Optional[str] = None,
+    use_llm: bool = True,
+    pattern_tracker = None,  # Type hint omitted to avoid circular import
+    api_key: Optional[str] = None,
+    cache: Optional[URLClassificationCache] = None,
+    batch_size: int = LLM_BATCH_SIZE,
+    max_concurrency: int = LLM_MAX_CONCURRENCY,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> dict:
+    """Classify URLs that already went through the heuristic filter.
+
+    Second half of filter_urls (steps 3-6), split out so batch jobs can run
+    extraction and heuristics elsewhere (e.g. in a process pool) and only do
+    the async classification work here.
+
+    Args:
+        all_urls: All URLs extracted from the description
+        heuristic_result: Output of apply_heuristic_filter(all_urls)
+        video_context: Dict with video_title, etc.
+        (remaining args as in filter_urls)
+
+    Returns:
+        Same dict as filter_urls
+    """
     blocked_urls = [url for url, _ in heuristic_result["blocked"]]
     blocked_reasons = {url: reason for url, reason in heuristic_result["blocked"]}
     remaining_urls = heuristic_result["remaining"]
@@ -339,14 +860,14 @@ async def filter_urls(
     # Record heuristic blocks (if pattern tracker provided)
     if pattern_tracker and video_id:
         for url in blocked_urls:
-            await pattern_tracker.record_classification(
+            await _tracker_write(url, pattern_tracker.record_classification(
                 url=url,
                 video_id=video_id,
                 classification="marketing",  # Heuristic blocks are assumed marketing
                 confidence=1.0,  # Heuristic rules are 100% confident
                 method="heuristic",
                 reason=blocked_reasons.get(url, "Blocked by heuristic filter"),
-            )
+            ))
 
     # If no remaining URLs, return early
     if not remaining_urls:
@@ -356,7 +877,11 @@ async def filter_urls(
     urls_after_learned_patterns = []
     if pattern_tracker:
         for url in remaining_urls:
-            pattern_match = await pattern_tracker.check_learned_patterns(url)
+            try:
+                pattern_match = await pattern_tracker.check_learned_patterns(url)
+            except Exception as e:
+                logger.warning(f"Checking learned patterns failed for {url}: {e}")
+                pattern_match = None
             if pattern_match:
                 classification, reason, confidence = pattern_match
 
@@ -376,14 +901,14 @@ async def filter_urls(
 
                 # Record classification
                 if video_id:
-                    await pattern_tracker.record_classification(
+                    await _tracker_write(url, pattern_tracker.record_classification(
                         url=url,
                         video_id=video_id,
                         classification=classification,
                         confidence=confidence,
                         method="learned_pattern",
                         reason=reason,
-                    )
+                    ))
             else:
                 # No pattern match, needs LLM
                 urls_after_learned_patterns.append(url)
@@ -395,12 +920,49 @@ async def filter_urls(
         result["content_urls"].extend(urls_after_learned_patterns)
         return result
 
-    # Classify remaining URLs with LLM
+    if cache is None:
+        cache = get_classification_cache()
+
+    # Reuse cached classifications (memory first, then persisted store)
+    cached: dict[str, dict] = {}
     for url in urls_after_learned_patterns:
+        entry = cache.get(url)
+        if entry is not None:
+            cached[url] = entry
+
+    uncached = [url for url in urls_after_learned_patterns if url not in cached]
+    if uncached and pattern_tracker:
         try:
-            classification, confidence, reason, suggested_pattern, cost = classify_url_with_llm(
-                url, video_context, api_key
+            persisted = await pattern_tracker.get_cached_classifications(
+                [normalize_url(url) for url in uncached]
             )
+        except Exception as e:
+            logger.warning(f"Loading cached classifications failed: {e}")
+            persisted = {}
+        for url in uncached:
+            entry = persisted.get(normalize_url(url))
+            if entry is not None:
+                cache.put(url, entry)
+                cached[url] = entry
+
+    # Classify cache misses with LLM (batched, concurrent)
+    misses = [url for url in urls_after_learned_patterns if url not in cached]
+    llm_results = await classify_urls_concurrently(
+        misses,
+        video_context,
+        api_key=api_key,
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+        semaphore=semaphore,
+    )
+
+    for url in urls_after_learned_patterns:
+        if url in cached:
+            entry = cached[url]
+            classification = entry["classification"]
+            confidence = entry["confidence"]
+            reason = entry["reason"]
+            suggested_pattern = entry.get("suggested_pattern")
 
             result["llm_classifications"].append({
                 "url": url,
@@ -408,19 +970,17 @@ async def filter_urls(
                 "confidence": confidence,
                 "reason": reason,
                 "suggested_pattern": suggested_pattern,
-                "cost_usd": cost,
+                "cost_usd": 0.0,
+                "cached": True,
             })
 
-            result["total_llm_cost"] += cost
-
             if classification == "content":
                 result["content_urls"].append(url)
             else:
                 result["marketing_urls"].append(url)
 
-            # Record classification
             if pattern_tracker and video_id:
-                await pattern_tracker.record_classification(
+                await _tracker_write(url, pattern_tracker.record_classification(
                     url=url,
                     video_id=video_id,
                     classification=classification,
@@ -428,38 +988,92 @@ async def filter_urls(
                     method="llm",
                     reason=reason,
                     pattern_suggested=suggested_pattern.get("pattern") if suggested_pattern else None,
-                )
+                ))
+            continue
 
-                # Add high-confidence patterns to learned patterns
-                if suggested_pattern and confidence >= 0.7:
-                    await pattern_tracker.add_learned_pattern(
-                        pattern=suggested_pattern.get("pattern"),
-                        pattern_type=suggested_pattern.get("type", "domain"),
-                        classification=classification,
-                        confidence=confidence,
-                    )
+        outcome = llm_results[url]
 
-        except Exception as e:
-            # On error, default to marketing (safer to exclude than include)
+        if isinstance(outcome, Exception):
+            # On error (or an unparseable reply), default to marketing (safer
+            # to exclude than include), but don't cache it as a classification
+            cost = getattr(outcome, "cost_usd", 0.0)
+            result["total_llm_cost"] += cost
             result["marketing_urls"].append(url)
             result["llm_classifications"].append({
                 "url": url,
                 "classification": "marketing",
                 "confidence": 0.0,
-                "reason": f"LLM error: {str(e)}",
+                "reason": f"LLM error: {str(outcome)}",
                 "suggested_pattern": None,
-                "cost_usd": 0.0,
+                "cost_usd": cost,
             })
 
             # Record error classification
             if pattern_tracker and video_id:
-                await pattern_tracker.record_classification(
+                await _tracker_write(url, pattern_tracker.record_classification(
                     url=url,
                     video_id=video_id,
                     classification="marketing",
                     confidence=0.0,
                     method="llm",
-                    reason=f"LLM error: {str(e)}",
-                )
+                    reason=f"LLM error: {str(outcome)}",
+                ))
+            continue
+
+        classification, confidence, reason, suggested_pattern, cost = outcome
+
+        result["llm_classifications"].append({
+            "url": url,
+            "classification": classification,
+            "confidence": confidence,
+            "reason": reason,
+            "suggested_pattern": suggested_pattern,
+            "cost_usd": cost,
+        })
+
+        result["total_llm_cost"] += cost
+
+        if classification == "content":
+            result["content_urls"].append(url)
+        else:
+            result["marketing_urls"].append(url)
+
+        entry = {
+            "classification": classification,
+            "confidence": confidence,
+            "reason": reason,
+            "suggested_pattern": suggested_pattern,
+        }
+        cache.put(url, entry)
+
+        if pattern_tracker:
+            await _tracker_write(url, pattern_tracker.cache_classification(
+                normalized_url=normalize_url(url),
+                classification=classification,
+                confidence=confidence,
+                reason=reason,
+                suggested_pattern=suggested_pattern,
+            ))
+
+        # Record classification
+        if pattern_tracker and video_id:
+            await _tracker_write(url, pattern_tracker.record_classification(
+                url=url,
+                video_id=video_id,
+                classification=classification,
+                confidence=confidence,
+                method="llm",
+                reason=reason,
+                pattern_suggested=suggested_pattern.get("pattern") if suggested_pattern else None,
+            ))
+
+            # Add high-confidence patterns to learned patterns
+            if suggested_pattern and confidence >= 0.7:
+                await _tracker_write(url, pattern_tracker.add_learned_pattern(
+                    pattern=suggested_pattern.get("pattern"),
+                    pattern_type=suggested_pattern.get("type", "domain"),
+                    classification=classification,
+                    confidence=confidence,
+                ))
 
     return result
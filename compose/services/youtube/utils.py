@@ -3,7 +3,7 @@
 import re
 from typing import Any, Optional
 
-from .transcript_service import YouTubeTranscriptService
+from .transcript_service import get_default_service
 
 # Import CacheManager protocol from cache service (avoid duplication)
 try:
@@ -121,8 +121,7 @@ def get_timed_transcript(url: str) -> tuple[list[dict], Optional[str]]:
     """
     try:
         video_id = extract_video_id(url)
-        service = YouTubeTranscriptService()
-        segments = service.fetch_timed_transcript(video_id)
+        segments = get_default_service().fetch_timed_transcript(video_id)
         return segments, None
     except Exception as e:
         return [], str(e)
@@ -159,9 +158,8 @@ def get_transcript(url: str, cache: Optional[CacheManager] = None) -> str:
             if cached and "transcript" in cached:
                 return cached["transcript"]
 
-        # Fetch transcript using proxy-enabled service
-        service = YouTubeTranscriptService()
-        full_text, error = service.fetch_transcript_safe(video_id)
+        # Fetch transcript using the shared proxy-enabled service (pooled session)
+        full_text, error = get_default_service().fetch_transcript_safe(video_id)
 
         if error:
             return f"ERROR: {error}"
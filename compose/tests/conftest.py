@@ -29,6 +29,8 @@ def setup_test_environment():
     os.environ.setdefault("SURREALDB_URL", "http://localhost:8000")
     os.environ.setdefault("INFINITY_URL", "http://localhost:7997")
     os.environ.setdefault("OLLAMA_URL", "http://localhost:11434")
+    # No resource warm-up: tests don't have the backing services
+    os.environ.setdefault("API_WARMUP", "false")
     yield
 
 
@@ -0,0 +1,121 @@
+"""Tests for the pure-ASGI correlation and metrics middleware."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from compose.api.middleware import CorrelationMiddleware, HTTPServerMetricsMiddleware
+
+
+@pytest.fixture
+def metrics_app():
+    """App with both middlewares and an in-memory metric reader."""
+    reader = InMemoryMetricReader()
+    app = FastAPI()
+
+    @app.get("/conversations/{conversation_id}")
+    async def get_conversation(conversation_id: str, request: Request):
+        return {"id": conversation_id, "correlation_id": request.state.correlation_id}
+
+    @app.get("/stream")
+    async def stream():
+        async def events():
+            yield b"data: 1\n\n"
+            await asyncio.sleep(0.05)
+            yield b"data: 2\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    app.add_middleware(CorrelationMiddleware)
+    app.add_middleware(HTTPServerMetricsMiddleware, meter_provider=MeterProvider(metric_readers=[reader]))
+    return app, reader
+
+
+def _points(reader, name):
+    data = reader.get_metrics_data()
+    for resource_metrics in data.resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                if metric.name == name:
+                    return list(metric.data.data_points)
+    return []
+
+
+@pytest.mark.unit
+class TestCorrelationMiddleware:
+    """Tests for correlation ID propagation."""
+
+    def test_generates_and_exposes_id(self, metrics_app):
+        """A generated ID is set on request.state and the response header."""
+        app, _ = metrics_app
+        response = TestClient(app).get("/conversations/abc")
+
+        assert response.headers["x-correlation-id"] == response.json()["correlation_id"]
+
+    def test_reuses_incoming_id(self, metrics_app):
+        """An incoming X-Correlation-ID is kept."""
+        app, _ = metrics_app
+        response = TestClient(app).get(
+            "/conversations/abc", headers={"X-Correlation-ID": "req-42"}
+        )
+
+        assert response.headers["x-correlation-id"] == "req-42"
+        assert response.json()["correlation_id"] == "req-42"
+
+
+@pytest.mark.unit
+class TestHTTPServerMetricsMiddleware:
+    """Tests for HTTP server metrics."""
+
+    def test_route_label_is_template(self, metrics_app):
+        """Requests are labelled with the route template, not the raw path."""
+        app, reader = metrics_app
+        client = TestClient(app)
+        for conversation_id in ("a", "b", "c"):
+            client.get(f"/conversations/{conversation_id}")
+        client.get("/no/such/path")
+
+        points = _points(reader, "http_server_requests_total")
+        routes = {point.attributes["http_route"]: point.value for point in points}
+        assert routes == {"/conversations/{conversation_id}": 3, "unmatched": 1}
+
+    def test_streaming_ttfb_recorded(self, metrics_app):
+        """Streaming responses record time to first byte before the full duration."""
+        app, reader = metrics_app
+        response = TestClient(app).get("/stream")
+
+        assert response.text == "data: 1\n\ndata: 2\n\n"
+        (ttfb,) = _points(reader, "http_server_time_to_first_byte_seconds")
+        (duration,) = _points(reader, "http_server_request_duration_seconds")
+        assert ttfb.attributes["http_route"] == "/stream"
+        assert ttfb.sum < duration.sum
+        assert duration.sum >= 0.05
+
+    def test_non_streaming_has_no_ttfb(self, metrics_app):
+        """Single-chunk responses only record duration."""
+        app, reader = metrics_app
+        TestClient(app).get("/conversations/a")
+
+        assert _points(reader, "http_server_time_to_first_byte_seconds") == []
+
+    def test_errors_recorded(self, metrics_app):
+        """Unhandled errors count as 500 with the error type."""
+        app, reader = metrics_app
+        TestClient(app, raise_server_exceptions=False).get("/boom")
+
+        (point,) = _points(reader, "http_server_requests_total")
+        assert point.attributes["http_status_code"] == "500"
+        assert point.attributes["error_type"] == "RuntimeError"
+        assert point.attributes["http_route"] == "/boom"
+
+        active = _points(reader, "http_server_active_requests")
+        assert sum(p.value for p in active) == 0
@@ -0,0 +1,240 @@
+"""Tests for the API resource registry (warm-up, readiness, shutdown)."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from compose.api.resources import ResourceRegistry, SkipResource
+
+
+def _hook(events: list, name: str, delay: float = 0.0, error: Exception | None = None):
+    async def hook():
+        events.append(f"{name}:start")
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        events.append(f"{name}:end")
+
+    return hook
+
+
+@pytest.mark.unit
+class TestResourceRegistry:
+    """Tests for ResourceRegistry."""
+
+    async def test_starts_resources_concurrently(self):
+        """All startup hooks run at once, not one after another."""
+        events = []
+        registry = ResourceRegistry()
+        registry.register("a", _hook(events, "a", 0.05))
+        registry.register("b", _hook(events, "b", 0.05))
+
+        await registry.start()
+
+        assert events[:2] == ["a:start", "b:start"]
+        assert registry.ready
+        assert {r.status for r in registry.resources.values()} == {"ready"}
+
+    async def test_failed_and_skipped_statuses(self):
+        """Failures and unconfigured resources are reported, not raised."""
+        registry = ResourceRegistry(warmup_timeout=0.05)
+        registry.register("broken", _hook([], "broken", error=ConnectionError("refused")))
+        registry.register("absent", _hook([], "absent", error=SkipResource("not configured")))
+        registry.register("slow", _hook([], "slow", delay=1))
+
+        await registry.start()
+
+        resources = registry.status()["resources"]
+        assert resources["broken"]["status"] == "failed"
+        assert resources["broken"]["error"] == "refused"
+        assert resources["absent"]["status"] == "skipped"
+        assert resources["slow"]["status"] == "failed"
+        # None of them is required
+        assert registry.ready
+
+    async def test_not_ready_until_required_resource_starts(self):
+        """Readiness waits for warm-up and fails if a required resource fails."""
+        registry = ResourceRegistry()
+        registry.register("db", _hook([], "db", error=ConnectionError("down")), required=True)
+
+        assert not registry.ready
+        await registry.start()
+        assert not registry.ready
+        assert registry.status()["resources"]["db"]["status"] == "failed"
+
+    async def test_shutdown_waits_for_tracked_streams(self):
+        """Shutdown drains in-flight streams before closing resources."""
+        events = []
+        registry = ResourceRegistry()
+        registry.register("db", _hook(events, "db"), _hook(events, "db-close"))
+        registry.on_drain(lambda: events.append("drain"))
+        await registry.start()
+
+        async def stream():
+            async with registry.track_stream():
+                await asyncio.sleep(0.05)
+                events.append("stream:done")
+
+        task = asyncio.create_task(stream())
+        await asyncio.sleep(0)
+        assert registry.status()["active_streams"] == 1
+
+        await registry.shutdown()
+        await task
+
+        assert events[-4:] == ["drain", "stream:done", "db-close:start", "db-close:end"]
+        assert registry.draining
+        assert not registry.ready
+
+    async def test_drain_timeout(self):
+        """Shutdown stops waiting for streams after the drain timeout."""
+        events = []
+        registry = ResourceRegistry(drain_timeout=0.01)
+        registry.register("db", _hook(events, "db"), _hook(events, "db-close"))
+        await registry.start()
+
+        async def stream():
+            async with registry.track_stream():
+                await asyncio.sleep(1)
+
+        task = asyncio.create_task(stream())
+        await asyncio.sleep(0)
+        await registry.shutdown()
+
+        assert events[-1] == "db-close:end"
+        task.cancel()
+
+    async def test_shutdown_cancels_warmup(self):
+        """Shutdown during warm-up cancels it and still closes resources."""
+        events = []
+        registry = ResourceRegistry()
+        registry.register("slow", _hook(events, "slow", delay=10), _hook(events, "close"))
+
+        task = registry.start_background()
+        await asyncio.sleep(0)
+        await registry.shutdown()
+
+        assert task.cancelled()
+        assert events[-1] == "close:end"
+
+
+    async def test_drain_before_shutdown(self):
+        """An early drain reports not ready while resources stay open."""
+        events = []
+        registry = ResourceRegistry()
+        registry.register("db", _hook(events, "db"), _hook(events, "db-close"))
+        registry.on_drain(lambda: events.append("drain"))
+        await registry.start()
+
+        await registry.drain()
+
+        assert not registry.ready
+        assert events == ["db:start", "db:end", "drain"]
+
+        await registry.shutdown()
+
+        # Drain hooks don't run twice
+        assert events == ["db:start", "db:end", "drain", "db-close:start", "db-close:end"]
+
+
+@pytest.mark.unit
+class TestDrainOnSignal:
+    """Tests for install_drain_on_signal."""
+
+    async def test_signal_drains_before_server_handler(self):
+        """SIGTERM reaches the server only after tracked streams finish."""
+        import signal
+
+        from compose.api.resources import install_drain_on_signal
+
+        server_calls = []
+        previous = signal.signal(signal.SIGTERM, lambda sig, frame: server_calls.append(sig))
+        try:
+            registry = ResourceRegistry()
+            await registry.start()
+            restore = install_drain_on_signal(registry)
+
+            async def stream():
+                async with registry.track_stream():
+                    await asyncio.sleep(0.1)
+
+            task = asyncio.create_task(stream())
+            await asyncio.sleep(0)
+
+            signal.raise_signal(signal.SIGTERM)
+            await asyncio.sleep(0.02)
+
+            assert registry.draining
+            assert not registry.ready
+            assert server_calls == []
+
+            await task
+            await asyncio.sleep(0.02)
+            assert server_calls == [signal.SIGTERM]
+
+            restore()
+            assert signal.getsignal(signal.SIGTERM) is not None
+            signal.raise_signal(signal.SIGTERM)
+            assert server_calls == [signal.SIGTERM, signal.SIGTERM]
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+
+    async def test_second_signal_forwarded_immediately(self):
+        """A second signal doesn't wait for the drain."""
+        import signal
+
+        from compose.api.resources import install_drain_on_signal
+
+        server_calls = []
+        previous = signal.signal(signal.SIGTERM, lambda sig, frame: server_calls.append(sig))
+        try:
+            registry = ResourceRegistry()
+            await registry.start()
+            restore = install_drain_on_signal(registry)
+
+            async def stream():
+                async with registry.track_stream():
+                    await asyncio.sleep(1)
+
+            task = asyncio.create_task(stream())
+            await asyncio.sleep(0)
+
+            signal.raise_signal(signal.SIGTERM)
+            signal.raise_signal(signal.SIGTERM)
+
+            assert server_calls == [signal.SIGTERM]
+            task.cancel()
+            restore()
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+
+
+@pytest.mark.unit
+class TestReadinessEndpoints:
+    """Tests for /health/live and /health/ready."""
+
+    def test_live_and_ready(self):
+        """Liveness is always ok; readiness follows the registry."""
+        from unittest.mock import patch
+
+        from compose.api.routers.health import router
+
+        registry = ResourceRegistry()
+        registry.register("db", _hook([], "db"), required=True)
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+
+        with patch("compose.api.routers.health.get_resource_registry", return_value=registry):
+            assert client.get("/health/live").json() == {"status": "ok"}
+
+            response = client.get("/health/ready")
+            assert response.status_code == 503
+            assert response.json()["resources"]["db"]["status"] == "pending"
+
+            asyncio.run(registry.start())
+            response = client.get("/health/ready")
+            assert response.status_code == 200
+            assert response.json()["ready"] is True
@@ -42,7 +42,7 @@ class TestClientManagement:
         chat.OPENROUTER_API_KEY = "test-key"
 
         try:
-            with patch("compose.api.routers.chat.AsyncOpenAI") as mock_openai:
+            with patch("openai.AsyncOpenAI") as mock_openai:
                 mock_client = MagicMock()
                 mock_openai.return_value = mock_client
 
@@ -71,7 +71,7 @@ class TestClientManagement:
         """get_ollama_client() should create client on first use."""
         chat.reset_clients()
 
-        with patch("compose.api.routers.chat.AsyncOpenAI") as mock_openai:
+        with patch("openai.AsyncOpenAI") as mock_openai:
             mock_client = MagicMock()
             mock_openai.return_value = mock_client
 
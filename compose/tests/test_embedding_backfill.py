@@ -102,29 +102,35 @@ class TestProcessChunkVideo:
 
     @pytest.mark.asyncio
     async def test_archive_not_found(self):
-        """Return failure if archive doesn't exist."""
+        """Return failure if archive doesn't exist, with a single GET."""
         mock_minio = MagicMock()
-        mock_minio.exists.return_value = False
+        mock_minio.get_json = AsyncMock(return_value=None)
 
         from compose.worker.embedding_backfill import process_chunk_video
 
-        success, msg, count = await process_chunk_video("video123", mock_minio)
+        success, msg, count = await process_chunk_video(
+            "video123", "archives/youtube/video123.json", mock_minio
+        )
 
         assert success is False
         assert "Archive not found" in msg
         assert count == 0
-        mock_minio.exists.assert_called_with("youtube:video:video123")
+        mock_minio.get_json.assert_awaited_once_with(
+            "archives/youtube/video123.json", missing_ok=True
+        )
+        mock_minio.exists.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_no_timed_transcript(self):
-        """Return failure if archive has no timed_transcript."""
+        """Return failure if archive has no transcript."""
         mock_minio = MagicMock()
-        mock_minio.exists.return_value = True
-        mock_minio.get_json.return_value = {"transcript": "text only"}
+        mock_minio.get_json = AsyncMock(return_value={"transcript": "text only"})
 
         from compose.worker.embedding_backfill import process_chunk_video
 
-        success, msg, count = await process_chunk_video("video123", mock_minio)
+        success, msg, count = await process_chunk_video(
+            "video123", "archives/youtube/video123.json", mock_minio
+        )
 
         assert success is False
         assert "No timed_transcript" in msg
@@ -0,0 +1,200 @@
+"""Tests for the archive-wide URL filter job (compose/cli/filter_description_urls.py).
+
+Covers the process-pool scan, batched atomic archive writes and checkpoint
+resume, including archives whose write fails.
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from compose.cli import filter_description_urls as job
+
+
+def _archive(path: Path, description: str | None) -> Path:
+    metadata = {"title": path.stem, "channel_title": "Channel"}
+    if description is not None:
+        metadata["description"] = description
+    path.write_text(json.dumps({"video_id": path.stem, "youtube_metadata": metadata}))
+    return path
+
+
+async def _fake_classify(all_urls, heuristic_result, video_context, **kwargs):
+    return {
+        "all_urls": all_urls,
+        "blocked_urls": [],
+        "content_urls": all_urls,
+        "marketing_urls": [],
+        "learned_pattern_urls": [],
+        "total_llm_cost": 0.0,
+    }
+
+
+@pytest.fixture
+def job_files(tmp_path):
+    """Point checkpoint/progress files at tmp_path and stub classification."""
+    checkpoint = tmp_path / "checkpoint.json"
+    with patch.object(job, "CHECKPOINT_FILE", checkpoint), \
+            patch.object(job, "PROGRESS_FILE", tmp_path / "progress.json"), \
+            patch.object(job, "classify_filtered_urls", _fake_classify), \
+            patch.object(job, "_create_job_tracker", return_value=None):
+        yield checkpoint
+
+
+@pytest.fixture
+def archives(tmp_path):
+    """Six archives (video_0..video_5) with one URL each, in a month folder."""
+    month = tmp_path / "youtube" / "2025-01"
+    month.mkdir(parents=True)
+    return [
+        _archive(month / f"video_{i}.json", f"Links: https://example.com/{i}")
+        for i in range(6)
+    ]
+
+
+def _archive_manager(tmp_path):
+    return SimpleNamespace(writer=SimpleNamespace(
+        youtube_dir=tmp_path / "youtube",
+        config=SimpleNamespace(organize_by_month=True),
+    ))
+
+
+def _filtered(path: Path) -> bool:
+    return "url_filtered_at" in json.loads(path.read_text())["youtube_metadata"]
+
+
+@pytest.mark.unit
+class TestScanArchive:
+    """Tests for scan_archive (process pool worker)."""
+
+    def test_extracts_urls_and_heuristics(self, tmp_path):
+        """Only the small fields needed downstream are returned."""
+        path = _archive(tmp_path / "abc.json", "Watch https://example.com/post")
+
+        scanned = job.scan_archive(str(path))
+
+        assert scanned["video_id"] == "abc"
+        assert scanned["all_urls"] == ["https://example.com/post"]
+        assert "heuristic_result" in scanned
+        assert scanned["video_context"]["video_title"] == "abc"
+
+    def test_skip_and_error(self, tmp_path):
+        """Missing descriptions are skipped; unreadable archives are errors."""
+        no_description = _archive(tmp_path / "empty.json", None)
+        broken = tmp_path / "broken.json"
+        broken.write_text("{not json")
+
+        assert "skip" in job.scan_archive(str(no_description))
+        assert "error" in job.scan_archive(str(broken))
+
+
+@pytest.mark.unit
+class TestWriteUrlFields:
+    """Tests for write_url_fields."""
+
+    def test_writes_fields(self, tmp_path):
+        """URL fields are written into youtube_metadata; other fields are kept."""
+        path = _archive(tmp_path / "abc.json", "desc")
+        result = {"all_urls": ["u"], "blocked_urls": [], "content_urls": ["u"], "marketing_urls": []}
+
+        job.write_url_fields(str(path), result, "2025-01-01T00:00:00")
+
+        metadata = json.loads(path.read_text())["youtube_metadata"]
+        assert metadata["content_urls"] == ["u"]
+        assert metadata["url_filtered_at"] == "2025-01-01T00:00:00"
+        assert metadata["description"] == "desc"
+        assert [p.name for p in tmp_path.iterdir()] == ["abc.json"]
+
+    def test_failed_write_leaves_archive_intact(self, tmp_path):
+        """A failed replace removes the temp file and keeps the original."""
+        path = _archive(tmp_path / "abc.json", "desc")
+        original = path.read_text()
+        result = {"all_urls": [], "blocked_urls": [], "content_urls": [], "marketing_urls": []}
+
+        with patch.object(job.os, "replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                job.write_url_fields(str(path), result, "2025-01-01T00:00:00")
+
+        assert path.read_text() == original
+        assert [p.name for p in tmp_path.iterdir()] == ["abc.json"]
+
+
+@pytest.mark.unit
+class TestRunFilterJob:
+    """Tests for run_filter_job and process_all_videos."""
+
+    async def test_processes_all_archives(self, job_files, archives):
+        """All archives are scanned in the process pool and written in batches."""
+        stats = await job.run_filter_job(archives, workers=2, write_batch_size=2)
+
+        assert stats["processed"] == 6
+        assert stats["errors"] == 0
+        assert all(_filtered(path) for path in archives)
+        checkpoint = json.loads(job_files.read_text())
+        assert checkpoint["last_path"] == str(archives[-1])
+
+    def test_resumes_from_checkpoint(self, job_files, archives, tmp_path):
+        """A run resumes after the checkpointed archive and clears it when done."""
+        job.save_checkpoint(str(archives[1]), "video_1", 2)
+
+        stats = job.process_all_videos(_archive_manager(tmp_path), use_llm=False, workers=2)
+
+        assert stats["processed"] == 4
+        assert not _filtered(archives[0])
+        assert all(_filtered(path) for path in archives[2:])
+        assert not job_files.exists()
+
+    async def test_write_failure_stops_checkpoint(self, job_files, archives):
+        """An archive whose write failed is not checkpointed past."""
+        real_write = job.write_url_fields
+
+        def write(path, result, filtered_at):
+            if path == str(archives[2]):
+                raise OSError("disk full")
+            real_write(path, result, filtered_at)
+
+        with patch.object(job, "write_url_fields", write):
+            stats = await job.run_filter_job(archives, workers=2, write_batch_size=2)
+
+        assert stats["errors"] == 1
+        assert stats["processed"] == 5
+        assert not _filtered(archives[2])
+        checkpoint = json.loads(job_files.read_text())
+        assert checkpoint["last_path"] == str(archives[1])
+
+    async def test_scan_error_stops_checkpoint(self, job_files, archives):
+        """An unreadable archive is not checkpointed past either."""
+        archives[3].write_text("{not json")
+
+        stats = await job.run_filter_job(archives, workers=2, write_batch_size=2)
+
+        assert stats["errors"] == 1
+        assert json.loads(job_files.read_text())["last_path"] == str(archives[2])
+
+    def test_resume_retries_failed_archives(self, job_files, archives, tmp_path):
+        """Errors keep the checkpoint; the next run resumes at the failed archive."""
+        manager = _archive_manager(tmp_path)
+        real_write = job.write_url_fields
+
+        def failing_write(path, result, filtered_at):
+            if path == str(archives[2]):
+                raise OSError("disk full")
+            real_write(path, result, filtered_at)
+
+        with patch.object(job, "write_url_fields", failing_write):
+            first = job.process_all_videos(manager, use_llm=False, workers=2)
+
+        assert first["errors"] == 1
+        assert job_files.exists()
+        assert not _filtered(archives[2])
+
+        second = job.process_all_videos(manager, use_llm=False, workers=2)
+
+        # Resumed after archives[1]: archives 2-5 are redone, 0-1 are not
+        assert second["processed"] == 4
+        assert second["errors"] == 0
+        assert _filtered(archives[2])
+        assert not job_files.exists()
@@ -0,0 +1,40 @@
+"""Tests that heavy SDKs are imported on first use, not at module load."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+DEFERRED = ("anthropic", "openai", "googleapiclient", "minio", "surrealdb", "opentelemetry.sdk")
+
+
+def _loaded_after_import(module: str) -> list[str]:
+    code = (
+        f"import sys, {module}\n"
+        f"print(' '.join(m for m in {DEFERRED!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.split()
+
+
+@pytest.mark.unit
+class TestLazyImports:
+    """Importing entry points doesn't load LLM, storage or telemetry SDKs."""
+
+    @pytest.mark.parametrize(
+        "module",
+        ["compose.api.main", "compose.worker.queue_processor", "compose.worker.embedding_backfill"],
+    )
+    def test_entry_point_defers_heavy_sdks(self, module):
+        """Entry points import clients on first use."""
+        assert _loaded_after_import(module) == []
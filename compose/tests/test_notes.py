@@ -156,6 +156,7 @@ class TestNoteServiceCreate:
         assert note.title == "Test Note"
         assert note.path == "test-note.md"
         mock_vault_service.save_note_content.assert_called_once()
+        mock_vault_service.tree_cache.add.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_create_note_with_wiki_links(
@@ -275,6 +276,9 @@ class TestNoteServiceDelete:
 
         assert result is True
         mock_vault_service.delete_note_content.assert_called_once()
+        mock_vault_service.tree_cache.remove.assert_called_once_with(
+            sample_note_record["vault_id"], sample_note_record["path"]
+        )
 
     @pytest.mark.asyncio
     async def test_delete_note_not_found(self, note_service, mock_execute_query):
@@ -0,0 +1,107 @@
+"""Tests for the streaming, parallel archive reprocessing pipeline."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from compose.lib.reprocessing.pipeline import BaseReprocessingPipeline, MANIFEST_INDEX_FILENAME
+from compose.services.archive import create_local_archive_writer
+
+
+class UpperTitlePipeline(BaseReprocessingPipeline):
+    """Module-level so it can be pickled into worker processes."""
+
+    def get_output_type(self) -> str:
+        return "upper_title_v1"
+
+    def get_version_keys(self) -> list[str]:
+        return ["normalizer"]
+
+    def process_archive(self, archive) -> str:
+        if archive.video_id == "bad":
+            raise ValueError("cannot process")
+        return json.dumps({"title": archive.youtube_metadata.get("title", "").upper()})
+
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    """Archive directory with three videos."""
+    writer = create_local_archive_writer(base_dir=tmp_path)
+    for video_id in ("vid1", "vid2", "vid3"):
+        writer.archive_youtube_video(
+            video_id=video_id,
+            url=f"https://youtube.com/watch?v={video_id}",
+            transcript="hello",
+            metadata={"title": f"title {video_id}"},
+        )
+    return tmp_path
+
+
+def _derived(archive_dir, video_id):
+    archive = create_local_archive_writer(base_dir=archive_dir).get(video_id)
+    return archive.get_latest_derived_output("upper_title_v1")
+
+
+class TestReprocessingRun:
+    """Tests for BaseReprocessingPipeline.run."""
+
+    def test_processes_and_writes_without_reread(self, archive_dir):
+        """Derived outputs are written from the parsed archive, not re-read."""
+        pipeline = UpperTitlePipeline(archive_base_dir=archive_dir, max_workers=1)
+
+        with patch.object(pipeline.archive_writer, "get", side_effect=AssertionError("re-read")):
+            stats = pipeline.run()
+
+        assert stats == {"processed": 3, "skipped": 0, "errors": 0, "total": 3}
+        assert json.loads(_derived(archive_dir, "vid2").output_value) == {"title": "TITLE VID2"}
+
+    def test_index_skips_without_parsing(self, archive_dir):
+        """A second run skips up-to-date archives straight from the manifest index."""
+        UpperTitlePipeline(archive_base_dir=archive_dir, max_workers=1).run()
+        assert (archive_dir / MANIFEST_INDEX_FILENAME).exists()
+
+        pipeline = UpperTitlePipeline(archive_base_dir=archive_dir, max_workers=1)
+        with patch.object(pipeline, "load_archive", side_effect=AssertionError("parsed")):
+            stats = pipeline.run()
+
+        assert stats["skipped"] == 3
+        assert stats["processed"] == 0
+
+    def test_version_bump_reprocesses(self, archive_dir):
+        """Indexed manifests with stale versions are processed again."""
+        UpperTitlePipeline(archive_base_dir=archive_dir, max_workers=1).run()
+
+        with patch.dict("compose.lib.reprocessing.versions.VERSIONS", {"normalizer": "v9.9"}):
+            stats = UpperTitlePipeline(archive_base_dir=archive_dir, max_workers=1).run()
+
+        assert stats["processed"] == 3
+        assert _derived(archive_dir, "vid1").transform_manifest["normalizer"] == "v9.9"
+
+    def test_thread_pool_counts_errors(self, archive_dir):
+        """Failures in workers are counted and don't stop the run."""
+        create_local_archive_writer(base_dir=archive_dir).archive_youtube_video(
+            video_id="bad", url="https://youtube.com/watch?v=bad", transcript="x",
+        )
+
+        stats = UpperTitlePipeline(
+            archive_base_dir=archive_dir, max_workers=3, use_processes=False,
+        ).run()
+
+        assert stats == {"processed": 3, "skipped": 0, "errors": 1, "total": 4}
+
+    def test_process_pool(self, archive_dir):
+        """Archives are processed in worker processes."""
+        stats = UpperTitlePipeline(archive_base_dir=archive_dir, max_workers=2).run(limit=2)
+
+        assert stats["processed"] == 2
+        assert stats["total"] == 2
+        assert _derived(archive_dir, "vid3") is None
+
+    def test_dry_run_writes_nothing(self, archive_dir):
+        """Dry runs leave archives and the index untouched."""
+        stats = UpperTitlePipeline(archive_base_dir=archive_dir, dry_run=True, max_workers=1).run()
+
+        assert stats["processed"] == 3
+        assert _derived(archive_dir, "vid1") is None
+        assert not (archive_dir / MANIFEST_INDEX_FILENAME).exists()
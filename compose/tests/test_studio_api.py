@@ -285,11 +285,13 @@ class TestVaultsAPI:
 
         assert response.status_code == 404
 
-    def test_get_file_tree_empty(self, client, sample_vault):
+    def test_get_file_tree_empty(self, client):
         """Test GET /vaults/{id}/tree returns empty tree."""
+        from compose.services.vault_tree import VaultTree
+
         mock_service = MagicMock()
-        mock_service.get_vault = AsyncMock(return_value=sample_vault)
-        mock_service.get_file_tree = AsyncMock(return_value=[])
+        mock_service.vault_exists = AsyncMock(return_value=True)
+        mock_service.get_vault_tree = AsyncMock(return_value=VaultTree())
 
         with patch("compose.api.routers.vaults.get_vault_service", return_value=mock_service):
             response = client.get("/vaults/vault-123/tree")
@@ -301,13 +303,60 @@ class TestVaultsAPI:
     def test_get_file_tree_vault_not_found(self, client):
         """Test GET /vaults/{id}/tree returns 404 for non-existent vault."""
         mock_service = MagicMock()
-        mock_service.get_vault = AsyncMock(return_value=None)
+        mock_service.vault_exists = AsyncMock(return_value=False)
 
         with patch("compose.api.routers.vaults.get_vault_service", return_value=mock_service):
             response = client.get("/vaults/non-existent/tree")
 
         assert response.status_code == 404
 
+    def test_get_file_tree_etag(self, client):
+        """Test GET /vaults/{id}/tree returns 304 until the tree changes."""
+        from compose.services.vault_tree import VaultTree
+
+        tree = VaultTree.from_records([{"id": "note:1", "path": "inbox/idea.md"}])
+        mock_service = MagicMock()
+        mock_service.vault_exists = AsyncMock(return_value=True)
+        mock_service.get_vault_tree = AsyncMock(return_value=tree)
+
+        with patch("compose.api.routers.vaults.get_vault_service", return_value=mock_service):
+            first = client.get("/vaults/vault-123/tree")
+            etag = first.headers["etag"]
+            unchanged = client.get("/vaults/vault-123/tree", headers={"If-None-Match": etag})
+            tree.add("inbox/other.md", "2")
+            changed = client.get("/vaults/vault-123/tree", headers={"If-None-Match": etag})
+
+        assert first.json()["tree"][0]["children"][0]["note_id"] == "1"
+        assert unchanged.status_code == 304
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert len(changed.json()["tree"][0]["children"]) == 2
+
+    def test_get_file_tree_level(self, client):
+        """Test GET /vaults/{id}/tree?path= returns one folder level."""
+        from compose.services.vault_tree import VaultTree
+
+        tree = VaultTree.from_records([
+            {"id": "note:1", "path": "projects/alpha/plan.md"},
+            {"id": "note:2", "path": "projects/notes.md"},
+        ])
+        mock_service = MagicMock()
+        mock_service.vault_exists = AsyncMock(return_value=True)
+        mock_service.get_vault_tree = AsyncMock(return_value=tree)
+
+        with patch("compose.api.routers.vaults.get_vault_service", return_value=mock_service):
+            root = client.get("/vaults/vault-123/tree", params={"path": ""})
+            level = client.get("/vaults/vault-123/tree", params={"path": "projects"})
+            missing = client.get("/vaults/vault-123/tree", params={"path": "nope"})
+
+        assert [n["name"] for n in root.json()["tree"]] == ["projects"]
+        assert root.json()["tree"][0]["children"] == []
+        assert [(n["name"], n["type"]) for n in level.json()["tree"]] == [
+            ("alpha", "folder"),
+            ("notes.md", "file"),
+        ]
+        assert missing.status_code == 404
+
 
 # ============ Notes API Tests ============
 
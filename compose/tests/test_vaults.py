@@ -293,6 +293,82 @@ class TestVaultServiceFileTree:
         assert len(folder.children) == 2  # note1.md and subfolder
 
 
+    @pytest.mark.asyncio
+    async def test_get_file_tree_sorted_folders_first(self, vault_service, mock_execute_query):
+        """Test folders sort before files, case-insensitively."""
+        mock_execute_query.return_value = [
+            {"id": "note:1", "path": "b.md"},
+            {"id": "note:2", "path": "Zeta/x.md"},
+            {"id": "note:3", "path": "A.md"},
+            {"id": "note:4", "path": "alpha/y.md"},
+        ]
+
+        tree = await vault_service.get_file_tree("test-123")
+
+        assert [n.name for n in tree] == ["alpha", "Zeta", "A.md", "b.md"]
+
+    @pytest.mark.asyncio
+    async def test_file_tree_loaded_once(self, vault_service, mock_execute_query):
+        """Test the tree is queried once and then served from the cache."""
+        mock_execute_query.return_value = [{"id": "note:1", "path": "a.md"}]
+
+        await vault_service.get_file_tree("test-123")
+        await vault_service.get_file_tree("vault:test-123")
+
+        assert mock_execute_query.call_count == 1
+        assert await vault_service.vault_exists("test-123")
+        assert mock_execute_query.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_file_tree_updated_incrementally(self, vault_service, mock_execute_query):
+        """Test note create, rename and delete update the cached tree in place."""
+        mock_execute_query.return_value = [{"id": "note:1", "path": "inbox/idea.md"}]
+        tree = await vault_service.get_vault_tree("test-123")
+        etag = tree.etag
+        cache = vault_service.tree_cache
+
+        cache.add("test-123", "projects/alpha/plan.md", "2")
+        cache.move("vault:test-123", "inbox/idea.md", "projects/idea.md", "1")
+
+        assert tree.etag != etag
+        assert [n.name for n in tree.level("")] == ["projects"]
+        assert [n.name for n in tree.level("projects")] == ["alpha", "idea.md"]
+        assert tree.level("inbox") is None
+
+        cache.remove("test-123", "projects/alpha/plan.md")
+
+        assert tree.level("projects/alpha") is None
+        assert [n.path for n in (await vault_service.get_file_tree("test-123"))[0].children] == [
+            "projects/idea.md"
+        ]
+        assert mock_execute_query.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_file_tree_invalidated_on_vault_delete(self, vault_service, mock_execute_query):
+        """Test deleting a vault drops its cached tree."""
+        mock_execute_query.return_value = [{"id": "note:1", "path": "a.md"}]
+        await vault_service.get_file_tree("test-123")
+
+        await vault_service.delete_vault("test-123")
+
+        assert vault_service.tree_cache.peek("test-123") is None
+
+    @pytest.mark.asyncio
+    async def test_write_during_load_not_cached(self, vault_service, mock_execute_query):
+        """Test a tree loaded while a note was written is not cached stale."""
+        cache = vault_service.tree_cache
+
+        async def load(query, params):
+            cache.add("test-123", "new.md", "2")
+            return [{"id": "note:1", "path": "old.md"}]
+
+        mock_execute_query.side_effect = load
+
+        await vault_service.get_file_tree("test-123")
+
+        assert cache.peek("test-123") is None
+
+
 # ============ MinIO Integration Tests ============
 
 
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-video vs. batched UNWIND writes to the Neo4j graph.
+
+Writes the same synthetic videos (with channel and topic links) twice:
+once through the per-video repository functions (upsert_video,
+link_video_to_channel, link_video_to_topics) and once through the bulk
+UNWIND variants (upsert_videos, link_videos_to_channels,
+link_videos_to_topics).
+
+By default the driver is replaced with a stub that simulates a network
+round trip per statement plus a small per-row server cost, so the
+comparison runs anywhere. Pass --neo4j to write to the Neo4j configured
+by NEO4J_URI/NEO4J_USER/NEO4J_PASSWORD (e.g. a local test container);
+benchmark nodes use the "bench_" video ID prefix and are deleted afterwards.
+
+Usage:
+    uv run python compose/tools/benchmark_graph_writes.py
+    uv run python compose/tools/benchmark_graph_writes.py --videos 20000 --rtt-ms 1.0
+    uv run python compose/tools/benchmark_graph_writes.py --neo4j --videos 5000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime
+
+from compose.services.graph import driver
+from compose.services.graph import (
+    VideoNode,
+    execute_write,
+    link_video_to_channel,
+    link_video_to_topics,
+    link_videos_to_channels,
+    link_videos_to_topics,
+    upsert_video,
+    upsert_videos,
+)
+
+TOPICS = [
+    "agents", "rag", "llama", "langchain", "vector-db", "embeddings", "prompting",
+    "ollama", "cursor", "mcp", "evals", "graphs", "memory", "tools", "routing",
+]
+
+
+class _StubCounters:
+    def __getattr__(self, name):
+        return 0
+
+
+class _StubSummary:
+    counters = _StubCounters()
+
+
+class _StubResult:
+    def consume(self):
+        return _StubSummary()
+
+
+class StubSession:
+    """Session that sleeps one round trip per statement plus per-row cost."""
+
+    def __init__(self, stats: dict, rtt: float, row_cost: float):
+        self.stats = stats
+        self.rtt = rtt
+        self.row_cost = row_cost
+
+    def run(self, query, parameters=None):
+        rows = len((parameters or {}).get("rows", [])) or 1
+        self.stats["round_trips"] += 1
+        time.sleep(self.rtt + rows * self.row_cost)
+        return _StubResult()
+
+    def execute_write(self, fn, *args):
+        return fn(self, *args)
+
+    def close(self):
+        pass
+
+
+class StubDriver:
+    """Driver handing out StubSessions that share round-trip stats."""
+
+    def __init__(self, rtt: float, row_cost: float):
+        self.stats = {"round_trips": 0}
+        self.rtt = rtt
+        self.row_cost = row_cost
+
+    def session(self, database=None):
+        return StubSession(self.stats, self.rtt, self.row_cost)
+
+    def close(self):
+        pass
+
+
+def build_videos(count: int, channels: int, seed: int = 42) -> tuple[list[VideoNode], dict[str, list[str]]]:
+    """Generate videos spread over channels, each with 3 topics."""
+    rng = random.Random(seed)
+    videos = []
+    topics = {}
+    for i in range(count):
+        video_id = f"bench_{i:08d}"
+        channel = rng.randrange(channels)
+        videos.append(VideoNode(
+            video_id=video_id,
+            url=f"https://youtube.com/watch?v={video_id}",
+            fetched_at=datetime.now(),
+            title=f"Benchmark video {i}",
+            channel_id=f"bench_channel_{channel}",
+            channel_name=f"Benchmark Channel {channel}",
+        ))
+        topics[video_id] = rng.sample(TOPICS, 3)
+    return videos, topics
+
+
+def write_per_video(videos: list[VideoNode], topics: dict[str, list[str]]) -> None:
+    for video in videos:
+        upsert_video(video)
+        link_video_to_channel(video.video_id, video.channel_id, video.channel_name)
+        link_video_to_topics(video.video_id, topics[video.video_id])
+
+
+def write_batched(videos: list[VideoNode], topics: dict[str, list[str]], batch_size: int) -> None:
+    upsert_videos(videos, batch_size)
+    link_videos_to_channels(((v.video_id, v.channel_id, v.channel_name) for v in videos), batch_size)
+    link_videos_to_topics(topics, batch_size)
+
+
+def cleanup() -> None:
+    """Delete benchmark nodes from a real database."""
+    execute_write("MATCH (v:Video) WHERE v.video_id STARTS WITH 'bench_' DETACH DELETE v")
+    execute_write("MATCH (c:Channel) WHERE c.channel_id STARTS WITH 'bench_' DETACH DELETE c")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--videos", type=int, default=5000, help="Videos to write")
+    parser.add_argument("--channels", type=int, default=50, help="Distinct channels")
+    parser.add_argument("--batch-size", type=int, default=driver.DEFAULT_BATCH_SIZE, help="Rows per UNWIND transaction")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="Stub round-trip latency per statement")
+    parser.add_argument("--row-us", type=float, default=5.0, help="Stub server cost per row")
+    parser.add_argument("--neo4j", action="store_true", help="Write to the configured Neo4j instead of the stub")
+    args = parser.parse_args()
+
+    videos, topics = build_videos(args.videos, args.channels)
+
+    if args.neo4j:
+        from compose.services.graph import init_schema
+
+        init_schema()
+        target = driver.NEO4J_URI
+    else:
+        stub = StubDriver(rtt=args.rtt_ms / 1000, row_cost=args.row_us / 1e6)
+        driver._driver = stub
+        target = f"stub (rtt {args.rtt_ms} ms, {args.row_us} us/row)"
+
+    results = []
+    for name, fn in [
+        ("per-video statements", lambda: write_per_video(videos, topics)),
+        (f"UNWIND batches of {args.batch_size}", lambda: write_batched(videos, topics, args.batch_size)),
+    ]:
+        if args.neo4j:
+            cleanup()
+        else:
+            stub.stats["round_trips"] = 0
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        round_trips = None if args.neo4j else stub.stats["round_trips"]
+        results.append((name, elapsed, round_trips))
+
+    if args.neo4j:
+        cleanup()
+        driver.close_driver()
+    else:
+        driver.reset_driver()
+
+    baseline = results[0][1]
+    print(f"Target: {target}")
+    print(f"Videos: {args.videos:,} ({args.channels} channels, 3 topics each)")
+    print()
+    print(f"{'strategy':<32}{'total s':>10}{'videos/s':>12}{'round trips':>14}{'speedup':>10}")
+    for name, elapsed, round_trips in results:
+        print(
+            f"{name:<32}{elapsed:>10.2f}"
+            f"{args.videos / elapsed:>12,.0f}"
+            f"{(f'{round_trips:,}' if round_trips is not None else '-'):>14}"
+            f"{baseline / elapsed:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for API and worker entry points.
+
+Imports each target module in a fresh interpreter with ``python -X importtime``
+and reports the median total import time over several runs, plus the
+heaviest top-level packages it pulled in. Heavy SDKs (anthropic, openai,
+googleapiclient, minio, surrealdb, neo4j, the OTLP exporters) are imported
+on first use, so they should not show up here; if one does, some module
+imports it at load time again.
+
+Usage:
+    uv run python compose/tools/benchmark_imports.py
+    uv run python compose/tools/benchmark_imports.py compose.api.main --repeat 10 --top 20
+    uv run python compose/tools/benchmark_imports.py --budget-ms 1500   # exit 1 if over budget
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+# API app, queue worker and embedding backfill CLI
+DEFAULT_TARGETS = [
+    "compose.api.main",
+    "compose.worker.queue_processor",
+    "compose.worker.embedding_backfill",
+]
+
+# Packages that should only be imported on first use
+DEFERRED_PACKAGES = [
+    "anthropic",
+    "openai",
+    "googleapiclient",
+    "minio",
+    "surrealdb",
+    "neo4j",
+    "pydantic_ai",
+    "docling",
+    "opentelemetry.exporter",
+]
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse ``-X importtime`` stderr into records (in completion order)."""
+    records = []
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            records.append(ImportRecord(
+                name=match[4],
+                self_us=int(match[1]),
+                cumulative_us=int(match[2]),
+                depth=len(match[3]) // 2,
+            ))
+    return records
+
+
+def package_times(records: list[ImportRecord]) -> dict[str, int]:
+    """Self time (us) per top-level package, summed over its modules."""
+    totals: dict[str, int] = {}
+    for record in records:
+        package = record.name.split(".")[0]
+        totals[package] = totals.get(package, 0) + record.self_us
+    return totals
+
+
+def run_import(module: str) -> list[ImportRecord]:
+    """Import a module in a fresh interpreter and return its import records."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown error"
+        raise RuntimeError(f"import {module} failed: {error}")
+    return parse_importtime(result.stderr)
+
+
+def benchmark(module: str, repeat: int) -> tuple[float, list[ImportRecord]]:
+    """Median total import time (ms) of a module, and the records of the last run."""
+    totals = []
+    records: list[ImportRecord] = []
+    for _ in range(repeat):
+        records = run_import(module)
+        target = next((r for r in reversed(records) if r.name == module), None)
+        totals.append((target.cumulative_us if target else 0) / 1000)
+    return statistics.median(totals), records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_TARGETS, help="Modules to import")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh-interpreter runs per module (median is reported)")
+    parser.add_argument("--top", type=int, default=10, help="Heaviest packages to list per module")
+    parser.add_argument("--budget-ms", type=float, help="Exit with status 1 if any module's median exceeds this")
+    args = parser.parse_args()
+
+    over_budget = []
+    for module in args.modules:
+        median_ms, records = benchmark(module, args.repeat)
+        loaded = {r.name for r in records}
+        deferred = [p for p in DEFERRED_PACKAGES if p in loaded]
+
+        print(f"{module}: {median_ms:.0f} ms (median of {args.repeat}, {len(records)} modules)")
+        print(f"  {'package':<32}{'self ms':>10}")
+        heaviest = sorted(package_times(records).items(), key=lambda item: item[1], reverse=True)
+        for package, self_us in heaviest[:args.top]:
+            print(f"  {package:<32}{self_us / 1000:>10.1f}")
+        if deferred:
+            print(f"  imported at load time (expected deferred): {', '.join(deferred)}")
+        print()
+
+        if args.budget_ms is not None and median_ms > args.budget_ms:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"Over {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
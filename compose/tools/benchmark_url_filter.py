@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the heuristic URL filter.
+
+Compares the original per-URL loop (substring domain scan + re.search over
+uncompiled patterns) with the precompiled HeuristicURLFilter engine on a
+corpus of description URLs.
+
+The corpus is built from archived video descriptions when --archive-dir is
+given, otherwise from a synthetic set of typical YouTube description links
+(sponsors, affiliate links, social profiles, repos, docs, articles).
+
+Usage:
+    uv run python compose/tools/benchmark_url_filter.py
+    uv run python compose/tools/benchmark_url_filter.py --urls 200000 --repeat 5
+    uv run python compose/tools/benchmark_url_filter.py --archive-dir compose/data/archive/youtube
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+from pathlib import Path
+
+from compose.services.youtube.url_filter import (
+    BLOCKED_DOMAINS,
+    BLOCKED_URL_PATTERNS,
+    SOCIAL_PROFILE_PATTERNS,
+    HeuristicURLFilter,
+    extract_urls,
+)
+
+# Representative links seen in tech/AI channel descriptions
+SAMPLE_URLS = [
+    "https://github.com/{user}/{repo}",
+    "https://github.com/{user}/{repo}/blob/main/README.md",
+    "https://docs.python.org/3/library/{repo}.html",
+    "https://arxiv.org/abs/2401.{n:05d}",
+    "https://huggingface.co/{user}/{repo}",
+    "https://medium.com/@{user}/{repo}-{n}",
+    "https://www.anthropic.com/news/{repo}",
+    "https://platform.openai.com/docs/guides/{repo}",
+    "https://stackoverflow.com/questions/{n}",
+    "https://en.wikipedia.org/wiki/{repo}",
+    "https://www.youtube.com/watch?v={video}",
+    "https://youtu.be/{video}",
+    "https://discord.gg/{repo}",
+    "https://{user}.substack.com/p/{repo}",
+    "https://twitter.com/{user}",
+    "https://x.com/{user}",
+    "https://x.com/{user}/status/{n}",
+    "https://www.instagram.com/{user}/",
+    "https://www.linkedin.com/in/{user}",
+    "https://www.youtube.com/@{user}",
+    "https://www.patreon.com/join/{user}",
+    "https://{user}.gumroad.com/l/{repo}",
+    "https://ko-fi.com/{user}",
+    "https://www.buymeacoffee.com/{user}",
+    "https://bit.ly/{video}",
+    "https://amzn.to/{video}",
+    "https://www.amazon.com/dp/B0{n:08d}",
+    "https://linktr.ee/{user}",
+    "https://{user}.com/course?ref=youtube",
+    "https://www.{repo}.ai/?utm_source=youtube&utm_medium=video",
+    "https://{repo}.io/pricing",
+    "https://www.skool.com/{repo}/about",
+]
+
+WORDS = [
+    "agent", "rag", "llama", "langchain", "vector", "embed", "prompt", "swarm",
+    "ollama", "cursor", "mcp", "eval", "graph", "memory", "tools", "router",
+]
+
+
+def build_synthetic_corpus(size: int, seed: int = 42) -> list[str]:
+    """Generate `size` URLs from SAMPLE_URLS templates."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        template = rng.choice(SAMPLE_URLS)
+        corpus.append(template.format(
+            user=rng.choice(WORDS) + str(rng.randint(1, 500)),
+            repo="-".join(rng.sample(WORDS, 2)),
+            video="".join(rng.choices("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-", k=11)),
+            n=rng.randint(1, 99_999_999),
+        ))
+    return corpus
+
+
+def load_archive_corpus(archive_dir: Path) -> list[str]:
+    """Extract URLs from every archived description under archive_dir."""
+    corpus = []
+    for path in archive_dir.rglob("*.json"):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        description = (data.get("youtube_metadata") or {}).get("description") or ""
+        corpus.extend(extract_urls(description))
+    return corpus
+
+
+def legacy_is_blocked(url: str) -> tuple[bool, str | None]:
+    """Original is_blocked_by_heuristic implementation (baseline)."""
+    url_lower = url.lower()
+
+    for domain in BLOCKED_DOMAINS:
+        if domain in url_lower:
+            return True, f"Blocked domain: {domain}"
+
+    for pattern in BLOCKED_URL_PATTERNS:
+        if re.search(pattern, url_lower):
+            return True, f"Blocked pattern: {pattern}"
+
+    for pattern in SOCIAL_PROFILE_PATTERNS:
+        if re.search(pattern, url_lower):
+            return True, "Social media profile (not content)"
+
+    return False, None
+
+
+def time_best(fn, repeat: int) -> float:
+    """Return best wall time of `repeat` runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--urls", type=int, default=100_000, help="Synthetic corpus size")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation (best is reported)")
+    parser.add_argument("--archive-dir", type=Path, help="Build corpus from archived descriptions instead")
+    args = parser.parse_args()
+
+    if args.archive_dir:
+        corpus = load_archive_corpus(args.archive_dir)
+        source = f"archive ({args.archive_dir})"
+    else:
+        corpus = build_synthetic_corpus(args.urls)
+        source = "synthetic"
+
+    if not corpus:
+        print("Corpus is empty, nothing to benchmark")
+        return
+
+    engine = HeuristicURLFilter()
+
+    legacy_time = time_best(lambda: [legacy_is_blocked(u) for u in corpus], args.repeat)
+    check_time = time_best(lambda: [engine.check(u) for u in corpus], args.repeat)
+    many_time = time_best(lambda: engine.filter_many(corpus), args.repeat)
+
+    legacy_blocked = sum(1 for u in corpus if legacy_is_blocked(u)[0])
+    engine_blocked = len(engine.filter_many(corpus)["blocked"])
+
+    print(f"Corpus: {len(corpus):,} URLs ({len(set(corpus)):,} unique, {source})")
+    print(f"Blocked: legacy={legacy_blocked:,} engine={engine_blocked:,}")
+    print()
+    print(f"{'implementation':<32}{'total ms':>12}{'us/url':>10}{'speedup':>10}")
+    for name, elapsed in [
+        ("legacy loop", legacy_time),
+        ("HeuristicURLFilter.check", check_time),
+        ("HeuristicURLFilter.filter_many", many_time),
+    ]:
+        print(
+            f"{name:<32}{elapsed * 1000:>12.1f}"
+            f"{elapsed / len(corpus) * 1e6:>10.2f}"
+            f"{legacy_time / elapsed:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
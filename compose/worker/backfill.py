@@ -6,7 +6,7 @@ and reprocesses them. It can be run alongside queue_processor.
 
 Usage:
     python -m compose.worker.backfill --step fetch_transcript --batch 50
-    python -m compose.worker.backfill --all --batch 20
+    python -m compose.worker.backfill --all --batch 20 --concurrency 8
 """
 
 import argparse
@@ -22,17 +22,19 @@ def log(msg: str):
     print(f"[{timestamp}] {msg}", flush=True)
 
 
-def run_backfill_for_step(step_name: str, batch_size: int = 50) -> dict:
+def run_backfill_for_step(step_name: str, batch_size: int = 50, concurrency: int = None) -> dict:
     """Run backfill for a specific pipeline step.
 
     Args:
         step_name: Name of the step to backfill
         batch_size: Number of videos to process
+        concurrency: Videos processed at once (default: BACKFILL_CONCURRENCY)
 
     Returns:
         Summary dict
     """
     from compose.services.pipeline import run_backfill, get_step, get_backfill_counts
+    from compose.services.pipeline.runner import DEFAULT_BACKFILL_CONCURRENCY
 
     step = get_step(step_name)
     if not step:
@@ -51,17 +53,22 @@ def run_backfill_for_step(step_name: str, batch_size: int = 50) -> dict:
         return {"step": step_name, "queued": 0, "succeeded": 0, "failed": 0}
 
     # Process batch
-    summary = run_backfill(step_name, batch_size=batch_size)
+    summary = run_backfill(
+        step_name,
+        batch_size=batch_size,
+        max_concurrency=concurrency or DEFAULT_BACKFILL_CONCURRENCY,
+    )
     log(f"Processed: {summary['succeeded']} succeeded, {summary['failed']} failed")
 
     return summary
 
 
-def run_backfill_all(batch_size: int = 20) -> dict:
+def run_backfill_all(batch_size: int = 20, concurrency: int = None) -> dict:
     """Run backfill for all pipeline steps.
 
     Args:
         batch_size: Number of videos to process per step
+        concurrency: Videos processed at once per step
 
     Returns:
         Summary dict
@@ -86,7 +93,7 @@ def run_backfill_all(batch_size: int = 20) -> dict:
             continue
 
         log(f"  {step_name}: {stale_count} stale videos")
-        summary = run_backfill_for_step(step_name, batch_size)
+        summary = run_backfill_for_step(step_name, batch_size, concurrency)
 
         total_summary["steps_processed"] += 1
         total_summary["total_succeeded"] += summary.get("succeeded", 0)
@@ -100,23 +107,25 @@ def run_backfill_all(batch_size: int = 20) -> dict:
 def show_status():
     """Show backfill status for all steps."""
     import asyncio
-    from compose.services.pipeline import get_all_steps, get_backfill_counts
-    from compose.services.surrealdb import get_video_count
+    from compose.services.pipeline import get_all_steps, get_pipeline_status
 
     log("=== Backfill Status ===")
 
-    total_videos = asyncio.run(get_video_count())
+    status = get_pipeline_status()
+    counts = asyncio.run(status.get_counts())
+    total_videos = status.total
     log(f"Total videos in database: {total_videos}")
 
-    steps = get_all_steps()
-    counts = get_backfill_counts()
-
     log("\nStep Status:")
-    for step_name, metadata in steps.items():
-        stale = counts.get(step_name, 0)
-        processed = total_videos - stale
-        pct = (processed / total_videos * 100) if total_videos > 0 else 0
-        log(f"  {step_name}: {processed}/{total_videos} ({pct:.1f}%) - {stale} need backfill")
+    for step_name, metadata in get_all_steps().items():
+        step = counts.get(step_name)
+        if step is None:
+            continue
+        pct = (step.done / total_videos * 100) if total_videos > 0 else 0
+        log(
+            f"  {step_name}: {step.done}/{total_videos} ({pct:.1f}%) - "
+            f"{step.stale} stale, {step.pending} never run"
+        )
         log(f"    version: {metadata.version_hash}")
 
 
@@ -128,15 +137,19 @@ def main():
     parser.add_argument("--all", action="store_true", help="Backfill all steps")
     parser.add_argument("--status", action="store_true", help="Show backfill status")
     parser.add_argument("--batch", type=int, default=50, help="Batch size (default: 50)")
+    parser.add_argument(
+        "--concurrency", type=int, default=None,
+        help="Videos processed at once (default: BACKFILL_CONCURRENCY env or 4)",
+    )
 
     args = parser.parse_args()
 
     if args.status:
         show_status()
     elif args.all:
-        run_backfill_all(batch_size=args.batch)
+        run_backfill_all(batch_size=args.batch, concurrency=args.concurrency)
     elif args.step:
-        run_backfill_for_step(args.step, batch_size=args.batch)
+        run_backfill_for_step(args.step, batch_size=args.batch, concurrency=args.concurrency)
     else:
         show_status()
 
@@ -37,9 +37,8 @@ from pathlib import Path
 from typing import Literal
 
 import typer
+from opentelemetry import metrics
 from rich.console import Console
-from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
 
 # Setup Python path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -47,19 +46,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from compose.lib.telemetry import setup_telemetry
 from compose.services.chunking import chunk_youtube_transcript, chunk_plain_transcript
 from compose.services.embeddings import get_chunk_embedder
-from compose.services.minio import create_minio_client
-from compose.services.surrealdb.driver import execute_query
+from compose.services.minio import AsyncMinIOClient, create_minio_client
+from compose.services.surrealdb.driver import execute_multi_query, execute_query
 from compose.services.surrealdb.models import VideoChunkRecord
 from compose.services.surrealdb.repository import (
     delete_chunks_for_video,
     get_chunks_for_video,
     upsert_chunk,
     upsert_chunks,
-    get_chunk_count,
 )
 
-# Initialize OpenTelemetry
-_, meter = setup_telemetry("embedding-backfill", enable_instrumentation=False)
+# Instruments bind to the meter provider once the CLI sets up telemetry
+meter = metrics.get_meter(__name__)
 
 # Metrics instruments
 videos_chunked_counter = meter.create_counter(
@@ -99,6 +97,12 @@ app = typer.Typer(help="Embedding backfill worker for chunk embeddings")
 console = Console(force_terminal=True, force_interactive=False, width=120, legacy_windows=True)
 logger = logging.getLogger(__name__)
 
+
+@app.callback()
+def main():
+    """Set up telemetry before running a command."""
+    setup_telemetry("embedding-backfill", enable_instrumentation=False)
+
 # Configuration
 MINIO_URL = os.getenv("MINIO_URL", "http://192.168.16.241:9000")
 MINIO_BUCKET = os.getenv("MINIO_BUCKET", "cache")
@@ -137,6 +141,32 @@ async def get_videos_needing_embeddings(limit: int = 100) -> list[dict]:
     return await execute_query(query)
 
 
+STATUS_COUNTS_QUERY = """
+SELECT
+    count() AS total,
+    count(archive_path IS NOT NONE) AS archived,
+    count(pipeline_state['chunk_transcript'] IS NOT NONE) AS chunked,
+    count(pipeline_state['embed_chunks'] IS NOT NONE) AS embedded
+FROM video GROUP ALL;
+SELECT
+    count() AS chunks,
+    count(embedding IS NOT NONE) AS chunks_embedded
+FROM video_chunk GROUP ALL;
+"""
+
+
+async def get_status_counts() -> dict[str, int]:
+    """Get video and chunk backfill counts in one round trip.
+
+    Returns:
+        Dict with total, archived, chunked, embedded, chunks, chunks_embedded
+    """
+    video_rows, chunk_rows = await execute_multi_query(STATUS_COUNTS_QUERY)
+    counts = {**(video_rows[0] if video_rows else {}), **(chunk_rows[0] if chunk_rows else {})}
+    keys = ("total", "archived", "chunked", "embedded", "chunks", "chunks_embedded")
+    return {key: int(counts.get(key, 0) or 0) for key in keys}
+
+
 async def update_pipeline_state(video_id: str, step: str, version: str) -> None:
     """Update the pipeline_state for a video."""
     query = """
@@ -153,7 +183,7 @@ async def process_chunk_video(video_id: str, archive_path: str, minio_client) ->
     Args:
         video_id: YouTube video ID
         archive_path: Path/key in MinIO where archive is stored
-        minio_client: MinIO client instance
+        minio_client: AsyncMinIOClient instance
 
     Returns:
         (success, message, chunk_count)
@@ -162,10 +192,10 @@ async def process_chunk_video(video_id: str, archive_path: str, minio_client) ->
 
     try:
         # Get archive from MinIO using the archive_path from DB
-        if not minio_client.exists(archive_path):
+        archive_data = await minio_client.get_json(archive_path, missing_ok=True)
+        if archive_data is None:
             return False, f"Archive not found: {archive_path}", 0
 
-        archive_data = minio_client.get_json(archive_path)
         timed_transcript = archive_data.get("timed_transcript")
         raw_transcript = archive_data.get("raw_transcript")
 
@@ -277,42 +307,18 @@ async def process_embed_video(video_id: str) -> tuple[bool, str, int]:
 @app.command()
 def status():
     """Show backfill progress statistics."""
+    from rich.table import Table
 
     async def _status():
         console.print("[bold blue]Checking backfill status...[/]\n")
 
-        # Get total videos
-        total_result = await execute_query(
-            "SELECT COUNT() AS count FROM video GROUP ALL;"
-        )
-        total = total_result[0].get("count", 0) if total_result else 0
-
-        # Videos with archives
-        archived_result = await execute_query(
-            "SELECT COUNT() AS count FROM video WHERE archive_path IS NOT NONE GROUP ALL;"
-        )
-        archived = archived_result[0].get("count", 0) if archived_result else 0
-
-        # Videos chunked
-        chunked_result = await execute_query(
-            "SELECT COUNT() AS count FROM video WHERE pipeline_state['chunk_transcript'] IS NOT NONE GROUP ALL;"
-        )
-        chunked = chunked_result[0].get("count", 0) if chunked_result else 0
-
-        # Videos with chunk embeddings
-        embedded_result = await execute_query(
-            "SELECT COUNT() AS count FROM video WHERE pipeline_state['embed_chunks'] IS NOT NONE GROUP ALL;"
-        )
-        embedded = embedded_result[0].get("count", 0) if embedded_result else 0
-
-        # Total chunks
-        chunk_count = await get_chunk_count()
-
-        # Chunks with embeddings
-        chunks_embedded_result = await execute_query(
-            "SELECT COUNT() AS count FROM video_chunk WHERE embedding IS NOT NONE GROUP ALL;"
-        )
-        chunks_embedded = chunks_embedded_result[0].get("count", 0) if chunks_embedded_result else 0
+        counts = await get_status_counts()
+        total = counts["total"]
+        archived = counts["archived"]
+        chunked = counts["chunked"]
+        embedded = counts["embedded"]
+        chunk_count = counts["chunks"]
+        chunks_embedded = counts["chunks_embedded"]
 
         # Build table
         table = Table(title="Embedding Backfill Status")
@@ -377,13 +383,14 @@ def run(
     ),
 ):
     """Run backfill for chunking and/or embedding."""
+    from rich.progress import BarColumn, Progress, TaskProgressColumn, TextColumn
 
     async def _run():
         console.print(f"[bold blue]Starting backfill (step={step}, batch={batch})...[/]\n")
 
         # Initialize MinIO client (reads from env vars)
         try:
-            minio_client = create_minio_client()
+            minio_client = AsyncMinIOClient(create_minio_client())
             console.print(f"[green]OK[/] MinIO connected")
         except Exception as e:
             console.print(f"[red]ERROR[/] MinIO connection failed: {e}")
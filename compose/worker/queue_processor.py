@@ -18,7 +18,7 @@ import os
 import shutil
 import sys
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 # Configuration from environment
@@ -26,6 +26,7 @@ MINIO_URL = os.getenv("MINIO_URL", "http://minio:9000")
 MINIO_BUCKET = os.getenv("MINIO_BUCKET", "cache")
 POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "10"))
 WORKER_POOL_SIZE = int(os.getenv("WORKER_POOL_SIZE", "3"))
+TRANSCRIPT_BATCH_SIZE = int(os.getenv("TRANSCRIPT_BATCH_SIZE", "8"))  # Transcripts fetched concurrently per batch
 
 # Paths - configurable via environment, with sensible defaults for Docker and local dev
 def _get_data_base() -> Path:
@@ -52,19 +53,21 @@ PROCESSING_DIR = QUEUE_BASE / "processing"
 COMPLETED_DIR = QUEUE_BASE / "completed"
 PROGRESS_FILE = QUEUE_BASE / ".progress.json"
 
-from compose.services.youtube import get_transcript, extract_video_id, fetch_video_metadata
+from compose.services.youtube import get_transcript, extract_video_id, fetch_video_metadata, get_default_service
+from compose.services.youtube.metadata_service import YouTubeMetadataService
 from compose.services.minio import create_minio_client, ArchiveStorage
 from compose.services.archive import create_archive_manager, create_local_archive_writer, ImportMetadata, ChannelContext
 from compose.services.surrealdb.repository import get_video, upsert_video
 from compose.services.surrealdb.models import VideoRecord
 from compose.services.surrealdb.driver import execute_query
+from compose.services.progress_feed import publish_progress, publish_progress_cleared
 
 # OpenTelemetry metrics
 from opentelemetry import metrics
 from compose.lib.telemetry import setup_telemetry
 
-# Initialize telemetry
-_, meter = setup_telemetry("queue-worker", enable_instrumentation=False)
+# Instruments bind to the meter provider once main() sets up telemetry
+meter = metrics.get_meter(__name__)
 
 # Metrics instruments
 jobs_processed_counter = meter.create_counter(
@@ -160,6 +163,16 @@ async def update_progress(worker_id: str, filename: str, completed: int, total:
             "total": total,
             "started_at": actual_started_at,
         })
+
+        # Push to in-process subscribers (co-located dashboard)
+        publish_progress(worker_id, {
+            "worker_id": worker_id,
+            "filename": filename,
+            "completed": completed,
+            "total": total,
+            "started_at": actual_started_at,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        })
     except Exception as e:
         # Non-critical, log but don't break processing
         log(f"[{worker_id}] Failed to update progress in SurrealDB: {e}")
@@ -171,6 +184,7 @@ async def clear_progress(worker_id: str):
         # Delete from worker_progress table
         query = "DELETE worker_progress WHERE worker_id = $worker_id;"
         await execute_query(query, {"worker_id": worker_id})
+        publish_progress_cleared(worker_id)
 
         # Clean up start time tracking
         async with _start_times_lock:
@@ -187,6 +201,8 @@ async def ingest_video(
     source_type: str = "single_import",
     channel_id: str = None,
     channel_name: str = None,
+    prefetched_metadata: tuple = None,
+    prefetched_transcript: str = None,
 ) -> tuple[bool, str]:
     """Fetch transcript and metadata, archive, and cache to SurrealDB.
 
@@ -199,6 +215,10 @@ async def ingest_video(
 
     Args:
         source_type: Must be one of: single_import, repl_import, bulk_channel, bulk_multi_channel
+        prefetched_metadata: (metadata, error) from a batched fetch; fetched
+            individually when None
+        prefetched_transcript: Transcript (or "ERROR: ..." string) from a
+            batched fetch; fetched individually when None
     """
     video_start_time = time.time()
     try:
@@ -212,8 +232,11 @@ async def ingest_video(
             video_duration_histogram.record(time.time() - video_start_time, {"result": "skipped"})
             return True, f"SKIP: Already in SurrealDB ({video_id})"
 
-        log(f"  Fetching transcript for {video_id}...")
-        transcript = get_transcript(url, cache=None)
+        if prefetched_transcript is not None:
+            transcript = prefetched_transcript
+        else:
+            log(f"  Fetching transcript for {video_id}...")
+            transcript = get_transcript(url, cache=None)
 
         if "ERROR:" in transcript:
             videos_failed_counter.add(1, {"source_type": source_type, "reason": "transcript_fetch"})
@@ -221,8 +244,11 @@ async def ingest_video(
             return False, f"ERROR: {transcript}"
 
         # Fetch YouTube metadata (title, description, etc.)
-        log(f"  Fetching YouTube metadata for {video_id}...")
-        youtube_metadata, metadata_error = fetch_video_metadata(video_id)
+        if prefetched_metadata is not None:
+            youtube_metadata, metadata_error = prefetched_metadata
+        else:
+            log(f"  Fetching YouTube metadata for {video_id}...")
+            youtube_metadata, metadata_error = fetch_video_metadata(video_id)
         if metadata_error:
             log(f"  [WARN] Metadata fetch failed: {metadata_error}")
             youtube_metadata = {}
@@ -334,6 +360,66 @@ async def ingest_video(
         return False, f"ERROR: {type(e).__name__}: {e}"
 
 
+def _safe_video_id(url: str):
+    """Extract a video ID, returning None for unparseable URLs."""
+    try:
+        return extract_video_id(url)
+    except Exception:
+        return None
+
+
+async def prefetch_metadata(videos: list[dict]) -> dict:
+    """Batch-fetch YouTube metadata for CSV rows.
+
+    Returns:
+        Dict of video_id -> (metadata, error). Empty if the API is not
+        configured, in which case ingest_video fetches (and reports) per video.
+    """
+    video_ids = [_safe_video_id(v.get('url', '').strip()) for v in videos]
+    video_ids = [vid for vid in video_ids if vid]
+    if not video_ids:
+        return {}
+
+    try:
+        service = YouTubeMetadataService()
+    except ValueError as e:
+        log(f"  [WARN] Metadata prefetch disabled: {e}")
+        return {}
+
+    return await service.fetch_metadata_many(video_ids)
+
+
+async def prefetch_transcripts(urls: list[str]) -> dict:
+    """Fetch transcripts for a batch of videos concurrently.
+
+    Videos already in SurrealDB are left out so their transcripts are not
+    downloaded just to be skipped. Any failure returns an empty dict and
+    ingest_video falls back to fetching per video.
+
+    Returns:
+        Dict of video_id -> transcript text, or "ERROR: ..." in the format
+        returned by get_transcript
+    """
+    try:
+        video_ids = list(dict.fromkeys(vid for vid in map(_safe_video_id, urls) if vid))
+        existing = await asyncio.gather(*(get_video(vid) for vid in video_ids))
+        missing = [vid for vid, record in zip(video_ids, existing) if not record]
+        if not missing:
+            return {}
+
+        results = await asyncio.to_thread(
+            get_default_service().fetch_many, missing, max_workers=TRANSCRIPT_BATCH_SIZE
+        )
+    except Exception as e:
+        log(f"  [WARN] Transcript prefetch failed: {e}")
+        return {}
+
+    return {
+        vid: result.text if result.ok else f"ERROR: {result.error}"
+        for vid, result in results.items()
+    }
+
+
 async def process_csv(csv_path: Path, archive_manager, storage: ArchiveStorage, worker_id: str) -> dict:
     """Process all videos from a CSV file."""
     log(f"[{worker_id}] Processing CSV: {csv_path.name}")
@@ -360,7 +446,18 @@ async def process_csv(csv_path: Path, archive_manager, storage: ArchiveStorage,
         else:
             source_type = "bulk_multi_channel"
 
+        # Fetch YouTube metadata for the whole CSV up front (50 IDs per API call)
+        metadata_by_id = await prefetch_metadata(videos)
+
+        transcripts = {}
         for i, video in enumerate(videos, 1):
+            # Fetch the next batch of transcripts concurrently
+            if (i - 1) % TRANSCRIPT_BATCH_SIZE == 0:
+                batch = videos[i - 1:i - 1 + TRANSCRIPT_BATCH_SIZE]
+                transcripts = await prefetch_transcripts(
+                    [v.get('url', '').strip() for v in batch if v.get('url', '').strip()]
+                )
+
             url = video.get('url', '').strip()
             if not url:
                 # Update progress even for skipped empty URLs
@@ -371,7 +468,9 @@ async def process_csv(csv_path: Path, archive_manager, storage: ArchiveStorage,
             channel_name = video.get('channel_name', '').strip() or None
 
             success, message = await ingest_video(
-                url, archive_manager, storage, source_type, channel_id, channel_name
+                url, archive_manager, storage, source_type, channel_id, channel_name,
+                prefetched_metadata=metadata_by_id.get(_safe_video_id(url)),
+                prefetched_transcript=transcripts.get(_safe_video_id(url)),
             )
 
             if "SKIP" in message:
@@ -382,12 +481,10 @@ async def process_csv(csv_path: Path, archive_manager, storage: ArchiveStorage,
                 stats["errors"] += 1
                 log(f"[{worker_id}]   [{i}/{len(videos)}] {message}")
 
-            # Update progress after each video
+            # Update progress after each video (transcript fetches are rate
+            # limited per proxy by the transcript service)
             await update_progress(worker_id, csv_path.name, i, len(videos), started_at)
 
-            # Small delay
-            await asyncio.sleep(1)
-
         log(f"[{worker_id}]   Done: {stats['processed']} processed, {stats['skipped']} skipped, {stats['errors']} errors")
 
         # Record job success metrics
@@ -512,6 +609,7 @@ async def poll_and_process():
 
 def main():
     """Entry point."""
+    setup_telemetry("queue-worker", enable_instrumentation=False)
     try:
         asyncio.run(poll_and_process())
     except KeyboardInterrupt:
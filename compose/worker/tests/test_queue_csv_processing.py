@@ -103,6 +103,14 @@ class TestCsvProcessingSkipsDone:
 class TestProcessCsvWithMocks:
     """Test process_csv function with mocked dependencies."""
 
+    @pytest.fixture(autouse=True)
+    def no_transcript_prefetch(self):
+        """Keep batch transcript prefetch off the network and SurrealDB."""
+        with patch(
+            "compose.worker.queue_processor.prefetch_transcripts", AsyncMock(return_value={})
+        ) as mock_prefetch:
+            yield mock_prefetch
+
     @patch("compose.worker.queue_processor.ingest_video")
     @patch("compose.worker.queue_processor.update_progress")
     @patch("compose.worker.queue_processor.clear_progress")
@@ -254,6 +262,68 @@ class TestProcessCsvWithMocks:
         for call in mock_ingest.call_args_list:
             assert call[0][3] == "bulk_multi_channel"
 
+    @patch("compose.worker.queue_processor.prefetch_metadata")
+    @patch("compose.worker.queue_processor.ingest_video")
+    @patch("compose.worker.queue_processor.update_progress")
+    @patch("compose.worker.queue_processor.clear_progress")
+    async def test_passes_prefetched_metadata(
+        self, mock_clear, mock_update, mock_ingest, mock_prefetch, temp_dir
+    ):
+        """Metadata is fetched once for the CSV and handed to each ingest."""
+        from compose.worker.queue_processor import process_csv
+
+        csv_file = temp_dir / "test.csv"
+        with open(csv_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["url"])
+            writer.writeheader()
+            writer.writerow({"url": "https://youtube.com/watch?v=dQw4w9WgXcQ"})
+            writer.writerow({"url": "https://youtube.com/watch?v=jNQXAC9IVRw"})
+
+        mock_prefetch.return_value = {
+            "dQw4w9WgXcQ": ({"title": "First"}, None),
+            "jNQXAC9IVRw": (None, "Video not found: jNQXAC9IVRw"),
+        }
+        mock_ingest.return_value = (True, "OK: processed")
+
+        await process_csv(csv_file, MagicMock(), MagicMock(), "W001")
+
+        mock_prefetch.assert_awaited_once()
+        prefetched = [c.kwargs["prefetched_metadata"] for c in mock_ingest.call_args_list]
+        assert prefetched == [
+            ({"title": "First"}, None),
+            (None, "Video not found: jNQXAC9IVRw"),
+        ]
+
+    @patch("compose.worker.queue_processor.ingest_video")
+    @patch("compose.worker.queue_processor.update_progress")
+    @patch("compose.worker.queue_processor.clear_progress")
+    async def test_prefetches_transcripts_in_batches(
+        self, mock_clear, mock_update, mock_ingest, no_transcript_prefetch, temp_dir
+    ):
+        """Transcripts are fetched once per batch and handed to each ingest."""
+        from compose.worker import queue_processor
+
+        ids = ["dQw4w9WgXcQ", "jNQXAC9IVRw", "9bZkp7q19f0"]
+        csv_file = temp_dir / "test.csv"
+        with open(csv_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["url"])
+            writer.writeheader()
+            for vid in ids:
+                writer.writerow({"url": f"https://youtube.com/watch?v={vid}"})
+
+        no_transcript_prefetch.side_effect = lambda urls: {
+            queue_processor.extract_video_id(u): f"text {queue_processor.extract_video_id(u)}"
+            for u in urls
+        }
+        mock_ingest.return_value = (True, "OK: processed")
+
+        with patch.object(queue_processor, "TRANSCRIPT_BATCH_SIZE", 2):
+            await queue_processor.process_csv(csv_file, MagicMock(), MagicMock(), "W001")
+
+        assert [len(c.args[0]) for c in no_transcript_prefetch.await_args_list] == [2, 1]
+        transcripts = [c.kwargs["prefetched_transcript"] for c in mock_ingest.call_args_list]
+        assert transcripts == [f"text {vid}" for vid in ids]
+
 
 # =============================================================================
 # Test: Log Function